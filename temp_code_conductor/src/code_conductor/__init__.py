@@ -4,8 +4,17 @@
 Code Conductor - AI Development Environment Setup Tool
 """
 
-from .core.work_effort.manager import WorkEffortManager
-from .events import EventEmitter, Event
-
 __version__ = "0.5.0"
 __all__ = ['WorkEffortManager', 'EventEmitter', 'Event']
+
+
+def __getattr__(name):
+    # Imported on first access so that reading __version__ (as every console
+    # script does at startup) does not load the manager stack
+    if name == 'WorkEffortManager':
+        from .core.work_effort.manager import WorkEffortManager
+        return WorkEffortManager
+    if name in ('EventEmitter', 'Event'):
+        from . import events
+        return getattr(events, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,6 +8,8 @@ This script sets up a directory with AI assistance tools and
 a work effort tracking system.
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import shutil
@@ -17,7 +19,7 @@ import json
 from datetime import datetime, timedelta
 import logging
 import re
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
 from pathlib import Path
 
 # Import version from package
@@ -30,31 +32,36 @@ except ImportError:
 # Use imported version
 VERSION = __version__
 
+from ..config import find_nearest_config as _find_nearest_config, get_config_resolver
+
 # Setup logging
 logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('CodeConductor')
 
-# Import core components
-from ..core.work_effort.validator import WorkEffortValidator
-from ..core.work_effort.manager import WorkEffortManager
-from ..core.work_effort.counter import WorkEffortCounter
-from ..core.work_effort.template import WorkEffortTemplate
-from ..core.work_effort.event_emitter import EventEmitter
-from ..core.work_effort.parser import WorkEffortParser
-from ..core.work_effort.formatter import WorkEffortFormatter
-from ..core.work_effort.tracer import WorkEffortTracer
-from ..core.work_effort.indexer import WorkEffortIndexer
-from ..core.work_effort.manager_info import WorkEffortManagerInfo
-from ..core.work_effort.manager_config import WorkEffortManagerConfig
-from ..core.work_effort.manager_factory import WorkEffortManagerFactory
-from ..core.work_effort.manager_registry import WorkEffortManagerRegistry
-from ..core.work_effort.manager_loader import WorkEffortManagerLoader
-from ..core.work_effort.manager_validator import WorkEffortManagerValidator
-from ..core.work_effort.manager_parser import WorkEffortManagerParser
-from ..core.work_effort.manager_formatter import WorkEffortManagerFormatter
-from ..core.work_effort.manager_tracer import WorkEffortManagerTracer
-from ..core.work_effort.manager_indexer import WorkEffortManagerIndexer
+# Core components are imported on first use so that simple commands such as
+# --version or list do not pay for loading the whole work effort package.
+from ..core.work_effort import get_work_effort_manager_class
+
+if TYPE_CHECKING:
+    from ..core.work_effort.manager import WorkEffortManager
+
+def get_work_effort_service(work_efforts_dir: str, use_daemon: bool = True):
+    """
+    Return the work effort service for a directory.
+
+    When a ``code-conductor serve`` daemon is running for the directory this is a
+    thin client talking to it; otherwise the service runs in process.
+
+    Args:
+        work_efforts_dir: The directory containing work efforts
+        use_daemon: If False, never talk to a daemon
+
+    Returns:
+        DaemonClient or WorkEffortService
+    """
+    from .daemon import connect_service
+    return connect_service(work_efforts_dir, use_daemon=use_daemon)
 
 def validate_title(title: str) -> str:
     """
@@ -211,6 +218,7 @@ def create_or_update_config(base_dir=None, config_data=None):
     except Exception as e:
         logger.error(f"Error writing config file: {str(e)}")
         return None, None
+    get_config_resolver().invalidate(config_file)
 
     return config_file, merged_config
 
@@ -219,72 +227,20 @@ def find_nearest_config(start_dir=None):
     """
     Find the nearest _AI-Setup/config.json by walking up the directory tree
 
+    A .code-conductor manifest with a setup_path takes precedence. Lookups are
+    memoized by the shared resolver in code_conductor.config.
+
     Args:
         start_dir: Directory to start searching from (default: current directory)
 
     Returns:
         (config_file_path, config_data) or (None, None) if not found
     """
-    if start_dir is None:
-        start_dir = os.getcwd()
-
-    # Convert to absolute path
-    start_dir = os.path.abspath(start_dir)
-    original_start = start_dir
-
-    # First, try to find a .code-conductor project manifest file by walking up the directory tree
-    current_dir = start_dir
-    while current_dir:
-        manifest_file = os.path.join(current_dir, ".code-conductor")
-        if os.path.exists(manifest_file) and os.path.isfile(manifest_file):
-            try:
-                with open(manifest_file, 'r') as f:
-                    manifest_data = json.load(f)
-                    logger.info(f"Found project manifest file at: {manifest_file}")
-
-                    # If the manifest has a setup_path, use it to find the config.json
-                    if "setup_path" in manifest_data and os.path.exists(manifest_data["setup_path"]):
-                        config_file = os.path.join(manifest_data["setup_path"], "config.json")
-                        if os.path.exists(config_file):
-                            try:
-                                with open(config_file, 'r') as f:
-                                    config_data = json.load(f)
-                                    logger.info(f"Found config file via manifest at: {config_file}")
-                                    return config_file, config_data
-                            except Exception as e:
-                                logger.warning(f"Error reading config file referenced in manifest: {str(e)}")
-            except Exception as e:
-                logger.warning(f"Error reading manifest file: {str(e)}")
-
-        # Move up one directory
-        parent_dir = os.path.dirname(current_dir)
-        if parent_dir == current_dir:  # We've reached the root
-            break
-        current_dir = parent_dir
-
-    # If no manifest file found or it didn't lead to a valid config, fall back to the original behavior
-    # Walk up the directory tree looking for _AI-Setup/config.json
-    while start_dir:
-        config_file = os.path.join(start_dir, "_AI-Setup", "config.json")
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, 'r') as f:
-                    config_data = json.load(f)
-                    logger.info(f"Found config file at: {config_file}")
-                    return config_file, config_data
-            except json.JSONDecodeError:
-                logger.warning(f"Found config file but it's not valid JSON: {config_file}")
-            except Exception as e:
-                logger.warning(f"Error reading config file {config_file}: {str(e)}")
-
-        # Move up one directory
-        parent_dir = os.path.dirname(start_dir)
-        if parent_dir == start_dir:  # We've reached the root
-            break
-        start_dir = parent_dir
-
-    logger.info(f"No config file found in or above: {original_start}")
-    return None, None
+    config_file, config_data = _find_nearest_config(start_dir)
+    if not config_file:
+        logger.info(f"No config file found in or above: {os.path.abspath(start_dir or os.getcwd())}")
+        return None, None
+    return config_file, config_data
 
 # Function to add a new work effort manager
 def add_work_manager(target_dir=None, manager_name=None):
@@ -846,7 +802,17 @@ code-conductor list
     return work_efforts_dir, template_path, active_dir, completed_dir, archived_dir
 
 def create_template_if_missing(template_path):
-    """Copy the main template to the work efforts template directory if it doesn't exist"""
+    """
+    Copy the main template to the work efforts template directory if it doesn't exist.
+
+    Args:
+        template_path: Where the work effort template should be
+
+    Returns:
+        CompiledTemplate: The template, compiled once and cached until the file changes
+    """
+    from ..work_efforts.template_engine import load_template
+
     if not os.path.exists(template_path):
         # First check if we have a template in the project root
         source_template = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
@@ -905,6 +871,8 @@ tags: [feature, bugfix, refactor, documentation, testing, devops]
                 f.write(template_content)
             print(f"Created template file at: {template_path}")
 
+    return load_template(template_path)
+
 def create_directory_reference(command=None):
     """
     Create a local reference file in the current directory that points back to the project manifest.
@@ -1248,40 +1216,43 @@ async def create_work_effort(args: argparse.Namespace, manager: WorkEffortManage
         logger.error(f"Error creating work effort: {str(e)}")
         return 1
 
-async def select_work_effort(args: argparse.Namespace, manager: WorkEffortManager) -> int:
+async def select_work_effort(args: argparse.Namespace, service) -> int:
     """Select a work effort to work on.
 
+    Choices are printed as they are produced and honor the list filter, sort and
+    paging options; only their titles are kept for the selection prompt.
+
     Args:
         args: Command line arguments.
-        manager: Work effort manager instance.
+        service: Work effort service (daemon client or in-process).
 
     Returns:
         Exit code.
     """
     try:
-        # Get list of work efforts
-        work_efforts = manager.list_work_efforts()
-        if not work_efforts:
-            print("No work efforts found.")
-            return 1
-
         # Display work efforts
-        print("\nAvailable Work Efforts:")
-        print("======================")
-        for i, work_effort in enumerate(work_efforts, 1):
-            title = work_effort.get("title", "Untitled")
-            status = work_effort.get("status", "unknown")
-            assignee = work_effort.get("assignee", "unassigned")
+        titles = []
+        for i, work_effort in enumerate(service.iter_work_efforts(**listing_options(args)), 1):
+            if i == 1:
+                print("\nAvailable Work Efforts:")
+                print("======================")
+            title = work_effort["title"] or "Untitled"
+            status = work_effort["status"] or "unknown"
+            assignee = work_effort["assignee"] or "unassigned"
             print(f"{i}. {title} ({status}) - {assignee}")
+            titles.append(title)
+
+        if not titles:
+            print("No work efforts found.")
+            return 1
 
         # Get selection
         if args.interactive:
             try:
                 selection = input("\nSelect a work effort (number): ")
                 index = int(selection) - 1
-                if 0 <= index < len(work_efforts):
-                    selected = work_efforts[index]
-                    print(f"\nSelected: {selected.get('title', 'Untitled')}")
+                if 0 <= index < len(titles):
+                    print(f"\nSelected: {titles[index]}")
                     return 0
                 else:
                     print("Invalid selection.")
@@ -1297,10 +1268,9 @@ async def select_work_effort(args: argparse.Namespace, manager: WorkEffortManage
                 return 1
 
             # Find work effort by title
-            for work_effort in work_efforts:
-                if work_effort.get("title") == title:
-                    print(f"\nSelected: {title}")
-                    return 0
+            if title in titles:
+                print(f"\nSelected: {title}")
+                return 0
 
             print(f"Work effort not found: {title}")
             return 1
@@ -1385,8 +1355,11 @@ async def main() -> int:
             print("❌ Could not find work efforts directory. Run 'code-conductor setup' first.")
             return 1
 
-        # Create manager instance
-        manager = WorkEffortManager(project_dir=project_root)
+        # Create a manager instance only for the commands that need one
+        manager = None
+        if args.command in ("new-work-effort", "cc-index"):
+            WorkEffortManager = get_work_effort_manager_class()
+            manager = WorkEffortManager(project_dir=project_root)
 
         # Handle commands
         if args.command == "setup":
@@ -1406,14 +1379,31 @@ async def main() -> int:
             return set_default_manager(args)
 
         elif args.command == "update-status":
-            return await update_work_effort_status(args, manager)
+            service = get_work_effort_service(work_efforts_dir, use_daemon=not args.no_daemon)
+            return await update_work_effort_status(args, service)
 
         elif args.command == "list":
-            list_work_efforts(work_efforts_dir)
+            list_work_efforts(work_efforts_dir, use_daemon=not args.no_daemon,
+                              output_format=args.format, pager=args.pager, **listing_options(args))
             return 0
 
+        elif args.command == "search":
+            return search_work_efforts(args, work_efforts_dir)
+
+        elif args.command == "transition":
+            service = get_work_effort_service(work_efforts_dir, use_daemon=not args.no_daemon)
+            return transition_work_efforts(args, service)
+
+        elif args.command == "import":
+            return import_work_efforts(args, work_efforts_dir)
+
+        elif args.command == "serve":
+            from .daemon import serve
+            return serve(work_efforts_dir)
+
         elif args.command == "select":
-            return await select_work_effort(args, manager)
+            service = get_work_effort_service(work_efforts_dir, use_daemon=not args.no_daemon)
+            return await select_work_effort(args, service)
 
         elif args.command == "find-root":
             print(f"Project root: {project_root}")
@@ -1433,12 +1423,12 @@ async def main() -> int:
         logger.error(f"Error in main: {str(e)}")
         return 1
 
-async def update_work_effort_status(args, manager):
+async def update_work_effort_status(args, service):
     """Update the status of a work effort.
 
     Args:
         args: Command line arguments.
-        manager: WorkEffortManager instance.
+        service: Work effort service (daemon client or in-process).
 
     Returns:
         Exit code.
@@ -1456,11 +1446,8 @@ async def update_work_effort_status(args, manager):
             print("❌ No new status specified.")
             return 1
 
-        # Get all work efforts
-        work_efforts = manager.list_work_efforts()
-
-        # Find work effort by title
-        matching_efforts = [w for w in work_efforts if work_effort_title.lower() in w.get("metadata", {}).get("title", "").lower()]
+        # Find work effort by path, filename or title
+        matching_efforts = service.find(work_effort_title)
 
         if not matching_efforts:
             print(f"❌ No work effort found with title containing '{work_effort_title}'")
@@ -1472,7 +1459,7 @@ async def update_work_effort_status(args, manager):
             if args.interactive:
                 print("\nMultiple matching work efforts found:")
                 for i, effort in enumerate(matching_efforts, 1):
-                    print(f"{i}. {effort.get('metadata', {}).get('title')} (ID: {effort.get('id')})")
+                    print(f"{i}. {effort['title']} ({effort['path']})")
 
                 while True:
                     try:
@@ -1493,12 +1480,13 @@ async def update_work_effort_status(args, manager):
 
         # Update work effort status
         if work_effort:
-            if manager.update_status(work_effort.get("id"), new_status):
-                print(f"✅ Updated work effort status to: {new_status}")
-                return 0
-            else:
-                print("❌ Failed to update work effort status.")
+            try:
+                updated = service.update_status(work_effort["path"], new_status)
+            except ValueError as e:
+                print(f"❌ Failed to update work effort status: {e}")
                 return 1
+            print(f"✅ Updated work effort status to: {new_status} ({updated['path']})")
+            return 0
         else:
             print("❌ No work effort selected.")
             return 1
@@ -1507,43 +1495,167 @@ async def update_work_effort_status(args, manager):
         logger.error(f"Error updating work effort status: {str(e)}")
         return 1
 
-def list_work_efforts(work_efforts_dir: str) -> None:
-    """List all work efforts in the directory.
+def listing_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """Collect the filter, sort and paging options for list and select.
+
+    Args:
+        args: Command line arguments.
+
+    Returns:
+        Keyword arguments for iter_work_efforts.
+    """
+    return {
+        "status": args.status,
+        "assignee": args.assignee,
+        "tag": args.tag,
+        "sort_by": args.sort,
+        "reverse": args.reverse,
+        "offset": args.offset,
+        "limit": args.limit,
+    }
+
+def list_work_efforts(work_efforts_dir: str, use_daemon: bool = True, output_format: str = "text",
+                      pager: bool = False, **options) -> None:
+    """List work efforts in the directory.
+
+    Rows are printed as they come out of the listing pipeline, so the first one
+    appears before the rest of a large project has been read.
 
     Args:
         work_efforts_dir: The directory containing work efforts.
+        use_daemon: If False, never talk to a running daemon.
+        output_format: "text" for readable blocks, "jsonl" for one JSON object per line,
+            "table" for a streamed table.
+        pager: Page the table on a terminal.
+        **options: Filter, sort and paging options (see listing_options).
     """
     try:
-        # Create manager instance
-        manager = WorkEffortManager(os.path.dirname(work_efforts_dir))
-
-        # Get work efforts
-        work_efforts = manager.list_work_efforts()
+        service = get_work_effort_service(work_efforts_dir, use_daemon=use_daemon)
+        if output_format == "table":
+            from ..utils.table_renderer import render_table
 
-        # Format output
-        if not work_efforts:
-            print("\nNo work efforts found.")
+            if not render_table(service.iter_work_efforts(**options), pager=pager):
+                print("\nNo work efforts found.")
             return
 
-        print("\nWork Efforts:")
-        print("=============")
+        count = 0
+        for work_effort in service.iter_work_efforts(**options):
+            count += 1
+            if output_format == "jsonl":
+                print(json.dumps(work_effort, ensure_ascii=False), flush=True)
+                continue
 
-        for work_effort in work_efforts:
-            metadata = work_effort.get("metadata", {})
-            title = metadata.get("title", "Untitled")
-            status = metadata.get("status", "unknown")
-            assignee = metadata.get("assignee", "unassigned")
-            priority = metadata.get("priority", "none")
+            if count == 1:
+                print("\nWork Efforts:")
+                print("=============")
+            print(f"\n{work_effort['title'] or 'Untitled'}")
+            print(f"  Status: {work_effort['status'] or 'unknown'}")
+            print(f"  Assignee: {work_effort['assignee'] or 'unassigned'}")
+            print(f"  Priority: {work_effort['priority'] or 'none'}", flush=True)
 
-            print(f"\n{title}")
-            print(f"  Status: {status}")
-            print(f"  Assignee: {assignee}")
-            print(f"  Priority: {priority}")
+        if not count and output_format != "jsonl":
+            print("\nNo work efforts found.")
 
+    except BrokenPipeError:
+        # The reader (e.g. head) went away; stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
     except Exception as e:
         logger.error(f"Error listing work efforts: {str(e)}")
         print("\nError listing work efforts. Please check the logs for details.")
 
+def search_work_efforts(args: argparse.Namespace, work_efforts_dir: str) -> int:
+    """Search work efforts by filename and title.
+
+    Args:
+        args: Command line arguments.
+        work_efforts_dir: The directory containing work efforts.
+
+    Returns:
+        Exit code.
+    """
+    query = args.query or args.title
+    if not query:
+        print("❌ No search query specified. Use --query.")
+        return 1
+
+    service = get_work_effort_service(work_efforts_dir, use_daemon=not args.no_daemon)
+    results = service.search(query)
+    if not results:
+        print(f"\nNo work efforts matching '{query}'.")
+        return 0
+
+    for result in results:
+        print(f"{result['title']}  [{result['status']}]  {result['path']}")
+    return 0
+
+def transition_work_efforts(args: argparse.Namespace, service) -> int:
+    """Move every work effort matching a selector to a new status.
+
+    Args:
+        args: Command line arguments.
+        service: Work effort service (daemon client or in-process).
+
+    Returns:
+        Exit code (1 if the selector is invalid or any work effort failed to move).
+    """
+    if not args.where or not args.to:
+        print('❌ Specify a selector and a status, e.g. --where "status:completed updated<2025-01-01" --to archived')
+        return 1
+
+    try:
+        result = service.transition(args.where, args.to)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    if not args.quiet:
+        for record in result["moved"]:
+            print(f"  {record['path']}")
+    for rel_path, message in result["errors"]:
+        print(f"❌ {rel_path}: {message}")
+    print(f"✅ Moved {len(result['moved'])} work efforts to {args.to}")
+    return 1 if result["errors"] else 0
+
+def import_work_efforts(args: argparse.Namespace, work_efforts_dir: str) -> int:
+    """Create work efforts from a JSON Lines file.
+
+    Every line is imported on its own; lines that fail are reported and the rest
+    of the file is still imported.
+
+    Args:
+        args: Command line arguments.
+        work_efforts_dir: The directory containing work efforts.
+
+    Returns:
+        Exit code (1 if any line failed).
+    """
+    from ..work_efforts.bulk_import import import_work_efforts as run_import
+
+    if not args.jsonl:
+        print("❌ No input specified. Use --jsonl FILE (or - for stdin).")
+        return 1
+    if args.template and not os.path.isfile(args.template):
+        print(f"❌ Template not found: {args.template}")
+        return 1
+
+    try:
+        if args.jsonl == "-":
+            report = run_import(work_efforts_dir, sys.stdin, workers=args.workers, template_path=args.template)
+        else:
+            with open(args.jsonl, "r", encoding="utf-8") as f:
+                report = run_import(work_efforts_dir, f, workers=args.workers, template_path=args.template)
+    except OSError as e:
+        print(f"❌ Could not read {args.jsonl}: {e}")
+        return 1
+
+    if not args.quiet:
+        for rel_path in report["created"]:
+            print(f"  {rel_path}")
+    for line_number, message in report["errors"]:
+        print(f"❌ Line {line_number}: {message}")
+    print(f"✅ Imported {len(report['created'])} work efforts ({len(report['errors'])} failed)")
+    return 1 if report["errors"] else 0
+
 def find_project_root() -> Optional[str]:
     """Find the root directory of the Code Conductor project.
 
@@ -1592,6 +1704,21 @@ def parse_arguments():
     parser.add_argument("--manager-name", help="Name for work effort manager")
     parser.add_argument("--target-dir", help="Target directory for work effort manager")
     parser.add_argument("-q", "--quiet", action="store_true", help="Quiet mode (minimal output)")
+    parser.add_argument("--query", help="Text to look for with the search command")
+    parser.add_argument("--status", choices=["active", "completed", "archived", "paused"], help="Only list work efforts with this status")
+    parser.add_argument("--tag", help="Only list work efforts with this tag")
+    parser.add_argument("--sort", choices=["created", "title", "priority", "status", "assignee"], default="created", help="Sort order for list and select (default: newest first)")
+    parser.add_argument("--reverse", action="store_true", help="Reverse the sort order")
+    parser.add_argument("--limit", type=int, help="Maximum number of work efforts to list")
+    parser.add_argument("--offset", type=int, default=0, help="Number of work efforts to skip")
+    parser.add_argument("--format", choices=["text", "jsonl", "table"], default="text", help="Output format for list")
+    parser.add_argument("--pager", action="store_true", help="Page the list table on a terminal")
+    parser.add_argument("--where", help="Selector for the transition command, e.g. \"status:completed updated<2025-01-01\"")
+    parser.add_argument("--to", choices=["active", "completed", "archived", "paused"], help="Target status for the transition command")
+    parser.add_argument("--jsonl", help="JSON Lines file of work efforts for the import command ('-' for stdin)")
+    parser.add_argument("--template", help="Markdown template with {{placeholders}} used by the import command")
+    parser.add_argument("--workers", type=int, default=4, help="Worker threads used by the import command")
+    parser.add_argument("--no-daemon", action="store_true", help="Run in process even if 'code-conductor serve' is running")
     parser.add_argument("command", nargs="?", help="Command to execute")
     return parser.parse_args()
 
@@ -1641,19 +1768,8 @@ def find_work_efforts_dir(start_dir=None):
                 if os.path.exists(work_efforts_dir):
                     return work_efforts_dir
 
-    # Fall back to looking for _AI-Setup/work_efforts
-    while start_dir:
-        work_efforts_dir = os.path.join(start_dir, "_AI-Setup", "work_efforts")
-        if os.path.exists(work_efforts_dir):
-            return work_efforts_dir
-
-        # Move up one directory
-        parent_dir = os.path.dirname(start_dir)
-        if parent_dir == start_dir:  # We've reached the root
-            break
-        start_dir = parent_dir
-
-    return None
+    # Fall back to the nearest _AI-Setup/work_efforts, found by the same resolver walk
+    return get_config_resolver().resolve(start_dir)["work_efforts_dir"]
 
 async def create_work_manager(args: argparse.Namespace) -> int:
     """Create a new work effort manager."""
@@ -1670,6 +1786,7 @@ async def create_work_manager(args: argparse.Namespace) -> int:
         logger.info(f"Created target directory: {target_dir}")
 
         # Create manager
+        WorkEffortManager = get_work_effort_manager_class()
         manager = WorkEffortManager(project_dir=project_root, config={"work_efforts_dir": target_dir})
         manager.create_new_manager(args.manager_name, target_dir)
         logger.info(f"✅ Created work manager: {args.manager_name}")
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Code Conductor Daemon
+
+``code-conductor serve`` keeps a ``WorkEffortService`` (the retrieval index, the
+relationship graph and a file watcher) alive and answers JSON-RPC 2.0 requests
+over a Unix domain socket, one JSON object per line.
+
+The socket lives next to the indexes (``.code_conductor.sock`` in the work
+efforts directory, or a hashed name in the temp directory when that path is too
+long for a socket address), so every client finds the daemon for its own work
+efforts directory.
+
+``connect_service()`` is what the CLI calls: it returns a ``DaemonClient`` when a
+daemon is listening and an in-process ``WorkEffortService`` otherwise. Both expose
+the same methods, so commands work the same way with or without the daemon.
+"""
+
+import os
+import json
+import socket
+import inspect
+import hashlib
+import logging
+import tempfile
+import threading
+import socketserver
+
+try:
+    from ..work_efforts.work_effort_service import WorkEffortService
+except ImportError:
+    import sys
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'work_efforts'))
+    from work_effort_service import WorkEffortService
+
+logger = logging.getLogger(__name__)
+
+# Constants
+SOCKET_FILENAME = '.code_conductor.sock'
+MAX_SOCKET_PATH_BYTES = 100
+CONNECT_TIMEOUT = 0.2
+REQUEST_TIMEOUT = 30.0
+WATCH_INTERVAL = 1.0
+PAGE_SIZE = 200
+RPC_METHODS = {
+    'list': 'list_work_efforts',
+    'search': 'search',
+    'find': 'find',
+    'related': 'related',
+    'update_status': 'update_status',
+    'transition': 'transition',
+    'refresh': 'refresh',
+}
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon reports an error or cannot be reached mid-request."""
+
+
+def daemon_available():
+    """Return True if this platform supports the Unix domain socket daemon."""
+    return hasattr(socket, 'AF_UNIX')
+
+
+def socket_path_for(work_efforts_dir):
+    """
+    Return the socket path of the daemon serving a work efforts directory.
+
+    Args:
+        work_efforts_dir: Directory containing the status subdirectories
+
+    Returns:
+        str: Socket path
+    """
+    work_efforts_dir = os.path.abspath(work_efforts_dir)
+    path = os.path.join(work_efforts_dir, SOCKET_FILENAME)
+    if len(path.encode('utf-8')) < MAX_SOCKET_PATH_BYTES:
+        return path
+    digest = hashlib.sha1(work_efforts_dir.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"code-conductor-{digest}.sock")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answer newline-delimited JSON-RPC requests on one connection."""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.daemon.handle_line(line)
+            if response is None:
+                continue
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server that knows its daemon."""
+
+    daemon_threads = True
+
+
+class WorkEffortDaemon:
+    """
+    Serve a WorkEffortService over a Unix domain socket.
+    """
+
+    def __init__(self, work_efforts_dir, socket_path=None, watch_interval=WATCH_INTERVAL):
+        """
+        Initialize the daemon and load the indexes.
+
+        Args:
+            work_efforts_dir: Directory containing the status subdirectories
+            socket_path: Socket to listen on (default: socket_path_for(work_efforts_dir))
+            watch_interval: Seconds between background refreshes (0 disables the watcher)
+        """
+        self.work_efforts_dir = os.path.abspath(work_efforts_dir)
+        self.socket_path = socket_path or socket_path_for(self.work_efforts_dir)
+        self.watch_interval = watch_interval
+        self.service = WorkEffortService(self.work_efforts_dir)
+        self.requests_served = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._server = None
+        self._watcher = None
+
+    def handle_line(self, line):
+        """
+        Decode one request line and return its response.
+
+        Args:
+            line: Raw JSON-RPC request
+
+        Returns:
+            dict: JSON-RPC response, or None for a notification
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return self._error(None, PARSE_ERROR, f"Parse error: {e}")
+        return self.handle_request(request)
+
+    def handle_request(self, request):
+        """
+        Run one JSON-RPC request against the service.
+
+        Args:
+            request: Decoded JSON-RPC request
+
+        Returns:
+            dict: JSON-RPC response, or None for a notification
+        """
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return self._error(None, INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get('id')
+        method = request['method']
+        params = request.get('params') or {}
+        if not isinstance(params, dict):
+            return self._error(request_id, INVALID_PARAMS, "Params must be an object")
+
+        try:
+            if method == 'ping':
+                result = {'work_efforts_dir': self.work_efforts_dir, 'pid': os.getpid(),
+                          'requests_served': self.requests_served}
+            elif method == 'shutdown':
+                threading.Thread(target=self.shutdown, daemon=True).start()
+                result = True
+            elif method in RPC_METHODS:
+                handler = getattr(self.service, RPC_METHODS[method])
+                try:
+                    inspect.signature(handler).bind(**params)
+                except TypeError as e:
+                    return self._error(request_id, INVALID_PARAMS, str(e))
+                with self._lock:
+                    result = handler(**params)
+            else:
+                return self._error(request_id, METHOD_NOT_FOUND, f"Method not found: {method}")
+        except Exception as e:
+            # Errors raised by the method itself, whatever their type, are server errors
+            logger.error(f"Error handling {method}: {e}")
+            return self._error(request_id, SERVER_ERROR, str(e), {'type': type(e).__name__})
+
+        self.requests_served += 1
+        if request_id is None:
+            return None
+        return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+
+    @staticmethod
+    def _error(request_id, code, message, data=None):
+        """Build a JSON-RPC error response."""
+        error = {'code': code, 'message': message}
+        if data is not None:
+            error['data'] = data
+        return {'jsonrpc': '2.0', 'id': request_id, 'error': error}
+
+    def _watch(self):
+        """Refresh the indexes until the daemon stops, so edits inside files are seen."""
+        while not self._stopped.wait(self.watch_interval):
+            try:
+                with self._lock:
+                    changed = self.service.refresh()
+                if changed:
+                    logger.info(f"Watcher refreshed {changed} work efforts")
+            except Exception as e:
+                logger.error(f"Watcher refresh failed: {e}")
+
+    def _remove_stale_socket(self):
+        """Remove a leftover socket file, refusing if a daemon still answers on it."""
+        if not os.path.exists(self.socket_path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        probe.settimeout(CONNECT_TIMEOUT)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            os.remove(self.socket_path)
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"A daemon is already serving {self.work_efforts_dir} on {self.socket_path}")
+
+    def start(self):
+        """Bind the socket and start the watcher thread without blocking."""
+        if not daemon_available():
+            raise RuntimeError("The daemon needs Unix domain socket support")
+        self._remove_stale_socket()
+        self._server = _UnixServer(self.socket_path, _RequestHandler)
+        self._server.daemon = self
+        os.chmod(self.socket_path, 0o600)
+        if self.watch_interval:
+            self._watcher = threading.Thread(target=self._watch, name='code-conductor-watcher', daemon=True)
+            self._watcher.start()
+        logger.info(f"Serving {self.work_efforts_dir} on {self.socket_path}")
+
+    def serve_forever(self):
+        """Start the daemon if needed and serve until shutdown() is called."""
+        if self._server is None:
+            self.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self.close()
+
+    def shutdown(self):
+        """Stop serving; serve_forever() returns once the current request is done."""
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+
+    def close(self):
+        """Release the socket and stop the watcher."""
+        self._stopped.set()
+        if self._server is not None:
+            self._server.server_close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+class DaemonClient:
+    """
+    Thin client with the same methods as WorkEffortService.
+    """
+
+    def __init__(self, socket_path, timeout=REQUEST_TIMEOUT):
+        """
+        Connect to a running daemon.
+
+        Args:
+            socket_path: Socket the daemon listens on
+            timeout: Seconds to wait for a response
+
+        Raises:
+            OSError: If no daemon is listening
+        """
+        self.socket_path = socket_path
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(CONNECT_TIMEOUT)
+        try:
+            self._socket.connect(socket_path)
+        except OSError:
+            self._socket.close()
+            raise
+        self._socket.settimeout(timeout)
+        self._reader = self._socket.makefile('rb')
+        self._next_id = 0
+
+    def call(self, method, **params):
+        """
+        Send a request and wait for its result.
+
+        Args:
+            method: RPC method name
+            **params: Method parameters
+
+        Returns:
+            The method result
+
+        Raises:
+            TypeError: If the parameters do not match the method's signature
+            ValueError: If the method raised ValueError, as the in-process service would
+            DaemonError: For any other daemon or connection error
+        """
+        self._next_id += 1
+        request = {'jsonrpc': '2.0', 'id': self._next_id, 'method': method, 'params': params}
+        try:
+            self._socket.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            line = self._reader.readline()
+        except OSError as e:
+            raise DaemonError(f"Lost connection to daemon: {e}") from e
+        if not line:
+            raise DaemonError("Daemon closed the connection")
+
+        response = json.loads(line)
+        error = response.get('error')
+        if error:
+            if error.get('code') == INVALID_PARAMS:
+                raise TypeError(error.get('message'))
+            if (error.get('data') or {}).get('type') == 'ValueError':
+                raise ValueError(error.get('message'))
+            raise DaemonError(error.get('message'))
+        return response.get('result')
+
+    def close(self):
+        """Close the connection."""
+        self._reader.close()
+        self._socket.close()
+
+    def ping(self):
+        """Return the daemon's status."""
+        return self.call('ping')
+
+    def list_work_efforts(self, status=None, assignee=None, tag=None, sort_by='created',
+                          reverse=False, offset=0, limit=None):
+        """See WorkEffortService.list_work_efforts; filtering, sorting and paging run in the daemon."""
+        return self.call('list', status=status, assignee=assignee, tag=tag, sort_by=sort_by,
+                         reverse=reverse, offset=offset, limit=limit)
+
+    def iter_work_efforts(self, status=None, assignee=None, tag=None, sort_by='created',
+                          reverse=False, offset=0, limit=None):
+        """
+        See WorkEffortService.iter_work_efforts.
+
+        Records are fetched PAGE_SIZE at a time, so the first rows arrive before
+        the rest of a large listing has been produced.
+        """
+        remaining = limit
+        while remaining is None or remaining > 0:
+            count = PAGE_SIZE if remaining is None else min(PAGE_SIZE, remaining)
+            page = self.list_work_efforts(status=status, assignee=assignee, tag=tag, sort_by=sort_by,
+                                          reverse=reverse, offset=offset, limit=count)
+            yield from page
+            if len(page) < count:
+                return
+            offset += count
+            if remaining is not None:
+                remaining -= count
+
+    def search(self, query, limit=10):
+        """See WorkEffortService.search."""
+        return self.call('search', query=query, limit=limit)
+
+    def find(self, name):
+        """See WorkEffortService.find."""
+        return self.call('find', name=name)
+
+    def related(self, rel_path):
+        """See WorkEffortService.related."""
+        return self.call('related', rel_path=rel_path)
+
+    def update_status(self, rel_path, new_status):
+        """See WorkEffortService.update_status."""
+        return self.call('update_status', rel_path=rel_path, new_status=new_status)
+
+    def transition(self, selector, new_status):
+        """See WorkEffortService.transition."""
+        return self.call('transition', selector=selector, new_status=new_status)
+
+    def refresh(self):
+        """See WorkEffortService.refresh."""
+        return self.call('refresh')
+
+
+def connect_service(work_efforts_dir, use_daemon=True):
+    """
+    Return a client for the running daemon, or an in-process service.
+
+    Args:
+        work_efforts_dir: Directory containing the status subdirectories
+        use_daemon: If False, always run in process
+
+    Returns:
+        DaemonClient or WorkEffortService: Object exposing the service methods
+    """
+    if use_daemon and daemon_available():
+        try:
+            return DaemonClient(socket_path_for(work_efforts_dir))
+        except OSError:
+            logger.debug("No daemon running, using the in-process service")
+    return WorkEffortService(work_efforts_dir)
+
+
+def serve(work_efforts_dir, watch_interval=WATCH_INTERVAL):
+    """
+    Run the daemon in the foreground until interrupted.
+
+    Args:
+        work_efforts_dir: Directory containing the status subdirectories
+        watch_interval: Seconds between background refreshes
+
+    Returns:
+        int: Exit code
+    """
+    import signal
+
+    try:
+        daemon = WorkEffortDaemon(work_efforts_dir, watch_interval=watch_interval)
+        daemon.start()
+    except (OSError, RuntimeError) as e:
+        print(f"❌ Could not start daemon: {e}")
+        return 1
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=daemon.shutdown).start())
+    print(f"✅ Serving {daemon.work_efforts_dir} on {daemon.socket_path} (Ctrl+C to stop)")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -3,10 +3,20 @@
 Config module for code_conductor package.
 
 This module provides compatibility for tests by implementing basic JSON config handling.
+
+Config discovery goes through a process-wide ``ConfigResolver``. It walks from
+the start directory to the filesystem root once, checking each ancestor for a
+``.code-conductor`` manifest, an ``_AI-Setup/config.json`` and an
+``_AI-Setup/work_efforts`` directory in the same pass, and caches the answer and
+the parsed JSON. A cached answer is reused as long as a stat of every file it
+looked at still matches, so repeated lookups within one command open no files.
 """
 
 import os
+import copy
 import json
+import stat
+import threading
 from typing import Dict, Any, Optional, Tuple
 import logging
 from datetime import datetime
@@ -14,6 +24,162 @@ from datetime import datetime
 # Version used in config files
 VERSION = "0.4.6"
 
+# Config discovery file names
+MANIFEST_FILENAME = ".code-conductor"
+AI_SETUP_DIRNAME = "_AI-Setup"
+CONFIG_FILENAME = "config.json"
+
+
+class ConfigResolver:
+    """
+    Memoized lookup of the nearest project config.
+
+    Resolutions are keyed by start directory and validated by stat; parsed config
+    files are keyed by path and validated by mtime and size. ``counters`` records
+    how many walks, cache hits, JSON parses and stat calls were made.
+    """
+
+    def __init__(self):
+        """Initialize an empty resolver."""
+        self._resolutions = {}
+        self._parsed = {}
+        self._lock = threading.RLock()
+        self.counters = {"walks": 0, "hits": 0, "parses": 0, "stats": 0}
+
+    def reset(self) -> None:
+        """Drop every cached resolution and parsed file and zero the counters."""
+        with self._lock:
+            self._resolutions.clear()
+            self._parsed.clear()
+            for key in self.counters:
+                self.counters[key] = 0
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Forget cached resolutions after a config file was written.
+
+        Args:
+            path: Config file that changed; its parsed data is dropped as well
+        """
+        with self._lock:
+            self._resolutions.clear()
+            if path:
+                self._parsed.pop(os.path.abspath(path), None)
+
+    def _stat_key(self, path: str):
+        """Return a comparable fingerprint of a path, or None if it does not exist."""
+        self.counters["stats"] += 1
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if stat.S_ISDIR(st.st_mode):
+            return ("dir",)
+        return ("file", st.st_mtime_ns, st.st_size)
+
+    def load(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the parsed JSON of a file, parsing it only when it changed.
+
+        Args:
+            path: Path of the JSON file
+
+        Returns:
+            The parsed data, or None if the file is missing or not valid JSON
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            key = self._stat_key(path)
+            if key is None or key[0] != "file":
+                return None
+            cached = self._parsed.get(path)
+            if cached and cached[0] == key:
+                return cached[1]
+
+            self.counters["parses"] += 1
+            try:
+                with open(path, "r") as f:
+                    data = json.load(f)
+            except Exception as e:
+                logging.warning(f"Could not read config file {path}: {str(e)}")
+                data = None
+            self._parsed[path] = (key, data)
+            return data
+
+    def _walk(self, start_dir: str) -> Dict[str, Any]:
+        """Resolve the config for start_dir with one pass over its ancestors."""
+        self.counters["walks"] += 1
+        signature = {}
+        manifest_config = None
+        setup_config = None
+        work_efforts_dir = None
+
+        current_dir = start_dir
+        while True:
+            manifest_file = os.path.join(current_dir, MANIFEST_FILENAME)
+            signature[manifest_file] = self._stat_key(manifest_file)
+            if manifest_config is None and signature[manifest_file] and signature[manifest_file][0] == "file":
+                manifest_data = self.load(manifest_file)
+                if isinstance(manifest_data, dict) and "setup_path" in manifest_data:
+                    logging.info(f"Found project manifest file at: {manifest_file}")
+                    candidate = os.path.join(current_dir, manifest_data["setup_path"], CONFIG_FILENAME)
+                    signature[candidate] = self._stat_key(candidate)
+                    if signature[candidate] and self.load(candidate) is not None:
+                        manifest_config = candidate
+
+            ai_setup_dir = os.path.join(current_dir, AI_SETUP_DIRNAME)
+            config_file = os.path.join(ai_setup_dir, CONFIG_FILENAME)
+            signature[config_file] = self._stat_key(config_file)
+            if setup_config is None and signature[config_file] and self.load(config_file) is not None:
+                setup_config = config_file
+
+            candidate_dir = os.path.join(ai_setup_dir, "work_efforts")
+            signature[candidate_dir] = self._stat_key(candidate_dir)
+            if work_efforts_dir is None and signature[candidate_dir] == ("dir",):
+                work_efforts_dir = candidate_dir
+
+            parent_dir = os.path.dirname(current_dir)
+            if parent_dir == current_dir:  # Reached the root directory
+                break
+            current_dir = parent_dir
+
+        config_file = manifest_config or setup_config
+        if config_file:
+            logging.info(f"Found config file at: {config_file}")
+        return {"config_file": config_file, "work_efforts_dir": work_efforts_dir, "signature": signature}
+
+    def resolve(self, start_dir: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Resolve the nearest config and _AI-Setup/work_efforts for a directory.
+
+        A manifest anywhere above start_dir that leads to a readable config wins
+        over an _AI-Setup/config.json, and nearer files win over farther ones.
+
+        Args:
+            start_dir: Starting directory (default: current directory)
+
+        Returns:
+            Dict with 'config_file' and 'work_efforts_dir' (either may be None)
+        """
+        start_dir = os.path.abspath(start_dir or os.getcwd())
+        with self._lock:
+            resolution = self._resolutions.get(start_dir)
+            if resolution and all(self._stat_key(path) == key for path, key in resolution["signature"].items()):
+                self.counters["hits"] += 1
+                return resolution
+
+            resolution = self._walk(start_dir)
+            self._resolutions[start_dir] = resolution
+            return resolution
+
+
+_resolver = ConfigResolver()
+
+
+def get_config_resolver() -> ConfigResolver:
+    """Return the process-wide config resolver."""
+    return _resolver
+
 def parse_json(json_str: str) -> Dict[str, Any]:
     """
     Parse a JSON string into a Python dictionary.
@@ -78,6 +244,7 @@ def save_json_file(file_path: str, data: Dict[str, Any]) -> bool:
 
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2)
+        _resolver.invalidate(file_path)
         return True
     except Exception as e:
         logging.error(f"Error saving JSON file: {e}")
@@ -173,6 +340,7 @@ def create_or_update_config(base_dir: str, config_data: Optional[Dict[str, Any]]
             logging.info(f"Wrote config to: {config_file}")
     except Exception as e:
         logging.error(f"Error saving config file: {str(e)}")
+    _resolver.invalidate(config_file)
 
     return config_file, merged_config
 
@@ -186,63 +354,12 @@ def find_nearest_config(start_dir: Optional[str] = None) -> Tuple[Optional[str],
     Returns:
         Tuple of (config_file_path, config_data) or (None, {}) if not found
     """
-    if start_dir is None:
-        start_dir = os.getcwd()
-
-    current_dir = os.path.abspath(start_dir)
-
-    # First try to find a .code-conductor manifest file
-    while current_dir:
-        manifest_file = os.path.join(current_dir, ".code-conductor")
-        if os.path.exists(manifest_file):
-            try:
-                with open(manifest_file, 'r') as f:
-                    manifest_data = json.load(f)
-                    logging.info(f"Found project manifest file at: {manifest_file}")
-
-                    # If the manifest has a setup_path, use it to find the config.json
-                    if "setup_path" in manifest_data:
-                        setup_path = os.path.join(current_dir, manifest_data["setup_path"])
-                        config_file = os.path.join(setup_path, "config.json")
-                        if os.path.exists(config_file):
-                            try:
-                                with open(config_file, 'r') as f:
-                                    config_data = json.load(f)
-                                    logging.info(f"Found config file via manifest at: {config_file}")
-                                    return config_file, config_data
-                            except Exception as e:
-                                logging.warning(f"Error reading config file referenced in manifest: {str(e)}")
-            except Exception as e:
-                logging.warning(f"Error reading manifest file: {str(e)}")
-
-        # Move up one directory
-        parent_dir = os.path.dirname(current_dir)
-        if parent_dir == current_dir:  # Reached the root directory
-            break
-        current_dir = parent_dir
-
-    # If no manifest found or it didn't lead to a valid config, fall back to looking for _AI-Setup/config.json
-    current_dir = os.path.abspath(start_dir)
-    while current_dir:
-        ai_setup_dir = os.path.join(current_dir, "_AI-Setup")
-        config_file = os.path.join(ai_setup_dir, "config.json")
-
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, 'r') as f:
-                    config_data = json.load(f)
-                    logging.info(f"Found config file at: {config_file}")
-                    return config_file, config_data
-            except Exception as e:
-                logging.warning(f"Found config file at {config_file} but could not read it: {str(e)}")
-
-        # Move up one directory
-        parent_dir = os.path.dirname(current_dir)
-        if parent_dir == current_dir:  # Reached the root directory
-            break
-        current_dir = parent_dir
-
-    return None, {}
+    config_file = _resolver.resolve(start_dir)["config_file"]
+    config_data = _resolver.load(config_file) if config_file else None
+    if config_data is None:
+        return None, {}
+    # Callers may modify the returned data, so never hand out the cached dict
+    return config_file, copy.deepcopy(config_data)
 
 def find_work_efforts_directory(start_dir: Optional[str] = None) -> Tuple[str, bool]:
     """
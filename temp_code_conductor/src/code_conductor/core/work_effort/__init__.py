@@ -0,0 +1,18 @@
+"""
+Work Effort Core
+
+The work effort manager pulls in its formatting and parsing dependencies (rich,
+tabulate, yaml), so command-line entry points get the class through
+``get_work_effort_manager_class()`` and only load it once a command needs it.
+"""
+
+
+def get_work_effort_manager_class():
+    """
+    Import and return the WorkEffortManager class.
+
+    Returns:
+        type: The WorkEffortManager class
+    """
+    from .manager import WorkEffortManager
+    return WorkEffortManager
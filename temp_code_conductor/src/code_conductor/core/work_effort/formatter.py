@@ -3,8 +3,26 @@ from datetime import datetime
 import json
 from tabulate import tabulate
 from rich.console import Console
-from rich.table import Table
-from rich.text import Text
+
+from ...utils.table_renderer import TableRenderer, Column, use_color
+
+# Constants
+TABLE_COLUMNS = [
+    Column("Title", "title", "Untitled"),
+    Column("Status", "status", "Not started", styles={
+        "not_started": "\033[31m",
+        "in_progress": "\033[33m",
+        "completed": "\033[32m",
+        "blocked": "\033[31m"
+    }),
+    Column("Priority", "priority", "Medium", styles={
+        "high": "\033[31m",
+        "medium": "\033[33m",
+        "low": "\033[32m"
+    }),
+    Column("Assignee", "assignee", "Unassigned"),
+    Column("Due Date", "due_date", "Not set"),
+]
 
 class WorkEffortFormatter:
     """Formatter for work effort data for display."""
@@ -28,6 +46,11 @@ class WorkEffortFormatter:
         if not work_efforts:
             return "No work efforts found."
 
+        if format_type == "simple":
+            # Sized from a sample of rows instead of measuring every cell
+            renderer = TableRenderer(TABLE_COLUMNS)
+            return "\n".join(renderer.iter_lines(self._display_rows(work_efforts)))
+
         headers = ["Title", "Status", "Priority", "Assignee", "Due Date"]
         rows = []
 
@@ -42,45 +65,21 @@ class WorkEffortFormatter:
 
         return tabulate(rows, headers=headers, tablefmt=format_type)
 
+    def _display_rows(self, work_efforts):
+        """Yield work efforts with their due dates formatted for display."""
+        for we in work_efforts:
+            yield dict(we, due_date=self.format_date(we.get("due_date")))
+
     def format_rich_table(self, work_efforts: List[Dict[str, Any]]) -> None:
         """Format work efforts as a rich table with colors."""
         if not work_efforts:
             self.console.print("No work efforts found.")
             return
 
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Title")
-        table.add_column("Status")
-        table.add_column("Priority")
-        table.add_column("Assignee")
-        table.add_column("Due Date")
-
-        status_colors = {
-            "not_started": "red",
-            "in_progress": "yellow",
-            "completed": "green",
-            "blocked": "red"
-        }
-
-        priority_colors = {
-            "high": "red",
-            "medium": "yellow",
-            "low": "green"
-        }
-
-        for we in work_efforts:
-            status = we.get("status", "not_started").lower()
-            priority = we.get("priority", "medium").lower()
-
-            table.add_row(
-                we.get("title", "Untitled"),
-                Text(status, style=status_colors.get(status, "white")),
-                Text(priority, style=priority_colors.get(priority, "white")),
-                we.get("assignee", "Unassigned"),
-                self.format_date(we.get("due_date"))
-            )
-
-        self.console.print(table)
+        # Rows are streamed to the console in chunks instead of building a rich table
+        stream = self.console.file
+        renderer = TableRenderer(TABLE_COLUMNS, color=use_color(stream))
+        renderer.write(self._display_rows(work_efforts), stream)
 
     def format_json(self, work_efforts: List[Dict[str, Any]], indent: int = 2) -> str:
         """Format work efforts as JSON."""
@@ -22,6 +22,7 @@ from typing import Dict, List, Optional, Callable, Any, Union, IO, Tuple
 from pathlib import Path
 
 from ...work_efforts.counter import WorkEffortCounter, get_counter, format_work_effort_filename
+from ...work_efforts.frontmatter import patch_frontmatter
 from ...events import EventEmitter, Event
 from .manager_indexer import WorkEffortManagerIndexer
 from .manager_validator import WorkEffortManagerValidator
@@ -283,7 +284,8 @@ class WorkEffortManager:
                 return False
 
             # Get old and new file paths
-            old_status = work_effort.get("metadata", {}).get("status", "active")  # Default to active if not found
+            metadata = work_effort.get("metadata", {})
+            old_status = metadata.get("status", work_effort.get("status", "active"))  # Default to active if not found
 
             # Get old and new directories
             status_dirs = {
@@ -306,28 +308,16 @@ class WorkEffortManager:
             if not os.path.exists(old_file):
                 return False
 
-            # Update work effort data
-            if "metadata" not in work_effort:
-                work_effort["metadata"] = {}
-            work_effort["metadata"]["status"] = new_status
-            work_effort["metadata"]["updated_at"] = datetime.now().isoformat()
-
-            # Format and write updated content
-            content = self.formatter.format_work_effort(work_effort)
-
-            # Create new directory if it doesn't exist
+            # Patch only the changed frontmatter keys and move the file in one rename
+            updated_at = datetime.now().isoformat()
             os.makedirs(os.path.dirname(new_file), exist_ok=True)
+            patch_frontmatter(old_file, {"status": new_status, "updated_at": updated_at}, target_path=new_file)
 
-            # Write updated content to new file
-            with open(new_file, "w") as f:
-                f.write(content)
-
-            # Remove old file if it exists and is different from new file
-            if old_file != new_file and os.path.exists(old_file):
-                os.remove(old_file)
-
-            # Update index
-            self.index_all_work_efforts()
+            # Re-index this work effort instead of every work effort
+            self.indexer.index_work_effort(work_effort_id, {
+                **work_effort, **metadata,
+                "status": new_status, "updated_at": updated_at, "file_path": new_file,
+            })
 
             return True
 
@@ -587,17 +577,9 @@ class WorkEffortManager:
             if not file_path:
                 return False
 
-            # Read content
-            with open(file_path, "r") as f:
-                content = f.read()
-
-            # Update status in content
-            old_status = work_effort.get("metadata", {}).get("status", "active")
-            content = content.replace(f'status: "{old_status}"', f'status: "{new_status}"')
-
-            # Write updated content
-            with open(file_path, "w") as f:
-                f.write(content)
+            # Update the status key in the frontmatter only
+            patch_frontmatter(file_path, {"status": new_status})
+            work_effort["metadata"]["status"] = new_status
 
             return True
         except Exception as e:
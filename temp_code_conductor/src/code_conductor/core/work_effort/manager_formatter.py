@@ -8,6 +8,8 @@ from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
+from ...utils.table_renderer import TableRenderer, WORK_EFFORT_COLUMNS
+
 class WorkEffortManagerFormatter:
     """Formatter for work effort manager data."""
 
@@ -180,24 +182,10 @@ class WorkEffortManagerFormatter:
                 return json.dumps(work_efforts, indent=2)
 
             if format_type == 'table':
-                table = Table(show_header=True, header_style="bold magenta")
-                table.add_column("Title")
-                table.add_column("Status")
-                table.add_column("Priority")
-                table.add_column("Assignee")
-                table.add_column("Due Date")
-
-                for work_effort in work_efforts:
-                    metadata = work_effort.get('metadata', {})
-                    table.add_row(
-                        metadata.get('title', 'Untitled'),
-                        metadata.get('status', 'unknown'),
-                        metadata.get('priority', 'medium'),
-                        metadata.get('assignee', 'unassigned'),
-                        metadata.get('due_date', 'not set')
-                    )
-
-                return self.console.render_str(table)
+                # Sized from a sample of rows instead of measuring every cell
+                renderer = TableRenderer(WORK_EFFORT_COLUMNS)
+                rows = (work_effort.get('metadata', {}) for work_effort in work_efforts)
+                return "\n".join(renderer.iter_lines(rows))
 
             # Default to simple text format
             formatted = ""
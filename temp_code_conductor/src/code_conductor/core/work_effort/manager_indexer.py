@@ -4,6 +4,8 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
+from ...work_efforts.frontmatter import parse_document
+
 class WorkEffortManagerIndexer:
     """Indexes work efforts in a directory."""
 
@@ -112,9 +114,9 @@ class WorkEffortManagerIndexer:
             A dictionary containing the extracted metadata.
         """
         try:
-            # Split content into frontmatter and body
-            parts = content.split("---", 2)
-            if len(parts) != 3:
+            # Parse the frontmatter with the shared document parser
+            fields = parse_document(content, sections=False).fields
+            if not fields:
                 self.logger.debug("No frontmatter found in content")
                 # Create default metadata if no frontmatter
                 metadata = {
@@ -124,30 +126,7 @@ class WorkEffortManagerIndexer:
                 }
                 return metadata
 
-            # Parse frontmatter
-            frontmatter = parts[1].strip()
-            if not frontmatter:
-                self.logger.debug("Empty frontmatter found")
-                metadata = {
-                    "id": datetime.now().strftime("%Y%m%d%H%M") + "_untitled",
-                    "title": "Untitled",
-                    "status": "active"
-                }
-                return metadata
-
-            metadata = {}
-
-            # Try YAML parsing first
-            try:
-                import yaml
-                metadata = yaml.safe_load(frontmatter) or {}
-            except Exception as e:
-                self.logger.debug(f"YAML parsing failed, falling back to key-value parsing: {str(e)}")
-                # Fall back to key-value parsing
-                for line in frontmatter.split("\n"):
-                    if ":" in line:
-                        key, value = line.split(":", 1)
-                        metadata[key.strip()] = value.strip()
+            metadata = dict(fields)
 
             # Ensure required fields are present
             if not metadata.get("id"):
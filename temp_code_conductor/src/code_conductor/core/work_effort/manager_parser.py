@@ -2,10 +2,11 @@ from typing import Dict, Optional, Any, List
 import os
 import logging
 import json
-import yaml
 import re
 from datetime import datetime
 
+from ...work_efforts.frontmatter import decode, read_document
+
 class WorkEffortManagerParser:
     """Parser for work effort manager data."""
 
@@ -21,21 +22,10 @@ class WorkEffortManagerParser:
                 self.logger.error(f"Work effort file not found: {file_path}")
                 return None
 
-            with open(file_path, 'r') as f:
-                content = f.read()
-
             # Extract metadata from frontmatter if present
-            metadata = {}
-            if content.startswith('---'):
-                try:
-                    # Find the second '---' to get the frontmatter
-                    end_index = content.find('---', 3)
-                    if end_index != -1:
-                        frontmatter = content[3:end_index].strip()
-                        metadata = yaml.safe_load(frontmatter)
-                        content = content[end_index + 3:].strip()
-                except Exception as e:
-                    self.logger.warning(f"Error parsing frontmatter: {e}")
+            document = read_document(file_path)
+            metadata = dict(document.fields)
+            content = decode(document.body).strip()
 
             # Extract basic information from filename
             filename = os.path.basename(file_path)
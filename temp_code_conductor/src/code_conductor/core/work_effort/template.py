@@ -3,6 +3,8 @@ import json
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from ...work_efforts.template_engine import get_template_cache
+
 class WorkEffortTemplate:
     """Handles work effort templates."""
 
@@ -48,13 +50,16 @@ class WorkEffortTemplate:
     def load(self) -> Dict[str, Any]:
         """Load the template.
 
+        The parsed template is cached until the file changes.
+
         Returns:
             The template data.
         """
-        self._ensure_template_file()
-
-        with open(self.template_path, "r") as f:
-            return json.load(f)
+        try:
+            return get_template_cache().get_json(self.template_path)
+        except FileNotFoundError:
+            self._ensure_template_file()
+            return get_template_cache().get_json(self.template_path)
 
     def save(self, data: Dict[str, Any]) -> None:
         """Save the template.
@@ -66,6 +71,7 @@ class WorkEffortTemplate:
 
         with open(self.template_path, "w") as f:
             json.dump(data, f, indent=2)
+        get_template_cache().invalidate(self.template_path)
 
     def get_field_names(self) -> List[str]:
         """Get the field names in the template.
@@ -6,6 +6,7 @@ from ai_setup.utils.helpers import sanitize_directory_name, create_env_file, cre
 from ai_setup.creators.setup_files import create_ai_setup_folder, create_devlog_folder, create_docs_folder
 from ai_setup.creators.work_efforts import create_work_efforts_structure, update_readme_with_work_efforts
 from ai_setup.providers import ollama, openai
+from ai_setup.providers.response_cache import get_response_cache
 
 def create_project(project_name, ai_assisted=False, ai_provider="ollama", openai_api_key=None, ollama_model="phi4", code_dir=None):
     """
@@ -147,13 +148,21 @@ Please provide:
 
 Keep your response concise but comprehensive."""
 
-    # Get response from the selected AI provider
+    # Get response from the selected AI provider, or from the cache if this plan was generated before
     try:
-        print("\nGenerating project plan from AI...")
-        if ai_provider == "ollama":
-            response = ollama.get_ai_response(prompt, ollama_model)
-        else:  # openai
-            response = openai.get_ai_response(prompt, openai_api_key)
+        cache = get_response_cache()
+        cache_key = cache.key(ai_provider, ollama_model if ai_provider == "ollama" else "gpt-4o", prompt)
+        response = cache.get(cache_key)
+        if response is not None:
+            print("\nUsing the project plan generated earlier for these requirements.")
+        else:
+            print("\nGenerating project plan from AI...")
+            if ai_provider == "ollama":
+                response = ollama.get_ai_response(prompt, ollama_model)
+            else:  # openai
+                response = openai.get_ai_response(prompt, openai_api_key)
+            if response.strip() and not response.startswith(("❌", "Error:")):
+                cache.put(cache_key, response)
 
         # Save response to project_plan.md
         plan_path = os.path.join(project_dir, "project_plan.md")
@@ -12,6 +12,8 @@ from datetime import datetime
 from typing import Dict, Any, Union
 import logging
 
+from .work_efforts.frontmatter import decode, read_document
+
 # Re-export common operations needed by tests
 try:
     from src.code_conductor.work_efforts.filesystem.operations import FileSystemOperations
@@ -93,34 +95,22 @@ except ImportError:
                 logging.error(f"File not found: {file_path}")
                 return {}
 
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-
-            # First try YAML frontmatter
-            if content.startswith('---'):
-                # Find the end of the frontmatter
-                end_idx = content.find('---', 3)
-                if end_idx != -1:
-                    # Extract the YAML content
-                    yaml_content = content[3:end_idx].strip()
-                    # Parse YAML
-                    try:
-                        import yaml
-                        metadata = yaml.safe_load(yaml_content)
-                        if isinstance(metadata, dict):
-                            # Add filename to metadata
-                            metadata['filename'] = os.path.basename(file_path)
-                            return metadata
-                    except Exception as e:
-                        logging.error(f"Error parsing YAML frontmatter: {e}")
-
-            # If YAML parsing fails, try regex-based approach for WorkEffort format
+            document = read_document(file_path)
+
+            # First try the frontmatter
+            if document.fields:
+                metadata = dict(document.fields)
+                # Add filename to metadata
+                metadata['filename'] = os.path.basename(file_path)
+                return metadata
+
+            # Otherwise fall back to the WorkEffort-style content
+            content = decode(document.data)
             metadata = {}
 
             # Extract title from first heading
-            title_match = re.search(r'# (.*?)$', content, re.MULTILINE)
-            if title_match:
-                metadata['title'] = title_match.group(1).strip()
+            if document.sections:
+                metadata['title'] = document.sections[0].title
 
             # Extract metadata from frontmatter-like sections
             patterns = {
@@ -171,7 +161,6 @@ except ImportError:
             # Check if work_effort is a WorkEffort object or dictionary
             if hasattr(work_effort, 'to_markdown'):
                 # It's a WorkEffort object
-                content = work_effort.to_markdown()
                 title = work_effort.title
                 # Use created timestamp if available, otherwise use current time
                 timestamp = getattr(work_effort, 'created', datetime.now().strftime("%Y%m%d%H%M"))
@@ -194,6 +183,9 @@ except ImportError:
 
                     filename = create_filename_from_title(title, timestamp)
                     file_path = os.path.join(target_dir, filename)
+
+                # Unchanged parts of a work effort read from this file are not rewritten
+                return work_effort.save(file_path)
             else:
                 # Handle as dictionary (original implementation)
                 # Generate filename from metadata
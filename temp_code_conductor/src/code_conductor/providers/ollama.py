@@ -2,22 +2,418 @@ import subprocess
 import platform
 import os
 import shutil
+import json
+import time
+import queue
+import asyncio
+import threading
+import contextlib
+import http.client
+from urllib.parse import urlsplit
+
+# Constants
+DEFAULT_OLLAMA_HOST = "http://127.0.0.1:11434"
+DEFAULT_MAX_CONNECTIONS = 4
+DEFAULT_TIMEOUT = 300
+MODEL_CACHE_TTL = 30
+FAILED_RESPONSE = "❌ Failed to get response from Ollama. Is Ollama installed and running?"
+
+# Errors that mean a request could not be completed
+REQUEST_ERRORS = (OSError, http.client.HTTPException, ValueError)
+
+
+class OllamaError(Exception):
+    """Raised when the Ollama API answers with an error."""
+
+
+try:
+    from contextlib import aclosing
+except ImportError:
+    # contextlib.aclosing is new in Python 3.10
+    @contextlib.asynccontextmanager
+    async def aclosing(thing):
+        """Close an async generator when the block exits, like contextlib.aclosing."""
+        try:
+            yield thing
+        finally:
+            await thing.aclose()
+
+
+def parse_host(host=None):
+    """
+    Split an Ollama server URL into its parts.
+
+    Args:
+        host: Server URL or host:port (default: $OLLAMA_HOST or http://127.0.0.1:11434)
+
+    Returns:
+        tuple: (scheme, hostname, port)
+    """
+    host = host or os.environ.get("OLLAMA_HOST") or DEFAULT_OLLAMA_HOST
+    if "://" not in host:
+        host = f"http://{host}"
+    url = urlsplit(host)
+    return url.scheme, url.hostname or "127.0.0.1", url.port or (443 if url.scheme == "https" else 11434)
+
+
+def _check_status(status, data):
+    """Raise OllamaError if status is an HTTP error."""
+    if status >= 400:
+        try:
+            message = json.loads(data).get("error", "")
+        except ValueError:
+            message = data.decode("utf-8", "replace")
+        raise OllamaError(f"Ollama returned HTTP {status}: {message}".rstrip(": "))
+
+
+class OllamaClient:
+    """
+    Client for the local Ollama HTTP API.
+
+    Requests go over a pool of keep-alive connections, so a prompt costs one
+    socket round-trip instead of starting an ``ollama`` process. At most
+    ``max_connections`` requests run at the same time; further callers wait for
+    a free connection. The list of installed models is cached for ``model_ttl``
+    seconds, and an unreachable server is remembered for the same time.
+    """
+
+    def __init__(self, host=None, max_connections=DEFAULT_MAX_CONNECTIONS, timeout=DEFAULT_TIMEOUT,
+                 model_ttl=MODEL_CACHE_TTL):
+        """
+        Initialize the client.
+
+        Args:
+            host: Ollama server URL (default: $OLLAMA_HOST or http://127.0.0.1:11434)
+            max_connections: Most requests in flight at the same time
+            timeout: Socket timeout in seconds
+            model_ttl: Seconds to cache the model list and server availability
+        """
+        scheme, self.host, self.port = parse_host(host)
+        self.connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        self.timeout = timeout
+        self.model_ttl = model_ttl
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._models = None
+        self._models_checked = 0.0
+        self._models_lock = threading.Lock()
+
+    def _connect(self):
+        """Return an idle connection, or a new one if none is idle."""
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self.connection_class(self.host, self.port, timeout=self.timeout), False
+
+    def _send(self, method, path, payload=None):
+        """
+        Send a request, retrying once on a fresh connection if a reused one was closed.
+
+        Returns:
+            tuple: (connection, response)
+        """
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        connection, reused = self._connect()
+        while True:
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                return connection, connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if not reused:
+                    raise
+                connection, reused = self.connection_class(self.host, self.port, timeout=self.timeout), False
+            except BaseException:
+                connection.close()
+                raise
+
+    def _release(self, connection, response):
+        """Return a connection to the pool if the server will keep it open."""
+        if response.will_close:
+            connection.close()
+        else:
+            self._idle.put(connection)
+
+    def _check(self, response, data):
+        """Raise OllamaError for an error response."""
+        _check_status(response.status, data)
+
+    def request(self, method, path, payload=None):
+        """
+        Send a request and return the decoded JSON response.
+
+        Args:
+            method: HTTP method
+            path: API path such as /api/tags
+            payload: JSON body
+
+        Returns:
+            dict: The response
+
+        Raises:
+            OllamaError: If the server answers with an error
+            OSError: If the server cannot be reached
+        """
+        with self._slots:
+            connection, response = self._send(method, path, payload)
+            try:
+                data = response.read()
+            except BaseException:
+                connection.close()
+                raise
+            self._release(connection, response)
+        self._check(response, data)
+        return json.loads(data) if data else {}
+
+    def stream(self, method, path, payload=None):
+        """
+        Send a request and yield each JSON line of a streamed response.
+
+        The connection goes back to the pool once the stream has been read to
+        the end; it is closed if the caller stops early.
+
+        Yields:
+            dict: One decoded line of the response
+
+        Raises:
+            OllamaError: If the server answers with an error
+        """
+        with self._slots:
+            connection, response = self._send(method, path, payload)
+            finished = False
+            try:
+                if response.status >= 400:
+                    data = response.read()
+                    finished = True
+                    self._check(response, data)
+                while True:
+                    line = response.readline()
+                    if not line:
+                        finished = True
+                        break
+                    if line.strip():
+                        yield json.loads(line)
+            finally:
+                if finished:
+                    self._release(connection, response)
+                else:
+                    connection.close()
+
+    def generate(self, prompt, model="phi4"):
+        """
+        Get a complete response to a prompt.
+
+        Args:
+            prompt: The prompt to send
+            model: The model to use
+
+        Returns:
+            str: The model's response
+        """
+        return self.request("POST", "/api/generate", {"model": model, "prompt": prompt, "stream": False})["response"]
+
+    def generate_stream(self, prompt, model="phi4"):
+        """
+        Stream the response to a prompt as it is generated.
+
+        Args:
+            prompt: The prompt to send
+            model: The model to use
+
+        Yields:
+            str: Pieces of the response in order
+        """
+        for chunk in self.stream("POST", "/api/generate", {"model": model, "prompt": prompt, "stream": True}):
+            if chunk.get("error"):
+                raise OllamaError(chunk["error"])
+            if chunk.get("response"):
+                yield chunk["response"]
+
+    def list_models(self, refresh=False):
+        """
+        Get the names of the installed models, cached for model_ttl seconds.
+
+        Args:
+            refresh: Ignore the cached list
+
+        Returns:
+            list: Model names, or None if the server cannot be reached
+        """
+        with self._models_lock:
+            if not refresh and time.monotonic() - self._models_checked < self.model_ttl:
+                return self._models
+            try:
+                models = [entry["name"] for entry in self.request("GET", "/api/tags").get("models", [])]
+            except (OllamaError, *REQUEST_ERRORS):
+                models = None
+            self._models, self._models_checked = models, time.monotonic()
+            return models
+
+    def has_model(self, model):
+        """
+        Check if a model is installed; "phi4" matches "phi4:latest".
+
+        Args:
+            model: Model name with or without a tag
+
+        Returns:
+            bool: True if the model is installed
+        """
+        return any(name == model or name.split(":", 1)[0] == model for name in self.list_models() or [])
+
+    def is_available(self):
+        """Return True if the server answered within the last model_ttl seconds."""
+        return self.list_models() is not None
+
+    def invalidate(self):
+        """Forget the cached model list."""
+        with self._models_lock:
+            self._models, self._models_checked = None, 0.0
+
+    def close(self):
+        """Close the idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """
+    Get the Ollama client shared by the process.
+
+    Returns:
+        OllamaClient: The shared client
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OllamaClient()
+        return _client
+
+
+def _response_piece(line):
+    """Decode one line of a streamed generate response; returns its text, if any."""
+    if not line.strip():
+        return None
+    chunk = json.loads(line)
+    if chunk.get("error"):
+        raise OllamaError(chunk["error"])
+    return chunk.get("response")
+
+
+async def _read_body(reader, headers):
+    """Yield the body of an HTTP response as it arrives, chunked or not."""
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        while True:
+            size_line = await reader.readline()
+            if not size_line:
+                raise OllamaError("Ollama closed the connection mid-response")
+            size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                # Skip any trailers up to the blank line ending the response
+                while (await reader.readline()).strip():
+                    pass
+                return
+            yield await reader.readexactly(size)
+            await reader.readline()
+    elif "content-length" in headers:
+        remaining = int(headers["content-length"])
+        while remaining > 0:
+            data = await reader.read(min(remaining, 65536))
+            if not data:
+                raise OllamaError("Ollama closed the connection mid-response")
+            remaining -= len(data)
+            yield data
+    else:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                return
+            yield data
+
+
+async def agenerate_stream(prompt, model="phi4", host=None):
+    """
+    Stream the response to a prompt without blocking the event loop.
+
+    The request goes over an asyncio connection, so other tasks keep running
+    while the model generates. Cancelling the consuming task (on a timeout or
+    Ctrl+C) stops at the next read and closes the connection, which makes
+    Ollama stop generating.
+
+    Args:
+        prompt: The prompt to send
+        model: The model to use
+        host: Server URL (default: $OLLAMA_HOST or http://127.0.0.1:11434)
+
+    Yields:
+        str: Pieces of the response in order
+
+    Raises:
+        OllamaError: If the server answers with an error
+        OSError: If the server cannot be reached
+    """
+    scheme, hostname, port = parse_host(host)
+    reader, writer = await asyncio.open_connection(hostname, port, ssl=True if scheme == "https" else None)
+    try:
+        body = json.dumps({"model": model, "prompt": prompt, "stream": True}).encode("utf-8")
+        writer.write(
+            f"POST /api/generate HTTP/1.1\r\nHost: {hostname}:{port}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode("ascii") + body
+        )
+        await writer.drain()
+
+        status_line = (await reader.readline()).split(None, 2)
+        if len(status_line) < 2 or not status_line[0].startswith(b"HTTP/") or not status_line[1].isdigit():
+            raise OllamaError("Ollama sent an invalid HTTP response")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if not line.strip():
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        status = int(status_line[1])
+        if status >= 400:
+            async with aclosing(_read_body(reader, headers)) as body:
+                _check_status(status, b"".join([data async for data in body]))
+
+        pending = b""
+        async with aclosing(_read_body(reader, headers)) as body:
+            async for data in body:
+                *lines, pending = (pending + data).split(b"\n")
+                for line in lines:
+                    piece = _response_piece(line)
+                    if piece:
+                        yield piece
+        piece = _response_piece(pending)
+        if piece:
+            yield piece
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
 
 def is_ollama_installed():
     """
-    Check if Ollama is installed on the system.
+    Check if Ollama is installed and its server is running.
 
     Returns:
         bool: True if installed, False otherwise
     """
-    try:
-        result = subprocess.run(["ollama", "list"],
-                               stdout=subprocess.PIPE,
-                               stderr=subprocess.PIPE,
-                               check=False)
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    return get_client().is_available()
 
 def install_ollama():
     """
@@ -110,6 +506,7 @@ def setup_ollama_model(model="phi4"):
 
         print(f"🔄 Pulling {model} model to Ollama...")
         subprocess.run(["ollama", "pull", model], check=True)
+        get_client().invalidate()
         print(f"✅ {model} model installed successfully")
         return True
     except (subprocess.SubprocessError, FileNotFoundError):
@@ -126,39 +523,31 @@ def check_model_exists(model="phi4"):
     Returns:
         bool: True if model exists, False otherwise
     """
-    try:
-        model_check = subprocess.run(
-            ["ollama", "list"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False
-        )
+    return get_client().has_model(model)
 
-        return model in model_check.stdout
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return False
-
-def get_ai_response(prompt, model="phi4"):
+def get_ai_response(prompt, model="phi4", on_chunk=None):
     """
     Get a response from Ollama model.
 
     Args:
         prompt: The prompt to send to the model
         model: The model to use (default: phi4)
+        on_chunk: Called with each piece of the response as it is generated;
+            the response is streamed when given
 
     Returns:
         str: Model's response or error message
     """
+    client = get_client()
     try:
         print(f"🤖 Getting response from Ollama ({model})...")
-        result = subprocess.run(
-            ["ollama", "run", model, prompt],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=True
-        )
-        return result.stdout
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return "❌ Failed to get response from Ollama. Is Ollama installed and running?"
\ No newline at end of file
+        if on_chunk is None:
+            return client.generate(prompt, model)
+
+        pieces = []
+        for piece in client.generate_stream(prompt, model):
+            on_chunk(piece)
+            pieces.append(piece)
+        return "".join(pieces)
+    except (OllamaError, *REQUEST_ERRORS):
+        return FAILED_RESPONSE
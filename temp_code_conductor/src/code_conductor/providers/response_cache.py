@@ -0,0 +1,291 @@
+"""
+Response Cache
+
+A disk-backed cache of model responses, so the same prompt sent to the same
+model is answered from disk instead of generating it again.
+
+Entries are content-addressed: the key is a hash of the provider, the model,
+the prompt's hash and any generation parameters, so a change to any of them
+misses. Each entry is a small JSON file under ``<cache dir>/<key[:2]>/``,
+written to a temporary file and renamed into place, so a reader never sees a
+partial entry and concurrent writers of the same key simply replace each
+other.
+
+Eviction:
+
+- TTL: an entry written more than ``ttl`` seconds ago is a miss and is removed.
+  The entry file's modification time is when it was written; lookups and
+  eviction both check it.
+- LRU: a hit sets the entry file's access time, so the access time is the last
+  use. When a write takes the cache past ``max_bytes``, the least recently used
+  entries are removed until it fits.
+
+Eviction scans the cache directory, so it does not run on every write. Each
+cache object keeps a running total of the bytes it has written on top of the
+size found by its last scan, and scans when that total crosses ``max_bytes``
+or after ``EVICT_INTERVAL`` writes (which also catches expired entries and
+writes from other processes).
+
+The cache lives in ``$CODE_CONDUCTOR_CACHE_DIR``, or in ``code_conductor/responses``
+under ``$XDG_CACHE_HOME`` (default ``~/.cache``). Hits and misses are counted
+per cache object; ``stats()`` reports them with the entry count and size.
+"""
+
+import os
+import json
+import time
+import logging
+import hashlib
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Constants
+CACHE_VERSION = 1
+CACHE_DIR_ENV = "CODE_CONDUCTOR_CACHE_DIR"
+DEFAULT_TTL = 7 * 24 * 60 * 60
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+EVICT_INTERVAL = 100
+ENTRY_SUFFIX = ".json"
+
+
+def default_cache_dir():
+    """
+    Get the directory the shared response cache is kept in.
+
+    Returns:
+        str: $CODE_CONDUCTOR_CACHE_DIR, or code_conductor/responses in the user cache directory
+    """
+    if os.environ.get(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "code_conductor", "responses")
+
+
+class ResponseCache:
+    """
+    Content-addressed cache of model responses with TTL and LRU eviction.
+
+    Values can be anything JSON can store: response text, or the fields parsed
+    from a response.
+    """
+
+    def __init__(self, cache_dir=None, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache. The directory is created on the first write.
+
+        Args:
+            cache_dir: Directory for the entries (default: default_cache_dir())
+            ttl: Seconds an entry stays valid
+            max_bytes: Most bytes of entries to keep on disk
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._bytes = None  # Size on disk as of the last scan plus later writes; None until scanned
+        self._writes = 0
+
+    @staticmethod
+    def key(provider, model, prompt, params=None):
+        """
+        Build the key of a request.
+
+        Args:
+            provider: Provider name such as 'ollama'
+            model: Model name
+            prompt: The prompt text
+            params: Generation parameters that change the response
+
+        Returns:
+            str: Hex digest identifying the request
+        """
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        identity = json.dumps([CACHE_VERSION, provider, model, prompt_hash, params or {}], sort_keys=True)
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        """Return the entry file for a key."""
+        return os.path.join(self.cache_dir, key[:2], key + ENTRY_SUFFIX)
+
+    def _count(self, hit):
+        """Count a hit or a miss."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key):
+        """
+        Look up an entry, marking it as recently used.
+
+        Args:
+            key: Key from ResponseCache.key
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                written = os.fstat(f.fileno()).st_mtime
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._count(False)
+            return None
+
+        now = time.time()
+        if now - written > self.ttl:
+            self._remove(path)
+            self._count(False)
+            return None
+
+        # Mark the entry as used, keeping its write time
+        try:
+            os.utime(path, (now, written))
+        except OSError:
+            pass
+        self._count(True)
+        return entry["value"]
+
+    def put(self, key, value):
+        """
+        Store an entry atomically, then evict entries if the cache may have
+        grown past max_bytes or EVICT_INTERVAL writes were made since the last scan.
+
+        A cache that cannot be written only logs a warning.
+
+        Args:
+            key: Key from ResponseCache.key
+            value: JSON-serializable value
+
+        Returns:
+            bool: True if the entry was stored
+        """
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".entry-")
+        except OSError as e:
+            logger.warning(f"Could not cache response: {e}")
+            return False
+        try:
+            data = json.dumps({"value": value}, separators=(",", ":")).encode("utf-8")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            try:
+                replaced = os.stat(path).st_size
+            except OSError:
+                replaced = 0
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self._remove(tmp_path)
+            logger.warning(f"Could not cache response: {e}")
+            return False
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+        with self._lock:
+            if self._bytes is not None:
+                self._bytes += len(data) - replaced
+            self._writes += 1
+            due = self._bytes is None or self._bytes > self.max_bytes or self._writes >= EVICT_INTERVAL
+        if due:
+            self.evict()
+        return True
+
+    def _remove(self, path):
+        """Remove a file if it exists."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _entries(self):
+        """Return (last used, written, size, path) for every entry file."""
+        entries = []
+        try:
+            shards = list(os.scandir(self.cache_dir))
+        except OSError:
+            return entries
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(ENTRY_SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_atime, stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self):
+        """
+        Remove entries written longer than the TTL ago, then the least recently
+        used entries until the cache fits in max_bytes.
+
+        Returns:
+            int: Number of entries removed
+        """
+        now = time.time()
+        entries = sorted(self._entries())
+        removed = 0
+        total = sum(size for _, _, size, _ in entries)
+        for _, written, size, path in entries:
+            if total <= self.max_bytes and now - written <= self.ttl:
+                continue
+            self._remove(path)
+            total -= size
+            removed += 1
+        with self._lock:
+            self._bytes = total
+            self._writes = 0
+        return removed
+
+    def clear(self):
+        """Remove every entry."""
+        for _, _, _, path in self._entries():
+            self._remove(path)
+        with self._lock:
+            self._bytes = 0
+            self._writes = 0
+
+    def stats(self):
+        """
+        Report how the cache has been used.
+
+        Returns:
+            dict: hits and misses of this object, and the entries and bytes on disk
+        """
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "bytes": sum(size for _, _, size, _ in entries),
+        }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """
+    Get the response cache shared by the process.
+
+    Returns:
+        ResponseCache: The shared cache
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
@@ -21,17 +21,13 @@ from pathlib import Path
 from typing import Dict, List, Optional, Union
 from datetime import datetime
 
-# Import the correct WorkEffortManager and setup functions
+# WorkEffortManager is imported on first use, which keeps --help and argument errors fast
 try:
     # Direct import if installed as a package
-    from code_conductor.core.work_effort.manager import WorkEffortManager
+    from code_conductor.core.work_effort import get_work_effort_manager_class
 except ImportError:
-    try:
-        # Try importing from src directory
-        from src.code_conductor.core.work_effort.manager import WorkEffortManager
-    except ImportError:
-        print("Error: Could not import WorkEffortManager. Make sure code_conductor is installed.")
-        sys.exit(1)
+    # Try importing from src directory
+    from src.code_conductor.core.work_effort import get_work_effort_manager_class
 
 def parse_arguments():
     """Parse command-line arguments with clear, simple options."""
@@ -177,7 +173,7 @@ def main():
         print(f"  Format:    Sequential numbering")
 
     # Create the WorkEffortManager with the project root
-    manager = WorkEffortManager(project_dir=project_root)
+    manager = get_work_effort_manager_class()(project_dir=project_root)
 
     # Create the work effort in the work_efforts directory in the current directory
     work_effort_path = create_work_effort_in_current_dir(
@@ -11,16 +11,13 @@ import json
 import os
 from pathlib import Path
 
+# WorkEffortManager is imported on first use, which keeps --help and argument errors fast
 try:
     # Direct import if installed as a package
-    from code_conductor.core.work_effort.manager import WorkEffortManager
+    from code_conductor.core.work_effort import get_work_effort_manager_class
 except ImportError:
-    try:
-        # Try importing from src directory
-        from src.code_conductor.core.work_effort.manager import WorkEffortManager
-    except ImportError:
-        print("Error: Could not import WorkEffortManager. Make sure code_conductor is installed.")
-        sys.exit(1)
+    # Try importing from src directory
+    from src.code_conductor.core.work_effort import get_work_effort_manager_class
 
 def format_work_efforts_as_table(work_efforts: List[Dict[str, Any]]) -> str:
     """Format work efforts as a nicely formatted table."""
@@ -120,7 +117,7 @@ def main():
     args = parser.parse_args()
 
     # Initialize the manager
-    manager = WorkEffortManager()
+    manager = get_work_effort_manager_class()()
 
     # Handle different tracing modes
     if args.related:
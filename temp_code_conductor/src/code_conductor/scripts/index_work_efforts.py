@@ -13,6 +13,7 @@ import sys
 import json
 import logging
 import argparse
+import fnmatch
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -21,7 +22,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from code_conductor.core.project import find_project_root
-from code_conductor.core.work_effort.manager import WorkEffortManager
+from code_conductor.utils.project_walker import ProjectWalker, DEFAULT_EXCLUDES, walk_cache_path
 
 # Set up logging
 logging.basicConfig(
@@ -30,6 +31,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger("index_work_efforts")
 
+WORK_EFFORT_DIR_PATTERNS = ["*work_effort*", "*work-effort*"]
+STATUS_DIRS = ["active", "completed", "archived"]
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -84,8 +88,86 @@ def parse_args():
         help="Filter results by text in title or content"
     )
 
+    parser.add_argument(
+        "--exclude", "-x",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="Glob pattern for files or directories to skip during a thorough search (can be repeated)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Don't reuse directory listings cached by a previous thorough search"
+    )
+
+    parser.add_argument(
+        "--cache-in-project",
+        action="store_true",
+        help="Cache directory listings in .code_conductor/ inside the project instead of the user cache directory"
+    )
+
     return parser.parse_args()
 
+def find_work_efforts_thorough(project_dir: str, exclude: Optional[List[str]] = None,
+                               use_cache: bool = True, filter_text: Optional[str] = None,
+                               cache_in_project: bool = False) -> List[Dict[str, Any]]:
+    """
+    Find every markdown file inside a work effort directory anywhere in the project.
+
+    The walk honours .gitignore files and the exclude globs, lists directories in
+    parallel and reuses cached listings for directories that have not changed.
+
+    Args:
+        project_dir: Project directory to scan
+        exclude: Extra glob patterns for files and directories to skip
+        use_cache: If True, reuse directory listings cached by a previous run
+        filter_text: Only keep work efforts whose title or path contains this text
+        cache_in_project: If True, cache directory listings inside the project instead of
+            the user cache directory
+
+    Returns:
+        List of work effort dictionaries sorted by relative path
+    """
+    from code_conductor.utils.frontmatter_fields import read_frontmatter_fields
+
+    walker = ProjectWalker(
+        project_dir,
+        exclude=DEFAULT_EXCLUDES + list(exclude or []),
+        cache_path=walk_cache_path(project_dir, cache_in_project) if use_cache else None
+    )
+
+    work_efforts = []
+    for file_path in walker.iter_files(["*.md"]):
+        relative_path = os.path.relpath(file_path, walker.root_dir)
+        parts = relative_path.split(os.sep)[:-1]
+        containers = [p for p in parts if any(fnmatch.fnmatch(p.lower(), pat) for pat in WORK_EFFORT_DIR_PATTERNS)]
+        if not containers:
+            continue
+
+        metadata = read_frontmatter_fields(file_path)
+        metadata.setdefault("title", os.path.splitext(os.path.basename(file_path))[0])
+        status = metadata.get("status") or next((p for p in reversed(parts) if p in STATUS_DIRS), "unknown")
+
+        if filter_text:
+            needle = filter_text.lower()
+            if needle not in str(metadata["title"]).lower() and needle not in relative_path.lower():
+                continue
+
+        work_efforts.append({
+            "path": file_path,
+            "relative_path": relative_path,
+            "metadata": metadata,
+            "status": status,
+            "container_type": containers[-1],
+            "last_modified": datetime.fromtimestamp(os.path.getmtime(file_path)).strftime("%Y-%m-%d %H:%M:%S"),
+        })
+
+    logger.debug(f"Walker listed {walker.stats['listed']} directories, reused {walker.stats['cached']} from cache")
+    return sorted(work_efforts, key=lambda we: we["relative_path"])
+
 def format_work_efforts_as_table(work_efforts: List[Dict[str, Any]]) -> str:
     """Format work efforts as a nicely formatted table."""
     if not work_efforts:
@@ -200,14 +282,42 @@ def generate_summary(work_efforts: List[Dict[str, Any]]) -> str:
 
 def main():
     """Main entry point for the index_work_efforts script."""
+    args = parse_args()
+
     try:
+        if args.thorough:
+            logger.info(f"Scanning project directory: {args.project_dir}")
+            work_efforts = find_work_efforts_thorough(
+                args.project_dir,
+                exclude=args.exclude,
+                use_cache=args.use_cache,
+                filter_text=args.filter,
+                cache_in_project=args.cache_in_project
+            )
+
+            if args.format == "json":
+                print(json.dumps(work_efforts, indent=2, default=str))
+            else:
+                print(format_work_efforts_as_table(work_efforts))
+            if args.summary:
+                print()
+                print(generate_summary(work_efforts))
+            if not args.no_save:
+                with open(args.output, "w", encoding="utf-8") as f:
+                    json.dump(work_efforts, f, indent=2, default=str)
+                logger.info(f"Saved index to {args.output}")
+
+            logger.info(f"✅ Indexed {len(work_efforts)} work efforts")
+            return 0
+
         # Get project root
         project_root = find_project_root()
         if not project_root:
             logger.error("❌ Could not find project root")
             return 1
 
-        # Initialize manager
+        # Initialize manager (imported here to keep startup fast)
+        from code_conductor.core.work_effort.manager import WorkEffortManager
         manager = WorkEffortManager(project_dir=project_root)
         logger.info(f"Scanning project directory: {project_root}")
 
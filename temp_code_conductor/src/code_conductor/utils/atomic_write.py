@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Atomic Writes
+
+Writes files so that readers see either the old content or the new content,
+never a partial file.
+
+The content is written to a temporary file next to the destination (named with
+the process id, so concurrent writers do not share one) and renamed over it
+with ``os.replace``, which is atomic within a filesystem. A crash part way
+through leaves the original file untouched.
+"""
+
+import os
+
+
+def atomic_write_text(path, content):
+    """
+    Write text to a file atomically.
+
+    The content is written to a temporary file in the same directory and then
+    renamed over the destination, preserving the original file mode.
+
+    Args:
+        path (str): Destination file path
+        content (str): Text to write
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Frontmatter Fields
+
+Reads the frontmatter fields of a markdown file for crawlers and indexes that
+only need a document's metadata.
+
+Only the head of the file is read, up to the closing ``---`` line, so scanning
+a large tree costs the same however long the documents are. Parsing is shared
+with every other reader (see ``work_efforts.frontmatter.parse_document``).
+"""
+
+import os
+import sys
+import logging
+
+try:
+    from ..work_efforts.frontmatter import read_document
+except ImportError:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'work_efforts'))
+    from frontmatter import read_document
+
+logger = logging.getLogger(__name__)
+
+
+def read_frontmatter_fields(file_path):
+    """
+    Read the frontmatter of a markdown file without loading the whole document.
+
+    Scalar keys are returned as strings, inline ``[a, b]`` lists as lists of
+    items and block lists as lists of wiki link targets (or of the plain items
+    when an item has no wiki link).
+
+    Args:
+        file_path (str): Path to the markdown file
+
+    Returns:
+        dict: Mapping of frontmatter keys to values (empty if there is no frontmatter)
+    """
+    try:
+        return read_document(file_path, frontmatter_only=True).fields
+    except OSError as e:
+        logger.error(f"Error reading frontmatter from {file_path}: {e}")
+        return {}
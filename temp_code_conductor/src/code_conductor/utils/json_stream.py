@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Streaming JSON Fields
+
+Picks the fields of a JSON object out of text that arrives a piece at a time.
+
+A model asked for JSON answers with tokens, often wrapped in prose or a Markdown
+code fence. Waiting for the whole answer and then searching for the first ``{``
+and the last ``}`` means nothing can be used until the model stops, and a stray
+brace in the trailing prose breaks the parse. ``JSONFieldParser`` instead scans
+each piece once as it is fed:
+
+1. Text before the first ``{`` is skipped.
+2. Inside the object, strings (with escapes), nesting depth and the
+   key/colon/value position are tracked, so a top-level value is known to be
+   complete as soon as the ``,`` or ``}`` after it arrives. The value is then
+   decoded with ``json.loads`` and reported straight away.
+3. The parser is done once the object is closed; anything after it is ignored,
+   so the caller can stop reading the stream.
+
+If the text at a ``{`` turns out not to be a JSON object (a brace in prose), the
+fields found so far are dropped and scanning resumes after that brace.
+"""
+
+import json
+
+# Constants
+WHITESPACE = ' \t\r\n'
+
+
+class JSONFieldParser:
+    """
+    Incremental parser for the top-level fields of a streamed JSON object.
+    """
+
+    def __init__(self, keys=None, on_field=None):
+        """
+        Initialize the parser.
+
+        Args:
+            keys: Field names to keep (default: every field)
+            on_field: Called with (key, value) as soon as a kept field is complete
+        """
+        self.keys = set(keys) if keys is not None else None
+        self.on_field = on_field
+        self.fields = {}
+        self.done = False
+        self._text = ''
+        self._pos = 0
+        self._restart()
+
+    def _restart(self):
+        """Forget the current object and look for the next '{'."""
+        self.fields = {}
+        self._start = None
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._state = 'key'
+        self._key = None
+        self._token_start = None
+
+    def _fail(self):
+        """Give up on the object at self._start; returns where to resume scanning."""
+        resume = self._start + 1
+        self._restart()
+        return resume
+
+    def _complete(self, end):
+        """Decode the value ending at end; returns False if it is not valid JSON."""
+        try:
+            value = json.loads(self._text[self._token_start:end])
+        except ValueError:
+            return False
+        if self.keys is None or self._key in self.keys:
+            self.fields[self._key] = value
+            if self.on_field:
+                self.on_field(self._key, value)
+        return True
+
+    def feed(self, text):
+        """
+        Scan the next piece of the stream.
+
+        Args:
+            text: The next piece of text
+
+        Returns:
+            bool: True once the object is complete
+        """
+        if self.done:
+            return True
+        self._text += text
+        data = self._text
+        i = self._pos
+
+        while i < len(data):
+            char = data[i]
+            i += 1
+
+            if self._start is None:
+                if char == '{':
+                    self._start = i - 1
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._state == 'key_string':
+                        self._key = json.loads(data[self._token_start:i])
+                        self._state = 'colon'
+                continue
+
+            if char in WHITESPACE:
+                continue
+
+            if self._depth > 1:
+                if char == '"':
+                    self._in_string = True
+                elif char in '{[':
+                    self._depth += 1
+                elif char in '}]':
+                    self._depth -= 1
+                continue
+
+            if self._state == 'key':
+                if char == '"':
+                    self._in_string = True
+                    self._state = 'key_string'
+                    self._token_start = i - 1
+                else:
+                    i = self._fail()
+            elif self._state == 'colon':
+                if char == ':':
+                    self._state = 'value'
+                    self._token_start = i
+                else:
+                    i = self._fail()
+            elif char in ',}':
+                if not self._complete(i - 1):
+                    i = self._fail()
+                elif char == ',':
+                    self._state = 'key'
+                else:
+                    self.done = True
+                    break
+            elif char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            elif char == ']':
+                i = self._fail()
+
+        self._pos = i
+        self._trim()
+        return self.done
+
+    def _trim(self):
+        """Drop text that can no longer be needed."""
+        if self.done:
+            self._text = ''
+            self._pos = 0
+        elif self._start is None:
+            self._text = self._text[self._pos:]
+            self._pos = 0
+        elif self._start > 0:
+            shift = self._start
+            self._text = self._text[shift:]
+            self._pos -= shift
+            self._start = 0
+            if self._token_start is not None:
+                self._token_start -= shift
+
+    def result(self):
+        """
+        Get the fields found so far.
+
+        Returns:
+            dict: Complete fields of the current object, by key
+        """
+        return dict(self.fields)
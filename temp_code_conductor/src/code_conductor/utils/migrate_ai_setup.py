@@ -23,9 +23,16 @@ Options:
 
 import os
 import sys
+import mmap
 import shutil
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from .project_walker import ProjectWalker, DEFAULT_EXCLUDES, walk_cache_path
+except ImportError:
+    from project_walker import ProjectWalker, DEFAULT_EXCLUDES, walk_cache_path
 
 # Setup logging
 logging.basicConfig(
@@ -41,16 +48,77 @@ logger = logging.getLogger(__name__)
 # Constants
 OLD_DIR_NAME = ".AI-Setup"
 NEW_DIR_NAME = "_AI-Setup"
-EXCLUDED_DIRS = ['.git', 'node_modules', 'venv', '.env', '__pycache__']
+EXCLUDED_DIRS = DEFAULT_EXCLUDES
 FILE_PATTERNS = ['*.py', '*.md', '*.json', '*.sh', '*.txt']
 EXCLUDED_FILES = ['migrate_ai_setup.py', 'CHANGELOG.md', 'devlog.md', '*.log']
+OLD_DIR_BYTES = OLD_DIR_NAME.encode('utf-8')
+NEW_DIR_BYTES = NEW_DIR_NAME.encode('utf-8')
+BINARY_SNIFF_BYTES = 8192
+COPY_CHUNK_SIZE = 1024 * 1024
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _open_mapped(file_path):
+    """
+    Memory-map a file for reading.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Tuple of (file object, mmap) or None if the file is empty or binary
+        (contains a NUL byte in its first BINARY_SNIFF_BYTES bytes)
+    """
+    f = open(file_path, 'rb')
+    try:
+        if os.fstat(f.fileno()).st_size == 0:
+            f.close()
+            return None
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception:
+        f.close()
+        raise
+    if b'\0' in mapped[:BINARY_SNIFF_BYTES]:
+        mapped.close()
+        f.close()
+        return None
+    return f, mapped
+
+
+def _write_replaced(mapped, first_match, out):
+    """
+    Stream a mapped file to out with every OLD_DIR_BYTES replaced by NEW_DIR_BYTES.
+
+    Unchanged stretches are copied in chunks straight from the mapping, so the
+    file is never held in memory as a whole.
+
+    Args:
+        mapped: mmap of the source file
+        first_match: Offset of the first occurrence of OLD_DIR_BYTES
+        out: Binary file object to write to
+    """
+    pos = 0
+    match = first_match
+    size = len(mapped)
+    while True:
+        end = match if match != -1 else size
+        while pos < end:
+            chunk_end = min(pos + COPY_CHUNK_SIZE, end)
+            out.write(mapped[pos:chunk_end])
+            pos = chunk_end
+        if match == -1:
+            break
+        out.write(NEW_DIR_BYTES)
+        pos = match + len(OLD_DIR_BYTES)
+        match = mapped.find(OLD_DIR_BYTES, pos)
 
 class AiSetupMigrator:
     """
     Handles the migration from .AI-Setup to _AI-Setup directory naming convention.
     """
 
-    def __init__(self, root_dir=None, dry_run=False, force=False, verbose=False):
+    def __init__(self, root_dir=None, dry_run=False, force=False, verbose=False,
+                 exclude=None, use_gitignore=False, use_cache=True, cache_in_project=False, workers=None):
         """
         Initialize the migrator.
 
@@ -59,15 +127,30 @@ class AiSetupMigrator:
             dry_run: If True, don't actually make changes
             force: If True, don't ask for confirmation
             verbose: If True, show detailed information
+            exclude: Extra glob patterns for files and directories to skip
+            use_gitignore: If True, skip paths ignored by .gitignore files (off by default,
+                since ignored files may still reference the old directory name)
+            use_cache: If True, reuse unchanged directory listings from the previous run
+            cache_in_project: If True, cache directory listings inside the project instead
+                of the user cache directory
+            workers: Number of threads used to scan and rewrite files
         """
         self.root_dir = os.path.abspath(root_dir or os.getcwd())
         self.dry_run = dry_run
         self.force = force
         self.verbose = verbose
+        self.workers = workers or DEFAULT_WORKERS
 
         if verbose:
             logger.setLevel(logging.DEBUG)
 
+        self.walker = ProjectWalker(
+            self.root_dir,
+            exclude=EXCLUDED_DIRS + list(exclude or []),
+            use_gitignore=use_gitignore,
+            cache_path=walk_cache_path(self.root_dir, cache_in_project) if use_cache and not dry_run else None
+        )
+
         self.found_dirs = []
         self.renamed_dirs = []
         self.updated_files = []
@@ -84,15 +167,13 @@ class AiSetupMigrator:
 
         found_dirs = []
 
-        for root, dirs, _ in os.walk(self.root_dir):
-            # Skip excluded directories
-            dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
-
+        for root, dirs, _ in self.walker.walk():
             if OLD_DIR_NAME in dirs:
                 found_dir = os.path.join(root, OLD_DIR_NAME)
                 found_dirs.append(found_dir)
                 logger.debug(f"Found {OLD_DIR_NAME} directory: {found_dir}")
 
+        found_dirs.sort()
         self.found_dirs = found_dirs
         logger.info(f"Found {len(found_dirs)} {OLD_DIR_NAME} directories")
         return found_dirs
@@ -155,44 +236,113 @@ class AiSetupMigrator:
 
         return False
 
-    def find_files_with_references(self):
+    def _candidate_files(self):
         """
-        Find files containing references to .AI-Setup.
+        List files that may contain references, based on name patterns.
+
+        Paths that resolve to the same file (symlinks and hard links) are listed
+        once, so two workers never rewrite one file at the same time.
 
         Returns:
-            List of files with references
+            List of file paths
         """
-        logger.info(f"Searching for files with references to {OLD_DIR_NAME}")
+        candidates = []
+        seen = set()
+        for file_path in sorted(self.walker.iter_files(FILE_PATTERNS)):
+            if self._is_excluded_file(file_path):
+                logger.debug(f"Skipping excluded file: {file_path}")
+                continue
+            try:
+                file_stat = os.stat(file_path)
+            except OSError as e:
+                logger.warning(f"Error reading {file_path}: {e}")
+                continue
+            file_id = (file_stat.st_dev, file_stat.st_ino)
+            if file_id in seen:
+                logger.debug(f"Skipping {file_path}, already listed through another link")
+                continue
+            seen.add(file_id)
+            candidates.append(file_path)
+        return candidates
 
-        files_with_refs = []
+    def _process_file(self, file_path, rewrite):
+        """
+        Search one file for references and optionally rewrite it in the same pass.
 
-        for root, _, files in os.walk(self.root_dir):
-            # Skip excluded directories
-            if any(excl in root for excl in EXCLUDED_DIRS):
-                continue
+        The file is memory-mapped and searched as bytes. If a reference is found and
+        rewrite is True, the new content is streamed from the same mapping into a
+        temporary file that is then renamed over the original, so each file is read
+        only once. Symlinks and files with more than one hard link are instead
+        overwritten in place from the temporary file, so the link is preserved.
+
+        Args:
+            file_path: Path to the file
+            rewrite: If True, replace references in the file
+
+        Returns:
+            Tuple of (file_path, found, error message or None)
+        """
+        tmp_path = f"{file_path}.migrate.tmp"
+        try:
+            opened = _open_mapped(file_path)
+            if opened is None:
+                return file_path, False, None
+
+            f, mapped = opened
+            try:
+                first_match = mapped.find(OLD_DIR_BYTES)
+                if first_match == -1 or not rewrite:
+                    return file_path, first_match != -1, None
+
+                with open(tmp_path, 'wb') as out:
+                    _write_replaced(mapped, first_match, out)
+                file_stat = os.fstat(f.fileno())
+                os.chmod(tmp_path, file_stat.st_mode & 0o7777)
+            finally:
+                mapped.close()
+                f.close()
+
+            # Replace only after the mapping is closed (required on Windows)
+            if os.path.islink(file_path) or file_stat.st_nlink > 1:
+                with open(tmp_path, 'rb') as src, open(file_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+                os.remove(tmp_path)
+            else:
+                os.replace(tmp_path, file_path)
+            return file_path, True, None
+        except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return file_path, False, str(e)
 
-            for file in files:
-                # Check file extension matches patterns
-                if not any(file.endswith(pat[1:]) for pat in FILE_PATTERNS):
-                    continue
+    def _process_files(self, files, rewrite):
+        """
+        Run _process_file over files on a worker pool.
 
-                file_path = os.path.join(root, file)
+        Returns:
+            List of (file_path, found, error) tuples in the order of files
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(lambda path: self._process_file(path, rewrite), files))
 
-                # Skip excluded files
-                if self._is_excluded_file(file_path):
-                    logger.debug(f"Skipping excluded file: {file_path}")
-                    continue
+    def find_files_with_references(self):
+        """
+        Find files containing references to .AI-Setup.
 
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+        Returns:
+            List of files with references
+        """
+        logger.info(f"Searching for files with references to {OLD_DIR_NAME}")
+
+        files_with_refs = []
 
-                    if OLD_DIR_NAME in content:
-                        files_with_refs.append(file_path)
-                        if self.verbose:
-                            logger.debug(f"Found reference in {file_path}")
-                except Exception as e:
-                    logger.warning(f"Error reading {file_path}: {str(e)}")
+        for file_path, found, error in self._process_files(self._candidate_files(), rewrite=False):
+            if error:
+                logger.warning(f"Error reading {file_path}: {error}")
+            elif found:
+                files_with_refs.append(file_path)
+                if self.verbose:
+                    logger.debug(f"Found reference in {file_path}")
 
         logger.info(f"Found {len(files_with_refs)} files with references to {OLD_DIR_NAME}")
         return files_with_refs
@@ -211,30 +361,45 @@ class AiSetupMigrator:
             logger.info(f"No files found with references to {OLD_DIR_NAME}")
             return []
 
-        updated_files = []
+        self.updated_files = self._collect_updates(self._process_files(files, rewrite=not self.dry_run))
+        return self.updated_files
 
-        for file_path in files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                # Replace references
-                new_content = content.replace(OLD_DIR_NAME, NEW_DIR_NAME)
-
-                if new_content != content:
-                    if not self.dry_run:
-                        with open(file_path, 'w', encoding='utf-8') as f:
-                            f.write(new_content)
-                        updated_files.append(file_path)
-                        logger.info(f"Updated references in {file_path}")
-                    else:
-                        logger.info(f"Would update references in {file_path}")
-                        updated_files.append(file_path)
-            except Exception as e:
-                logger.error(f"Error updating references in {file_path}: {str(e)}")
-                self.errors.append(f"Error updating {file_path}: {str(e)}")
+    def migrate_references(self):
+        """
+        Find and update references to .AI-Setup in a single pass over the files.
+
+        Returns:
+            List of updated files
+        """
+        logger.info(f"Searching for and updating files with references to {OLD_DIR_NAME}")
+
+        results = self._process_files(self._candidate_files(), rewrite=not self.dry_run)
+        self.updated_files = self._collect_updates(results)
+
+        logger.info(f"Found {len(self.updated_files)} files with references to {OLD_DIR_NAME}")
+        return self.updated_files
+
+    def _collect_updates(self, results):
+        """
+        Log the results of _process_files and return the files that were updated.
 
-        self.updated_files = updated_files
+        Args:
+            results: List of (file_path, found, error) tuples
+
+        Returns:
+            List of updated files
+        """
+        updated_files = []
+        for file_path, found, error in results:
+            if error:
+                logger.error(f"Error updating references in {file_path}: {error}")
+                self.errors.append(f"Error updating {file_path}: {error}")
+            elif found:
+                if self.dry_run:
+                    logger.info(f"Would update references in {file_path}")
+                else:
+                    logger.info(f"Updated references in {file_path}")
+                updated_files.append(file_path)
         return updated_files
 
     def run(self):
@@ -268,13 +433,10 @@ class AiSetupMigrator:
             # Step 3: Rename directories
             self.rename_directories()
 
-            # Step 4: Find files with references
-            files_with_refs = self.find_files_with_references()
-
-            # Step 5: Update references in files
-            self.update_file_references(files_with_refs)
+            # Step 4: Find and update references in files
+            self.migrate_references()
 
-            # Step 6: Print summary
+            # Step 5: Print summary
             self.print_summary()
 
             return len(self.errors) == 0
@@ -326,6 +488,17 @@ def parse_args():
     parser.add_argument('--force', action='store_true', help="Don't ask for confirmation")
     parser.add_argument('--verbose', action='store_true', help="Show detailed information")
     parser.add_argument('--root-dir', type=str, help="Root directory to search", default=None)
+    parser.add_argument('--exclude', action='append', default=[], metavar='GLOB',
+                        help="Glob pattern for files or directories to skip (can be repeated)")
+    parser.add_argument('--gitignore', dest='use_gitignore', action='store_true',
+                        help="Skip paths ignored by .gitignore files")
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                        help="Don't reuse directory listings cached by a previous run")
+    parser.add_argument('--cache-in-project', dest='cache_in_project', action='store_true',
+                        help="Cache directory listings in .code_conductor/ inside the project "
+                             "instead of the user cache directory")
+    parser.add_argument('--workers', type=int, default=None,
+                        help=f"Number of threads used to scan and rewrite files (default: {DEFAULT_WORKERS})")
     return parser.parse_args()
 
 
@@ -338,7 +511,12 @@ def main():
         root_dir=args.root_dir,
         dry_run=args.dry_run,
         force=args.force,
-        verbose=args.verbose
+        verbose=args.verbose,
+        exclude=args.exclude,
+        use_gitignore=args.use_gitignore,
+        use_cache=args.use_cache,
+        cache_in_project=args.cache_in_project,
+        workers=args.workers
     )
     success = migrator.run()
     sys.exit(0 if success else 1)
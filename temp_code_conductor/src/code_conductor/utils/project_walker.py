@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Project Walker
+
+A shared directory walker for scripts that need to crawl a whole project.
+
+Compared to a bare ``os.walk`` it:
+
+1. Prunes directories and files matched by ``.gitignore`` files (at any level)
+   and by configurable glob patterns, so ``node_modules``, ``dist``, ``build``
+   and backup files are never descended into or returned
+2. Lists directories in parallel across a thread pool
+3. Optionally caches each directory's listing keyed by its mtime, so unchanged
+   directories are not re-listed on the next run
+
+The listing cache is kept out of the project: ``walk_cache_path`` puts it in
+``$CODE_CONDUCTOR_WALK_CACHE_DIR``, or in ``code_conductor/walk`` under
+``$XDG_CACHE_HOME`` (default ``~/.cache``), in a file named after a hash of the
+project root. Scripts store it in the project (``.code_conductor/walk_cache.json``)
+only when asked to with ``--cache-in-project``.
+
+Usage:
+    walker = ProjectWalker(root_dir, exclude=['*.bak'])
+    for dirpath, dirnames, filenames in walker.walk():
+        ...
+
+Like ``os.walk`` with ``topdown=True``, callers may remove entries from
+``dirnames`` to stop the walker from descending into them. Directories are
+yielded as soon as they have been listed, so the order is not deterministic.
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import fnmatch
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_EXCLUDES = [
+    '.git', 'node_modules', 'venv', '.venv', '.env', '__pycache__',
+    'dist', 'build', '*.egg-info', '.pytest_cache', '*.bak', '*.backup',
+]
+WALK_CACHE_PATH = os.path.join('.code_conductor', 'walk_cache.json')
+WALK_CACHE_DIR_ENV = 'CODE_CONDUCTOR_WALK_CACHE_DIR'
+CACHE_VERSION = 1
+# Directories modified this recently are not cached, because a second change
+# within the filesystem's timestamp granularity would go unnoticed.
+RACY_MTIME_WINDOW_NS = 2 * 1000 * 1000 * 1000
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def walk_cache_path(root_dir, in_project=False):
+    """
+    Get the file the directory listings of a project are cached in.
+
+    Args:
+        root_dir (str): Root of the project
+        in_project (bool): If True, use WALK_CACHE_PATH inside the project instead
+            of the user cache directory
+
+    Returns:
+        str: Path of the cache file (relative to root_dir when in_project is True)
+    """
+    if in_project:
+        return WALK_CACHE_PATH
+    cache_dir = os.environ.get(WALK_CACHE_DIR_ENV)
+    if not cache_dir:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        cache_dir = os.path.join(base, 'code_conductor', 'walk')
+    root_hash = hashlib.sha256(os.path.abspath(root_dir).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{root_hash}.json")
+
+
+def _translate_gitignore_pattern(pattern):
+    """Translate the path part of a gitignore pattern into a regular expression."""
+    i, n = 0, len(pattern)
+    parts = []
+    while i < n:
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('/**', i) and i + 3 == n:
+            parts.append('/.*')
+            i += 3
+        elif pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            parts.append('[^/]')
+            i += 1
+        elif pattern[i] == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                parts.append(re.escape(pattern[i]))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append(f'[{body}]')
+                i = end + 1
+        elif pattern[i] == '\\' and i + 1 < n:
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return ''.join(parts)
+
+
+def parse_gitignore(text, base=''):
+    """
+    Parse the contents of a .gitignore file.
+
+    Args:
+        text (str): Contents of the .gitignore file
+        base (str): Directory containing the file, relative to the walk root ('' for the root)
+
+    Returns:
+        list: Rules as (base, compiled regex, negate, dir_only) tuples
+    """
+    rules = []
+    for raw_line in text.splitlines():
+        line = raw_line.rstrip()
+        if raw_line.endswith('\\ '):
+            line += ' '
+        if not line or line.startswith('#'):
+            continue
+
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        elif line.startswith('\\'):
+            line = line[1:]
+
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            continue
+
+        anchored = '/' in line
+        line = line.lstrip('/')
+        regex = _translate_gitignore_pattern(line)
+        if not anchored:
+            regex = '(?:.*/)?' + regex
+        rules.append((base, re.compile(f'^{regex}$'), negate, dir_only))
+    return rules
+
+
+def is_ignored(rel_path, is_dir, rules):
+    """
+    Check a path against gitignore rules, where the last matching rule wins.
+
+    Args:
+        rel_path (str): Path relative to the walk root, using '/' separators
+        is_dir (bool): Whether the path is a directory
+        rules (list): Rules from parse_gitignore, outermost first
+
+    Returns:
+        bool: True if the path is ignored
+    """
+    ignored = False
+    for base, regex, negate, dir_only in rules:
+        if dir_only and not is_dir:
+            continue
+        if base:
+            if not rel_path.startswith(base + '/'):
+                continue
+            candidate = rel_path[len(base) + 1:]
+        else:
+            candidate = rel_path
+        if regex.match(candidate):
+            ignored = not negate
+    return ignored
+
+
+class ProjectWalker:
+    """
+    Gitignore-aware, parallel, cached replacement for os.walk over a project tree.
+    """
+
+    def __init__(self, root_dir, exclude=None, use_gitignore=True, skip_hidden_dirs=False,
+                 max_workers=None, cache_path=None):
+        """
+        Initialize the walker.
+
+        Args:
+            root_dir (str): Root of the project; .gitignore files are honoured from here down
+            exclude (list): Glob patterns for files and directories to skip. Patterns
+                containing '/' match the path relative to the root, others match the name.
+                Defaults to DEFAULT_EXCLUDES.
+            use_gitignore (bool): If True, honour .gitignore files
+            skip_hidden_dirs (bool): If True, skip directories whose name starts with '.'
+            max_workers (int): Number of threads used to list directories
+            cache_path (str): Optional path of a JSON file used to cache directory
+                listings between runs (relative paths are resolved against root_dir);
+                see walk_cache_path
+        """
+        self.root_dir = os.path.abspath(root_dir)
+        self.exclude = list(DEFAULT_EXCLUDES if exclude is None else exclude)
+        self.use_gitignore = use_gitignore
+        self.skip_hidden_dirs = skip_hidden_dirs
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self.cache_path = os.path.join(self.root_dir, cache_path) if cache_path else None
+
+        self._cache = {}
+        self._cache_dirty = False
+        self._lock = threading.Lock()
+        self.stats = {'listed': 0, 'cached': 0}
+        self._load_cache()
+
+    def _load_cache(self):
+        """Load cached directory listings from disk."""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION and data.get('root') == self.root_dir:
+                self._cache = data.get('dirs', {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable walk cache {self.cache_path}: {e}")
+
+    def save_cache(self):
+        """Persist cached directory listings if any changed during the walk."""
+        if not self.cache_path or not self._cache_dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'root': self.root_dir, 'dirs': self._cache}, f,
+                          separators=(',', ':'))
+            os.replace(tmp_path, self.cache_path)
+            self._cache_dirty = False
+        except OSError as e:
+            logger.warning(f"Could not save walk cache {self.cache_path}: {e}")
+
+    def _is_excluded(self, name, rel_path):
+        """Check a name or root-relative path against the configured exclude globs."""
+        if rel_path == WALK_CACHE_PATH.replace(os.sep, '/'):
+            return True
+        for pattern in self.exclude:
+            target = rel_path if '/' in pattern else name
+            if fnmatch.fnmatch(target, pattern):
+                return True
+        return False
+
+    def _list_dir(self, rel_dir):
+        """
+        List one directory, using the cache when its mtime is unchanged.
+
+        Returns:
+            tuple: (list of subdirectory names, list of file names)
+        """
+        abs_dir = os.path.join(self.root_dir, rel_dir) if rel_dir else self.root_dir
+        st = os.stat(abs_dir)
+
+        cached = self._cache.get(rel_dir) if self.cache_path else None
+        if cached and cached[0] == st.st_mtime_ns:
+            with self._lock:
+                self.stats['cached'] += 1
+            return list(cached[1]), list(cached[2])
+
+        dirs, files = [], []
+        with os.scandir(abs_dir) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    else:
+                        files.append(entry.name)
+                except OSError:
+                    continue
+
+        with self._lock:
+            self.stats['listed'] += 1
+            if self.cache_path and time.time_ns() - st.st_mtime_ns > RACY_MTIME_WINDOW_NS:
+                self._cache[rel_dir] = [st.st_mtime_ns, dirs, files]
+                self._cache_dirty = True
+        return dirs, files
+
+    def _read_rules(self, rel_dir, files, parent_rules):
+        """Extend the parent's gitignore rules with this directory's .gitignore."""
+        if not self.use_gitignore or '.gitignore' not in files:
+            return parent_rules
+        abs_path = os.path.join(self.root_dir, rel_dir, '.gitignore')
+        try:
+            with open(abs_path, 'r', encoding='utf-8', errors='replace') as f:
+                return parent_rules + parse_gitignore(f.read(), rel_dir.replace(os.sep, '/'))
+        except OSError as e:
+            logger.warning(f"Could not read {abs_path}: {e}")
+            return parent_rules
+
+    def _process_dir(self, rel_dir, parent_rules):
+        """List a directory and filter its entries. Runs on a worker thread."""
+        dirs, files = self._list_dir(rel_dir)
+        rules = self._read_rules(rel_dir, files, parent_rules)
+
+        def keep(name, is_dir):
+            rel_path = f"{rel_dir}/{name}" if rel_dir else name
+            rel_path = rel_path.replace(os.sep, '/')
+            if is_dir and self.skip_hidden_dirs and name.startswith('.'):
+                return False
+            if self._is_excluded(name, rel_path):
+                return False
+            return not (rules and is_ignored(rel_path, is_dir, rules))
+
+        kept_dirs = sorted(d for d in dirs if keep(d, True))
+        kept_files = sorted(f for f in files if keep(f, False))
+        return rel_dir, kept_dirs, kept_files, rules
+
+    def _rules_for(self, rel_dir):
+        """Collect gitignore rules from the root down to (and including) rel_dir."""
+        rules = []
+        if not self.use_gitignore:
+            return rules
+        current = ''
+        parts = [p for p in rel_dir.split(os.sep) if p] if rel_dir else []
+        for part in [None] + parts:
+            if part is not None:
+                current = os.path.join(current, part) if current else part
+            gitignore = os.path.join(self.root_dir, current, '.gitignore')
+            if os.path.isfile(gitignore):
+                rules = self._read_rules(current, ['.gitignore'], rules)
+        return rules
+
+    def walk(self, top=None):
+        """
+        Walk the tree under top (default: the root), yielding like os.walk.
+
+        Gitignore rules from directories between the root and top are applied.
+
+        Args:
+            top (str): Directory to start from; must be inside the root
+
+        Yields:
+            tuple: (dirpath, dirnames, filenames); dirnames may be pruned in place
+        """
+        top = os.path.abspath(top or self.root_dir)
+        rel_top = os.path.relpath(top, self.root_dir)
+        if rel_top == '.':
+            rel_top = ''
+        elif rel_top.startswith('..'):
+            raise ValueError(f"{top} is not inside {self.root_dir}")
+
+        if rel_top and not os.path.isdir(top):
+            return
+
+        parent_rules = self._rules_for(os.path.dirname(rel_top)) if rel_top else []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = {pool.submit(self._process_dir, rel_top, parent_rules)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        rel_dir, dirnames, filenames, rules = future.result()
+                    except OSError as e:
+                        logger.warning(f"Could not list directory: {e}")
+                        continue
+
+                    dirpath = os.path.join(self.root_dir, rel_dir) if rel_dir else self.root_dir
+                    yield dirpath, dirnames, filenames
+
+                    for name in dirnames:
+                        child = os.path.join(rel_dir, name) if rel_dir else name
+                        pending.add(pool.submit(self._process_dir, child, rules))
+
+        self.save_cache()
+
+    def iter_files(self, patterns=None, top=None):
+        """
+        Yield absolute paths of files, optionally filtered by fnmatch patterns.
+
+        Args:
+            patterns (list): Filename globs such as ['*.md']; None yields every file
+            top (str): Directory to start from (default: the root)
+
+        Yields:
+            str: Absolute file path
+        """
+        for dirpath, _, filenames in self.walk(top):
+            for name in filenames:
+                if patterns is None or any(fnmatch.fnmatch(name, p) for p in patterns):
+                    yield os.path.join(dirpath, name)
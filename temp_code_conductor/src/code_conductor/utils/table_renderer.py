@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Streaming Table Renderer
+
+Prints tables of work efforts without building the whole table first.
+
+``rich`` and ``tabulate`` measure every cell of every row before the first line
+is printed, so listing thousands of work efforts spends most of its time
+rendering. ``TableRenderer`` instead:
+
+1. Takes column widths from the column definition when they are known (status
+   and priority values have a fixed maximum), and otherwise from the first
+   ``sample_size`` rows. Widths are capped, and longer cells are cut with an
+   ellipsis, so a row outside the sample can never widen the table.
+2. Formats rows one at a time with ``str.ljust`` and writes them in chunks of
+   ``chunk_size`` lines, flushing after each chunk, so the first rows appear
+   while the rest are still being read.
+3. Colours status and priority cells only when the output is a terminal. When
+   it is not (a pipe or a file), rows are plain text with no escape codes.
+
+``Pager`` shows a table one screen at a time. It pulls rows from the source
+only as far as the user has scrolled and formats only the rows in the visible
+window, so paging through a large listing costs the same per screen regardless
+of its length.
+"""
+
+import os
+import sys
+import shutil
+from collections import namedtuple
+from itertools import chain, islice
+
+# Constants
+SAMPLE_SIZE = 200
+CHUNK_SIZE = 100
+MAX_COLUMN_WIDTH = 60
+ELLIPSIS = '…'
+COLUMN_GAP = '  '
+RESET = '\033[0m'
+CLEAR_SCREEN = '\033[H\033[2J'
+PAGER_KEYS = {
+    ' ': 'next', 'f': 'next', 'j': 'down', '\r': 'down', '\n': 'down',
+    'b': 'back', 'k': 'up', 'g': 'top', 'q': 'quit', '\x03': 'quit',
+}
+
+Column = namedtuple('Column', ['header', 'key', 'default', 'width', 'styles'])
+Column.__new__.__defaults__ = ('', None, None)
+
+STATUS_STYLES = {'active': '\033[33m', 'paused': '\033[34m', 'completed': '\033[32m', 'archived': '\033[2m'}
+PRIORITY_STYLES = {'critical': '\033[1;31m', 'high': '\033[31m', 'medium': '\033[33m', 'low': '\033[32m'}
+
+WORK_EFFORT_COLUMNS = [
+    Column('Title', 'title', 'Untitled'),
+    Column('Status', 'status', 'unknown', width=9, styles=STATUS_STYLES),
+    Column('Priority', 'priority', 'none', width=8, styles=PRIORITY_STYLES),
+    Column('Assignee', 'assignee', 'unassigned'),
+    Column('Due Date', 'due_date', 'not set', width=10),
+]
+
+
+def is_terminal(stream):
+    """Return True if stream is an interactive terminal."""
+    isatty = getattr(stream, 'isatty', None)
+    return bool(isatty and isatty())
+
+
+def use_color(stream):
+    """Return True if ANSI colours should be written to stream."""
+    return is_terminal(stream) and not os.environ.get('NO_COLOR')
+
+
+class TableRenderer:
+    """
+    Formats rows of dicts as a fixed-width table, one row at a time.
+    """
+
+    def __init__(self, columns=None, sample_size=SAMPLE_SIZE, chunk_size=CHUNK_SIZE,
+                 max_width=MAX_COLUMN_WIDTH, color=False):
+        """
+        Initialize the renderer.
+
+        Args:
+            columns (list): Column definitions (default: WORK_EFFORT_COLUMNS)
+            sample_size (int): Number of leading rows used to size columns without a width
+            chunk_size (int): Number of lines written per write call
+            max_width (int): Widest a sampled column may be
+            color (bool): Colour cells of columns that define styles
+        """
+        self.columns = list(columns or WORK_EFFORT_COLUMNS)
+        self.sample_size = sample_size
+        self.chunk_size = chunk_size
+        self.max_width = max_width
+        self.color = color
+        self.widths = None
+        self.sampled = 0
+
+    def cell(self, row, column):
+        """Return the text of one cell."""
+        value = row.get(column.key)
+        if value is None or value == '':
+            return column.default
+        if isinstance(value, (list, tuple)):
+            return ', '.join(str(item) for item in value)
+        return str(value)
+
+    def compute_widths(self, sample):
+        """
+        Size the columns from their fixed widths and a sample of rows.
+
+        Args:
+            sample (list): Rows used to measure columns without a fixed width
+
+        Returns:
+            list: Width of each column
+        """
+        widths = []
+        for column in self.columns:
+            if column.width:
+                widths.append(max(column.width, len(column.header)))
+                continue
+            longest = max((len(self.cell(row, column)) for row in sample), default=0)
+            widths.append(max(len(column.header), min(longest, self.max_width)))
+        self.widths = widths
+        return widths
+
+    def _fit(self, text, width):
+        """Pad or cut text to exactly width characters."""
+        if len(text) > width:
+            return text[:width - 1] + ELLIPSIS
+        return text.ljust(width)
+
+    def format_header(self):
+        """Return the header line and the separator line."""
+        header = COLUMN_GAP.join(self._fit(column.header, width) for column, width in zip(self.columns, self.widths))
+        separator = COLUMN_GAP.join('-' * width for width in self.widths)
+        return header.rstrip(), separator
+
+    def format_row(self, row):
+        """
+        Format one row with the current column widths.
+
+        Args:
+            row (dict): Values keyed by column key
+
+        Returns:
+            str: The formatted line, without a trailing newline
+        """
+        cells = []
+        for column, width in zip(self.columns, self.widths):
+            text = self._fit(self.cell(row, column), width)
+            if self.color and column.styles:
+                style = column.styles.get(text.strip().lower())
+                if style:
+                    text = f"{style}{text}{RESET}"
+            cells.append(text)
+        return COLUMN_GAP.join(cells).rstrip()
+
+    def sample(self, rows):
+        """
+        Read the sample rows and size the columns from them.
+
+        Args:
+            rows (iterable): Row source
+
+        Returns:
+            iterator: All rows, starting with the sampled ones
+        """
+        rows = iter(rows)
+        sample = list(islice(rows, self.sample_size))
+        self.compute_widths(sample)
+        self.sampled = len(sample)
+        return chain(sample, rows)
+
+    def iter_lines(self, rows):
+        """
+        Yield the header, the separator and one line per row.
+
+        Args:
+            rows (iterable): Row source; read lazily after the sample
+
+        Yields:
+            str: Lines without trailing newlines; nothing if there are no rows
+        """
+        rows = self.sample(rows)
+        if not self.sampled:
+            return
+        yield from self.format_header()
+        for row in rows:
+            yield self.format_row(row)
+
+    def write(self, rows, stream=None):
+        """
+        Write the table to stream in chunks.
+
+        Args:
+            rows (iterable): Row source
+            stream: Text stream (default: sys.stdout)
+
+        Returns:
+            int: Number of rows written
+        """
+        stream = stream or sys.stdout
+        lines = self.iter_lines(rows)
+        count = -2  # The header and separator are not rows
+        while True:
+            chunk = list(islice(lines, self.chunk_size))
+            if not chunk:
+                break
+            count += len(chunk)
+            stream.write('\n'.join(chunk) + '\n')
+            stream.flush()
+        return max(count, 0)
+
+
+class Pager:
+    """
+    Shows a table one screen at a time, formatting only the visible rows.
+    """
+
+    def __init__(self, renderer, rows, stream=None, height=None, keys=None):
+        """
+        Initialize the pager.
+
+        Args:
+            renderer (TableRenderer): Renderer used to format the visible rows
+            rows (iterable): Row source; read only as far as the user scrolls
+            stream: Terminal to draw on (default: sys.stdout)
+            height (int): Screen height in lines (default: the terminal height)
+            keys (iterable): Key presses to use instead of reading the keyboard
+        """
+        self.renderer = renderer
+        self.stream = stream or sys.stdout
+        self.height = height or shutil.get_terminal_size().lines
+        self.page_size = max(self.height - 3, 1)  # Header, separator and status line
+        self.keys = iter(keys) if keys is not None else None
+        self.top = 0
+        self._source = renderer.sample(rows)
+        self._rows = []
+        self._exhausted = False
+
+    def _fetch(self, count):
+        """Read rows from the source until count are buffered or it runs out."""
+        if count > len(self._rows) and not self._exhausted:
+            self._rows.extend(islice(self._source, count - len(self._rows)))
+            self._exhausted = len(self._rows) < count
+
+    def window(self):
+        """Return the formatted lines of the visible rows."""
+        self._fetch(self.top + self.page_size)
+        return [self.renderer.format_row(row) for row in self._rows[self.top:self.top + self.page_size]]
+
+    def draw(self):
+        """Draw the header, the visible rows and a status line."""
+        lines = list(self.renderer.format_header()) + self.window()
+        last = min(self.top + self.page_size, len(self._rows))
+        more = '' if self._exhausted and last >= len(self._rows) else '+'
+        status = f"rows {self.top + 1 if last else 0}-{last} of {len(self._rows)}{more}  (space/b page, j/k line, q quit)"
+        self.stream.write(CLEAR_SCREEN + '\n'.join(lines) + '\n' + status)
+        self.stream.flush()
+
+    def _read_key(self):
+        """Return the next key press, or 'q' when there is no more input."""
+        if self.keys is not None:
+            return next(self.keys, 'q')
+        try:
+            import termios
+            import tty
+        except ImportError:
+            return (input() or ' ')[:1]
+        fd = sys.stdin.fileno()
+        previous = termios.tcgetattr(fd)
+        try:
+            tty.setraw(fd)
+            return sys.stdin.read(1)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, previous)
+
+    def scroll(self, action):
+        """Move the window for a pager action."""
+        if action == 'next':
+            self._fetch(self.top + 2 * self.page_size)
+            if self.top + self.page_size < len(self._rows):
+                self.top += self.page_size
+        elif action == 'down':
+            self._fetch(self.top + self.page_size + 1)
+            if self.top + self.page_size < len(self._rows):
+                self.top += 1
+        elif action == 'back':
+            self.top = max(self.top - self.page_size, 0)
+        elif action == 'up':
+            self.top = max(self.top - 1, 0)
+        elif action == 'top':
+            self.top = 0
+
+    def run(self):
+        """
+        Page until the user quits.
+
+        Returns:
+            int: Number of rows read from the source
+        """
+        while True:
+            self.draw()
+            action = PAGER_KEYS.get(self._read_key())
+            if action == 'quit':
+                break
+            self.scroll(action)
+        self.stream.write('\n')
+        self.stream.flush()
+        return len(self._rows)
+
+
+def render_table(rows, columns=None, stream=None, pager=False, **options):
+    """
+    Print rows as a table, paging on a terminal if asked to.
+
+    Output that is not a terminal is written as plain text without colours and
+    is never paged.
+
+    Args:
+        rows (iterable): Row dicts; read lazily
+        columns (list): Column definitions (default: WORK_EFFORT_COLUMNS)
+        stream: Text stream (default: sys.stdout)
+        pager (bool): Page the table when stream is a terminal
+        **options: Further TableRenderer options
+
+    Returns:
+        int: Number of rows written or read by the pager
+    """
+    stream = stream or sys.stdout
+    renderer = TableRenderer(columns, color=use_color(stream), **options)
+    if pager and is_terminal(stream):
+        return Pager(renderer, rows, stream=stream).run()
+    return renderer.write(rows, stream)
@@ -1,10 +1,13 @@
-import json
 import asyncio
-import requests
 import random
 import sys
 from typing import Optional
 
+try:
+    from .json_stream import JSONFieldParser
+except ImportError:
+    from json_stream import JSONFieldParser
+
 # ANSI escape codes for terminal manipulation
 CLEAR_LINE = "\033[K"
 UP_ONE_LINE = "\033[F"
@@ -129,16 +132,21 @@ class ThoughtProcessSimulator:
             self._erase_current_line()
             sys.stdout.flush()
 
-async def generate_content_with_ollama(description: str, model: str = "phi3") -> Optional[dict]:
-    """Generate content for the work effort using Ollama with thought process simulation."""
-    print("🧠 Starting content generation process...")
-
-    # Create and start the thought process simulator
-    simulator = ThoughtProcessSimulator()
-    thought_process = asyncio.create_task(simulator.run_thought_process())
+async def generate_content_with_ollama(description: str, model: str = "phi3", use_cache: bool = True) -> Optional[dict]:
+    """Generate content for the work effort using Ollama with thought process simulation.
 
+    Complete content is kept in the response cache, so the same description and
+    model are answered from disk without calling the model. An answer whose JSON
+    object was never closed is not cached.
+    """
     try:
-        prompt = f"""
+        from ..providers.ollama import aclosing, agenerate_stream
+        from ..providers.response_cache import get_response_cache
+    except ImportError:
+        from providers.ollama import aclosing, agenerate_stream
+        from providers.response_cache import get_response_cache
+
+    prompt = f"""
         Based on this description: "{description}"
 
         Please generate structured content for a work effort. Provide:
@@ -151,48 +159,40 @@ async def generate_content_with_ollama(description: str, model: str = "phi3") ->
         Keep the content concise and focused.
         """
 
-        # Make the actual API call with streaming enabled
-        response = requests.post(
-            "http://localhost:11434/api/generate",
-            json={"model": model, "prompt": prompt, "stream": True},
-            stream=True
-        )
-
-        full_response = ""
-        first_token = True
-
-        for line in response.iter_lines():
-            if line:
-                # Signal generation has started on first token
-                if first_token:
-                    simulator.signal_generation_started()
-                    first_token = False
-
-                try:
-                    data = json.loads(line)
-                    if "response" in data:
-                        full_response += data["response"]
-                except json.JSONDecodeError:
-                    continue
+    cache = get_response_cache() if use_cache else None
+    if cache:
+        cache_key = cache.key("ollama", model, prompt)
+        content = cache.get(cache_key)
+        if content:
+            print("✨ Using cached content generated earlier for this description.")
+            return content
 
-        try:
-            # Find JSON object in the response
-            start_idx = full_response.find('{')
-            end_idx = full_response.rfind('}') + 1
-
-            if start_idx >= 0 and end_idx > start_idx:
-                json_str = full_response[start_idx:end_idx]
-                content = json.loads(json_str)
-
-                # Stop the thought process and show success
-                simulator.should_continue = False
-                await thought_process
-                print("\n✨ Content generated successfully!")
-                return content
-            else:
-                print("\n❌ Could not extract valid JSON from model response.")
-        except json.JSONDecodeError:
-            print("\n❌ Could not parse model response as JSON.")
+    print("🧠 Starting content generation process...")
+
+    # Create and start the thought process simulator
+    simulator = ThoughtProcessSimulator()
+    thought_process = asyncio.create_task(simulator.run_thought_process())
+
+    try:
+        # Stream the response without blocking the simulator, stopping once the JSON is complete
+        parser = JSONFieldParser()
+        async with aclosing(agenerate_stream(prompt, model)) as stream:
+            async for piece in stream:
+                simulator.signal_generation_started()
+                if parser.feed(piece):
+                    break
+
+        content = parser.result()
+        if content:
+            if cache and parser.done:
+                cache.put(cache_key, content)
+
+            # Stop the thought process and show success
+            simulator.should_continue = False
+            await thought_process
+            print("\n✨ Content generated successfully!")
+            return content
+        print("\n❌ Could not extract valid JSON from model response.")
     except Exception as e:
         print(f"\n❌ Error communicating with Ollama: {e}")
     finally:
@@ -205,6 +205,7 @@ async def generate_content_with_ollama(description: str, model: str = "phi3") ->
 def get_available_ollama_models():
     """Get a list of available Ollama models."""
     try:
+        import requests
         response = requests.get("http://localhost:11434/api/tags")
         if response.status_code == 200:
             models = response.json().get("models", [])
@@ -6,13 +6,35 @@ Work Effort data model.
 
 This module provides data structures for representing work efforts
 and functions for converting between different representations.
+
+A work effort read from markdown keeps the scanned document and the byte
+offsets of its sections. Sections are decoded only when they are read, and
+``to_markdown`` and ``save`` splice changed sections and frontmatter keys into
+the original bytes instead of regenerating the document. Saving back to the
+file a work effort was loaded from writes only the changed ranges, so appending
+to the last section of a large work effort writes just the appended text.
 """
 
+import os
 import json
-import re
+from collections.abc import MutableMapping
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Iterator, List, Optional, Union, Any
+
+from .work_efforts.frontmatter import decode, file_stamp, parse_document, splice, splice_file
+
+# Constants
+SECTION_EMOJIS = {
+    'objectives': '🚩',
+    'tasks': '🛠',
+    'notes': '📝',
+    'issues': '🐞',
+    'outcomes': '✅',
+    'links': '📌',
+    'timeline': '📅'
+}
+HEADER_FIELDS = ['title', 'status', 'priority', 'assignee', 'created', 'last_updated', 'due_date', 'tags']
 
 class WorkEffortStatus(Enum):
     """Enumeration of possible work effort statuses."""
@@ -44,6 +66,105 @@ class WorkEffortPriority(Enum):
                 return priority
         return cls.MEDIUM  # Default to medium if not found
 
+class SectionContent(MutableMapping):
+    """
+    Content sections of a work effort, keyed by section name.
+
+    Sections of a parsed document are decoded on first access; sections that
+    are set or deleted are remembered so they can be spliced into the document.
+    """
+
+    def __init__(self, values: Optional[Dict[str, str]] = None, document=None, sections=None):
+        """
+        Initialize the sections.
+
+        Args:
+            values: Section name -> content for sections without a document
+            document: MarkdownDocument the sections were scanned from
+            sections: Section name -> Section offsets in document
+        """
+        self.document = document
+        self.sections = dict(sections or {})
+        self.changed = {}  # Ordered set of changed section names
+        self._values = {}
+        for key, value in (values or {}).items():
+            self[key] = value
+
+    def __getitem__(self, key: str) -> str:
+        if key not in self._values:
+            if key not in self.sections or key in self.changed:
+                raise KeyError(key)
+            self._values[key] = self.document.section_content(self.sections[key])
+        return self._values[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self._values[key] = value
+        self.changed[key] = None
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._values.pop(key, None)
+        self.changed[key] = None
+        if key not in self.sections:
+            self.changed.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or (key in self.sections and key not in self.changed)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.sections:
+            if key in self:
+                yield key
+        for key in self._values:
+            if key not in self.sections:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"SectionContent({list(self)})"
+
+    def replacements(self) -> List[tuple]:
+        """
+        Return the byte replacements that write the changed sections into the document.
+
+        Returns:
+            List of (start, end, bytes); new sections are appended at the end
+        """
+        data = self.document.data
+        replacements, added = [], []
+        for key in self.changed:
+            section = self.sections.get(key)
+            if section is None:
+                added.append(key)
+                continue
+            if key not in self._values:
+                replacements.append((section.start, section.end, b''))
+                continue
+
+            # Keep the whitespace around the old content and only touch what changed
+            raw = data[section.content_start:section.end]
+            start = section.content_start + len(raw) - len(raw.lstrip())
+            end = section.content_start + len(raw.rstrip())
+            old, new = data[start:end], self._values[key].strip().encode('utf-8')
+            if new.startswith(old):
+                replacements.append((end, end, new[len(old):]))
+            else:
+                replacements.append((start, end, new))
+
+        if added:
+            # Separate the new sections from the last line with one blank line
+            if not data or data.endswith(b'\n\n'):
+                lead = b''
+            else:
+                lead = b'\n' if data.endswith(b'\n') else b'\n\n'
+            tail = b'\n'.join(f"{_section_heading(key)}\n{self._values[key]}\n".encode('utf-8') for key in added)
+            replacements.append((len(data), len(data), lead + tail))
+        return replacements
+
+
 class WorkEffort:
     """
     Representation of a work effort.
@@ -108,20 +229,25 @@ class WorkEffort:
 
         # Optional metadata
         self.tags = tags or []
-        self.content = content or {}
+        self.content = content if isinstance(content, SectionContent) else SectionContent(content)
 
         # File information
         self.path = path
         self.filename = filename
         self.last_modified = last_modified
 
+        # Frontmatter values as loaded, to find the keys that changed
+        self._loaded_header = None
+        # Modification time and size of the file the document was read from
+        self._stamp = None
+
     @classmethod
     def from_markdown(cls, content: str, path: Optional[str] = None, filename: Optional[str] = None, last_modified: Optional[float] = None) -> 'WorkEffort':
         """
         Create a WorkEffort from markdown content.
 
         Args:
-            content: Markdown content of the work effort
+            content: Markdown content of the work effort (str or bytes)
             path: Path to the file
             filename: Name of the file
             last_modified: Last modified timestamp
@@ -129,74 +255,19 @@ class WorkEffort:
         Returns:
             A WorkEffort instance
         """
-        # Extract metadata from frontmatter
-        metadata_match = re.search(r'---\s+(.*?)\s+---', content, re.DOTALL)
-        if not metadata_match:
+        document = parse_document(content)
+        if not document.has_frontmatter:
             raise ValueError("No metadata found in markdown content")
+        metadata = _normalize_metadata(document.fields)
 
-        metadata_text = metadata_match.group(1)
-        metadata = {}
-
-        # Parse frontmatter
-        for line in metadata_text.split('\n'):
-            line = line.strip()
-            if not line or line.startswith('#'):  # Skip empty lines and comments
-                continue
-
-            # Try to parse the line as key-value pair
-            try:
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-
-                # Special handling for tags
-                if key == 'tags':
-                    # Try to parse as JSON array
-                    try:
-                        tags = json.loads(value.replace("'", '"'))
-                        metadata[key] = tags
-                    except json.JSONDecodeError:
-                        # Fallback to manual parsing
-                        tags = value.strip('[]').split(',')
-                        metadata[key] = [tag.strip() for tag in tags]
-                else:
-                    metadata[key] = value
-            except ValueError:
-                # Skip line if it can't be parsed
-                continue
-
-        # Extract content sections
-        content_dict = {}
-        section_pattern = r'## ([^\n]+)\n(.*?)(?=\n## |$)'
-        for match in re.finditer(section_pattern, content, re.DOTALL):
-            section_title = match.group(1).strip()
-            section_content = match.group(2).strip()
-
-            # Convert section title to key
-            key = section_title.lower()
-            if key.startswith('🚩'):  # Handle emoji in section title
-                key = "objectives"
-            elif key.startswith('🛠'):
-                key = "tasks"
-            elif key.startswith('📝'):
-                key = "notes"
-            elif key.startswith('🐞'):
-                key = "issues"
-            elif key.startswith('✅'):
-                key = "outcomes"
-            elif key.startswith('📌'):
-                key = "links"
-            elif key.startswith('📅'):
-                key = "timeline"
-
-            content_dict[key] = section_content
+        # Record where each content section is; sections are decoded on first access
+        sections = {}
+        for section in document.sections:
+            if section.level == 2:
+                sections.setdefault(_section_key(section.title), section)
 
         # Create the WorkEffort
-        return cls(
+        work_effort = cls(
             title=metadata.get('title', "Untitled"),
             assignee=metadata.get('assignee', "self"),
             priority=metadata.get('priority', "medium"),
@@ -205,11 +276,32 @@ class WorkEffort:
             created=metadata.get('created'),
             last_updated=metadata.get('last_updated'),
             tags=metadata.get('tags', []),
-            content=content_dict,
+            content=SectionContent(document=document, sections=sections),
             path=path,
             filename=filename,
             last_modified=last_modified
         )
+        work_effort._loaded_header = work_effort._header_values()
+        return work_effort
+
+    @classmethod
+    def from_file(cls, path: str) -> 'WorkEffort':
+        """
+        Read a WorkEffort from a markdown file.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            A WorkEffort instance that can be saved back in place
+        """
+        with open(path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            data = f.read()
+        work_effort = cls.from_markdown(data, path=path, filename=os.path.basename(path),
+                                        last_modified=st.st_mtime)
+        work_effort._stamp = file_stamp(st)
+        return work_effort
 
     @classmethod
     def from_json(cls, json_data: Union[str, Dict]) -> 'WorkEffort':
@@ -253,6 +345,9 @@ class WorkEffort:
         Returns:
             Markdown representation of the work effort
         """
+        if self.content.document is not None:
+            return decode(splice(self.content.document.data, self._replacements()))
+
         # Start with metadata
         lines = [
             "---",
@@ -279,31 +374,95 @@ class WorkEffort:
         lines.append("")
 
         # Add content sections with emojis
-        section_emojis = {
-            'objectives': '🚩',
-            'tasks': '🛠',
-            'notes': '📝',
-            'issues': '🐞',
-            'outcomes': '✅',
-            'links': '📌',
-            'timeline': '📅'
-        }
-
-        for section, emoji in section_emojis.items():
+        for section in SECTION_EMOJIS:
             if section in self.content:
-                lines.append(f"## {emoji} {section.title()}")
+                lines.append(_section_heading(section))
                 lines.append(self.content[section])
                 lines.append("")
 
         # Add any other sections that might not have emojis
         for section, content in self.content.items():
-            if section not in section_emojis:
-                lines.append(f"## {section.title()}")
+            if section not in SECTION_EMOJIS:
+                lines.append(_section_heading(section))
                 lines.append(content)
                 lines.append("")
 
         return "\n".join(lines)
 
+    def save(self, path: Optional[str] = None) -> str:
+        """
+        Write the work effort to disk.
+
+        Saving to the file the work effort was read from splices only the
+        changed frontmatter keys and sections into it. Any other target, or a
+        file that changed since it was read, gets the whole document.
+
+        Args:
+            path: Where to write (default: the path the work effort was read from)
+
+        Returns:
+            The path written
+        """
+        path = path or self.path
+        if not path:
+            raise ValueError("No path to save the work effort to")
+
+        document = self.content.document
+        if document is None:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self.to_markdown())
+        else:
+            replacements = self._replacements()
+            data = splice(document.data, replacements)
+            try:
+                if not (self.path and os.path.exists(path) and os.path.exists(self.path)
+                        and os.path.samefile(path, self.path)):
+                    raise ValueError(f"{path} is not the file the work effort was read from")
+                splice_file(path, document.data, replacements, self._stamp)
+            except ValueError:
+                with open(path, 'wb') as f:
+                    f.write(data)
+            self._reload(data)
+
+        st = os.stat(path)
+        self.path = path
+        self.filename = os.path.basename(path)
+        self.last_modified = st.st_mtime
+        self._stamp = file_stamp(st)
+        return path
+
+    def _header_values(self) -> Dict[str, Any]:
+        """Return the frontmatter values of this work effort."""
+        return {
+            'title': self.title,
+            'status': self.status.value,
+            'priority': self.priority.value,
+            'assignee': self.assignee,
+            'created': self.created,
+            'last_updated': self.last_updated,
+            'due_date': self.due_date,
+            'tags': list(self.tags),
+        }
+
+    def _replacements(self) -> List[tuple]:
+        """Return the byte replacements that bring the loaded document up to date."""
+        document = self.content.document
+        values = self._header_values()
+        updates = {key: value for key, value in values.items()
+                   if (self._loaded_header or {}).get(key) != value}
+        replacements = document.header_replacements(updates) if updates else []
+        return replacements + self.content.replacements()
+
+    def _reload(self, data: bytes) -> None:
+        """Rescan the written document so later changes splice against it."""
+        document = parse_document(data)
+        sections = {}
+        for section in document.sections:
+            if section.level == 2:
+                sections.setdefault(_section_key(section.title), section)
+        self.content = SectionContent(document=document, sections=sections)
+        self._loaded_header = self._header_values()
+
     def to_json(self, include_content: bool = True) -> Dict:
         """
         Convert the work effort to JSON format.
@@ -331,7 +490,7 @@ class WorkEffort:
         }
 
         if include_content:
-            result["content"] = self.content
+            result["content"] = dict(self.content)
 
         return result
 
@@ -363,6 +522,17 @@ class WorkEffort:
         # Update last_updated time
         self.last_updated = datetime.now().strftime("%Y-%m-%d %H:%M")
 
+    def append_content(self, section: str, text: str) -> None:
+        """
+        Append text to a content section, creating it if needed.
+
+        Args:
+            section: Section to append to
+            text: Text to add on a new line
+        """
+        existing = self.content.get(section, "")
+        self.update_content(section, f"{existing}\n{text}" if existing else text)
+
     def __str__(self) -> str:
         """String representation of the work effort."""
         return f"WorkEffort(title={self.title}, status={self.status.value}, priority={self.priority.value})"
@@ -374,6 +544,19 @@ class WorkEffort:
 
 # Standalone functions for working with work efforts
 
+def _section_key(title: str) -> str:
+    """Convert a section heading to its content key."""
+    key = title.lower()
+    for section, emoji in SECTION_EMOJIS.items():
+        if key.startswith(emoji):  # Handle emoji in section title
+            return section
+    return key
+
+def _section_heading(key: str) -> str:
+    """Return the heading line written for a content key."""
+    emoji = SECTION_EMOJIS.get(key)
+    return f"## {emoji} {key.title()}" if emoji else f"## {key.title()}"
+
 def create_filename_from_title(title: str, timestamp: str, max_length: int = 200) -> str:
     """
     Create a filename from a title and timestamp.
@@ -425,45 +608,24 @@ def extract_metadata_from_markdown(markdown_content: str) -> Dict[str, Any]:
     Returns:
         Dictionary of metadata values
     """
-    metadata_match = re.search(r'---\s+(.*?)\s+---', markdown_content, re.DOTALL)
-    if not metadata_match:
-        return {}
+    return _normalize_metadata(parse_document(markdown_content, sections=False).fields)
 
-    metadata_text = metadata_match.group(1)
-    metadata = {}
+def _normalize_metadata(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert parsed frontmatter fields into WorkEffort metadata.
 
-    # Parse frontmatter
-    for line in metadata_text.split('\n'):
-        line = line.strip()
-        if not line or line.startswith('#'):  # Skip empty lines and comments
-            continue
+    Keys without a value become empty strings and tags are always a list.
 
-        # Try to parse the line as key-value pair
-        try:
-            key, value = line.split(':', 1)
-            key = key.strip()
-            value = value.strip()
-
-            # Remove quotes if present
-            if value.startswith('"') and value.endswith('"'):
-                value = value[1:-1]
-
-            # Special handling for tags
-            if key == 'tags':
-                # Try to parse as JSON array
-                try:
-                    tags = json.loads(value.replace("'", '"'))
-                    metadata[key] = tags
-                except json.JSONDecodeError:
-                    # Fallback to manual parsing
-                    tags = value.strip('[]').split(',')
-                    metadata[key] = [tag.strip() for tag in tags]
-            else:
-                metadata[key] = value
-        except ValueError:
-            # Skip line if it can't be parsed
-            continue
+    Args:
+        fields: Frontmatter fields from parse_document
 
+    Returns:
+        Dictionary of metadata values
+    """
+    metadata = {key: '' if value is None else value for key, value in fields.items()}
+    tags = metadata.get('tags')
+    if isinstance(tags, str):
+        metadata['tags'] = [tag.strip() for tag in tags.split(',') if tag.strip()]
     return metadata
 
 def sanitize_title_for_filename(title: str, max_length: int = 200) -> str:
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bulk Work Effort Import
+
+Creates many work efforts from a JSON Lines stream (one JSON object per line),
+as produced by agents or migration scripts, for ``code-conductor import --jsonl``.
+
+Creating work efforts one at a time formats, writes and re-indexes the whole
+directory per call. An import instead runs in stages:
+
+1. Lines are read in batches of ``batch_size`` and parsed and validated on a
+   worker pool. A bad line is recorded with its line number and skipped; it
+   never aborts the import.
+2. Numbers for every valid record are reserved from the work effort counter in
+   one locked update.
+3. Documents are formatted and written on the worker pool. Files are created
+   exclusively, so an existing work effort is never overwritten. With a
+   ``template_path`` each document is rendered from that markdown template,
+   which is compiled once for the whole import.
+4. The retrieval index and the work node index are updated with the new paths
+   and each is saved once.
+
+Each record takes the fields of ``create_work_effort``: ``title`` (required),
+``assignee``, ``priority``, ``status``, ``due_date``, ``description`` and
+``tags`` (a list or a comma-separated string). Templates can use those names
+and ``id``, ``created`` and ``last_updated`` as ``{{placeholders}}``.
+"""
+
+import os
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+
+try:
+    from ..work_effort import sanitize_title_for_filename
+    from .counter import get_counter, initialize_counter_from_existing_work_efforts
+    from .graph_export import WorkNodeIndex
+    from .retrieval_index import RetrievalIndex
+    from .template_engine import load_template
+    from .work_effort_service import STATUS_DIRECTORIES, VALID_STATUSES
+except ImportError:
+    from counter import get_counter, initialize_counter_from_existing_work_efforts
+    from graph_export import WorkNodeIndex
+    from retrieval_index import RetrievalIndex
+    from template_engine import load_template
+    from work_effort_service import STATUS_DIRECTORIES, VALID_STATUSES
+    from code_conductor.work_effort import sanitize_title_for_filename
+
+logger = logging.getLogger(__name__)
+
+# Constants
+BATCH_SIZE = 100
+DEFAULT_WORKERS = 4
+VALID_PRIORITIES = ['low', 'medium', 'high', 'critical']
+MAX_TITLE_LENGTH = 100
+
+
+def validate_record(data):
+    """
+    Check an import record and fill in defaults.
+
+    Args:
+        data (dict): Decoded JSON record
+
+    Returns:
+        dict: Work effort metadata ready to be formatted
+
+    Raises:
+        ValueError: If the record is not a valid work effort
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Record must be a JSON object")
+
+    title = data.get('title')
+    if not isinstance(title, str) or not title.strip():
+        raise ValueError("Missing required field 'title'")
+
+    priority = str(data.get('priority') or 'medium').lower()
+    if priority not in VALID_PRIORITIES:
+        raise ValueError(f"Invalid priority '{priority}', expected one of {', '.join(VALID_PRIORITIES)}")
+
+    status = str(data.get('status') or 'active').lower()
+    if status not in VALID_STATUSES:
+        raise ValueError(f"Invalid status '{status}', expected one of {', '.join(VALID_STATUSES)}")
+
+    due_date = data.get('due_date')
+    if due_date:
+        try:
+            datetime.strptime(str(due_date), '%Y-%m-%d')
+        except ValueError:
+            raise ValueError(f"Invalid due_date '{due_date}', expected YYYY-MM-DD")
+
+    tags = data.get('tags') or []
+    if isinstance(tags, str):
+        tags = [tag.strip() for tag in tags.split(',') if tag.strip()]
+    if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+        raise ValueError("Field 'tags' must be a list of strings")
+
+    description = data.get('description') or ''
+    if not isinstance(description, str):
+        raise ValueError("Field 'description' must be a string")
+
+    return {
+        'title': title.strip(),
+        'assignee': str(data.get('assignee') or 'self'),
+        'priority': priority,
+        'status': status,
+        'created_at': datetime.now().isoformat(),
+        'due_date': str(due_date) if due_date else '',
+        'description': description,
+        'tags': tags,
+    }
+
+
+def _parse_line(numbered_line):
+    """Decode and validate one numbered line, returning (line number, metadata, error)."""
+    line_number, line = numbered_line
+    try:
+        return line_number, validate_record(json.loads(line)), None
+    except json.JSONDecodeError as e:
+        return line_number, None, f"Invalid JSON: {e}"
+    except ValueError as e:
+        return line_number, None, str(e)
+
+
+def iter_batches(stream, batch_size=BATCH_SIZE):
+    """
+    Yield lists of (line number, line) from a text stream, skipping blank lines.
+
+    Args:
+        stream (iterable): Lines of JSON
+        batch_size (int): Maximum number of lines per batch
+
+    Yields:
+        list: Up to batch_size numbered lines
+    """
+    numbered = ((number, line) for number, line in enumerate(stream, 1) if line.strip())
+    while True:
+        batch = list(islice(numbered, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def template_values(metadata):
+    """
+    Return the placeholder values of a validated record for a markdown template.
+
+    Args:
+        metadata (dict): Work effort metadata from validate_record, with its id
+
+    Returns:
+        dict: Placeholder name -> text
+    """
+    created = datetime.fromisoformat(metadata['created_at']).strftime('%Y-%m-%d %H:%M')
+    return dict(metadata, created=created, last_updated=created, tags=', '.join(metadata['tags']))
+
+
+def _reserve_numbers(work_efforts_dir, count):
+    """Reserve count work effort numbers, seeding a new counter from existing files."""
+    # Constructing a counter creates its file, so check for it first
+    if not os.path.exists(os.path.join(work_efforts_dir, '.code-conductor', 'counter.json')):
+        initialize_counter_from_existing_work_efforts(work_efforts_dir)
+    counter = get_counter(work_efforts_dir)
+    return counter, counter.reserve(count)
+
+
+def import_work_efforts(work_efforts_dir, stream, batch_size=BATCH_SIZE, workers=DEFAULT_WORKERS,
+                        template_path=None):
+    """
+    Create work efforts from a JSON Lines stream.
+
+    Args:
+        work_efforts_dir (str): Directory containing the status subdirectories
+        stream (iterable): Lines of JSON, one work effort per line
+        batch_size (int): Number of lines parsed and validated per batch
+        workers (int): Size of the worker pool used to validate and write
+        template_path (str): Markdown template to render each work effort
+            from (default: the built-in work effort format)
+
+    Returns:
+        dict: ``created`` (relative paths of the new work efforts, in input
+            order) and ``errors`` (list of (line number, message))
+    """
+    from ..core.work_effort.manager_formatter import WorkEffortManagerFormatter
+
+    work_efforts_dir = os.path.abspath(work_efforts_dir)
+    template = load_template(template_path) if template_path else None
+    formatter = WorkEffortManagerFormatter(os.path.dirname(work_efforts_dir))
+    created, errors, valid = [], [], []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for batch in iter_batches(stream, batch_size):
+            for line_number, metadata, error in pool.map(_parse_line, batch):
+                if error:
+                    errors.append((line_number, error))
+                else:
+                    valid.append((line_number, metadata))
+
+        if valid:
+            counter, first = _reserve_numbers(work_efforts_dir, len(valid))
+            logger.info(f"Reserved work effort numbers {first}-{first + len(valid) - 1}")
+
+            def write(numbered_record):
+                number, (line_number, metadata) = numbered_record
+                safe_title = sanitize_title_for_filename(metadata['title'], MAX_TITLE_LENGTH)
+                metadata['id'] = f"{counter.format_work_effort_number(number)}_{safe_title}"
+                rel_path = os.path.join(STATUS_DIRECTORIES[metadata['status']], f"{metadata['id']}.md")
+                try:
+                    if template is not None:
+                        content = template.render(template_values(metadata))
+                    else:
+                        content = formatter.format_work_effort({'id': metadata['id'], 'metadata': metadata})
+                    if not content:
+                        return line_number, None, "Could not format work effort"
+                    full_path = os.path.join(work_efforts_dir, rel_path)
+                    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                    with open(full_path, 'x', encoding='utf-8') as f:
+                        f.write(content)
+                    return line_number, rel_path, None
+                except OSError as e:
+                    return line_number, None, f"Could not write {rel_path}: {e}"
+
+            for line_number, rel_path, error in pool.map(write, enumerate(valid, first)):
+                if error:
+                    errors.append((line_number, error))
+                else:
+                    created.append(rel_path)
+
+    if created:
+        RetrievalIndex(work_efforts_dir).update_paths(created)
+        graph = WorkNodeIndex(work_efforts_dir)
+        for rel_path in created:
+            graph.update_entry(rel_path)
+        graph.save()
+
+    errors.sort()
+    logger.info(f"Imported {len(created)} work efforts with {len(errors)} errors")
+    return {'created': created, 'errors': errors}
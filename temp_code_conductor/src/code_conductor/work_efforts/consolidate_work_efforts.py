@@ -21,7 +21,9 @@ This script captures and replicates the following manual workflow:
    - Creating a centralized directory structure for work efforts
    - Preserving the hierarchical organization with subdirectories
    - Resolving file naming conflicts during consolidation
+   - Collapsing byte-identical files (by content hash) into a single destination file
    - Handling file copying with appropriate error management
+   - Journaling every step so an interrupted run can be resumed
 
 3. Knowledge Linking Phase (Optional):
    - Analyzing content relationships between work efforts
@@ -56,6 +58,12 @@ Options:
     --force             Don't ask for confirmation before deleting original directories
     --add-links         Scan for related documents and add Obsidian-style links
     --verbose           Enable verbose logging
+    --exclude GLOB      Skip matching files or directories (can be repeated)
+    --no-gitignore      Don't skip paths ignored by .gitignore files
+    --no-cache          Don't reuse cached directory listings
+    --cache-in-project  Cache directory listings in .code_conductor/ inside the project
+    --copy-mode MODE    Place files by 'copy', 'reflink' (copy-on-write) or 'hardlink'
+    --restart           Discard the journal of an interrupted run instead of resuming it
 """
 
 import os
@@ -66,6 +74,19 @@ import re
 import argparse
 import datetime
 import fnmatch
+import hashlib
+
+try:
+    from ..utils.project_walker import ProjectWalker, DEFAULT_EXCLUDES, walk_cache_path
+    from .consolidation_journal import ConsolidationJournal, JOURNAL_FILENAME
+    from .entry_log import open_changelog, open_devlog
+    from .frontmatter import decode, parse_document
+except ImportError:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utils'))
+    from project_walker import ProjectWalker, DEFAULT_EXCLUDES, walk_cache_path
+    from consolidation_journal import ConsolidationJournal, JOURNAL_FILENAME
+    from entry_log import open_changelog, open_devlog
+    from frontmatter import decode, parse_document
 
 # Setup logging
 logging.basicConfig(
@@ -89,11 +110,15 @@ WORK_EFFORT_DIR_PATTERNS = [
     'work_effort',
     'work-effort',
 ]
-EXCLUDED_DIRS = ['.git', 'node_modules', 'venv', '.env', '__pycache__']
+EXCLUDED_DIRS = DEFAULT_EXCLUDES
 SUBDIRS_TO_CREATE = ['active', 'completed', 'archived', 'templates']
 MARKDOWN_EXTENSIONS = ['.md', '.markdown']
-YAML_FRONTMATTER_PATTERN = re.compile(r'^---\s*$(.*?)^---\s*$', re.MULTILINE | re.DOTALL)
 WIKI_LINK_PATTERN = re.compile(r'\[\[(.*?)\]\]')
+HASH_CHUNK_SIZE = 1024 * 1024
+CLASSIFY_HEAD_BYTES = 64 * 1024
+COPY_MODES = ['copy', 'reflink', 'hardlink']
+FICLONE = 0x40049409  # Linux ioctl for copy-on-write clones (btrfs, xfs)
+PARTIAL_SUFFIX = '.part'
 CHANGELOG_PATH = 'CHANGELOG.md'
 DEVLOG_PATH = os.path.join('_AI-Setup', 'work_efforts', 'devlog.md')
 
@@ -117,7 +142,9 @@ class WorkEffortConsolidator:
     """
 
     def __init__(self, root_dir=ROOT_DIR, dest_dir=DEST_DIR, dry_run=False,
-                 no_delete=False, force=False, add_links=False, verbose=False):
+                 no_delete=False, force=False, add_links=False, verbose=False,
+                 exclude=None, use_gitignore=True, use_cache=True, cache_in_project=False,
+                 copy_mode='copy', resume=True):
         """
         Initialize the consolidator with given parameters.
 
@@ -132,7 +159,20 @@ class WorkEffortConsolidator:
             force (bool): If True, don't ask for confirmation before deleting original directories
             add_links (bool): If True, scan for related documents and add Obsidian-style links
             verbose (bool): If True, enable verbose logging
+            exclude (list): Extra glob patterns for files and directories to skip
+            use_gitignore (bool): If True, skip paths ignored by .gitignore files
+            use_cache (bool): If True, reuse unchanged directory listings from the previous run
+            cache_in_project (bool): If True, cache directory listings inside the project
+                instead of the user cache directory
+            copy_mode (str): How files are placed in the destination: 'copy' (byte copy),
+                'reflink' (copy-on-write clone) or 'hardlink'. Modes that are not supported
+                by the filesystem fall back to a byte copy.
+            resume (bool): If True, continue an interrupted run recorded in the
+                consolidation journal; if False, discard the journal and plan again
         """
+        if copy_mode not in COPY_MODES:
+            raise ValueError(f"Unsupported copy mode: {copy_mode}")
+
         self.root_dir = os.path.abspath(root_dir)
         self.dest_dir = os.path.abspath(dest_dir)
         self.dry_run = dry_run
@@ -140,15 +180,29 @@ class WorkEffortConsolidator:
         self.force = force
         self.add_links = add_links
         self.verbose = verbose
+        self.copy_mode = copy_mode
+        self.resume = resume
 
         if verbose:
             logger.setLevel(logging.DEBUG)
 
+        self.walker = ProjectWalker(
+            self.root_dir,
+            exclude=EXCLUDED_DIRS + list(exclude or []),
+            use_gitignore=use_gitignore,
+            skip_hidden_dirs=True,
+            cache_path=walk_cache_path(self.root_dir, cache_in_project) if use_cache and not dry_run else None
+        )
+
         # Stats
         self.found_dirs = []
         self.copied_files = []
         self.deleted_dirs = []
         self.linked_docs = []
+        self.deduplicated_files = []
+        self.bytes_saved = 0
+        self._digest_cache = {}
+        self._reserved_paths = set()
 
         logger.info(f"Initializing Work Effort Consolidator")
         logger.info(f"Root directory: {self.root_dir}")
@@ -157,6 +211,7 @@ class WorkEffortConsolidator:
         logger.info(f"No delete: {self.no_delete}")
         logger.info(f"Force: {self.force}")
         logger.info(f"Add links: {self.add_links}")
+        logger.info(f"Copy mode: {self.copy_mode}")
 
     def ensure_dest_dir_exists(self):
         """
@@ -202,7 +257,8 @@ class WorkEffortConsolidator:
 
         The search is heuristic-based, looking for directory names that match common
         patterns for work effort directories. It also applies exclusions for standard
-        directories that should never be included (like .git, node_modules, etc.).
+        directories that should never be included (like .git, node_modules, etc.),
+        for paths ignored by .gitignore files and for any extra exclude globs.
 
         Returns:
             list: List of directory paths containing work efforts
@@ -211,10 +267,7 @@ class WorkEffortConsolidator:
 
         work_effort_dirs = []
 
-        for root, dirs, _ in os.walk(self.root_dir):
-            # Skip excluded directories
-            dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS and not d.startswith('.')]
-
+        for root, dirs, _ in self.walker.walk():
             # Skip the destination directory itself
             if os.path.normpath(root) == os.path.normpath(self.dest_dir):
                 continue
@@ -226,34 +279,39 @@ class WorkEffortConsolidator:
                 if self.verbose:
                     logger.debug(f"Found work effort directory: {root}")
 
+        work_effort_dirs.sort()
         logger.info(f"Found {len(work_effort_dirs)} work effort directories")
         self.found_dirs = work_effort_dirs
         return work_effort_dirs
 
-    def copy_files(self, dirs):
+    def plan_copies(self, dirs):
         """
-        Copy all markdown files from work effort directories to destination.
+        Plan which markdown files go where, without writing anything.
 
         This replicates the manual process of:
         1. Going through each work effort directory
         2. Identifying markdown files that represent work efforts
         3. Determining which category each work effort belongs to (active, completed, etc.)
-        4. Creating the appropriate directory structure in the destination
-        5. Copying the files with conflict resolution
+        4. Choosing a destination path with conflict resolution
 
-        The function specifically only copies markdown files, as these are the primary
+        The function specifically only plans markdown files, as these are the primary
         content files for work efforts. Other files (like images, code, etc.) are not copied
         to maintain focused organization.
 
+        Each file is read once in streaming chunks to compute its content hash. Files whose
+        content is already planned, or that are byte-identical to the file already at their
+        destination, are marked as duplicates and will not be copied.
+
         Args:
             dirs (list): List of directories containing work efforts
 
         Returns:
-            list: List of tuples (source_path, dest_path) of copied files
+            list: Planned operations as dicts with 'source', 'dest', 'digest', 'size'
+                  and 'duplicate' keys
         """
-        logger.info(f"Copying files to {self.dest_dir}")
-
-        copied_files = []
+        operations = []
+        placed = {}
+        self._reserved_paths = set()
 
         for work_dir in dirs:
             relative_path = os.path.relpath(work_dir, self.root_dir)
@@ -263,7 +321,7 @@ class WorkEffortConsolidator:
                 logger.info(f"Skipping directory already in destination: {work_dir}")
                 continue
 
-            for root, _, files in os.walk(work_dir):
+            for root, _, files in sorted(self.walker.walk(work_dir)):
                 for file in files:
                     file_path = os.path.join(root, file)
                     _, ext = os.path.splitext(file)
@@ -272,30 +330,247 @@ class WorkEffortConsolidator:
                     if ext.lower() not in MARKDOWN_EXTENSIONS:
                         continue
 
+                    # Hash the file and keep its head for classification
+                    try:
+                        digest, size, head = self._scan_file(file_path)
+                    except OSError as e:
+                        logger.error(f"Error reading file {file_path}: {e}")
+                        continue
+
+                    operation = {'source': file_path, 'digest': digest, 'size': size, 'duplicate': False}
+
+                    # Collapse files whose content has already been planned
+                    if digest in placed:
+                        operations.append(dict(operation, dest=placed[digest], duplicate=True))
+                        continue
+
                     # Determine appropriate subdirectory
-                    file_content = self._read_file(file_path)
-                    subdirectory = self._determine_subdirectory(file_content, file)
+                    subdirectory = self._determine_subdirectory(head, file)
 
                     # Create destination path
                     dest_path = os.path.join(self.dest_dir, subdirectory, file)
 
                     # Handle file name collisions
-                    dest_path = self._handle_name_collision(dest_path)
+                    dest_path = self._handle_name_collision(dest_path, digest)
+                    operation['dest'] = dest_path
+                    operation['duplicate'] = self._has_content(dest_path, digest, size)
 
-                    # Copy file
-                    if not self.dry_run:
-                        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                        shutil.copy2(file_path, dest_path)
-                        logger.info(f"Copied {file_path} to {dest_path}")
-                    else:
-                        logger.info(f"Would copy {file_path} to {dest_path}")
+                    placed[digest] = dest_path
+                    self._reserved_paths.add(dest_path)
+                    operations.append(operation)
 
-                    copied_files.append((file_path, dest_path))
+        return operations
 
-        logger.info(f"Copied {len(copied_files)} files")
+    def execute_copies(self, operations, journal=None, completed=()):
+        """
+        Place the files of a copy plan at their destinations.
+
+        Operations whose destination is listed in completed (from a resumed journal)
+        are skipped without touching the disk. A destination that already holds the
+        expected content, for example because a previous run was interrupted before
+        it could journal the copy, is not copied again. Files are written to a
+        temporary name and renamed into place, so an interrupted copy never leaves a
+        partial file under the destination name.
+
+        Args:
+            operations (list): Operations from plan_copies
+            journal (ConsolidationJournal): Optional journal to record each copy in
+            completed (set): Destination paths already recorded as copied
+
+        Returns:
+            list: List of tuples (source_path, dest_path) of copied files
+        """
+        logger.info(f"Copying files to {self.dest_dir}")
+
+        copied_files = []
+        self.deduplicated_files = []
+        self.bytes_saved = 0
+
+        for operation in operations:
+            file_path, dest_path, size = operation['source'], operation['dest'], operation['size']
+
+            if operation['duplicate']:
+                self._record_duplicate(file_path, dest_path, size)
+                continue
+
+            if dest_path in completed:
+                copied_files.append((file_path, dest_path))
+                continue
+
+            if self.dry_run:
+                logger.info(f"Would copy {file_path} to {dest_path}")
+                copied_files.append((file_path, dest_path))
+                continue
+
+            if self._has_content(dest_path, operation['digest'], size):
+                logger.info(f"Already copied {file_path} to {dest_path}")
+            else:
+                try:
+                    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                    method = self._place_file(file_path, dest_path)
+                except OSError as e:
+                    logger.error(f"Error copying {file_path} to {dest_path}: {e}")
+                    continue
+                if method != 'copy':
+                    self.bytes_saved += size
+                logger.info(f"Copied {file_path} to {dest_path} ({method})")
+
+            if journal:
+                journal.record('copy', source=file_path, dest=dest_path)
+            copied_files.append((file_path, dest_path))
+
+        logger.info(f"Copied {len(copied_files)} files, skipped {len(self.deduplicated_files)} duplicates "
+                    f"({self.bytes_saved} bytes saved)")
         self.copied_files = copied_files
         return copied_files
 
+    def copy_files(self, dirs):
+        """
+        Copy all markdown files from work effort directories to destination.
+
+        This plans the copies with plan_copies and places them with execute_copies.
+
+        Args:
+            dirs (list): List of directories containing work efforts
+
+        Returns:
+            list: List of tuples (source_path, dest_path) of copied files
+        """
+        return self.execute_copies(self.plan_copies(dirs))
+
+    def verify_copies(self, operations):
+        """
+        Verify that every planned destination holds the expected content.
+
+        Args:
+            operations (list): Operations from plan_copies
+
+        Returns:
+            list: Destination paths that are missing or have different content
+        """
+        failed = []
+        for operation in operations:
+            if not self._has_content(operation['dest'], operation['digest'], operation['size']):
+                failed.append(operation['dest'])
+        return failed
+
+    def _scan_file(self, file_path):
+        """
+        Hash a file in streaming chunks.
+
+        Args:
+            file_path (str): Path to the file
+
+        Returns:
+            tuple: (sha256 hex digest, size in bytes, decoded head of the file used
+                   to classify it)
+        """
+        sha = hashlib.sha256()
+        head = b''
+        size = 0
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                if len(head) < CLASSIFY_HEAD_BYTES:
+                    head += chunk[:CLASSIFY_HEAD_BYTES - len(head)]
+                sha.update(chunk)
+                size += len(chunk)
+        return sha.hexdigest(), size, head.decode('utf-8', errors='replace')
+
+    def _file_digest(self, file_path):
+        """
+        Return the content hash of a file, cached by path, size and mtime.
+
+        Args:
+            file_path (str): Path to the file
+
+        Returns:
+            str: sha256 hex digest
+        """
+        st = os.stat(file_path)
+        key = (file_path, st.st_size, st.st_mtime_ns)
+        if key not in self._digest_cache:
+            self._digest_cache[key] = self._scan_file(file_path)[0]
+        return self._digest_cache[key]
+
+    def _has_content(self, path, digest, size=None):
+        """
+        Check whether a file exists and has the given content hash.
+
+        The size is compared first so that most mismatches need no hashing.
+
+        Args:
+            path (str): Path to check
+            digest (str): Expected sha256 hex digest
+            size (int): Expected size in bytes, if known
+
+        Returns:
+            bool: True if the file exists with identical content
+        """
+        try:
+            if size is not None and os.path.getsize(path) != size:
+                return False
+            return self._file_digest(path) == digest
+        except OSError:
+            return False
+
+    def _record_duplicate(self, source_path, dest_path, size):
+        """Record a source file whose content already exists at dest_path."""
+        logger.info(f"Skipping {source_path}: identical to {dest_path}")
+        self.deduplicated_files.append((source_path, dest_path))
+        self.bytes_saved += size
+
+    def _place_file(self, source_path, dest_path):
+        """
+        Place a file at its destination using the configured copy mode.
+
+        Hardlinks and reflinks only create metadata, so their cost does not depend
+        on the file size. Note that a hardlinked destination shares its inode with
+        the source, so with --no-delete later edits to either are visible in both.
+        If the requested mode is not supported (for example across filesystems),
+        the file is copied instead.
+
+        The file is first placed under a temporary name and then renamed over
+        dest_path, so the destination either holds the complete file or nothing.
+
+        Args:
+            source_path (str): File to place
+            dest_path (str): Destination path
+
+        Returns:
+            str: The method that was used ('copy', 'reflink' or 'hardlink')
+        """
+        tmp_path = f"{dest_path}{PARTIAL_SUFFIX}"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        method = 'copy'
+        if self.copy_mode == 'hardlink':
+            try:
+                os.link(source_path, tmp_path)
+                method = 'hardlink'
+            except OSError as e:
+                logger.debug(f"Hardlink failed for {source_path}, copying instead: {e}")
+        elif self.copy_mode == 'reflink':
+            try:
+                import fcntl
+                with open(source_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                shutil.copystat(source_path, tmp_path)
+                method = 'reflink'
+            except (ImportError, OSError) as e:
+                logger.debug(f"Reflink failed for {source_path}, copying instead: {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        try:
+            if method == 'copy':
+                shutil.copy2(source_path, tmp_path)
+            os.replace(tmp_path, dest_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return method
+
     def _read_file(self, file_path):
         """
         Read the content of a file.
@@ -347,22 +622,19 @@ class WorkEffortConsolidator:
             return 'templates'
 
         # Check for status in frontmatter
-        match = YAML_FRONTMATTER_PATTERN.search(content)
-        if match:
-            frontmatter_text = match.group(1)
-            if 'status:' in frontmatter_text:
-                status_line = re.search(r'status:\s*"?(.*?)"?$', frontmatter_text, re.MULTILINE)
-                if status_line:
-                    status = status_line.group(1).lower().strip()
-                    if 'complete' in status or 'done' in status or 'finished' in status:
-                        return 'completed'
-                    if 'archive' in status or 'archived' in status:
-                        return 'archived'
+        document = parse_document(content, sections=False)
+        status = document.fields.get('status') if document.has_frontmatter else None
+        if isinstance(status, str):
+            status = status.lower().strip()
+            if 'complete' in status or 'done' in status or 'finished' in status:
+                return 'completed'
+            if 'archive' in status or 'archived' in status:
+                return 'archived'
 
         # Default to active
         return 'active'
 
-    def _handle_name_collision(self, dest_path):
+    def _handle_name_collision(self, dest_path, digest=None):
         """
         Handle file name collisions by adding a suffix if necessary.
 
@@ -373,15 +645,21 @@ class WorkEffortConsolidator:
         2. If it does, add a numeric suffix to the filename
         3. Increment the suffix until a unique filename is found
 
-        This approach preserves both files while avoiding overwriting.
+        This approach preserves both files while avoiding overwriting. If a content
+        hash is given and the existing file (or one of its suffixed variants) has the
+        same content, that path is returned instead of inventing a new name.
 
         Args:
             dest_path (str): Destination path that might have a collision
+            digest (str): Optional sha256 hex digest of the file being placed
 
         Returns:
-            str: Modified destination path with suffix if needed
+            str: Modified destination path with suffix if needed, or the path of an
+                 existing identical file
         """
-        if not os.path.exists(dest_path) or self.dry_run:
+        if not self._path_taken(dest_path):
+            return dest_path
+        if digest and self._has_content(dest_path, digest):
             return dest_path
 
         base, ext = os.path.splitext(dest_path)
@@ -389,12 +667,18 @@ class WorkEffortConsolidator:
 
         while True:
             new_path = f"{base}_{counter}{ext}"
-            if not os.path.exists(new_path):
+            if digest and os.path.exists(new_path) and self._has_content(new_path, digest):
+                return new_path
+            if not self._path_taken(new_path):
                 logger.warning(f"File collision detected, renamed to {new_path}")
                 return new_path
             counter += 1
 
-    def delete_original_dirs(self, dirs):
+    def _path_taken(self, path):
+        """Check whether a destination path exists or is reserved by the current plan."""
+        return path in self._reserved_paths or os.path.exists(path)
+
+    def delete_original_dirs(self, dirs, journal=None):
         """
         Delete the original work effort directories after copying.
 
@@ -409,6 +693,7 @@ class WorkEffortConsolidator:
 
         Args:
             dirs (list): List of directories to delete
+            journal (ConsolidationJournal): Optional journal to record each deletion in
 
         Returns:
             list: List of directories that were successfully deleted
@@ -437,6 +722,8 @@ class WorkEffortConsolidator:
                 shutil.rmtree(directory)
                 logger.info(f"Deleted directory: {directory}")
                 deleted_dirs.append(directory)
+                if journal:
+                    journal.record('delete', dir=directory)
             except Exception as e:
                 logger.error(f"Error deleting directory {directory}: {e}")
 
@@ -540,12 +827,10 @@ class WorkEffortConsolidator:
         Returns:
             str: Title of the document
         """
-        match = YAML_FRONTMATTER_PATTERN.search(content)
-        if match:
-            frontmatter_text = match.group(1)
-            title_match = re.search(r'title:\s*"?(.*?)"?$', frontmatter_text, re.MULTILINE)
-            if title_match:
-                return title_match.group(1).strip()
+        document = parse_document(content, sections=False)
+        title = document.fields.get('title') if document.has_frontmatter else None
+        if isinstance(title, str) and title.strip():
+            return title.strip()
 
         # Fallback to filename without extension
         return os.path.splitext(filename)[0]
@@ -572,25 +857,26 @@ class WorkEffortConsolidator:
         content = doc_info['content']
 
         # Process frontmatter if it exists
-        match = YAML_FRONTMATTER_PATTERN.search(content)
-        if match:
-            frontmatter_text = match.group(1)
-
-            # Check if related_efforts field exists
-            if 'related_efforts:' in frontmatter_text:
-                # Update existing related_efforts field
-                updated_frontmatter = frontmatter_text
+        document = parse_document(content, sections=False)
+        if document.has_frontmatter:
+            existing = document.fields.get('related_efforts')
+            if isinstance(existing, list):
+                links = list(existing)
             else:
-                # Add related_efforts field
-                updated_frontmatter = frontmatter_text.rstrip() + "\nrelated_efforts:\n"
+                links = [existing] if existing else []
 
-            # Add related documents to frontmatter
+            # Add related documents to the related_efforts field
             for _, filename in doc_info['related']:
-                if f"[[{filename}]]" not in updated_frontmatter:
-                    updated_frontmatter += f"  - [[{filename}]]\n"
-
-            # Replace frontmatter in content
-            content = content.replace(match.group(0), f"---\n{updated_frontmatter}---\n")
+                if filename not in links:
+                    links.append(filename)
+            if links == existing:
+                return content
+
+            # Replace only the related_efforts lines, or add them before the closing marker
+            nl = document.newline
+            field = b'related_efforts:' + nl + b''.join(f"  - [[{link}]]".encode('utf-8') + nl for link in links)
+            start, end = document.spans.get('related_efforts', (document.close_offset, document.close_offset))
+            content = decode(document.data[:start] + field + document.data[end:])
         else:
             # Create new frontmatter if none exists
             related_links = "\n".join([f"  - [[{filename}]]" for _, filename in doc_info['related']])
@@ -609,15 +895,26 @@ class WorkEffortConsolidator:
         2. Updating the devlog with a detailed entry about the work completed
 
         This ensures that the consolidation process is properly documented for
-        future reference and project history.
+        future reference and project history. The entries are appended first and
+        each document is rendered once at the end.
         """
         logger.info("Updating project documentation")
 
         # Update changelog
-        self._update_changelog()
+        changelog = self._update_changelog()
 
         # Update devlog
-        self._update_devlog()
+        devlog = self._update_devlog()
+
+        # Render each document once for all of its new entries
+        for log in (changelog, devlog):
+            if log is None:
+                continue
+            try:
+                log.render()
+                logger.info(f"Updated {log.document_path}")
+            except Exception as e:
+                logger.error(f"Error rendering {log.document_path}: {e}")
 
     def _update_changelog(self):
         """
@@ -631,48 +928,38 @@ class WorkEffortConsolidator:
 
         The function respects the dry_run flag and handles file access issues.
 
-        The changelog update follows standard changelog formatting conventions.
+        The entries are appended to the changelog's entry journal, so concurrent
+        updates are never lost; update_documentation renders the changelog.
+
+        Returns:
+            EntryLog: The changelog's entry log, or None if nothing was appended
         """
         changelog_path = os.path.join(self.root_dir, CHANGELOG_PATH)
         if not os.path.exists(changelog_path):
             logger.warning(f"Changelog not found at {changelog_path}, skipping update")
-            return
+            return None
 
         if self.dry_run:
             logger.info(f"Would update changelog at {changelog_path}")
-            return
+            return None
 
         try:
-            with open(changelog_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-
-            # Find the Unreleased section
-            unreleased_match = re.search(r'## \[Unreleased\]\s*\n', content)
-            if unreleased_match:
-                insert_pos = unreleased_match.end()
-
-                # Create update text
-                update_text = (
-                    "\n### Added\n"
-                    "- Consolidated work efforts into a centralized location\n"
-                    "- Added Obsidian-style document linking between related work efforts\n"
-                    "- Created work effort naming conventions documentation\n"
-                    "\n### Changed\n"
-                    "- Reorganized work effort directories for better structure\n"
-                    "- Enhanced linking between related work efforts\n"
-                    "\n"
-                )
-
-                # Insert update text
-                updated_content = content[:insert_pos] + update_text + content[insert_pos:]
-
-                with open(changelog_path, 'w', encoding='utf-8') as file:
-                    file.write(updated_content)
-                logger.info(f"Updated changelog at {changelog_path}")
-            else:
-                logger.warning(f"Could not find Unreleased section in changelog, skipping update")
+            changelog = open_changelog(changelog_path)
+            changelog.append(
+                "- Consolidated work efforts into a centralized location\n"
+                "- Added Obsidian-style document linking between related work efforts\n"
+                "- Created work effort naming conventions documentation",
+                section="Added"
+            )
+            changelog.append(
+                "- Reorganized work effort directories for better structure\n"
+                "- Enhanced linking between related work efforts",
+                section="Changed"
+            )
+            return changelog
         except Exception as e:
             logger.error(f"Error updating changelog: {e}")
+            return None
 
     def _update_devlog(self):
         """
@@ -685,21 +972,23 @@ class WorkEffortConsolidator:
         3. Linking to related work efforts for context
 
         The devlog entry provides a comprehensive record of the consolidation process,
-        including quantitative information about files processed.
+        including quantitative information about files processed. It is appended to
+        the devlog's entry journal; update_documentation renders the devlog with
+        the newest entry first.
+
+        Returns:
+            EntryLog: The devlog's entry log, or None if nothing was appended
         """
         devlog_path = os.path.join(self.root_dir, DEVLOG_PATH)
         if not os.path.exists(devlog_path):
             logger.warning(f"Devlog not found at {devlog_path}, skipping update")
-            return
+            return None
 
         if self.dry_run:
             logger.info(f"Would update devlog at {devlog_path}")
-            return
+            return None
 
         try:
-            with open(devlog_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-
             # Create update text
             today = datetime.datetime.now().strftime("%Y-%m-%d")
             update_text = (
@@ -721,14 +1010,12 @@ class WorkEffortConsolidator:
                 f"- [[obsidian_style_document_linking]]\n\n"
             )
 
-            # Append update text
-            updated_content = content + update_text
-
-            with open(devlog_path, 'w', encoding='utf-8') as file:
-                file.write(updated_content)
-            logger.info(f"Updated devlog at {devlog_path}")
+            devlog = open_devlog(devlog_path)
+            devlog.append(update_text)
+            return devlog
         except Exception as e:
             logger.error(f"Error updating devlog: {e}")
+            return None
 
     def run(self):
         """
@@ -747,6 +1034,12 @@ class WorkEffortConsolidator:
         at each step to ensure safe execution. It also collects and returns statistics
         about the operations performed.
 
+        Outside dry-run mode every step is recorded in a consolidation journal in the
+        destination directory. If a previous run was interrupted, its plan is loaded
+        from the journal and the run continues where it stopped. Original directories
+        are only deleted after every copied file has been verified against its content
+        hash and the commit point has been journaled.
+
         Returns:
             dict: Statistics about the consolidation process, or None if it fails
         """
@@ -755,35 +1048,75 @@ class WorkEffortConsolidator:
         # Ensure destination directory exists
         self.ensure_dest_dir_exists()
 
-        # Find work effort directories
-        work_effort_dirs = self.find_work_effort_dirs()
+        journal = None
+        state = None
+        if not self.dry_run:
+            journal = ConsolidationJournal(os.path.join(self.dest_dir, JOURNAL_FILENAME))
+            state = journal.load() if self.resume else None
+            if state and (state['plan']['root'] != self.root_dir or state['plan']['dest'] != self.dest_dir):
+                logger.warning(f"Ignoring journal for a different consolidation: {journal.path}")
+                state = None
+
+        if state:
+            logger.info(f"Resuming interrupted consolidation from {journal.path}")
+            work_effort_dirs = state['plan']['dirs']
+            operations = state['plan']['operations']
+            self.found_dirs = work_effort_dirs
+        else:
+            # Find work effort directories
+            work_effort_dirs = self.find_work_effort_dirs()
 
-        if not work_effort_dirs:
-            logger.warning("No work effort directories found")
-            return
+            if not work_effort_dirs:
+                logger.warning("No work effort directories found")
+                return
+
+            operations = self.plan_copies(work_effort_dirs)
+            state = {'copied': set(), 'committed': False, 'links': False, 'deleted': set()}
+            if journal:
+                journal.start(self.root_dir, self.dest_dir, work_effort_dirs, operations)
 
         # Copy files
-        copied_files = self.copy_files(work_effort_dirs)
+        copied_files = self.execute_copies(operations, journal, state['copied'])
 
-        if not copied_files:
+        if not copied_files and not self.deduplicated_files:
             logger.warning("No files were copied")
+            if journal:
+                journal.finish()
             return
 
+        # Verify every destination before anything irreversible happens
+        if journal and not state['committed']:
+            failed = self.verify_copies(operations)
+            if failed:
+                for dest_path in failed:
+                    logger.error(f"Verification failed for {dest_path}")
+                logger.error(f"Consolidation stopped before deleting anything; rerun to resume or "
+                             f"use --restart to plan again")
+                journal.close()
+                return
+            journal.record('commit')
+
         # Add Obsidian-style links
-        if self.add_links:
+        if self.add_links and not state['links']:
             self.add_obsidian_links()
+            if journal:
+                journal.record('links')
 
         # Delete original directories if requested
         if not self.no_delete and not self.dry_run:
-            self.delete_original_dirs(work_effort_dirs)
+            self.delete_original_dirs([d for d in work_effort_dirs if d not in state['deleted']], journal)
 
         # Update documentation
         if not self.dry_run:
             self.update_documentation()
 
+        if journal:
+            journal.finish()
+
         logger.info("Work effort consolidation completed successfully")
         logger.info(f"Found {len(self.found_dirs)} directories")
         logger.info(f"Copied {len(self.copied_files)} files")
+        logger.info(f"Skipped {len(self.deduplicated_files)} duplicate files ({self.bytes_saved} bytes saved)")
         logger.info(f"Deleted {len(self.deleted_dirs)} directories")
         if self.add_links:
             logger.info(f"Added links to {len(self.linked_docs)} documents")
@@ -791,6 +1124,8 @@ class WorkEffortConsolidator:
         return {
             'found_dirs': len(self.found_dirs),
             'copied_files': len(self.copied_files),
+            'deduplicated_files': len(self.deduplicated_files),
+            'bytes_saved': self.bytes_saved,
             'deleted_dirs': len(self.deleted_dirs),
             'linked_docs': len(self.linked_docs) if self.add_links else 0
         }
@@ -820,6 +1155,19 @@ def parse_args():
                         help="Scan for related documents and add Obsidian-style links")
     parser.add_argument('--verbose', dest='verbose', action='store_true',
                         help="Enable verbose logging")
+    parser.add_argument('--exclude', dest='exclude', action='append', default=[], metavar='GLOB',
+                        help="Glob pattern for files or directories to skip (can be repeated)")
+    parser.add_argument('--no-gitignore', dest='use_gitignore', action='store_false',
+                        help="Don't skip paths ignored by .gitignore files")
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                        help="Don't reuse directory listings cached by a previous run")
+    parser.add_argument('--cache-in-project', dest='cache_in_project', action='store_true',
+                        help="Cache directory listings in .code_conductor/ inside the project "
+                             "instead of the user cache directory")
+    parser.add_argument('--copy-mode', dest='copy_mode', choices=COPY_MODES, default='copy',
+                        help="Place files by byte copy, copy-on-write reflink or hardlink (default: copy)")
+    parser.add_argument('--restart', dest='resume', action='store_false',
+                        help="Discard the journal of an interrupted run and start from scratch")
     return parser.parse_args()
 
 def main():
@@ -851,7 +1199,13 @@ def main():
         no_delete=args.no_delete,
         force=args.force,
         add_links=args.add_links,
-        verbose=args.verbose
+        verbose=args.verbose,
+        exclude=args.exclude,
+        use_gitignore=args.use_gitignore,
+        use_cache=args.use_cache,
+        cache_in_project=args.cache_in_project,
+        copy_mode=args.copy_mode,
+        resume=args.resume
     )
 
     try:
@@ -860,6 +1214,7 @@ def main():
             print("\nWork effort consolidation completed successfully!")
             print(f"Found {results['found_dirs']} directories")
             print(f"Copied {results['copied_files']} files")
+            print(f"Skipped {results['deduplicated_files']} duplicate files ({results['bytes_saved']} bytes saved)")
             print(f"Deleted {results['deleted_dirs']} directories")
             if args.add_links:
                 print(f"Added links to {results['linked_docs']} documents")
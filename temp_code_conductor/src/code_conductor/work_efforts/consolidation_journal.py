@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Consolidation Journal
+
+An append-only journal that makes work effort consolidation restartable.
+
+The journal (``.consolidation_journal.jsonl`` in the destination directory) holds
+one JSON record per line:
+
+- ``plan``: written once at the start with the discovered directories and every
+  planned file operation (source, destination, content hash, size)
+- ``copy``: one record for every file that has been placed at its destination
+- ``commit``: written after every planned destination has been verified against
+  its content hash; original directories are never deleted before this point
+- ``links``: written after Obsidian-style links have been added
+- ``delete``: one record for every original directory that has been removed
+
+When a run finishes, the journal is removed. If a run is interrupted, the next
+run loads the journal, keeps the original plan and continues from the last
+recorded operation. Checkpoint records (``plan``, ``commit``, ``links``) are
+fsynced; per-file records are only flushed, because a lost ``copy`` record is
+recovered by re-checking the destination hash.
+"""
+
+import os
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Constants
+JOURNAL_FILENAME = '.consolidation_journal.jsonl'
+JOURNAL_VERSION = 1
+CHECKPOINT_OPS = ('plan', 'commit', 'links')
+
+
+class ConsolidationJournal:
+    """
+    Reads and appends the records of a consolidation journal.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize the journal.
+
+        Args:
+            path (str): Path of the journal file
+        """
+        self.path = path
+        self._file = None
+
+    def exists(self):
+        """Return True if an unfinished journal is present."""
+        return os.path.exists(self.path)
+
+    def load(self):
+        """
+        Replay the journal into a resume state.
+
+        A truncated last line (from a crash mid-write) is ignored.
+
+        Returns:
+            dict: State with keys 'plan', 'copied' (set of destination paths),
+                  'committed', 'links' and 'deleted' (set of directories), or None
+                  if there is no usable journal
+        """
+        if not self.exists():
+            return None
+
+        state = {'plan': None, 'copied': set(), 'committed': False, 'links': False, 'deleted': set()}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        logger.warning(f"Ignoring incomplete journal record in {self.path}")
+                        continue
+
+                    op = record.get('op')
+                    if op == 'plan':
+                        if record.get('version') != JOURNAL_VERSION:
+                            return None
+                        state['plan'] = record
+                    elif op == 'copy':
+                        state['copied'].add(record['dest'])
+                    elif op == 'commit':
+                        state['committed'] = True
+                    elif op == 'links':
+                        state['links'] = True
+                    elif op == 'delete':
+                        state['deleted'].add(record['dir'])
+        except OSError as e:
+            logger.error(f"Error reading journal {self.path}: {e}")
+            return None
+
+        return state if state['plan'] else None
+
+    def start(self, root_dir, dest_dir, dirs, operations):
+        """
+        Start a new journal with the consolidation plan, replacing any old one.
+
+        Args:
+            root_dir (str): Root directory that was searched
+            dest_dir (str): Destination directory
+            dirs (list): Work effort directories that were found
+            operations (list): Planned file operations (dicts with 'source', 'dest',
+                'digest', 'size' and 'duplicate')
+        """
+        self.close()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self.record('plan', version=JOURNAL_VERSION, root=root_dir, dest=dest_dir,
+                    dirs=dirs, operations=operations)
+
+    def record(self, op, **fields):
+        """
+        Append a record to the journal.
+
+        Args:
+            op (str): Operation name
+            **fields: Additional fields for the record
+        """
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(dict(op=op, **fields), separators=(',', ':')) + '\n')
+        self._file.flush()
+        if op in CHECKPOINT_OPS:
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        """Close the journal file if it is open."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def finish(self):
+        """Remove the journal after a completed run."""
+        self.close()
+        if self.exists():
+            os.remove(self.path)
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Context Bundle Builder
+
+Builds a size-limited context bundle for AI assistants from a work effort and the
+work efforts it links to.
+
+Starting from one work effort, the builder follows wiki links breadth-first (up to
+a maximum distance) and splits every document it reaches into its ``##`` sections.
+Each section gets a priority from its distance to the starting document and its
+kind: objectives first, then open tasks, status and descriptions, notes, and
+finally completed tasks and associated scripts. Sections are added in priority
+order until the token budget is used up; the section that no longer fits is
+trimmed line by line. The selected sections are then written out document by
+document, in their original order, as a stream of text chunks.
+
+Rendered bundles are cached in ``.context_cache`` inside the work efforts
+directory, keyed by the starting document and the build options. A cached bundle
+is served as long as every file it was built from still has the same content
+hash, every wiki link it followed (or failed to resolve) still resolves to the
+same document, and every work effort still has the same associated files. Files
+whose size and mtime are unchanged are not re-hashed, and a file whose mtime
+changed but whose content did not has its new mtime written back to the cache.
+
+Token counts are estimated at four characters per token, which is close enough
+for budgeting and needs no tokenizer.
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import logging
+from collections import OrderedDict
+
+try:
+    from ..utils.atomic_write import atomic_write_text
+    from .frontmatter import WIKI_LINK_PATTERN, decode, parse_document
+except ImportError:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utils'))
+    from atomic_write import atomic_write_text
+    from frontmatter import WIKI_LINK_PATTERN, decode, parse_document
+
+logger = logging.getLogger(__name__)
+
+# Constants
+CACHE_DIRNAME = '.context_cache'
+CACHE_VERSION = 3
+CHARS_PER_TOKEN = 4
+DEFAULT_TOKEN_BUDGET = 4000
+DEFAULT_MAX_DEPTH = 2
+DISTANCE_WEIGHT = 3
+STREAM_CHUNK_SIZE = 8192
+TRIM_MARKER = '... (trimmed)\n'
+DONE_TASK_PATTERN = re.compile(r'^\s*[-*]\s+\[[xX]\]')
+
+# Section kinds by heading keyword, lower rank is included first
+SECTION_RANKS = [
+    (('objective', 'goal', 'purpose'), 0),
+    (('task', 'todo', 'next step', 'action item'), 1),
+    (('status', 'summary', 'overview', 'description'), 2),
+    (('note', 'detail', 'implementation', 'design', 'decision'), 3),
+]
+DEFAULT_SECTION_RANK = 4
+DONE_TASKS_RANK = 5
+SCRIPT_RANK = 6
+
+
+def estimate_tokens(text):
+    """Estimate the number of tokens in a piece of text."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def section_rank(heading):
+    """
+    Return the priority rank of a section from its heading.
+
+    Args:
+        heading (str): Section heading without the leading #'s
+
+    Returns:
+        int: Rank, lower is more important
+    """
+    heading = heading.lower()
+    for keywords, rank in SECTION_RANKS:
+        if any(keyword in heading for keyword in keywords):
+            return rank
+    return DEFAULT_SECTION_RANK
+
+
+def split_sections(content):
+    """
+    Split a markdown document into its preamble and ``##`` sections.
+
+    The document is scanned with the shared parser (frontmatter.parse_document),
+    so headings inside fenced code blocks do not start sections. Frontmatter is
+    dropped except for its title, which takes precedence over the first ``#``
+    heading. Checked-off task items in task sections are moved to a
+    separate, lower-priority "(completed)" section so open tasks survive trimming.
+
+    Args:
+        content (str): Document content
+
+    Returns:
+        tuple: (title or None, list of (heading, text, rank) in document order;
+               the preamble has heading None)
+    """
+    document = parse_document(content)
+    data = document.data
+    headings = [section for section in document.sections if section.level == 2]
+    title_section = next((section for section in document.sections if section.level == 1), None)
+    title = document.fields.get('title')
+    if not isinstance(title, str) or not title:
+        title = title_section.title if title_section else None
+
+    sections = []
+    preamble_end = headings[0].start if headings else len(data)
+    preamble = data[document.body_offset:preamble_end]
+    if title_section and title_section.start < preamble_end:
+        preamble = (data[document.body_offset:title_section.start]
+                    + data[title_section.content_start:preamble_end])
+    preamble = decode(preamble)
+    if preamble.strip():
+        sections.append((None, preamble.strip() + '\n', DEFAULT_SECTION_RANK))
+
+    for i, section in enumerate(headings):
+        heading = section.title
+        # A section runs to the next ``##`` heading, including any ``#`` headings inside it
+        end = headings[i + 1].start if i + 1 < len(headings) else len(data)
+        body = decode(data[section.content_start:end]).strip('\n')
+        rank = section_rank(heading)
+
+        if rank == 1:
+            lines = body.split('\n')
+            done = [line for line in lines if DONE_TASK_PATTERN.match(line)]
+            if done:
+                body = '\n'.join(line for line in lines if not DONE_TASK_PATTERN.match(line))
+                sections.append((heading, body.strip('\n') + '\n', rank))
+                sections.append((f"{heading} (completed)", '\n'.join(done) + '\n', DONE_TASKS_RANK))
+                continue
+
+        sections.append((heading, body + '\n', rank))
+
+    return title, sections
+
+
+def trim_to_tokens(text, tokens):
+    """
+    Trim text to whole lines fitting a token budget, marking the cut.
+
+    Args:
+        text (str): Text to trim
+        tokens (int): Token budget for the returned text, including the marker
+
+    Returns:
+        str: Trimmed text, or an empty string if not even one line fits
+    """
+    budget = tokens * CHARS_PER_TOKEN - len(TRIM_MARKER)
+    kept = []
+    used = 0
+    for line in text.splitlines(keepends=True):
+        if used + len(line) > budget:
+            break
+        kept.append(line)
+        used += len(line)
+    return ''.join(kept) + TRIM_MARKER if kept else ''
+
+
+class ContextBundleBuilder:
+    """
+    Builds token-budgeted context bundles from a work effort and its relations.
+    """
+
+    def __init__(self, index, token_budget=DEFAULT_TOKEN_BUDGET, max_depth=DEFAULT_MAX_DEPTH,
+                 find_associated=None, use_cache=True):
+        """
+        Initialize the builder.
+
+        Args:
+            index (RetrievalIndex): Refreshed retrieval index used to resolve links
+            token_budget (int): Maximum number of tokens in a bundle
+            max_depth (int): Maximum link distance from the starting work effort
+            find_associated (callable): Optional function returning associated file
+                paths (such as scripts) for a work effort path
+            use_cache (bool): If True, serve and store rendered bundles in the cache
+        """
+        self.index = index
+        self.token_budget = token_budget
+        self.max_depth = max_depth
+        self.find_associated = find_associated
+        self.cache_dir = os.path.join(index.work_efforts_dir, CACHE_DIRNAME) if use_cache else None
+        self.cache_hit = False
+        self._hashes = {}
+        self._links = {}
+        self._associated = {}
+
+    def _read(self, path):
+        """Read a file, recording its content hash."""
+        with open(path, 'rb') as f:
+            data = f.read()
+        self._hashes[path] = self._fingerprint(path, hashlib.sha256(data).hexdigest())
+        return data.decode('utf-8', errors='replace')
+
+    @staticmethod
+    def _fingerprint(path, digest):
+        """Return the [size, mtime_ns, sha256] fingerprint stored in the cache."""
+        st = os.stat(path)
+        return [st.st_size, st.st_mtime_ns, digest]
+
+    def _resolve(self, link):
+        """Resolve a wiki link to a work effort path through the index, recording the result."""
+        matches = self.index.search(link, limit=1)
+        resolved = self.index.path_for(matches[0][0]) if matches else None
+        self._links[link] = resolved
+        return resolved
+
+    def _associated_files(self, path):
+        """Return the associated files of a work effort, recording them."""
+        paths = list(self.find_associated(path))
+        self._associated[path] = paths
+        return paths
+
+    def _collect(self, start_path):
+        """
+        Walk the link graph breadth-first from start_path.
+
+        Returns:
+            list: (path, distance, title, sections) for every document reached, in
+                  visiting order
+        """
+        documents = []
+        queue = [(start_path, 0)]
+        seen = {os.path.normpath(start_path)}
+        while queue:
+            path, distance = queue.pop(0)
+            try:
+                content = self._read(path)
+            except OSError as e:
+                logger.warning(f"Could not read {path}: {e}")
+                continue
+
+            title, sections = split_sections(content)
+            documents.append((path, distance, title or os.path.basename(path), sections))
+
+            if distance >= self.max_depth:
+                continue
+            for link in dict.fromkeys(WIKI_LINK_PATTERN.findall(content)):
+                linked = self._resolve(link)
+                if linked and os.path.normpath(linked) not in seen:
+                    seen.add(os.path.normpath(linked))
+                    queue.append((linked, distance + 1))
+        return documents
+
+    def _select(self, documents):
+        """
+        Choose the sections to include within the token budget.
+
+        Returns:
+            OrderedDict: Mapping of document path to (distance, title, list of
+                         (heading, text) in document order)
+        """
+        candidates = []
+        for doc_order, (path, distance, title, sections) in enumerate(documents):
+            for section_order, (heading, text, rank) in enumerate(sections):
+                candidates.append((rank + DISTANCE_WEIGHT * distance, doc_order, section_order, path, heading, text))
+
+            if self.find_associated:
+                for offset, script_path in enumerate(self._associated_files(path)):
+                    try:
+                        script = self._read(script_path)
+                    except OSError as e:
+                        logger.warning(f"Could not read {script_path}: {e}")
+                        continue
+                    candidates.append((SCRIPT_RANK + DISTANCE_WEIGHT * distance, doc_order,
+                                       len(sections) + offset, path,
+                                       f"Script: {os.path.basename(script_path)}", f"```\n{script}```\n"))
+
+        titles = {path: (distance, title) for path, distance, title, _ in documents}
+        remaining = self.token_budget
+        chosen = []
+        headers_paid = set()
+        for priority, doc_order, section_order, path, heading, text in sorted(candidates, key=lambda c: c[:3]):
+            header_cost = 0 if path in headers_paid else estimate_tokens(self._doc_header(path, *titles[path]))
+            heading_cost = estimate_tokens(f"## {heading}\n\n") if heading else 0
+            available = remaining - header_cost - heading_cost
+            if available <= 0:
+                continue
+
+            # Rendered sections are followed by a blank line
+            if estimate_tokens(text + '\n') > available:
+                text = trim_to_tokens(text, available - 1)
+                if not text:
+                    continue
+
+            remaining -= header_cost + heading_cost + estimate_tokens(text + '\n')
+            headers_paid.add(path)
+            chosen.append((doc_order, section_order, path, heading, text))
+
+        selected = OrderedDict()
+        for doc_order, section_order, path, heading, text in sorted(chosen, key=lambda c: c[:2]):
+            distance, title = titles[path]
+            selected.setdefault(path, (distance, title, []))[2].append((heading, text))
+        return selected
+
+    @staticmethod
+    def _doc_header(path, distance, title):
+        """Return the header written before each document in the bundle."""
+        relation = 'requested work effort' if distance == 0 else f"related, distance {distance}"
+        return f"# {title}\n\n_{os.path.basename(path)} ({relation})_\n\n"
+
+    def _render(self, selected):
+        """Yield the bundle text for the selected sections."""
+        for path, (distance, title, sections) in selected.items():
+            yield self._doc_header(path, distance, title)
+            for heading, text in sections:
+                if heading:
+                    yield f"## {heading}\n\n"
+                yield text + '\n'
+
+    def _cache_path(self, start_path):
+        """Return the cache file for a starting document and the current options."""
+        key = json.dumps([os.path.abspath(start_path), self.token_budget, self.max_depth,
+                          bool(self.find_associated), CACHE_VERSION])
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    def _load_cached(self, start_path):
+        """
+        Return a cached bundle if every file it was built from is unchanged and
+        every link and associated file lookup still gives the same result.
+        """
+        cache_path = self._cache_path(start_path)
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        touched = False
+        for path, (size, mtime_ns, digest) in cached['files'].items():
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+            if st.st_size != size:
+                return None
+            if st.st_mtime_ns != mtime_ns:
+                with open(path, 'rb') as f:
+                    if hashlib.sha256(f.read()).hexdigest() != digest:
+                        return None
+                # Same content with a new mtime: remember it so the file is not hashed again
+                cached['files'][path] = [size, st.st_mtime_ns, digest]
+                touched = True
+
+        # A link that resolves differently (such as to a document created since) changes the bundle
+        for link, resolved in cached['links'].items():
+            if self._resolve(link) != resolved:
+                return None
+        if self.find_associated:
+            for path, paths in cached['associated'].items():
+                if self._associated_files(path) != paths:
+                    return None
+
+        if touched:
+            self._write_cache(cache_path, cached)
+        return cached['bundle']
+
+    def _write_cache(self, cache_path, cached):
+        """Write a cache entry, logging instead of failing."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            atomic_write_text(cache_path, json.dumps(cached, separators=(',', ':')))
+        except OSError as e:
+            logger.warning(f"Could not cache context bundle: {e}")
+
+    def _store(self, start_path, bundle):
+        """Store a rendered bundle with the fingerprints of the files and the link resolutions it used."""
+        self._write_cache(self._cache_path(start_path), {
+            'files': self._hashes,
+            'links': self._links,
+            'associated': self._associated,
+            'bundle': bundle,
+        })
+
+    def build(self, start_path):
+        """
+        Build the context bundle for a work effort as a stream of text chunks.
+
+        Args:
+            start_path (str): Path of the starting work effort
+
+        Yields:
+            str: Chunks of the bundle
+        """
+        if self.cache_dir:
+            cached = self._load_cached(start_path)
+            if cached is not None:
+                self.cache_hit = True
+                for i in range(0, len(cached), STREAM_CHUNK_SIZE):
+                    yield cached[i:i + STREAM_CHUNK_SIZE]
+                return
+
+        self.cache_hit = False
+        self._hashes = {}
+        self._links = {}
+        self._associated = {}
+        selected = self._select(self._collect(start_path))
+
+        rendered = []
+        for chunk in self._render(selected):
+            rendered.append(chunk)
+            yield chunk
+
+        if self.cache_dir:
+            self._store(start_path, ''.join(rendered))
+
+    def write(self, start_path, stream):
+        """
+        Write the context bundle for a work effort to a text stream.
+
+        Args:
+            start_path (str): Path of the starting work effort
+            stream: Text stream such as sys.stdout
+        """
+        for chunk in self.build(start_path):
+            stream.write(chunk)
@@ -118,6 +118,38 @@ class WorkEffortCounter:
             finally:
                 self._release_file_lock()
 
+    def reserve(self, count: int) -> int:
+        """
+        Reserve a block of consecutive count values with a single counter update.
+
+        Args:
+            count: Number of values to reserve
+
+        Returns:
+            The first reserved value; the block is first .. first + count - 1
+
+        Raises:
+            IOError: If counter file cannot be read/written
+            ValueError: If count is less than 1
+        """
+        if count < 1:
+            raise ValueError("Reserved count must be at least 1")
+
+        with self.thread_lock:
+            self._acquire_file_lock()
+            try:
+                self._load_counter()
+
+                first = self.current_count
+                self.previous_count = first + count - 1
+                self.current_count = first + count
+
+                self._save_counter()
+
+                return first
+            finally:
+                self._release_file_lock()
+
     def format_work_effort_number(self, count: int, use_date_prefix: bool = False) -> str:
         """
         Format a work effort number with appropriate padding.
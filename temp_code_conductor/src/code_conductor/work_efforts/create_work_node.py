@@ -23,7 +23,8 @@ This script implements the following workflow:
 
 3. Link Integration Phase:
    - Creating bidirectional links between work nodes and connected documents
-   - Updating frontmatter of all related documents to reflect connections
+   - Updating frontmatter of all related documents to reflect connections,
+     batched so each document is rewritten at most once per run
    - Preserving existing links while adding new relationship information
 
 4. Visualization Phase (Optional):
@@ -35,6 +36,7 @@ Usage:
     python create_work_node.py --title "Node Title" --documents doc1.md doc2.md [--category Category]
     python create_work_node.py --auto-discover [--min-similarity 0.6] [--max-nodes 5]
     python create_work_node.py --visualize [--output graph.json]
+    python create_work_node.py --export graph.ndjson [--format ndjson|graphml|gexf] [--delta]
 
 Options:
     --title TITLE         Title for the work node (required unless using --auto-discover)
@@ -46,6 +48,9 @@ Options:
     --max-nodes NUM       Maximum number of nodes to create in auto-discover mode (default: 10)
     --visualize           Generate a visualization of the knowledge graph
     --output FILE         Output file for visualization data (default: "knowledge_graph.json")
+    --export FILE         Stream the knowledge graph from the node index to FILE
+    --format FMT          Export format: ndjson, graphml or gexf (default: ndjson)
+    --delta               Only export records that changed since the last export to FILE (ndjson only)
     --work-dir DIR        Work efforts directory (default: _AI-Setup/work_effort)
     --dry-run             Don't actually create or modify files, just show what would be done
     --verbose             Enable verbose logging
@@ -61,7 +66,15 @@ import sys
 import argparse
 from collections import defaultdict
 import difflib
-import yaml
+
+try:
+    from .graph_export import WorkNodeIndex, EXPORT_FORMATS, DELTA_FORMATS, export_graph
+    from .link_patcher import LinkPatchPlanner
+    from .frontmatter import parse_document
+except ImportError:
+    from graph_export import WorkNodeIndex, EXPORT_FORMATS, DELTA_FORMATS, export_graph
+    from link_patcher import LinkPatchPlanner
+    from frontmatter import parse_document
 
 # Setup logging
 logging.basicConfig(
@@ -79,7 +92,6 @@ ROOT_DIR = os.getcwd()
 WORK_DIR = os.path.join(ROOT_DIR, '_AI-Setup', 'work_effort')
 NODE_DIR = os.path.join(WORK_DIR, 'node')
 MARKDOWN_EXTENSIONS = ['.md', '.markdown']
-YAML_FRONTMATTER_PATTERN = re.compile(r'^---\s*$(.*?)^---\s*$', re.MULTILINE | re.DOTALL)
 WIKI_LINK_PATTERN = re.compile(r'\[\[(.*?)\]\]')
 NODE_TEMPLATE = """---
 title: "{title}"
@@ -194,6 +206,9 @@ class WorkNodeManager:
         self.node_dir = os.path.join(self.work_dir, 'node')
         self.dry_run = dry_run
         self.verbose = verbose
+        self._index = None
+        self.link_planner = LinkPatchPlanner(self.work_dir)
+        self.pending_diffs = []
 
         if verbose:
             logger.setLevel(logging.DEBUG)
@@ -203,6 +218,13 @@ class WorkNodeManager:
         logger.info(f"Node directory: {self.node_dir}")
         logger.info(f"Dry run: {self.dry_run}")
 
+    @property
+    def index(self):
+        """The persistent node/document index for this work directory, loaded on first use."""
+        if self._index is None:
+            self._index = WorkNodeIndex(self.work_dir)
+        return self._index
+
     def ensure_node_dir_exists(self):
         """Ensure the node directory exists."""
         if not os.path.exists(self.node_dir):
@@ -243,12 +265,9 @@ class WorkNodeManager:
         title = os.path.splitext(os.path.basename(doc_path))[0]
 
         # Try to extract title from frontmatter
-        match = YAML_FRONTMATTER_PATTERN.search(content)
-        if match:
-            frontmatter_text = match.group(1)
-            title_match = re.search(r'title:\s*"?(.*?)"?$', frontmatter_text, re.MULTILINE)
-            if title_match:
-                title = title_match.group(1).strip()
+        frontmatter_title = parse_document(content, sections=False).fields.get('title')
+        if isinstance(frontmatter_title, str) and frontmatter_title.strip():
+            title = frontmatter_title.strip()
 
         return {
             "path": doc_path,
@@ -299,8 +318,14 @@ class WorkNodeManager:
         logger.info(f"Discovered {len(clusters)} potential document clusters")
         return clusters
 
-    def create_work_node(self, title, category, description, documents):
-        """Create a work node document."""
+    def create_work_node(self, title, category, description, documents, flush_links=True):
+        """
+        Create a work node document.
+
+        Links back to the node are queued on the link planner. With flush_links=False
+        the caller is responsible for calling flush_links() once all nodes of a run
+        have been created, so each document is rewritten only once.
+        """
         node = WorkNode(
             title=title,
             category=category,
@@ -316,66 +341,54 @@ class WorkNodeManager:
         if not self.dry_run:
             with open(node_path, 'w', encoding='utf-8') as f:
                 f.write(node.to_markdown())
+            self.index.update_entry(os.path.relpath(node_path, self.work_dir))
             logger.info(f"Created work node: {node_path}")
         else:
             logger.info(f"Would create work node: {node_path}")
 
-        # Update connected documents
+        # Queue links in the connected documents
         for doc in documents:
             self.add_node_link_to_document(doc, node)
 
+        if flush_links:
+            self.flush_links()
+
         return node
 
     def add_node_link_to_document(self, doc_path, node):
-        """Add a link to the work node in the specified document."""
-        full_path = os.path.join(self.work_dir, doc_path)
-        content = self.read_document(doc_path)
+        """
+        Queue a link to the work node in the specified document.
 
-        # Process frontmatter
-        match = YAML_FRONTMATTER_PATTERN.search(content)
-        if match:
-            frontmatter_text = match.group(1)
-            updated_frontmatter = frontmatter_text
-
-            # Check if connected_node field exists
-            if 'connected_node:' in frontmatter_text:
-                # Update existing field
-                if f"[[{node.filename}]]" not in frontmatter_text:
-                    # Find the end of the connected_node list
-                    nodes_pattern = re.compile(r'connected_node:\s*\n((?:  - .*\n)*)', re.MULTILINE)
-                    nodes_match = nodes_pattern.search(frontmatter_text)
-                    if nodes_match:
-                        nodes_list = nodes_match.group(1)
-                        updated_frontmatter = frontmatter_text.replace(
-                            nodes_list,
-                            nodes_list + f"  - [[{node.filename}]]\n"
-                        )
-            else:
-                # Add new connected_node field
-                updated_frontmatter = frontmatter_text.rstrip() + "\nconnected_node:\n  - [[" + node.filename + "]]\n"
+        The document is not touched until flush_links() applies all queued links.
+        """
+        self.link_planner.add_link(doc_path, 'connected_node', node.filename)
 
-            # Replace frontmatter
-            updated_content = content.replace(match.group(0), f"---\n{updated_frontmatter}---\n")
+    def flush_links(self):
+        """
+        Apply all queued node links with one frontmatter rewrite per document.
 
-            # Write updated content
-            if not self.dry_run:
-                with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write(updated_content)
-                logger.info(f"Updated document with node link: {full_path}")
-            else:
-                logger.info(f"Would update document with node link: {full_path}")
-        else:
-            # No frontmatter, create a new one
-            frontmatter = f"---\ntitle: \"{os.path.splitext(os.path.basename(doc_path))[0]}\"\nconnected_node:\n  - [[{node.filename}]]\n---\n\n"
-            updated_content = frontmatter + content
+        In dry-run mode nothing is written; the unified diffs are logged and kept in
+        self.pending_diffs instead.
 
-            # Write updated content
-            if not self.dry_run:
-                with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write(updated_content)
-                logger.info(f"Added frontmatter with node link: {full_path}")
-            else:
-                logger.info(f"Would add frontmatter with node link: {full_path}")
+        Returns:
+            list: Rewritten document paths, or unified diffs in dry-run mode
+        """
+        if not len(self.link_planner):
+            return []
+
+        if self.dry_run:
+            diffs = self.link_planner.apply(dry_run=True)
+            for diff in diffs:
+                logger.info(f"Would apply node link patch:\n{diff}")
+            self.pending_diffs.extend(diffs)
+            return diffs
+
+        written = self.link_planner.apply()
+        for doc_path in written:
+            self.index.update_entry(doc_path)
+        self.index.save()
+        logger.info(f"Rewrote {len(written)} documents with node links")
+        return written
 
     def create_auto_nodes(self, min_similarity=0.5, max_nodes=10):
         """Automatically discover related documents and create work nodes."""
@@ -392,75 +405,53 @@ class WorkNodeManager:
             # Generate a description based on the documents in the cluster
             description = f"Automatically generated connection between {len(cluster)} related documents."
 
-            # Create the work node
+            # Create the work node, deferring document updates to a single pass
             node = self.create_work_node(
                 title=title,
                 category="auto-discovered",
                 description=description,
-                documents=cluster
+                documents=cluster,
+                flush_links=False
             )
             created_nodes.append(node)
 
+        # Rewrite each touched document once, whatever the number of clusters it is in
+        self.flush_links()
+
         logger.info(f"Created {len(created_nodes)} work nodes")
         return created_nodes
 
     def generate_visualization(self, output_file="knowledge_graph.json"):
-        """Generate a visualization of the knowledge graph."""
-        # Collect all documents and nodes
-        documents = self.find_all_documents()
-        nodes = [os.path.join("node", f) for f in os.listdir(self.node_dir)
-                if any(f.endswith(ext) for ext in MARKDOWN_EXTENSIONS)]
+        """
+        Generate a visualization of the knowledge graph.
+
+        Node and edge data come from the maintained work node index, so only files
+        that changed since the last run are read.
+        """
+        self.index.refresh(save=not self.dry_run)
 
-        # Extract information for each document and node
         nodes_info = []
-        for node_file in nodes:
-            content = self.read_document(node_file)
-            match = YAML_FRONTMATTER_PATTERN.search(content)
-            if match:
-                try:
-                    frontmatter = yaml.safe_load(match.group(1))
-                    node_info = {
-                        "id": node_file,
-                        "title": frontmatter.get("title", os.path.basename(node_file)),
-                        "type": "node",
-                        "category": frontmatter.get("category", "connection"),
-                        "connected_document": frontmatter.get("connected_document", [])
-                    }
-                    nodes_info.append(node_info)
-                except yaml.YAMLError:
-                    logger.error(f"Error parsing frontmatter in {node_file}")
-
-        # Extract information for each document
         docs_info = []
-        for doc_file in documents:
-            content = self.read_document(doc_file)
-            match = YAML_FRONTMATTER_PATTERN.search(content)
-            if match:
-                try:
-                    frontmatter = yaml.safe_load(match.group(1))
-                    doc_info = {
-                        "id": doc_file,
-                        "title": frontmatter.get("title", os.path.basename(doc_file)),
-                        "type": "document",
-                        "connected_node": frontmatter.get("connected_node", [])
-                    }
-                    docs_info.append(doc_info)
-                except yaml.YAMLError:
-                    logger.error(f"Error parsing frontmatter in {doc_file}")
+        for rel_path, entry in sorted(self.index.entries.items()):
+            links = entry.get('links', {})
+            if entry['type'] == 'node':
+                nodes_info.append({
+                    "id": rel_path,
+                    "title": entry['title'],
+                    "type": "node",
+                    "category": entry.get('category', 'connection'),
+                    "connected_document": [f"[[{doc}]]" for doc in links.get('connected_document', [])]
+                })
+            else:
+                docs_info.append({
+                    "id": rel_path,
+                    "title": entry['title'],
+                    "type": "document",
+                    "connected_node": links.get('connected_node', [])
+                })
 
         # Build edges between nodes and documents
-        edges = []
-        for node in nodes_info:
-            for doc_ref in node["connected_document"]:
-                # Extract document filename from wiki link
-                doc_match = WIKI_LINK_PATTERN.search(doc_ref)
-                if doc_match:
-                    doc_file = doc_match.group(1)
-                    edges.append({
-                        "source": node["id"],
-                        "target": doc_file,
-                        "type": "node_to_document"
-                    })
+        edges = [edge for edge in self.index.iter_edges() if edge['type'] == 'node_to_document']
 
         # Create the final graph data
         graph_data = {
@@ -478,6 +469,24 @@ class WorkNodeManager:
 
         return graph_data
 
+    def export_graph(self, output_file, fmt="ndjson", delta=False):
+        """
+        Stream the knowledge graph from the index to a file.
+
+        Args:
+            output_file (str): Destination file
+            fmt (str): One of "ndjson", "graphml" or "gexf"
+            delta (bool): If True, only emit records that changed since the last export to output_file
+
+        Returns:
+            dict: Counts of exported nodes, edges and deletions
+        """
+        if self.dry_run:
+            logger.info(f"Would export {fmt} graph data: {output_file}")
+            return {'nodes': 0, 'edges': 0, 'deleted': 0}
+
+        return export_graph(self.index, output_file, fmt=fmt, delta=delta)
+
 
 def parse_args():
     """Parse command line arguments."""
@@ -500,6 +509,12 @@ def parse_args():
                         help='Generate a visualization of the knowledge graph')
     parser.add_argument('--output', dest='output', default='knowledge_graph.json',
                         help='Output file for visualization data')
+    parser.add_argument('--export', dest='export',
+                        help='Stream the knowledge graph from the node index to this file')
+    parser.add_argument('--format', dest='format', choices=EXPORT_FORMATS, default='ndjson',
+                        help='Export format (default: ndjson)')
+    parser.add_argument('--delta', dest='delta', action='store_true',
+                        help='Only export records that changed since the last export (ndjson only)')
     parser.add_argument('--work-dir', dest='work_dir', default=WORK_DIR,
                         help=f'Work efforts directory')
     parser.add_argument('--dry-run', dest='dry_run', action='store_true',
@@ -514,13 +529,16 @@ def main():
     args = parse_args()
 
     # Validate arguments
-    if not args.auto_discover and not args.visualize:
+    if not args.auto_discover and not args.visualize and not args.export:
         if not args.title:
-            print("Error: --title is required unless using --auto-discover or --visualize")
+            print("Error: --title is required unless using --auto-discover, --visualize or --export")
             return 1
         if not args.documents:
-            print("Error: --documents is required unless using --auto-discover or --visualize")
+            print("Error: --documents is required unless using --auto-discover, --visualize or --export")
             return 1
+    if args.delta and args.format not in DELTA_FORMATS:
+        print(f"Error: --delta is only supported with --format {' or '.join(DELTA_FORMATS)}")
+        return 1
 
     # Initialize the work node manager
     manager = WorkNodeManager(
@@ -540,6 +558,16 @@ def main():
             for node in created_nodes:
                 print(f"- {node.title}: {len(node.documents)} connected documents")
 
+        elif args.export:
+            # Stream the knowledge graph from the index
+            stats = manager.export_graph(args.export, fmt=args.format, delta=args.delta)
+            print(f"\nExported knowledge graph ({args.format}{', delta' if args.delta else ''}):")
+            print(f"- Nodes: {stats['nodes']}")
+            print(f"- Edges: {stats['edges']}")
+            if args.delta:
+                print(f"- Deleted: {stats['deleted']}")
+            print(f"- Output file: {args.export}")
+
         elif args.visualize:
             # Generate a visualization of the knowledge graph
             graph_data = manager.generate_visualization(output_file=args.output)
@@ -563,6 +591,10 @@ def main():
             print(f"- File: {os.path.join(manager.node_dir, node.filename)}")
 
         if args.dry_run:
+            if manager.pending_diffs:
+                print("\nDocument changes that would be applied:\n")
+                for diff in manager.pending_diffs:
+                    print(diff)
             print("\nThis was a dry run. No files were actually modified.")
 
     except KeyboardInterrupt:
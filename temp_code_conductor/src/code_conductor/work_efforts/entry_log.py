@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Entry Log
+
+Append-only storage for devlog and changelog entries, with a renderer that
+assembles the Markdown document from them.
+
+Adding an entry by reading the whole document and writing it back costs time
+proportional to the document, and two writers doing it at once lose one of the
+entries. ``EntryLog`` instead appends each entry as one JSON line to a journal
+next to the document (``.devlog.md.journal`` for ``devlog.md``). The journal
+is opened with ``O_APPEND`` and each record is written with a single
+``os.write``, so an append costs the same however long the log is, and
+concurrent appends from threads or processes never overwrite each other.
+
+The journal holds one JSON record per line:
+
+- ``base``: the document as it was last rendered (or found on disk), with its
+  modification time and size
+- ``entry``: an entry added since, with its text, its changelog section (such
+  as ``Added``) and when it was added
+- ``pending``: written by a render before it replaces the document, with a hash
+  of what it is about to write, so a render that stops before compacting is
+  recognized by the next one
+
+Only the records after the last ``base`` are pending: a render uses the base
+and the entries after it, and an entry appended after a ``pending`` record (by
+a writer that was waiting while that render ran) is rendered next time.
+
+``render`` writes the document from the base and the entries after it, newest
+first: devlog entries go below the title, changelog entries under their
+``### Section`` heading in ``## [Unreleased]``. It then compacts the journal to
+a single base holding the rendered document, so the journal never holds more
+than one copy of the document plus the entries added since the last render. A
+document edited by hand since the last render becomes the new base, so hand
+edits are kept, and a deleted document is rebuilt from the base.
+
+Rendering reads the journal and rewrites the document, so callers append
+entries as they go and render once per batch (or when the document is needed),
+not after every append. Appends hold a shared lock on the journal and render
+holds an exclusive one, so an entry appended while the journal is compacted is
+never lost. Without ``fcntl`` the journal is not locked.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+import datetime
+import tempfile
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+logger = logging.getLogger(__name__)
+
+# Constants
+JOURNAL_SUFFIX = '.journal'
+DEVLOG_TITLE = '# Development Log\n\n'
+CHANGELOG_TITLE = '# Changelog\n\n'
+TITLE_PATTERN = re.compile(r'\A\s*#[ \t][^\n]*(?:\n|\Z)\s*')
+UNRELEASED_PATTERN = re.compile(r'^## \[Unreleased\][^\n]*(?:\n|\Z)', re.MULTILINE)
+RELEASE_PATTERN = re.compile(r'^## ', re.MULTILINE)
+
+
+def render_devlog(base, entries):
+    """
+    Insert devlog entries below the document title, newest first.
+
+    Args:
+        base (str): The document without the entries
+        entries (list): Entry records, oldest first
+
+    Returns:
+        str: The rendered document
+    """
+    if not base.strip():
+        base = DEVLOG_TITLE
+    title = TITLE_PATTERN.match(base)
+    position = title.end() if title else 0
+    text = ''.join(entry['text'].strip('\n') + '\n\n' for entry in reversed(entries))
+    return base[:position] + text + base[position:]
+
+
+def render_changelog(base, entries):
+    """
+    Insert changelog entries under their sections of ``## [Unreleased]``, newest first.
+
+    Missing ``## [Unreleased]`` and ``### Section`` headings are created.
+
+    Args:
+        base (str): The document without the entries
+        entries (list): Entry records with a 'section', oldest first
+
+    Returns:
+        str: The rendered document
+    """
+    if not base.strip():
+        base = CHANGELOG_TITLE
+    unreleased = UNRELEASED_PATTERN.search(base)
+    if not unreleased:
+        title = TITLE_PATTERN.match(base)
+        position = title.end() if title else 0
+        base = base[:position] + '## [Unreleased]\n\n' + base[position:]
+        unreleased = UNRELEASED_PATTERN.search(base)
+
+    sections = {}
+    for entry in reversed(entries):
+        section = entry.get('section') or 'Changed'
+        sections[section] = sections.get(section, '') + entry['text'].strip('\n') + '\n'
+
+    # Insert sections in reverse so earlier offsets stay valid
+    for section, lines in reversed(list(sections.items())):
+        next_release = RELEASE_PATTERN.search(base, unreleased.end())
+        section_end = next_release.start() if next_release else len(base)
+        heading = re.compile(rf'^### {re.escape(section)}[ \t]*(?:\n|\Z)', re.MULTILINE).search(
+            base, unreleased.end(), section_end)
+        if heading:
+            position = heading.end()
+            if not base[heading.start():position].endswith('\n'):
+                lines = '\n' + lines
+        else:
+            position = unreleased.end()
+            lines = f"\n### {section}\n{lines}"
+        base = base[:position] + lines + base[position:]
+    return base
+
+
+class EntryLog:
+    """
+    An append-only journal of document entries and the renderer for the document.
+    """
+
+    def __init__(self, document_path, render_entries=render_devlog):
+        """
+        Initialize the entry log.
+
+        Args:
+            document_path (str): Path of the rendered Markdown document
+            render_entries (callable): Builds the document from a base text and entries
+        """
+        self.document_path = document_path
+        directory, filename = os.path.split(os.path.abspath(document_path))
+        self.journal_path = os.path.join(directory, f".{filename}{JOURNAL_SUFFIX}")
+        self.render_entries = render_entries
+
+    def _open_journal(self, lock):
+        """
+        Open the journal with the given flock mode, reopening it if a render
+        replaced the file while waiting for the lock.
+
+        Returns:
+            int: File descriptor of the current journal
+        """
+        while True:
+            fd = os.open(self.journal_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+            if not HAS_FCNTL:
+                return fd
+            fcntl.flock(fd, lock)
+            try:
+                if os.fstat(fd).st_ino == os.stat(self.journal_path).st_ino:
+                    return fd
+            except FileNotFoundError:
+                pass
+            os.close(fd)
+
+    def _write(self, op, **fields):
+        """Append one record to the journal with a single O_APPEND write."""
+        record = dict(op=op, **fields)
+        data = (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8')
+        fd = self._open_journal(fcntl.LOCK_SH if HAS_FCNTL else None)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        return record
+
+    def append(self, text, section=None):
+        """
+        Add an entry. The document is not changed until it is rendered.
+
+        Args:
+            text (str): Markdown text of the entry
+            section (str): Changelog section such as 'Added' or 'Changed'
+
+        Returns:
+            dict: The entry record
+        """
+        return self._write('entry', text=text, section=section,
+                           time=datetime.datetime.now().isoformat(timespec='seconds'))
+
+    def _parse(self, data):
+        """Parse journal bytes into records; a last line without a newline is left out."""
+        records = []
+        for line in data.decode('utf-8').split('\n')[:-1]:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                logger.warning(f"Ignoring unreadable entry record in {self.journal_path}")
+        return records
+
+    def records(self):
+        """
+        Read the journal.
+
+        A last line without a newline (an append in progress) is left for the
+        next read.
+
+        Returns:
+            list: Records, oldest first
+        """
+        try:
+            with open(self.journal_path, 'rb') as f:
+                return self._parse(f.read())
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _since_base(records):
+        """Split records into the last base (or None) and the records after it."""
+        for position in range(len(records) - 1, -1, -1):
+            if records[position]['op'] == 'base':
+                return records[position], records[position + 1:]
+        return None, records
+
+    @staticmethod
+    def _entries(records):
+        """Return the entry records among records."""
+        return [record for record in records if record['op'] == 'entry']
+
+    def entries(self):
+        """
+        Get the entries added since the document was last rendered, oldest first.
+
+        Returns:
+            list: Entry records after the last base
+        """
+        return self._entries(self._since_base(self.records())[1])
+
+    def _stamp(self):
+        """Return the document's (mtime_ns, size), or None if it does not exist."""
+        try:
+            stat = os.stat(self.document_path)
+        except FileNotFoundError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    @staticmethod
+    def _digest(text):
+        """Return the hash the journal records for a rendered document."""
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _replace(self, path, text, mode=None):
+        """Write text to path through a temporary file in the same directory."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.render-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def render(self):
+        """
+        Write the document from the base and the entries after it, then compact
+        the journal to the rendered document.
+
+        Returns:
+            bool: True if the document was written, False if it was up to date
+        """
+        fd = self._open_journal(fcntl.LOCK_EX if HAS_FCNTL else None)
+        try:
+            chunks = []
+            os.lseek(fd, 0, os.SEEK_SET)
+            while True:
+                chunk = os.read(fd, 1 << 20)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            base, later = self._since_base(self._parse(b''.join(chunks)))
+            entries = self._entries(later)
+            stamp = self._stamp()
+
+            if base and stamp == base['stamp'] and not entries:
+                return False
+
+            current = None
+            if stamp is not None and (base is None or stamp != base['stamp']):
+                with open(self.document_path, 'r', encoding='utf-8') as f:
+                    current = f.read()
+
+            digest = self._digest(current) if current is not None else None
+            rendered = next((position for position in range(len(later) - 1, -1, -1)
+                             if later[position]['op'] == 'pending' and later[position]['rendered'] == digest), None)
+
+            if rendered is not None:
+                # An earlier render wrote the entries before its pending record and
+                # stopped before compacting; only the entries appended after it are new
+                text, entries = current, self._entries(later[rendered + 1:])
+            elif base is None or current is None:
+                # First render or an unedited document; a deleted one is rebuilt from the base
+                text = base['text'] if base else (current or '')
+            else:
+                # Edited by hand (or only touched) since the last render: the document is the new base
+                text = current
+
+            content = self.render_entries(text, entries)
+            if entries:
+                # Record the rendering before writing it, so a render that stops
+                # before compacting is recognized instead of adding the entries twice
+                record = {'op': 'pending', 'rendered': self._digest(content)}
+                os.write(fd, (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8'))
+
+            written = current is None or content != current
+            if written:
+                mode = os.stat(self.document_path).st_mode & 0o777 if stamp is not None else None
+                self._replace(self.document_path, content, mode)
+
+            compacted = {'op': 'base', 'text': content, 'stamp': self._stamp()}
+            self._replace(self.journal_path, json.dumps(compacted, separators=(',', ':')) + '\n', 0o644)
+            logger.debug(f"Rendered {self.document_path} with {len(entries)} new entries")
+            return written
+        finally:
+            os.close(fd)
+
+
+def open_devlog(path):
+    """
+    Get the entry log of a devlog document.
+
+    Args:
+        path (str): Path of devlog.md
+
+    Returns:
+        EntryLog: Entry log rendering entries newest first below the title
+    """
+    return EntryLog(path, render_devlog)
+
+
+def open_changelog(path):
+    """
+    Get the entry log of a changelog document.
+
+    Args:
+        path (str): Path of CHANGELOG.md
+
+    Returns:
+        EntryLog: Entry log rendering entries under the Unreleased section
+    """
+    return EntryLog(path, render_changelog)
@@ -0,0 +1,660 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Markdown Frontmatter and Section Parsing
+
+The one parser for work effort documents. ``parse_document`` scans a document
+once and returns a ``MarkdownDocument`` holding:
+
+- ``fields``: the frontmatter mapping. Scalars are strings with quotes and
+  trailing ``# comments`` removed, and inline ``[a, b]`` and block lists are
+  lists. Wiki links are replaced by their targets in every form: list items
+  become their link targets (or stay as they are when they have no wiki link),
+  and a scalar made only of wiki links becomes its target, or a list of
+  targets. A key without a value that starts no list is None.
+- ``spans``: the byte span of every top-level key (its line plus any indented
+  or list lines that continue it)
+- ``sections``: the byte offsets of every heading, its content and its end
+- ``frontmatter``, ``body`` and ``section(title)``: memoryview slices of the
+  original bytes, so nothing is copied until a caller decodes what it needs
+
+Only the frontmatter is scanned line by line. Headings are found with a single
+compiled pattern over the body, which skips fenced code blocks and never
+backtracks across the document. ``read_document(path, frontmatter_only=True)``
+reads no further than the closing ``---`` marker.
+
+``patch_frontmatter`` rewrites individual keys using the recorded spans. It
+splices new ``key: value`` lines into the header, appends keys that were not
+present before the closing marker, and copies the body after the header as raw
+bytes. The work done per update is proportional to the size of the frontmatter,
+and content below the frontmatter is kept byte for byte.
+
+The new document is written to a temporary file next to the destination and
+renamed into place, so readers see either the old or the new document. Passing
+a ``target_path`` moves the document in the same step.
+
+``patch_frontmatter_in_place`` overwrites key lines inside the file instead,
+when every new line fits in the line it replaces (shorter lines are padded
+with trailing spaces). Nothing else in the file moves, so only the changed
+bytes are written. Given a ``target_path`` it then renames the document, which
+is how status changes move a work effort into its new status directory.
+
+``splice_file`` applies byte replacements for edits below the frontmatter. It
+checks that the file still has the modification time and size it had when it
+was read, copies it to a temporary file inside the kernel (``copy_file_range``,
+which copy-on-write filesystems turn into a reflink), writes only the changed
+ranges over the copy and renames it into place. Readers never see a partly
+written document, and a document edited since it was read is not overwritten.
+
+How much is flushed to disk is chosen with an fsync policy:
+
+- ``none``: rely on the operating system to write the data back
+- ``file``: fsync the temporary file before it is renamed (the default)
+- ``full``: also fsync the directories whose entries changed
+"""
+
+import os
+import re
+import json
+import shutil
+import logging
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+# Constants
+FRONTMATTER_DELIMITER = b'---'
+MAX_FRONTMATTER_BYTES = 64 * 1024
+READ_CHUNK_SIZE = 8192
+FSYNC_POLICIES = ('none', 'file', 'full')
+DEFAULT_FSYNC_POLICY = 'file'
+FIELD_PATTERN = re.compile(r'^([A-Za-z_][\w-]*):\s*(.*?)\s*$')
+WIKI_LINK_PATTERN = re.compile(r'\[\[(.*?)(?:\|.*?)?\]\]')
+CLOSING_LINE_PATTERN = re.compile(rb'\n---[ \t]*(?:\r?\n|\r?\Z)')
+HEADING_PATTERN = re.compile(rb'^(?:(#{1,6})[ \t]+([^\r\n]*)|(```|~~~))', re.MULTILINE)
+TRAILING_COMMENT_PATTERN = re.compile(rb'^[^:]+:\s*(?:"[^"]*"|\'[^\']*\'|[^#"\'\r\n]*?)(\s+#[^\r\n]*)$')
+
+Section = namedtuple('Section', ['title', 'level', 'start', 'content_start', 'end'])
+
+
+def parse_scalar(value):
+    """
+    Parse a frontmatter value into a string, or a list for inline ``[a, b]`` lists.
+
+    Quotes are removed and trailing ``# comments`` are dropped.
+    """
+    if value[:1] in ('"', "'"):
+        end = value.find(value[0], 1)
+        if end != -1:
+            return value[1:end]
+    value = value.split(' #', 1)[0].strip()
+    if value.startswith('[') and value.endswith(']') and not value.startswith('[['):
+        return [item.strip().strip('"\'') for item in value[1:-1].split(',') if item.strip()]
+    return value.strip('"\'')
+
+
+def link_targets(value):
+    """
+    Replace wiki links in a parsed frontmatter value with their targets.
+
+    List items become their link targets (or stay as they are when they hold no
+    link), as for block list items. A scalar made only of wiki links becomes
+    its target, or a list of targets when it holds several.
+    """
+    if isinstance(value, list):
+        targets = []
+        for item in value:
+            targets.extend(WIKI_LINK_PATTERN.findall(item) or [item])
+        return targets
+    links = WIKI_LINK_PATTERN.findall(value)
+    if not links or WIKI_LINK_PATTERN.sub('', value).strip(' ,;'):
+        return value
+    return links[0] if len(links) == 1 else links
+
+
+class MarkdownDocument:
+    """
+    A markdown document scanned once.
+
+    Attributes:
+        data (bytes): The scanned bytes
+        fields (dict): Frontmatter key -> value
+        spans (dict): Frontmatter key -> (start, end) byte offsets of its lines
+        sections (list): Section tuples (title, level, start, content_start, end)
+            in document order
+        close_offset (int): Offset of the closing marker line, or None if the
+            document has no closed frontmatter
+        body_offset (int): Offset of the first byte after the frontmatter
+        newline (bytes): Line ending used by the frontmatter
+    """
+
+    def __init__(self, data, fields=None, spans=None, sections=None, frontmatter_start=None,
+                 close_offset=None, body_offset=0, newline=b'\n'):
+        self.data = data
+        self.fields = fields if fields is not None else {}
+        self.spans = spans if spans is not None else {}
+        self.sections = sections if sections is not None else []
+        self.frontmatter_start = frontmatter_start
+        self.close_offset = close_offset
+        self.body_offset = body_offset
+        self.newline = newline
+        self._view = memoryview(data)
+
+    @property
+    def has_frontmatter(self):
+        """True if the document starts with a closed frontmatter block."""
+        return self.close_offset is not None
+
+    @property
+    def header(self):
+        """The bytes up to and including the closing marker line."""
+        return self.data[:self.body_offset]
+
+    @property
+    def frontmatter(self):
+        """The text between the frontmatter markers, or None without frontmatter."""
+        if not self.has_frontmatter:
+            return None
+        return self._view[self.frontmatter_start:self.close_offset]
+
+    @property
+    def body(self):
+        """Everything after the frontmatter."""
+        return self._view[self.body_offset:]
+
+    def find_section(self, title, level=None):
+        """
+        Return the first section with the given title (case-insensitive).
+
+        Args:
+            title (str): Heading text without the leading hashes
+            level (int): Only match headings of this level
+
+        Returns:
+            Section: The section, or None if there is none
+        """
+        title = title.strip().lower()
+        for section in self.sections:
+            if section.title.lower() == title and (level is None or section.level == level):
+                return section
+        return None
+
+    def section(self, title, level=None):
+        """Return the content of a section (without its heading line) as a memoryview, or None."""
+        section = self.find_section(title, level)
+        if section is None:
+            return None
+        return self._view[section.content_start:section.end]
+
+    def section_content(self, section):
+        """Return the decoded, stripped content of a section."""
+        return decode(self._view[section.content_start:section.end]).strip()
+
+    def header_replacements(self, updates):
+        """
+        Return the byte replacements that set the given keys in the header.
+
+        Args:
+            updates (dict): Key -> new value (see format_value)
+
+        Returns:
+            list: (start, end, bytes) replacements in header order
+        """
+        nl = self.newline
+        if not self.has_frontmatter:
+            lines = b''.join(_key_line(key, value, nl) for key, value in updates.items())
+            return [(0, 0, FRONTMATTER_DELIMITER + nl + lines + FRONTMATTER_DELIMITER + nl + nl)]
+
+        replacements = []
+        added = b''
+        for key, value in updates.items():
+            span = self.spans.get(key)
+            if span is None:
+                added += _key_line(key, value, nl)
+                continue
+            start, end = span
+            old_line = self.data[start:end].splitlines()[0]
+            comment = TRAILING_COMMENT_PATTERN.match(old_line)
+            replacements.append((start, end, _key_line(key, value, nl, comment.group(1) if comment else b'')))
+        if added:
+            replacements.append((self.close_offset, self.close_offset, added))
+        return sorted(replacements, key=lambda item: item[0])
+
+    def patched_header(self, updates):
+        """
+        Return the header with the given keys set.
+
+        Args:
+            updates (dict): Key -> new value (see format_value)
+
+        Returns:
+            bytes: The new header, ending where the body starts
+        """
+        return splice(self.header, self.header_replacements(updates))
+
+
+def decode(view):
+    """Decode a memoryview or bytes slice as UTF-8, replacing invalid bytes."""
+    return str(view, 'utf-8', 'replace')
+
+
+def splice(data, replacements):
+    """
+    Apply byte replacements to data.
+
+    Args:
+        data (bytes): Original bytes
+        replacements (list): (start, end, bytes) tuples that do not overlap
+
+    Returns:
+        bytes: data with every range replaced
+    """
+    parts, position = [], 0
+    for start, end, text in sorted(replacements, key=lambda item: item[0]):
+        parts.append(data[position:start])
+        parts.append(text)
+        position = end
+    parts.append(data[position:])
+    return b''.join(parts)
+
+
+def _scan_frontmatter(data):
+    """
+    Scan the frontmatter at the start of data.
+
+    Returns:
+        tuple: (fields, spans, frontmatter_start, close_offset, body_offset,
+            newline, closed); close_offset is None when the block is not closed
+    """
+    fields, spans = {}, {}
+    first_end = data.find(b'\n')
+    if not data.startswith(FRONTMATTER_DELIMITER) or first_end == -1 \
+            or data[:first_end].rstrip() != FRONTMATTER_DELIMITER:
+        return fields, spans, None, None, 0, b'\n', False
+
+    newline = b'\r\n' if data[first_end - 1:first_end] == b'\r' else b'\n'
+    start = position = first_end + 1
+
+    # Find the closing marker first so an unclosed block is not scanned line by line
+    if not CLOSING_LINE_PATTERN.search(data, first_end, MAX_FRONTMATTER_BYTES + len(FRONTMATTER_DELIMITER) + 3):
+        return fields, spans, start, None, 0, newline, False
+
+    current_key = None
+    size = len(data)
+    while position < size and position <= MAX_FRONTMATTER_BYTES:
+        end = data.find(b'\n', position)
+        next_position = size if end == -1 else end + 1
+        line = data[position:next_position]
+        if line.rstrip() == FRONTMATTER_DELIMITER:
+            return fields, spans, start, position, next_position, newline, True
+
+        text = line.decode('utf-8', 'replace').rstrip('\r\n')
+        key_match = FIELD_PATTERN.match(text)
+        if key_match:
+            current_key, value = key_match.groups()
+            fields[current_key] = link_targets(parse_scalar(value)) if value else None
+            spans[current_key] = (position, next_position)
+        elif current_key and text[:1] in (' ', '\t', '-') and text.strip():
+            spans[current_key] = (spans[current_key][0], next_position)
+            item = text.lstrip()
+            if item.startswith('-'):
+                if not isinstance(fields.get(current_key), list):
+                    fields[current_key] = []
+                links = WIKI_LINK_PATTERN.findall(item)
+                value = parse_scalar(item[1:].strip())
+                if not links and value:
+                    links = value if isinstance(value, list) else [value]
+                fields[current_key].extend(links)
+        elif text.strip() and not text.startswith('#'):
+            current_key = None
+        position = next_position
+
+    return fields, spans, start, None, 0, newline, False
+
+
+def _scan_sections(data, start):
+    """Return the Section tuples of every heading from start on, outside code fences."""
+    sections, open_sections = [], []
+    match = HEADING_PATTERN.search(data, start)
+    while match:
+        position = match.end()
+        fence = match.group(3)
+        if fence:
+            # Jump straight to the closing fence instead of matching every line inside
+            close = data.find(b'\n' + fence, position)
+            if close == -1:
+                break
+            match = HEADING_PATTERN.search(data, close + 1 + len(fence))
+            continue
+
+        level = len(match.group(1))
+        while open_sections and sections[open_sections[-1]].level >= level:
+            index = open_sections.pop()
+            sections[index] = sections[index]._replace(end=match.start())
+        line_end = data.find(b'\n', position)
+        content_start = len(data) if line_end == -1 else line_end + 1
+        title = decode(match.group(2).rstrip(b' \t\r'))
+        sections.append(Section(title, level, match.start(), content_start, len(data)))
+        open_sections.append(len(sections) - 1)
+        match = HEADING_PATTERN.search(data, content_start)
+    return sections
+
+
+def parse_document(content, sections=True):
+    """
+    Scan a markdown document once.
+
+    Args:
+        content (str, bytes or memoryview): The document
+        sections (bool): If False, skip the heading scan
+
+    Returns:
+        MarkdownDocument: The parsed document
+    """
+    if isinstance(content, str):
+        data = content.encode('utf-8')
+    elif isinstance(content, bytes):
+        data = content
+    else:
+        data = bytes(content)
+
+    fields, spans, start, close_offset, body_offset, newline, closed = _scan_frontmatter(data)
+    if not closed and start is not None and len(data) > MAX_FRONTMATTER_BYTES:
+        logger.warning(f"Frontmatter is not closed within {MAX_FRONTMATTER_BYTES} bytes")
+    return MarkdownDocument(
+        data, fields, spans,
+        _scan_sections(data, body_offset) if sections else [],
+        start, close_offset, body_offset, newline,
+    )
+
+
+def _read_head(f):
+    """Read a binary file up to the end of its frontmatter (or its first chunk if it has none)."""
+    data = f.read(READ_CHUNK_SIZE)
+    if not data.startswith(FRONTMATTER_DELIMITER):
+        return data
+    while len(data) <= MAX_FRONTMATTER_BYTES and not CLOSING_LINE_PATTERN.search(data, 3):
+        chunk = f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def scan_frontmatter(f):
+    """
+    Parse only the frontmatter at the start of a binary file.
+
+    The file is read no further than the closing marker (in whole chunks).
+
+    Args:
+        f: File object opened in binary mode, positioned at the start
+
+    Returns:
+        MarkdownDocument: The document header, without sections
+    """
+    return parse_document(_read_head(f), sections=False)
+
+
+def read_document(file_path, frontmatter_only=False):
+    """
+    Read and parse a markdown file.
+
+    Args:
+        file_path (str): Path to the markdown file
+        frontmatter_only (bool): Read only as far as the frontmatter and skip sections
+
+    Returns:
+        MarkdownDocument: The parsed document
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(file_path, 'rb') as f:
+        if frontmatter_only:
+            return scan_frontmatter(f)
+        return parse_document(f.read())
+
+
+def format_value(value):
+    """
+    Format a value for a frontmatter line.
+
+    Strings are double-quoted, lists become inline ``[a, b]`` lists, booleans
+    are lowercase and anything else is written as is.
+    """
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(format_value(item) for item in value) + ']'
+    return str(value)
+
+
+def _key_line(key, value, newline, comment=b''):
+    """Return a complete ``key: value`` line as bytes."""
+    return f"{key}: {format_value(value)}".encode('utf-8') + comment + newline
+
+
+def _fsync_directory(path):
+    """Flush a directory entry to disk where the platform allows it."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def file_stamp(st):
+    """
+    Return the stamp splice_file compares to tell whether a file changed.
+
+    Args:
+        st (os.stat_result): Stat result of the file
+
+    Returns:
+        tuple: (mtime_ns, size)
+    """
+    return st.st_mtime_ns, st.st_size
+
+
+def _copy_file(src, dst, size):
+    """Copy size bytes between binary files, inside the kernel where the platform allows it."""
+    src.seek(0)
+    if hasattr(os, 'copy_file_range'):
+        copied = 0
+        try:
+            while copied < size:
+                count = os.copy_file_range(src.fileno(), dst.fileno(), size - copied, copied, copied)
+                if count == 0:
+                    break
+                copied += count
+            if copied == size:
+                return
+        except OSError:
+            pass
+        src.seek(0)
+        dst.seek(0)
+        dst.truncate()
+    shutil.copyfileobj(src, dst)
+
+
+def splice_file(path, data, replacements, stamp, fsync=DEFAULT_FSYNC_POLICY):
+    """
+    Apply byte replacements to a file, writing only what changed.
+
+    The unchanged file is copied to a temporary file next to it inside the
+    kernel, and the replacements are written over the copy: ranges that keep
+    their length at their offset, and from the first replacement that changes
+    length on, the rest of the file once. The copy is then renamed over the
+    file, so appending to the last section writes only the appended bytes and
+    readers see either the old or the new document.
+
+    Args:
+        path (str): File to update
+        data (bytes): The contents of the file when it was read, as the replacements were computed
+        replacements (list): (start, end, bytes) tuples that do not overlap
+        stamp (tuple): file_stamp() of the file when data was read
+        fsync (str): One of FSYNC_POLICIES
+
+    Returns:
+        int: Number of bytes written over the copy
+
+    Raises:
+        ValueError: If the fsync policy is unknown or the file changed since it was read
+        OSError: If the file cannot be written
+    """
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy '{fsync}', expected one of {', '.join(FSYNC_POLICIES)}")
+    replacements = sorted(replacements, key=lambda item: item[0])
+    written = 0
+    with open(path, 'rb') as src:
+        st = os.fstat(src.fileno())
+        if stamp is None or file_stamp(st) != tuple(stamp) or st.st_size != len(data):
+            raise ValueError(f"{path} changed since it was read")
+
+        tmp_path = f"{path}.tmp.{os.getpid()}"
+        try:
+            with open(tmp_path, 'w+b') as out:
+                _copy_file(src, out, st.st_size)
+                for index, (start, end, text) in enumerate(replacements):
+                    out.seek(start)
+                    if len(text) == end - start:
+                        written += out.write(text)
+                        continue
+                    rest = [(s - start, e - start, t) for s, e, t in replacements[index:]]
+                    written += out.write(splice(data[start:], rest))
+                    out.truncate()
+                    break
+                if fsync != 'none':
+                    out.flush()
+                    os.fsync(out.fileno())
+            os.chmod(tmp_path, st.st_mode & 0o7777)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    if fsync == 'full':
+        _fsync_directory(os.path.dirname(os.path.abspath(path)))
+    logger.debug(f"Spliced {len(replacements)} ranges into {path} ({written} bytes written)")
+    return written
+
+
+def patch_frontmatter_in_place(path, updates, target_path=None, fsync=DEFAULT_FSYNC_POLICY):
+    """
+    Overwrite frontmatter key lines inside a document without rewriting it.
+
+    This only applies when every key is present on a single line and its new
+    line is no longer than the old one; a shorter line is padded with trailing
+    spaces, so the offsets of everything after it stay the same. Otherwise
+    nothing is written and the caller falls back to patch_frontmatter. A
+    patched document is then renamed to target_path.
+
+    Args:
+        path (str): Document to patch
+        updates (dict): Key -> new value
+        target_path (str): Where the patched document should end up (default: path)
+        fsync (str): One of FSYNC_POLICIES
+
+    Returns:
+        bool: True if the document was patched in place (or already had the
+            values) and moved, False if it has to be rewritten
+
+    Raises:
+        ValueError: If the fsync policy is unknown
+        OSError: If the document cannot be read, written or moved
+    """
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy '{fsync}', expected one of {', '.join(FSYNC_POLICIES)}")
+    with open(path, 'r+b') as f:
+        document = scan_frontmatter(f)
+        if not document.has_frontmatter:
+            return False
+        writes = []
+        for start, end, text in document.header_replacements(updates):
+            old_line = document.data[start:end].rstrip(b'\r\n')
+            new_line = text.rstrip(b'\r\n')
+            if start == end or b'\n' in document.data[start:end].rstrip(b'\r\n') or len(new_line) > len(old_line):
+                return False
+            if new_line.rstrip(b' ') != old_line.rstrip(b' '):
+                writes.append((start, new_line.ljust(len(old_line))))
+        for start, text in writes:
+            f.seek(start)
+            f.write(text)
+        if writes and fsync != 'none':
+            f.flush()
+            os.fsync(f.fileno())
+    if target_path and os.path.abspath(target_path) != os.path.abspath(path):
+        os.rename(path, target_path)
+        if fsync == 'full':
+            _fsync_directory(os.path.dirname(os.path.abspath(target_path)))
+            _fsync_directory(os.path.dirname(os.path.abspath(path)))
+    if writes:
+        logger.debug(f"Patched {', '.join(updates)} in place in {path}")
+    return True
+
+
+def patch_frontmatter(path, updates, target_path=None, fsync=DEFAULT_FSYNC_POLICY):
+    """
+    Set frontmatter keys of a document, optionally moving it.
+
+    Args:
+        path (str): Document to patch
+        updates (dict): Key -> new value
+        target_path (str): Where the patched document should end up (default: path)
+        fsync (str): One of FSYNC_POLICIES
+
+    Returns:
+        bool: True if anything was written, False if the document already had
+            the values and was not being moved
+
+    Raises:
+        ValueError: If the fsync policy is unknown or the frontmatter is not closed
+        OSError: If the document cannot be read, written or moved
+    """
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy '{fsync}', expected one of {', '.join(FSYNC_POLICIES)}")
+    target_path = target_path or path
+    moving = os.path.abspath(target_path) != os.path.abspath(path)
+
+    with open(path, 'rb') as src:
+        document = scan_frontmatter(src)
+        if document.frontmatter_start is not None and not document.has_frontmatter:
+            if len(document.data) > MAX_FRONTMATTER_BYTES:
+                raise ValueError(f"Frontmatter in {path} is not closed within {MAX_FRONTMATTER_BYTES} bytes")
+            raise ValueError(f"Frontmatter in {path} has no closing '---' line")
+        header = document.patched_header(updates)
+        if header == document.header and not moving:
+            return False
+
+        tmp_path = f"{target_path}.tmp.{os.getpid()}"
+        try:
+            with open(tmp_path, 'wb') as out:
+                out.write(header)
+                src.seek(document.body_offset)
+                shutil.copyfileobj(src, out)
+                if fsync != 'none':
+                    out.flush()
+                    os.fsync(out.fileno())
+            os.chmod(tmp_path, os.fstat(src.fileno()).st_mode & 0o7777)
+            os.replace(tmp_path, target_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    if moving:
+        os.remove(path)
+    if fsync == 'full':
+        _fsync_directory(os.path.dirname(os.path.abspath(target_path)))
+        if moving:
+            _fsync_directory(os.path.dirname(os.path.abspath(path)))
+    logger.debug(f"Patched {', '.join(updates)} in {target_path}")
+    return True
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Knowledge Graph Export
+
+This module maintains a small on-disk index of the work node graph and streams
+it out in graph interchange formats without re-reading every document.
+
+The index (``.work_node_index.json`` in the work directory) stores one entry per
+markdown file with its stat fingerprint, title, type and outgoing links. It is
+kept current by ``WorkNodeManager`` whenever it writes a node or a link, and
+``refresh()`` only re-reads the frontmatter of files whose size or mtime changed.
+
+Exports are written record by record, so the output never has to be assembled
+in memory:
+
+- ``ndjson``: one JSON object per line for every node and edge
+- ``graphml``: GraphML XML
+- ``gexf``: GEXF 1.2 XML
+
+In delta mode the exporter compares each record against the digests saved by the
+previous export and emits only added or changed records, plus ``delete`` records
+for anything that disappeared. Delta exports are NDJSON only: GraphML and GEXF
+describe a whole graph, so they are always written in full.
+
+Memory: the index is held in memory while it is refreshed or exported, about
+one small dict per markdown file (its fingerprint, title and link targets), and
+the paths are sorted once per export. The export state holds one 16-character
+digest per node and per edge. Both therefore grow linearly with the number of
+documents and links, which stays in the low megabytes for tens of thousands of
+documents; the exported records themselves are never held in memory.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import logging
+from xml.sax.saxutils import escape, quoteattr
+
+try:
+    from ..utils.atomic_write import atomic_write_text
+    from ..utils.frontmatter_fields import read_frontmatter_fields
+except ImportError:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utils'))
+    from atomic_write import atomic_write_text
+    from frontmatter_fields import read_frontmatter_fields
+
+logger = logging.getLogger(__name__)
+
+# Constants
+INDEX_FILENAME = '.work_node_index.json'
+INDEX_VERSION = 2
+STATE_SUFFIX = '.state.json'
+EXPORT_FORMATS = ['ndjson', 'graphml', 'gexf']
+DELTA_FORMATS = ['ndjson']
+MARKDOWN_EXTENSIONS = ['.md', '.markdown']
+
+# Frontmatter list keys that produce edges, mapped to the edge type they create.
+# connected_node is the back-reference of connected_document, so it is indexed
+# but does not produce a second edge.
+LINK_FIELDS = {
+    'connected_document': 'node_to_document',
+    'related_efforts': 'document_to_document',
+}
+INDEXED_LINK_FIELDS = list(LINK_FIELDS) + ['connected_node']
+
+
+def _atomic_write_json(path, data):
+    """Write JSON data to a path through a temporary file and a rename."""
+    atomic_write_text(path, json.dumps(data, separators=(',', ':')))
+
+
+def _digest(record):
+    """Return a short stable digest for an exported record."""
+    payload = json.dumps(record, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class WorkNodeIndex:
+    """
+    Persistent index of work node and document metadata.
+
+    Each entry is keyed by the path relative to the work directory and records the
+    file's size and mtime, so unchanged files never have to be opened again. The
+    entries are kept in memory, one per markdown file.
+    """
+
+    def __init__(self, work_dir, node_dirname='node'):
+        """
+        Initialize the index for a work directory.
+
+        Args:
+            work_dir (str): Directory containing work effort documents
+            node_dirname (str): Name of the subdirectory holding work nodes
+        """
+        self.work_dir = os.path.abspath(work_dir)
+        self.node_dirname = node_dirname
+        self.index_path = os.path.join(self.work_dir, INDEX_FILENAME)
+        self.entries = {}
+        self._dirty = False
+        self._paths = None
+        self._load()
+
+    def _load(self):
+        """Load the index from disk if it exists and is readable."""
+        if not os.path.exists(self.index_path):
+            return
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                self.entries = data.get('entries', {})
+            else:
+                logger.info(f"Ignoring index with unsupported version at {self.index_path}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load work node index {self.index_path}: {e}")
+            self.entries = {}
+
+    def save(self):
+        """Persist the index if anything changed since it was loaded."""
+        if not self._dirty or not os.path.isdir(self.work_dir):
+            return
+
+        _atomic_write_json(self.index_path, {'version': INDEX_VERSION, 'entries': self.entries})
+        self._dirty = False
+        logger.debug(f"Saved work node index: {self.index_path}")
+
+    def _entry_type(self, rel_path):
+        """Return 'node' for files inside the node directory, 'document' otherwise."""
+        parts = rel_path.split(os.sep)
+        return 'node' if len(parts) > 1 and parts[-2] == self.node_dirname else 'document'
+
+    def update_entry(self, rel_path, stat_result=None):
+        """
+        Re-read a single file and store its metadata in the index.
+
+        Args:
+            rel_path (str): Path relative to the work directory
+            stat_result (os.stat_result): Optional stat result to avoid a second stat call
+
+        Returns:
+            dict: The updated entry, or None if the file no longer exists
+        """
+        full_path = os.path.join(self.work_dir, rel_path)
+        try:
+            st = stat_result or os.stat(full_path)
+        except OSError:
+            self.remove_entry(rel_path)
+            return None
+
+        fields = read_frontmatter_fields(full_path)
+        entry_type = self._entry_type(rel_path)
+        default_title = os.path.basename(rel_path) if entry_type == 'node' else os.path.splitext(os.path.basename(rel_path))[0]
+        title = fields.get('title')
+
+        links = {}
+        for field in INDEXED_LINK_FIELDS:
+            value = fields.get(field)
+            if isinstance(value, str) and value:
+                value = [value]
+            if isinstance(value, list) and value:
+                links[field] = value
+
+        entry = {
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'type': entry_type,
+            'title': title if isinstance(title, str) and title else default_title,
+            'links': links,
+        }
+        category = fields.get('category')
+        if entry_type == 'node':
+            entry['category'] = category if isinstance(category, str) and category else 'connection'
+
+        self.entries[rel_path] = entry
+        self._changed()
+        return entry
+
+    def rename_entry(self, rel_path, target_rel_path):
+        """
+        Move an entry to a new path after the file was renamed, keeping its title and links.
+
+        Args:
+            rel_path (str): Old path relative to the work directory
+            target_rel_path (str): New path relative to the work directory
+
+        Returns:
+            dict: The moved entry, or None if the file no longer exists
+        """
+        entry = self.entries.get(rel_path)
+        if entry is None or self._entry_type(rel_path) != self._entry_type(target_rel_path):
+            self.remove_entry(rel_path)
+            return self.update_entry(target_rel_path)
+        try:
+            st = os.stat(os.path.join(self.work_dir, target_rel_path))
+        except OSError:
+            self.remove_entry(rel_path)
+            self.remove_entry(target_rel_path)
+            return None
+
+        del self.entries[rel_path]
+        entry = dict(entry, mtime_ns=st.st_mtime_ns, size=st.st_size)
+        self.entries[target_rel_path] = entry
+        self._changed()
+        return entry
+
+    def remove_entry(self, rel_path):
+        """Drop a file from the index."""
+        if self.entries.pop(rel_path, None) is not None:
+            self._changed()
+
+    def _changed(self):
+        """Mark the index as needing to be saved and re-sorted."""
+        self._dirty = True
+        self._paths = None
+
+    def paths(self):
+        """
+        Get the indexed paths in a stable order, sorting only after a change.
+
+        Returns:
+            list: Sorted paths relative to the work directory
+        """
+        if self._paths is None:
+            self._paths = sorted(self.entries)
+        return self._paths
+
+    def _iter_markdown_files(self):
+        """Yield (relative path, stat result) for every markdown file under the work directory."""
+        stack = [self.work_dir]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith('.'):
+                                stack.append(entry.path)
+                        elif any(entry.name.endswith(ext) for ext in MARKDOWN_EXTENSIONS):
+                            yield os.path.relpath(entry.path, self.work_dir), entry.stat()
+            except OSError as e:
+                logger.warning(f"Could not scan {current}: {e}")
+
+    def refresh(self, save=True):
+        """
+        Bring the index up to date with the filesystem.
+
+        Files are only re-read when their size or mtime differs from the indexed
+        fingerprint. Entries for deleted files are removed.
+
+        Args:
+            save (bool): If True, persist the refreshed index
+
+        Returns:
+            int: Number of entries that were added, changed or removed
+        """
+        seen = set()
+        changes = 0
+        for rel_path, st in self._iter_markdown_files():
+            seen.add(rel_path)
+            entry = self.entries.get(rel_path)
+            if entry and entry.get('mtime_ns') == st.st_mtime_ns and entry.get('size') == st.st_size:
+                continue
+            self.update_entry(rel_path, st)
+            changes += 1
+
+        for rel_path in [p for p in self.entries if p not in seen]:
+            self.remove_entry(rel_path)
+            changes += 1
+
+        if changes:
+            logger.info(f"Refreshed work node index: {changes} changed entries")
+        if save:
+            self.save()
+        return changes
+
+    def iter_nodes(self):
+        """
+        Yield graph vertices in a stable order.
+
+        Yields:
+            dict: Vertex record with id, title, type and (for nodes) category
+        """
+        for rel_path in self.paths():
+            entry = self.entries[rel_path]
+            record = {'id': rel_path, 'title': entry['title'], 'type': entry['type']}
+            if entry['type'] == 'node':
+                record['category'] = entry.get('category', 'connection')
+            yield record
+
+    def iter_edges(self):
+        """
+        Yield graph edges in a stable order.
+
+        Yields:
+            dict: Edge record with source, target and type
+        """
+        for rel_path in self.paths():
+            links = self.entries[rel_path].get('links', {})
+            for field, edge_type in LINK_FIELDS.items():
+                for target in links.get(field, []):
+                    yield {'source': rel_path, 'target': target, 'type': edge_type}
+
+
+class GraphExporter:
+    """
+    Streams the work node graph held in a WorkNodeIndex to a file-like object.
+    """
+
+    def __init__(self, index, fmt='ndjson'):
+        """
+        Initialize the exporter.
+
+        Args:
+            index (WorkNodeIndex): Index to read nodes and edges from
+            fmt (str): Output format, one of EXPORT_FORMATS
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt}. Use one of: {', '.join(EXPORT_FORMATS)}")
+        self.index = index
+        self.fmt = fmt
+
+    @staticmethod
+    def edge_id(edge):
+        """Return the identifier used for an edge in delta state and XML output."""
+        return f"{edge['source']}-[{edge['type']}]->{edge['target']}"
+
+    def _records(self, previous_state, new_state):
+        """
+        Yield ('node'|'edge', op, record) tuples, recording digests in new_state.
+
+        When previous_state is None every record is emitted; otherwise only
+        records whose digest changed are emitted, followed by deletions.
+        """
+        for kind, records, key in (('node', self.index.iter_nodes(), lambda r: r['id']),
+                                   ('edge', self.index.iter_edges(), self.edge_id)):
+            bucket = new_state.setdefault(kind, {})
+            for record in records:
+                record_id = key(record)
+                digest = _digest(record)
+                bucket[record_id] = digest
+                if previous_state is None or previous_state.get(kind, {}).get(record_id) != digest:
+                    yield kind, 'upsert', record
+
+        if previous_state is not None:
+            for kind in ('node', 'edge'):
+                for record_id in previous_state.get(kind, {}):
+                    if record_id not in new_state[kind]:
+                        yield kind, 'delete', {'id': record_id}
+
+    def export(self, stream, previous_state=None):
+        """
+        Write the graph to a text stream.
+
+        Args:
+            stream: Writable text file-like object
+            previous_state (dict): Digests from a previous export for delta mode, or None
+
+        Returns:
+            tuple: (stats dict, new state dict)
+
+        Raises:
+            ValueError: If previous_state is given for a format without delta support
+        """
+        if previous_state is not None and self.fmt not in DELTA_FORMATS:
+            raise ValueError(f"Delta export is not supported for {self.fmt}. Use one of: {', '.join(DELTA_FORMATS)}")
+        new_state = {}
+        stats = {'nodes': 0, 'edges': 0, 'deleted': 0}
+        writer = getattr(self, f"_write_{self.fmt}")
+        writer(stream, self._records(previous_state, new_state), stats)
+        return stats, new_state
+
+    def _write_ndjson(self, stream, records, stats):
+        """Write records as newline-delimited JSON."""
+        for kind, op, record in records:
+            if op == 'delete':
+                stats['deleted'] += 1
+            else:
+                stats[f"{kind}s"] += 1
+            stream.write(json.dumps({'kind': kind, 'op': op, **record}, ensure_ascii=False))
+            stream.write('\n')
+
+    def _write_graphml(self, stream, records, stats):
+        """Write records as GraphML."""
+        stream.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        stream.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+        for key, target in (('title', 'node'), ('type', 'node'), ('category', 'node'), ('type', 'edge')):
+            stream.write(f'  <key id="{target[0]}_{key}" for="{target}" attr.name="{key}" attr.type="string"/>\n')
+        stream.write('  <graph id="work_nodes" edgedefault="directed">\n')
+        for kind, op, record in records:
+            if kind == 'node':
+                stats['nodes'] += 1
+                stream.write(f'    <node id={quoteattr(record["id"])}>')
+                for key in ('title', 'type', 'category'):
+                    if key in record:
+                        stream.write(f'<data key="n_{key}">{escape(record[key])}</data>')
+                stream.write('</node>\n')
+            else:
+                stats['edges'] += 1
+                stream.write(
+                    f'    <edge id={quoteattr(self.edge_id(record))} source={quoteattr(record["source"])} '
+                    f'target={quoteattr(record["target"])}><data key="e_type">{escape(record["type"])}</data></edge>\n'
+                )
+        stream.write('  </graph>\n</graphml>\n')
+
+    def _write_gexf(self, stream, records, stats):
+        """Write records as GEXF 1.2. Nodes precede edges, as the format requires."""
+        stream.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        stream.write('<gexf xmlns="http://www.gexf.net/1.2draft" version="1.2">\n')
+        stream.write('  <graph mode="static" defaultedgetype="directed">\n')
+        stream.write('    <attributes class="node">\n')
+        stream.write('      <attribute id="0" title="type" type="string"/>\n')
+        stream.write('      <attribute id="1" title="category" type="string"/>\n')
+        stream.write('    </attributes>\n')
+        stream.write('    <nodes>\n')
+        in_edges = False
+        for kind, op, record in records:
+            if kind == 'edge' and not in_edges:
+                stream.write('    </nodes>\n    <edges>\n')
+                in_edges = True
+            if kind == 'node':
+                stats['nodes'] += 1
+                stream.write(f'      <node id={quoteattr(record["id"])} label={quoteattr(record["title"])}><attvalues>')
+                stream.write(f'<attvalue for="0" value={quoteattr(record["type"])}/>')
+                if 'category' in record:
+                    stream.write(f'<attvalue for="1" value={quoteattr(record["category"])}/>')
+                stream.write('</attvalues></node>\n')
+            else:
+                stats['edges'] += 1
+                stream.write(
+                    f'      <edge id={quoteattr(self.edge_id(record))} source={quoteattr(record["source"])} '
+                    f'target={quoteattr(record["target"])} label={quoteattr(record["type"])}/>\n'
+                )
+        if not in_edges:
+            stream.write('    </nodes>\n    <edges>\n')
+        stream.write('    </edges>\n  </graph>\n</gexf>\n')
+
+
+def load_export_state(output_file):
+    """
+    Load the digests recorded by the previous export to output_file.
+
+    Args:
+        output_file (str): Path of the export output
+
+    Returns:
+        dict: Previous state, or an empty dict if there was no previous export
+    """
+    state_path = output_file + STATE_SUFFIX
+    if not os.path.exists(state_path):
+        return {}
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read export state {state_path}, exporting everything: {e}")
+        return {}
+
+
+def export_graph(index, output_file, fmt='ndjson', delta=False):
+    """
+    Export the indexed graph to a file, optionally as a delta against the last export.
+
+    The output is written to a temporary file and renamed into place, and the new
+    record digests are saved next to it for the next delta export. If the export
+    fails, the temporary file is removed and any previous output is left as it was.
+
+    Args:
+        index (WorkNodeIndex): Index to export (refreshed before exporting)
+        output_file (str): Destination path
+        fmt (str): Output format, one of EXPORT_FORMATS
+        delta (bool): If True, only emit records changed since the previous export (NDJSON only)
+
+    Returns:
+        dict: Counts of exported nodes, edges and deletions
+
+    Raises:
+        ValueError: If the format is unknown, or delta is requested for an XML format
+    """
+    exporter = GraphExporter(index, fmt)
+    if delta and fmt not in DELTA_FORMATS:
+        raise ValueError(f"Delta export is not supported for {fmt}. Use one of: {', '.join(DELTA_FORMATS)}")
+    index.refresh()
+
+    previous_state = load_export_state(output_file) if delta else None
+    tmp_path = f"{output_file}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as stream:
+            stats, new_state = exporter.export(stream, previous_state)
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _atomic_write_json(output_file + STATE_SUFFIX, new_state)
+
+    logger.info(f"Exported {stats['nodes']} nodes and {stats['edges']} edges to {output_file} ({fmt})")
+    return stats
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Batched Frontmatter Link Patching
+
+This module collects wiki link additions for many documents and applies them
+with a single frontmatter rewrite per document.
+
+Instead of reading and rewriting a document once for every (node, document)
+pair, callers queue links with ``add_link`` during a run and call ``apply`` once
+at the end. Each touched document's frontmatter is read once with the shared
+parser (``frontmatter.parse_document``), the new links are merged into each
+field's current value, whether it is a block list, an inline list or a scalar,
+and the field is written back as one inline list by ``patch_frontmatter``. The
+body is copied byte for byte through a temporary file that is renamed over the
+original, so a crash never leaves a half-written document behind, and the
+document's line endings are kept.
+
+In dry-run mode ``apply`` writes nothing and returns unified diffs instead.
+"""
+
+import os
+import difflib
+import logging
+from collections import OrderedDict
+
+try:
+    from .frontmatter import decode, parse_document, patch_frontmatter, read_document
+except ImportError:
+    from frontmatter import decode, parse_document, patch_frontmatter, read_document
+
+logger = logging.getLogger(__name__)
+
+
+def link_updates(document, links_by_field, default_title):
+    """
+    Work out the frontmatter updates that add wiki links to a document's list fields.
+
+    Each field's current value is parsed (block list, inline list or scalar),
+    the links that are not already present are added after it and the whole
+    field is written back as one inline list. A document without frontmatter
+    also gets a title.
+
+    Args:
+        document (MarkdownDocument): The parsed document (the frontmatter is enough)
+        links_by_field (dict): Mapping of frontmatter field to an ordered list of link targets
+        default_title (str): Title to use if a new frontmatter block has to be created
+
+    Returns:
+        dict: Frontmatter key -> new value, empty if every link is already present
+    """
+    updates = {}
+    for field, targets in links_by_field.items():
+        current = document.fields.get(field)
+        if not current:
+            current = []
+        elif not isinstance(current, list):
+            current = [current]
+        added = [target for target in dict.fromkeys(targets) if target not in current]
+        if added:
+            updates[field] = [f"[[{target}]]" for target in current + added]
+    if updates and not document.has_frontmatter:
+        updates = {'title': default_title, **updates}
+    return updates
+
+
+def add_links_to_frontmatter(content, links_by_field, default_title):
+    """
+    Add wiki links to list fields in a document's frontmatter.
+
+    Links that are already present are skipped. Missing fields are appended to the
+    end of the frontmatter, and a frontmatter block is created if the document has
+    none.
+
+    Args:
+        content (str): Original document content
+        links_by_field (dict): Mapping of frontmatter field to an ordered list of link targets
+        default_title (str): Title to use if a new frontmatter block has to be created
+
+    Returns:
+        str: The patched content (identical to content if nothing had to change)
+    """
+    document = parse_document(content, sections=False)
+    updates = link_updates(document, links_by_field, default_title)
+    if not updates:
+        return content
+    return decode(document.patched_header(updates) + document.data[document.body_offset:])
+
+
+class LinkPatchPlanner:
+    """
+    Collects link additions per document and applies them in one rewrite each.
+    """
+
+    def __init__(self, base_dir):
+        """
+        Initialize the planner.
+
+        Args:
+            base_dir (str): Directory that document paths are relative to
+        """
+        self.base_dir = os.path.abspath(base_dir)
+        self.pending = OrderedDict()
+
+    def add_link(self, doc_path, field, target):
+        """
+        Queue a wiki link to be added to a document's frontmatter list field.
+
+        Args:
+            doc_path (str): Document path relative to the base directory
+            field (str): Frontmatter list field, e.g. "connected_node"
+            target (str): Link target to wrap in [[...]]
+        """
+        fields = self.pending.setdefault(doc_path, OrderedDict())
+        fields.setdefault(field, []).append(target)
+
+    def __len__(self):
+        """Return the number of documents with pending links."""
+        return len(self.pending)
+
+    def _plan(self):
+        """Yield (doc_path, full_path, document, updates) for every pending document, reading only frontmatter."""
+        for doc_path, links_by_field in self.pending.items():
+            full_path = os.path.join(self.base_dir, doc_path)
+            try:
+                document = read_document(full_path, frontmatter_only=True)
+            except OSError as e:
+                logger.error(f"Error reading {full_path}: {e}")
+                continue
+
+            if document.frontmatter_start is not None and not document.has_frontmatter:
+                logger.error(f"Not adding links to {full_path}: its frontmatter has no closing '---' line")
+                continue
+            default_title = os.path.splitext(os.path.basename(doc_path))[0]
+            yield doc_path, full_path, document, link_updates(document, links_by_field, default_title)
+
+    def diff(self):
+        """
+        Render the pending changes as unified diffs without writing anything.
+
+        Only the frontmatter changes, so the diffs cover the document header.
+
+        Returns:
+            list: One unified diff string per document that would change
+        """
+        diffs = []
+        for doc_path, _, document, updates in self._plan():
+            if not updates:
+                continue
+            diffs.append(''.join(difflib.unified_diff(
+                decode(document.header).splitlines(keepends=True),
+                decode(document.patched_header(updates)).splitlines(keepends=True),
+                fromfile=f"a/{doc_path}",
+                tofile=f"b/{doc_path}"
+            )))
+        return diffs
+
+    def apply(self, dry_run=False):
+        """
+        Apply all pending link additions, one atomic rewrite per document.
+
+        Args:
+            dry_run (bool): If True, return diffs instead of writing files
+
+        Returns:
+            list: Paths (relative to the base directory) of documents that were
+                  rewritten, or unified diffs in dry-run mode
+        """
+        if dry_run:
+            diffs = self.diff()
+            self.pending.clear()
+            return diffs
+
+        written = []
+        for doc_path, full_path, _, updates in self._plan():
+            if not updates:
+                logger.debug(f"Links already present in {full_path}")
+                continue
+            try:
+                patch_frontmatter(full_path, updates)
+                written.append(doc_path)
+                logger.info(f"Updated document with node links: {full_path}")
+            except (OSError, ValueError) as e:
+                logger.error(f"Error writing {full_path}: {e}")
+
+        self.pending.clear()
+        return written
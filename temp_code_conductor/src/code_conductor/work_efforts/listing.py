@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Work Effort Listing
+
+Generator stages used to list work efforts without materializing them:
+
+1. filter: keep records matching a status, assignee or tag
+2. sort: order records by a key; when only a page is wanted, a heap keeps just
+   the top ``offset + limit`` records instead of sorting everything
+3. paginate: skip ``offset`` records and stop after ``limit``
+
+Selectors such as ``status:completed updated<2025-01-01`` are parsed once by
+``parse_selector`` into terms that ``match_selector`` checks against a record.
+Every term must match. ``field:value`` (or ``field=value``) tests equality,
+case-insensitively, and membership for ``tag``; ``!=`` negates it. ``created``
+and ``updated`` also take ``<``, ``<=``, ``>`` and ``>=`` against a
+``YYYY-MM-DD`` date. Values with spaces are quoted: ``title:"Login Page"``.
+
+Records come from ``WorkEffortService`` already ordered by creation time (newest
+first), so the default ``created`` sort streams straight through and the first
+row is produced before later records are even described.
+"""
+
+import re
+import heapq
+import shlex
+import itertools
+from datetime import datetime
+
+# Constants
+PRIORITY_ORDER = ['critical', 'high', 'medium', 'low']
+SORT_KEYS = {
+    'created': None,
+    'title': lambda record: record['title'].lower(),
+    'priority': lambda record: (PRIORITY_ORDER.index(record['priority'])
+                                if record['priority'] in PRIORITY_ORDER else len(PRIORITY_ORDER)),
+    'status': lambda record: record['status'],
+    'assignee': lambda record: record['assignee'].lower(),
+}
+SELECTOR_FIELDS = ['status', 'priority', 'assignee', 'tag', 'title', 'created', 'updated']
+DATE_FIELDS = ['created', 'updated']
+SELECTOR_TERM_PATTERN = re.compile(r'^(\w+)(!=|<=|>=|:|=|<|>)(.+)$')
+COMPARISONS = {
+    '<': lambda left, right: left < right,
+    '<=': lambda left, right: left <= right,
+    '>': lambda left, right: left > right,
+    '>=': lambda left, right: left >= right,
+}
+
+
+def filter_work_efforts(records, status=None, assignee=None, tag=None):
+    """
+    Yield the records matching every given filter.
+
+    Args:
+        records (iterable): Work effort records
+        status (str): Status to match
+        assignee (str): Assignee to match (case-insensitive)
+        tag (str): Tag the record must carry (case-insensitive)
+
+    Yields:
+        dict: Matching records
+    """
+    assignee = assignee.lower() if assignee else None
+    tag = tag.lower() if tag else None
+    for record in records:
+        if status and record['status'] != status:
+            continue
+        if assignee and record['assignee'].lower() != assignee:
+            continue
+        if tag and tag not in (item.lower() for item in record.get('tags', [])):
+            continue
+        yield record
+
+
+def parse_selector(selector):
+    """
+    Parse a selector into (field, operator, value) terms.
+
+    Args:
+        selector (str): Space-separated terms, e.g. "status:completed updated<2025-01-01";
+            values containing spaces can be quoted
+
+    Returns:
+        list: Terms for match_selector
+
+    Raises:
+        ValueError: If a term is malformed or uses an unknown field or operator
+    """
+    terms = []
+    try:
+        texts = shlex.split(selector)
+    except ValueError as e:
+        raise ValueError(f"Invalid selector: {e}")
+    for text in texts:
+        match = SELECTOR_TERM_PATTERN.match(text)
+        if not match:
+            raise ValueError(f"Invalid selector term '{text}', expected field:value or field<date")
+        field, operator, value = match.groups()
+        field = 'tag' if field == 'tags' else field
+        if field not in SELECTOR_FIELDS:
+            raise ValueError(f"Unknown selector field '{field}', expected one of {', '.join(SELECTOR_FIELDS)}")
+        if field in DATE_FIELDS:
+            try:
+                value = datetime.strptime(value, '%Y-%m-%d').timestamp()
+            except ValueError:
+                raise ValueError(f"Invalid date '{value}' in selector, expected YYYY-MM-DD")
+        elif operator in COMPARISONS:
+            raise ValueError(f"Operator '{operator}' only applies to {' and '.join(DATE_FIELDS)}")
+        else:
+            value = value.lower()
+        terms.append((field, '=' if operator == ':' else operator, value))
+    if not terms:
+        raise ValueError("Empty selector")
+    return terms
+
+
+def match_selector(record, terms):
+    """
+    Check whether a record matches every selector term.
+
+    Args:
+        record (dict): Work effort record
+        terms (list): Terms from parse_selector
+
+    Returns:
+        bool: True if all terms match
+    """
+    for field, operator, value in terms:
+        if field in DATE_FIELDS:
+            if operator in COMPARISONS:
+                matched = COMPARISONS[operator](record[field], value)
+            else:
+                matched = datetime.fromtimestamp(record[field]).date() == datetime.fromtimestamp(value).date()
+        elif field == 'tag':
+            matched = value in (tag.lower() for tag in record.get('tags', []))
+        else:
+            matched = (record[field] or '').lower() == value
+        if matched == (operator == '!='):
+            return False
+    return True
+
+
+def select_work_efforts(records, selector):
+    """
+    Keep the records matching a selector.
+
+    The selector is parsed immediately, so a malformed one raises before any
+    record is read.
+
+    Args:
+        records (iterable): Work effort records
+        selector (str): Selector text, see parse_selector
+
+    Returns:
+        iterator: Matching records
+    """
+    terms = parse_selector(selector)
+    return (record for record in records if match_selector(record, terms))
+
+
+def sort_work_efforts(records, sort_by='created', reverse=False, limit=None):
+    """
+    Order records by a sort key.
+
+    ``created`` keeps the incoming order. Other keys sort ascending (descending
+    with reverse); with a limit only the first ``limit`` records are kept, on a
+    heap of that size.
+
+    Args:
+        records (iterable): Work effort records
+        sort_by (str): One of SORT_KEYS
+        reverse (bool): Sort descending
+        limit (int): Number of leading records needed, or None for all
+
+    Returns:
+        iterator: Sorted records
+    """
+    if sort_by not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key '{sort_by}', expected one of {', '.join(SORT_KEYS)}")
+    key = SORT_KEYS[sort_by]
+    if key is None:
+        return iter(records)
+    if limit is None:
+        return iter(sorted(records, key=key, reverse=reverse))
+    select = heapq.nlargest if reverse else heapq.nsmallest
+    return iter(select(limit, records, key=key))
+
+
+def paginate(records, offset=0, limit=None):
+    """
+    Skip offset records and stop after limit.
+
+    Args:
+        records (iterable): Work effort records
+        offset (int): Number of records to skip
+        limit (int): Maximum number of records, or None for all
+
+    Returns:
+        iterator: The requested page
+    """
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("Offset and limit must not be negative")
+    return itertools.islice(records, offset, None if limit is None else offset + limit)
+
+
+def list_work_efforts(records, status=None, assignee=None, tag=None, sort_by='created',
+                      reverse=False, offset=0, limit=None):
+    """
+    Run records through the filter, sort and paginate stages.
+
+    Args:
+        records (iterable): Work effort records, newest first
+        status (str): Status to match
+        assignee (str): Assignee to match
+        tag (str): Tag to match
+        sort_by (str): One of SORT_KEYS
+        reverse (bool): Sort descending
+        offset (int): Number of records to skip
+        limit (int): Maximum number of records, or None for all
+
+    Returns:
+        iterator: The requested page of records
+    """
+    records = filter_work_efforts(records, status=status, assignee=assignee, tag=tag)
+    records = sort_work_efforts(records, sort_by, reverse, None if limit is None else offset + limit)
+    return paginate(records, offset, limit)
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Work Effort Retrieval Index
+
+A persistent index used by retrieve_work_effort to look up work efforts without
+opening them.
+
+The index (``.retrieval_index.json`` in the work efforts directory) stores for
+every work effort in the status directories:
+
+- its status, filename, title, creation time and the fields used to filter
+  listings (frontmatter status, priority, assignee and tags), plus the size and
+  mtime used to detect changes
+- a trigram posting list over the lowercased filename and title, used to rank
+  fuzzy name matches
+- a list of entries sorted by creation time, used for ``--latest``
+
+``refresh()`` lists the status directories and only re-reads the frontmatter of
+files whose size or mtime changed, so a lookup against an unchanged tree opens no
+files at all.
+
+The creation time comes from the frontmatter ``created`` field. Work efforts
+without one keep the time the index first saw them: status changes and
+frontmatter patches replace the file, so its ctime is not the creation time.
+"""
+
+import os
+import sys
+import json
+import bisect
+import logging
+from datetime import datetime
+from collections import Counter
+
+try:
+    from ..utils.atomic_write import atomic_write_text
+    from ..utils.frontmatter_fields import read_frontmatter_fields
+except ImportError:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utils'))
+    from atomic_write import atomic_write_text
+    from frontmatter_fields import read_frontmatter_fields
+
+logger = logging.getLogger(__name__)
+
+# Constants
+INDEX_FILENAME = '.retrieval_index.json'
+INDEX_VERSION = 4
+STATUSES = ['active', 'completed', 'archived']
+METADATA_FIELDS = ['status', 'priority', 'assignee']
+MIN_FUZZY_SCORE = 0.4
+FILENAME_MATCH_BONUS = 2.0
+TITLE_MATCH_BONUS = 1.0
+
+
+def parse_created(value):
+    """
+    Parse a frontmatter ``created`` value such as ``2025-03-19 15:48``.
+
+    Args:
+        value: The frontmatter value
+
+    Returns:
+        float: Timestamp of the value, or None if it is not a date
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return datetime.fromisoformat(value.strip()).timestamp()
+    except ValueError:
+        return None
+
+
+def trigrams(text):
+    """
+    Return the set of trigrams of a lowercased, space-padded string.
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        set: Trigrams of the text
+    """
+    padded = f"  {text.lower().strip()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class RetrievalIndex:
+    """
+    Persistent trigram and creation-time index over the work effort status directories.
+    """
+
+    def __init__(self, work_efforts_dir):
+        """
+        Initialize the index and load it from disk if present.
+
+        Args:
+            work_efforts_dir (str): Directory containing the status subdirectories
+        """
+        self.work_efforts_dir = work_efforts_dir
+        self.index_path = os.path.join(work_efforts_dir, INDEX_FILENAME)
+        self.entries = {}
+        self.postings = {}
+        self.by_created = []
+        self._saved = False
+        self._load()
+
+    def _load(self):
+        """Load the index from disk, starting empty if it is missing or unreadable."""
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Rebuilding unreadable retrieval index {self.index_path}: {e}")
+            return
+
+        if data.get('version') != INDEX_VERSION:
+            return
+        self.entries = data.get('entries', {})
+        self.postings = {gram: set(paths) for gram, paths in data.get('postings', {}).items()}
+        self.by_created = [tuple(item) for item in data.get('by_created', [])]
+        self._saved = True
+
+    def save(self):
+        """Write the index to disk atomically."""
+        data = {
+            'version': INDEX_VERSION,
+            'entries': self.entries,
+            'postings': {gram: sorted(paths) for gram, paths in self.postings.items()},
+            'by_created': self.by_created,
+        }
+        try:
+            atomic_write_text(self.index_path, json.dumps(data, separators=(',', ':')))
+            self._saved = True
+        except OSError as e:
+            logger.warning(f"Could not save retrieval index {self.index_path}: {e}")
+
+    def path_for(self, rel_path):
+        """Return the path of an indexed work effort, relative to the current directory."""
+        return os.path.join(self.work_efforts_dir, rel_path)
+
+    def _add(self, rel_path, status, filename, stat_result, first_seen=None):
+        """
+        Index one work effort, reading only its frontmatter.
+
+        Without a frontmatter ``created`` date the entry is dated first_seen, the
+        creation time of the entry it replaces, or else the file's ctime.
+        """
+        fields = read_frontmatter_fields(os.path.join(self.work_efforts_dir, rel_path))
+        title = fields.get('title')
+        tags = fields.get('tags')
+        created = parse_created(fields.get('created'))
+        if created is None:
+            created = first_seen if first_seen is not None else stat_result.st_ctime
+        entry = {
+            'status': status,
+            'filename': filename,
+            'title': title if isinstance(title, str) else '',
+            'metadata': {key: fields[key] for key in METADATA_FIELDS if isinstance(fields.get(key), str)},
+            'tags': tags if isinstance(tags, list) else [tag.strip() for tag in (tags or '').split(',') if tag.strip()],
+            'created': created,
+            'mtime_ns': stat_result.st_mtime_ns,
+            'size': stat_result.st_size,
+        }
+        self.entries[rel_path] = entry
+        for gram in self._entry_trigrams(entry):
+            self.postings.setdefault(gram, set()).add(rel_path)
+        bisect.insort(self.by_created, (entry['created'], rel_path))
+
+    def _remove(self, rel_path):
+        """Drop one work effort from the index."""
+        entry = self.entries.pop(rel_path)
+        for gram in self._entry_trigrams(entry):
+            paths = self.postings.get(gram)
+            if paths is not None:
+                paths.discard(rel_path)
+                if not paths:
+                    del self.postings[gram]
+        position = bisect.bisect_left(self.by_created, (entry['created'], rel_path))
+        if position < len(self.by_created) and self.by_created[position] == (entry['created'], rel_path):
+            del self.by_created[position]
+
+    @staticmethod
+    def _entry_trigrams(entry):
+        """Return the trigrams of an entry's filename stem and title."""
+        stem = os.path.splitext(entry['filename'])[0]
+        return trigrams(stem) | (trigrams(entry['title']) if entry['title'] else set())
+
+    def refresh(self, save=True):
+        """
+        Bring the index up to date with the status directories.
+
+        Files whose size and mtime are unchanged are not opened.
+
+        Args:
+            save (bool): If True, write the index to disk when anything changed or
+                no index was on disk yet (so an empty index is saved too)
+
+        Returns:
+            int: Number of entries added, updated or removed
+        """
+        seen = set()
+        changed = 0
+        for status in STATUSES:
+            directory = os.path.join(self.work_efforts_dir, status)
+            if not os.path.isdir(directory):
+                continue
+            with os.scandir(directory) as it:
+                for dir_entry in it:
+                    if not dir_entry.name.endswith('.md') or not dir_entry.is_file():
+                        continue
+                    rel_path = os.path.join(status, dir_entry.name)
+                    seen.add(rel_path)
+                    stat_result = dir_entry.stat()
+                    entry = self.entries.get(rel_path)
+                    if entry and entry['mtime_ns'] == stat_result.st_mtime_ns and entry['size'] == stat_result.st_size:
+                        continue
+                    if entry:
+                        self._remove(rel_path)
+                    self._add(rel_path, status, dir_entry.name, stat_result,
+                              entry['created'] if entry else None)
+                    changed += 1
+
+        for rel_path in [path for path in self.entries if path not in seen]:
+            self._remove(rel_path)
+            changed += 1
+
+        if save and (changed or not self._saved):
+            self.save()
+        return changed
+
+    def update_paths(self, rel_paths, save=True):
+        """
+        Re-index specific work efforts after they were written, moved or deleted.
+
+        Args:
+            rel_paths (list): Paths relative to the work efforts directory
+            save (bool): If True, write the index to disk
+        """
+        for rel_path in rel_paths:
+            entry = self.entries.get(rel_path)
+            if entry:
+                self._remove(rel_path)
+            try:
+                stat_result = os.stat(self.path_for(rel_path))
+            except OSError:
+                continue
+            status, filename = os.path.split(rel_path)
+            self._add(rel_path, status, filename, stat_result, entry['created'] if entry else None)
+        if save:
+            self.save()
+
+    def rename_entry(self, rel_path, target_rel_path, status=None, save=True):
+        """
+        Move an entry to a new path after the file was renamed, without re-reading it.
+
+        The entry keeps its creation time.
+
+        Args:
+            rel_path (str): Old path relative to the work efforts directory
+            target_rel_path (str): New path relative to the work efforts directory
+            status (str): New frontmatter status, if the rename changed it
+            save (bool): If True, write the index to disk
+        """
+        entry = self.entries.get(rel_path)
+        try:
+            stat_result = os.stat(self.path_for(target_rel_path))
+        except OSError:
+            stat_result = None
+        if entry is None or stat_result is None:
+            self.update_paths([rel_path, target_rel_path], save=save)
+            return
+
+        self._remove(rel_path)
+        if target_rel_path in self.entries:
+            self._remove(target_rel_path)
+        directory, filename = os.path.split(target_rel_path)
+        entry = dict(entry, status=directory, filename=filename,
+                     mtime_ns=stat_result.st_mtime_ns, size=stat_result.st_size)
+        if status is not None:
+            entry['metadata'] = dict(entry.get('metadata', {}), status=status)
+        self.entries[target_rel_path] = entry
+        for gram in self._entry_trigrams(entry):
+            self.postings.setdefault(gram, set()).add(target_rel_path)
+        bisect.insort(self.by_created, (entry['created'], target_rel_path))
+        if save:
+            self.save()
+
+    def search(self, name, limit=10):
+        """
+        Rank work efforts by how well their filename or title matches name.
+
+        Filenames containing name rank first, then titles containing name, then fuzzy
+        matches by the share of the query's trigrams they contain. Ties keep the
+        active, completed, archived order.
+
+        Args:
+            name (str): Name or part of a name to look for
+            limit (int): Maximum number of results
+
+        Returns:
+            list: (relative path, score) tuples, best match first
+        """
+        query = name.lower().strip()
+        if not query:
+            return []
+
+        query_grams = trigrams(query)
+        counts = Counter()
+        for gram in query_grams:
+            for rel_path in self.postings.get(gram, ()):
+                counts[rel_path] += 1
+
+        # Substring matches on very short queries may share no padded trigram
+        candidates = self.entries if len(query) < 3 else counts
+
+        results = []
+        for rel_path in candidates:
+            entry = self.entries[rel_path]
+            score = counts.get(rel_path, 0) / len(query_grams)
+            if query in entry['filename'].lower():
+                score += FILENAME_MATCH_BONUS
+            elif query in entry['title'].lower():
+                score += TITLE_MATCH_BONUS
+            if score >= MIN_FUZZY_SCORE:
+                results.append((rel_path, score))
+
+        results.sort(key=lambda item: (-item[1], STATUSES.index(self.entries[item[0]]['status']), item[0]))
+        return results[:limit]
+
+    def latest(self, count=5):
+        """
+        Return the most recently created work efforts.
+
+        Args:
+            count (int): Number of work efforts to return
+
+        Returns:
+            list: Relative paths, newest first
+        """
+        return [rel_path for _, rel_path in reversed(self.by_created[-count:])] if count > 0 else []
@@ -8,22 +8,31 @@ It locates work efforts by name, status or date, and outputs their content along
 any associated files to provide comprehensive context.
 
 Usage:
-    python retrieve_work_effort.py --name <n>
+    python retrieve_work_effort.py --name <n> [--search-content]
     python retrieve_work_effort.py --status <active|completed|archived>
     python retrieve_work_effort.py --date <YYYYMMDD>
     python retrieve_work_effort.py --latest [count]
     python retrieve_work_effort.py --related <work_effort_name>
+    python retrieve_work_effort.py --name <n> --bundle [--budget <tokens>] [--depth <n>]
 """
 
 import os
 import sys
 import re
 import argparse
-import yaml
 import logging
 
+try:
+    from .frontmatter import parse_document
+    from .retrieval_index import RetrievalIndex
+    from .context_bundle import ContextBundleBuilder, DEFAULT_TOKEN_BUDGET, DEFAULT_MAX_DEPTH
+except ImportError:
+    from frontmatter import parse_document
+    from retrieval_index import RetrievalIndex
+    from context_bundle import ContextBundleBuilder, DEFAULT_TOKEN_BUDGET, DEFAULT_MAX_DEPTH
+
 # Setup logging
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Define constants
@@ -43,24 +52,7 @@ def ensure_project_root():
 
 def extract_frontmatter(content):
     """Extract frontmatter from markdown content."""
-    logger.debug("Extracting frontmatter from content: %s", content[:100])  # Log first 100 characters
-    frontmatter = {}
-    if content.startswith('---'):
-        end_marker = content.find('---', 3)
-        if end_marker != -1:
-            frontmatter_text = content[3:end_marker].strip()
-            try:
-                # Try parsing as YAML
-                frontmatter = yaml.safe_load(frontmatter_text)
-                logger.debug("Parsed frontmatter: %s", frontmatter)
-            except yaml.YAMLError as e:
-                logger.error("YAML parsing error: %s", e)
-                # If YAML parsing fails, try a simple key-value approach
-                for line in frontmatter_text.split('\n'):
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        frontmatter[key.strip()] = value.strip().strip('"\'')
-    return frontmatter
+    return parse_document(content, sections=False).fields
 
 def extract_links(content):
     """Extract Obsidian-style links from content."""
@@ -68,38 +60,39 @@ def extract_links(content):
     links = re.findall(r'\[\[(.*?)(?:\|.*?)?\]\]', content)
     return links
 
-def find_work_effort_by_name(name):
-    """Find a work effort by name across all directories."""
-    directories = [ACTIVE_DIR, COMPLETED_DIR, ARCHIVED_DIR]
-    for directory in directories:
-        if not os.path.exists(directory):
-            continue
-
-        # Search for exact filename match
-        for filename in os.listdir(directory):
-            if filename.endswith('.md') and name in filename:
-                return os.path.join(directory, filename)
-
-    # If no exact match, do a more flexible search
-    for directory in directories:
-        if not os.path.exists(directory):
-            continue
-
-        # Search by content or title in frontmatter
-        for filename in os.listdir(directory):
-            if filename.endswith('.md'):
-                filepath = os.path.join(directory, filename)
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                    # Check frontmatter
-                    frontmatter = extract_frontmatter(content)
-                    if frontmatter and 'title' in frontmatter and name.lower() in frontmatter['title'].lower():
-                        return filepath
-
-                    # Check content
-                    if name.lower() in content.lower():
-                        return filepath
+def get_retrieval_index():
+    """Load the retrieval index and bring it up to date with the status directories."""
+    index = RetrievalIndex(WORK_EFFORTS_DIR)
+    index.refresh()
+    return index
+
+def search_work_efforts(name, limit=10):
+    """Rank work efforts by how well their filename or title matches the name."""
+    index = get_retrieval_index()
+    return [index.path_for(rel_path) for rel_path, _ in index.search(name, limit)]
+
+def find_work_effort_by_name(name, search_content=False):
+    """
+    Find a work effort by name across all directories.
+
+    Filename and title matches come from the retrieval index, so no work effort is
+    opened. Only if that finds nothing and search_content is True are the files
+    read to look for the name in their content.
+    """
+    matches = search_work_efforts(name, limit=1)
+    if matches:
+        return matches[0]
+
+    if search_content:
+        for directory in [ACTIVE_DIR, COMPLETED_DIR, ARCHIVED_DIR]:
+            if not os.path.exists(directory):
+                continue
+            for filename in sorted(os.listdir(directory)):
+                if filename.endswith('.md'):
+                    filepath = os.path.join(directory, filename)
+                    with open(filepath, 'r', encoding='utf-8') as f:
+                        if name.lower() in f.read().lower():
+                            return filepath
 
     return None
 
@@ -139,24 +132,8 @@ def get_work_efforts_by_date(date_str):
 
 def get_latest_work_efforts(count=5):
     """Get the most recently created work efforts."""
-    all_work_efforts = []
-
-    directories = [ACTIVE_DIR, COMPLETED_DIR, ARCHIVED_DIR]
-    for directory in directories:
-        if not os.path.exists(directory):
-            continue
-
-        for filename in os.listdir(directory):
-            if filename.endswith('.md'):
-                filepath = os.path.join(directory, filename)
-                creation_time = os.path.getctime(filepath)
-                all_work_efforts.append((filepath, creation_time))
-
-    # Sort by creation time (newest first)
-    all_work_efforts.sort(key=lambda x: x[1], reverse=True)
-
-    # Return only the filepaths
-    return [filepath for filepath, _ in all_work_efforts[:count]]
+    index = get_retrieval_index()
+    return [index.path_for(rel_path) for rel_path in index.latest(count)]
 
 def get_related_work_efforts(work_effort_path):
     """Get work efforts related to the given one."""
@@ -169,20 +146,26 @@ def get_related_work_efforts(work_effort_path):
     with open(work_effort_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
+    index = get_retrieval_index()
+
+    def resolve(name):
+        matches = index.search(name, limit=1)
+        return index.path_for(matches[0][0]) if matches else None
+
     # Check frontmatter for related_efforts
     frontmatter = extract_frontmatter(content)
     if frontmatter and 'related_efforts' in frontmatter:
         related_efforts = frontmatter['related_efforts']
         if isinstance(related_efforts, list):
             for related_effort in related_efforts:
-                related_path = find_work_effort_by_name(related_effort)
+                related_path = resolve(related_effort)
                 if related_path:
                     related.append(related_path)
 
     # Check for Obsidian-style links
     links = extract_links(content)
     for link in links:
-        related_path = find_work_effort_by_name(link)
+        related_path = resolve(link)
         if related_path:
             related.append(related_path)
 
@@ -257,13 +240,22 @@ def main():
 
     parser.add_argument('--no-associated', action='store_true', help='Do not show associated scripts')
     parser.add_argument('--recursive', action='store_true', help='Recursively display related work efforts')
+    parser.add_argument('--bundle', action='store_true',
+                        help='Output a token-budgeted context bundle of the work effort and its relations')
+    parser.add_argument('--budget', type=int, default=DEFAULT_TOKEN_BUDGET,
+                        help=f'Token budget for --bundle (default: {DEFAULT_TOKEN_BUDGET})')
+    parser.add_argument('--depth', type=int, default=DEFAULT_MAX_DEPTH,
+                        help=f'Maximum link distance followed by --bundle (default: {DEFAULT_MAX_DEPTH})')
+    parser.add_argument('--no-cache', action='store_true', help='Do not use cached context bundles')
+    parser.add_argument('--search-content', action='store_true',
+                        help='If no filename or title matches --name, also search the content of every work effort')
 
     args = parser.parse_args()
 
     work_efforts = []
 
     if args.name:
-        work_effort_path = find_work_effort_by_name(args.name)
+        work_effort_path = find_work_effort_by_name(args.name, search_content=args.search_content)
         if work_effort_path:
             work_efforts = [work_effort_path]
         else:
@@ -287,6 +279,18 @@ def main():
         print("No work efforts found.")
         return
 
+    if args.bundle:
+        builder = ContextBundleBuilder(
+            get_retrieval_index(),
+            token_budget=args.budget,
+            max_depth=args.depth,
+            find_associated=None if args.no_associated else find_associated_script,
+            use_cache=not args.no_cache
+        )
+        for work_effort_path in work_efforts:
+            builder.write(work_effort_path, sys.stdout)
+        return
+
     visited = set()
     for i, work_effort_path in enumerate(work_efforts):
         if work_effort_path in visited:
@@ -1,14 +1,18 @@
 import os
 import argparse
-import json
 import asyncio
-import requests
 import random
 import sys
 import signal
 from datetime import datetime
 from typing import Optional
 
+try:
+    from ..template_engine import load_template
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from template_engine import load_template
+
 # Get the absolute path to the work-efforts directory
 WORK_EFFORTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 TEMPLATE_PATH = os.path.join(WORK_EFFORTS_DIR, "templates", "work-effort-template.md")
@@ -23,6 +27,12 @@ SHOW_CURSOR = "\033[?25h"
 # Default timeout for AI content generation (in seconds)
 DEFAULT_TIMEOUT = 30
 
+# Models offered when the installed models cannot be listed
+DEFAULT_MODELS = ("phi3", "llama3", "mistral")
+
+# Fields of the model's JSON response used to fill the template
+CONTENT_KEYS = ("objectives", "tasks", "notes")
+
 # Simulated thought process messages for different phases
 PLANNING_THOUGHTS = [
     ("Analyzing work effort description...", "Understanding context and requirements..."),
@@ -155,24 +165,39 @@ class ThoughtProcessSimulator:
             self._erase_current_line()
             sys.stdout.flush()
 
-async def generate_content_with_ollama(description: str, model: str = "phi3", timeout: int = DEFAULT_TIMEOUT) -> Optional[dict]:
-    """Generate content for the work effort using Ollama with thought process simulation."""
+def _load_ai_modules():
+    """Import the streaming Ollama client, JSON parser and response cache when content is first generated."""
+    try:
+        from ...providers.ollama import aclosing, agenerate_stream
+        from ...providers.response_cache import get_response_cache
+        from ...utils.json_stream import JSONFieldParser
+    except ImportError:
+        sys.path.append(os.path.dirname(WORK_EFFORTS_DIR))
+        from providers.ollama import aclosing, agenerate_stream
+        from providers.response_cache import get_response_cache
+        from utils.json_stream import JSONFieldParser
+    return agenerate_stream, aclosing, JSONFieldParser, get_response_cache
+
+async def generate_content_with_ollama(description: str, model: str = "phi3", timeout: int = DEFAULT_TIMEOUT,
+                                       use_cache: bool = True) -> Optional[dict]:
+    """Generate content for the work effort using Ollama with thought process simulation.
+
+    The response is streamed over an asyncio connection, so the thought process
+    keeps running while the model generates, and the timeout or Ctrl+C cancel
+    the request mid-stream. The objectives, tasks and notes are picked out of the
+    JSON as their tokens arrive, and the stream is closed as soon as the JSON
+    object is complete. If the timeout is reached, the fields completed so far
+    are used.
+
+    Content generated in full (the JSON object was closed) is kept in the
+    response cache, so the same description and model are answered from disk
+    without calling the model. A truncated answer is used but not cached.
+    """
     global abort_requested
     abort_requested = False  # Reset at the start of each generation
 
-    print("🧠 Starting content generation process...")
-    print(f"⏱️  Timeout set to {timeout} seconds. Press Ctrl+C to abort.")
-    print("💡 Content generation will proceed in background. You can work on other tasks.")
-
-    # Set up the signal handler for SIGINT (Ctrl+C)
-    signal.signal(signal.SIGINT, signal_handler)
-
-    # Create and start the thought process simulator
-    simulator = ThoughtProcessSimulator()
-    thought_process = asyncio.create_task(simulator.run_thought_process())
-
-    try:
-        prompt = f"""
+    agenerate_stream, aclosing, JSONFieldParser, get_response_cache = _load_ai_modules()
+    prompt = f"""
         Based on this description: "{description}"
 
         Please generate structured content for a work effort. Provide:
@@ -185,86 +210,100 @@ async def generate_content_with_ollama(description: str, model: str = "phi3", ti
         Keep the content concise and focused.
         """
 
-        # Function to handle timeout
-        async def handle_timeout():
-            await asyncio.sleep(timeout)
-            global abort_requested
-            if not abort_requested:
-                abort_requested = True
-                print("\n⏱️ Timeout reached. Aborting AI content generation...")
+    cache = get_response_cache() if use_cache else None
+    if cache:
+        cache_key = cache.key("ollama", model, prompt)
+        content = cache.get(cache_key)
+        if content:
+            print("✨ Using cached content generated earlier for this description.")
+            return content
 
-        # Start the timeout handler
-        timeout_task = asyncio.create_task(handle_timeout())
+    print("🧠 Starting content generation process...")
+    print(f"⏱️  Timeout set to {timeout} seconds. Press Ctrl+C to abort.")
+    print("💡 Content generation will proceed in background. You can work on other tasks.")
 
-        try:
-            # Make the actual API call with streaming enabled
-            response = requests.post(
-                "http://localhost:11434/api/generate",
-                json={"model": model, "prompt": prompt, "stream": True},
-                stream=True
-            )
-
-            full_response = ""
-            first_token = True
-
-            for line in response.iter_lines():
-                if abort_requested:
+    parser = JSONFieldParser(CONTENT_KEYS)
+
+    # Create and start the thought process simulator
+    simulator = ThoughtProcessSimulator()
+    thought_process = asyncio.create_task(simulator.run_thought_process())
+
+    async def stream_content():
+        # Close the stream (and with it the connection) as soon as the loop stops
+        async with aclosing(agenerate_stream(prompt, model)) as stream:
+            async for piece in stream:
+                simulator.signal_generation_started()
+                if parser.feed(piece) or abort_requested:
                     break
 
-                if line:
-                    # Signal generation has started on first token
-                    if first_token:
-                        simulator.signal_generation_started()
-                        first_token = False
-
-                    try:
-                        data = json.loads(line)
-                        if "response" in data:
-                            full_response += data["response"]
-                    except json.JSONDecodeError:
-                        continue
-
-            # Cancel the timeout task
-            timeout_task.cancel()
-
-            if abort_requested:
-                simulator.should_continue = False
-                await thought_process
-                print("\n🛑 AI content generation aborted. Using template defaults.")
-                return None
-
-            try:
-                # Find JSON object in the response
-                start_idx = full_response.find('{')
-                end_idx = full_response.rfind('}') + 1
-
-                if start_idx >= 0 and end_idx > start_idx:
-                    json_str = full_response[start_idx:end_idx]
-                    content = json.loads(json_str)
-
-                    # Stop the thought process and show success
-                    simulator.should_continue = False
-                    await thought_process
-                    print("\n✨ Content generated successfully!")
-                    return content
-                else:
-                    print("\n❌ Could not extract valid JSON from model response.")
-            except json.JSONDecodeError:
-                print("\n❌ Could not parse model response as JSON.")
-        finally:
-            # Ensure the timeout task is cancelled
-            timeout_task.cancel()
+    generation = asyncio.create_task(stream_content())
+
+    def request_abort():
+        signal_handler(signal.SIGINT, None)
+        generation.cancel()
+
+    # Cancel the request on Ctrl+C; where the loop cannot handle signals, the flag is checked per token
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGINT, request_abort)
+        loop_handles_sigint = True
+    except (NotImplementedError, RuntimeError):
+        signal.signal(signal.SIGINT, signal_handler)
+        loop_handles_sigint = False
 
+    timed_out = False
+    try:
+        await asyncio.wait_for(generation, timeout)
+    except asyncio.TimeoutError:
+        timed_out = True
+        print("\n⏱️ Timeout reached. Aborting AI content generation...")
+    except asyncio.CancelledError:
+        if not abort_requested:
+            raise
     except Exception as e:
         print(f"\n❌ Error communicating with Ollama: {e}")
+        return None
     finally:
+        if loop_handles_sigint:
+            loop.remove_signal_handler(signal.SIGINT)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
         # Ensure thought process is stopped
         simulator.should_continue = False
         await thought_process
-        # Reset signal handler
-        signal.signal(signal.SIGINT, signal.SIG_DFL)
 
-    return None
+    content = parser.result()
+    if abort_requested or (timed_out and not content):
+        print("\n🛑 AI content generation aborted. Using template defaults.")
+        return None
+    if not content:
+        print("\n❌ Could not extract valid JSON from model response.")
+        return None
+    if timed_out:
+        print(f"\n✨ Using the content generated before the timeout: {', '.join(content)}")
+    else:
+        # Only a complete answer is cached; one cut short would be replayed until it expires
+        if cache and parser.done:
+            cache.put(cache_key, content)
+        print("\n✨ Content generated successfully!")
+    return content
+
+def format_content(value, bullet="- "):
+    """Format a generated field as Markdown list lines.
+
+    Args:
+        value: A string, or a list of items from the model's JSON
+        bullet: Prefix for items that do not start with one
+
+    Returns:
+        Markdown text
+    """
+    if not isinstance(value, list):
+        return str(value).strip()
+    lines = []
+    for item in value:
+        item = str(item).strip()
+        lines.append(item if item.startswith(("-", "*")) else f"{bullet}{item}")
+    return "\n".join(lines)
 
 # Function to support creating work efforts in the current directory
 def get_active_directory(use_current_dir=False):
@@ -307,11 +346,8 @@ def get_template_path(use_current_dir=False):
         # If the template doesn't exist in the current directory, copy it from the package
         if not os.path.exists(local_template_path):
             # Create the template file if it doesn't exist
-            with open(TEMPLATE_PATH, "r") as src_template:
-                template_content = src_template.read()
-
             with open(local_template_path, "w") as dest_template:
-                dest_template.write(template_content)
+                dest_template.write(load_template(TEMPLATE_PATH).source)
 
             print(f"Created template file at: {local_template_path}")
 
@@ -328,26 +364,25 @@ def create_work_effort(title, assignee, priority, due_date, content=None, use_cu
     template_path = get_template_path(use_current_dir)
     file_path = os.path.join(active_dir, filename)
 
-    with open(template_path, "r") as template_file:
-        template_content = template_file.read()
-
-    # Replace template variables
-    filled_content = template_content.replace("{{title}}", title)
-    filled_content = filled_content.replace("{{status}}", "active")
-    filled_content = filled_content.replace("{{priority}}", priority)
-    filled_content = filled_content.replace("{{assignee}}", assignee)
-    filled_content = filled_content.replace("{{created}}", timestamp)
-    filled_content = filled_content.replace("{{last_updated}}", timestamp)
-    filled_content = filled_content.replace("{{due_date}}", due_date)
+    # Fill the template variables; the compiled template is reused until the file changes
+    filled_content = load_template(template_path).render({
+        "title": title,
+        "status": "active",
+        "priority": priority,
+        "assignee": assignee,
+        "created": timestamp,
+        "last_updated": timestamp,
+        "due_date": due_date,
+    })
 
     # If AI-generated content is provided, replace the placeholders
     if content:
         if "objectives" in content:
-            filled_content = filled_content.replace("- Clearly define goals for this work effort.", content["objectives"])
+            filled_content = filled_content.replace("- Clearly define goals for this work effort.", format_content(content["objectives"]))
         if "tasks" in content:
-            filled_content = filled_content.replace("- [ ] Task 1\n- [ ] Task 2", content["tasks"])
+            filled_content = filled_content.replace("- [ ] Task 1\n- [ ] Task 2", format_content(content["tasks"], "- [ ] "))
         if "notes" in content:
-            filled_content = filled_content.replace("- Context, links to relevant code, designs, references.", content["notes"])
+            filled_content = filled_content.replace("- Context, links to relevant code, designs, references.", format_content(content["notes"]))
 
     with open(file_path, "w") as new_file:
         new_file.write(filled_content)
@@ -356,16 +391,18 @@ def create_work_effort(title, assignee, priority, due_date, content=None, use_cu
     return file_path
 
 def get_available_ollama_models():
-    """Get a list of available Ollama models."""
+    """Get a list of available Ollama models through the shared Ollama client."""
     try:
-        response = requests.get("http://localhost:11434/api/tags")
-        if response.status_code == 200:
-            models = response.json().get("models", [])
-            return [model["name"] for model in models]
-        return ["phi3", "llama3", "mistral"]  # Fallback defaults if can't get models
-    except Exception as e:
-        print(f"⚠️ Could not connect to Ollama: {e}")
-        return ["phi3", "llama3", "mistral"]  # Fallback defaults
+        from ...providers.ollama import get_client
+    except ImportError:
+        sys.path.append(os.path.dirname(WORK_EFFORTS_DIR))
+        from providers.ollama import get_client
+
+    models = get_client().list_models()
+    if models is None:
+        print("⚠️ Could not connect to Ollama. Offering the default models.")
+        return list(DEFAULT_MODELS)
+    return models
 
 def parse_arguments():
     """Parse command-line arguments."""
@@ -419,6 +456,11 @@ def parse_arguments():
         default=DEFAULT_TIMEOUT,
         help=f"Timeout in seconds for AI content generation (default: {DEFAULT_TIMEOUT})"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Generate AI content again instead of reusing cached content for the same description"
+    )
 
     # Add location options
     parser.add_argument(
@@ -478,12 +520,15 @@ async def main_async():
                 available_models = get_available_ollama_models()
 
                 if available_models:
-                    default_model = "phi3" if "phi3" in available_models else available_models[0]
+                    # Installed models are listed with their tag, as in "phi3:latest"
+                    names = set(available_models) | {name.split(":", 1)[0] for name in available_models}
+                    default_model = "phi3" if "phi3" in names else available_models[0]
                     print(f"Available models: {', '.join(available_models)}")
                     model_input = input(f"Choose a model [{default_model}]: ")
-                    model = model_input if model_input.strip() and model_input in available_models else default_model
+                    model = model_input if model_input.strip() and model_input in names else default_model
 
-                    ai_content = await generate_content_with_ollama(description_input, model, timeout)
+                    ai_content = await generate_content_with_ollama(description_input, model, timeout,
+                                                                    use_cache=not args.no_cache)
                 else:
                     print("⚠️ No Ollama models available. Using template defaults.")
     else:
@@ -516,7 +561,8 @@ async def main_async():
 
         # Only use AI if specifically requested with --use-ai flag
         if args.use_ai and args.description:
-            ai_content = await generate_content_with_ollama(args.description, args.model, args.timeout)
+            ai_content = await generate_content_with_ollama(args.description, args.model, args.timeout,
+                                                            use_cache=not args.no_cache)
 
         print(f"Creating work effort with title: {title}, assignee: {assignee}, priority: {priority}, due date: {due_date}")
         if use_current_dir:
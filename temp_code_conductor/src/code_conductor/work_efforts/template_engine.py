@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Work Effort Template Engine
+
+Compiles work effort templates once and renders them many times.
+
+Templates use ``{{name}}`` placeholders (spaces inside the braces are allowed).
+``compile_template`` splits a template into a render plan: a list of literal
+text and placeholder names. Rendering a record walks the plan and joins the
+pieces, so filling a template costs one pass over the output regardless of how
+many placeholders it has, instead of one ``str.replace`` per placeholder.
+Placeholders without a value are left in the output unchanged, as the
+``str.replace`` chains they replace did.
+
+Compiled templates are cached by path. Each lookup checks the file's
+modification time and size with a single ``os.stat`` and only reads and
+compiles the file again when either changed. JSON templates are cached the
+same way as parsed data. ``render_many`` looks the template up once for a whole
+batch, so bulk creation does no template I/O after the first record.
+"""
+
+import os
+import re
+import copy
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Constants
+PLACEHOLDER_PATTERN = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+
+class CompiledTemplate:
+    """
+    A template split into literal text and placeholders.
+
+    Attributes:
+        source (str): The template text
+        plan (tuple): Alternating literal strings and placeholder names; every
+            odd item is a placeholder name
+        fields (frozenset): Names of the placeholders in the template
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.plan = tuple(PLACEHOLDER_PATTERN.split(source))
+        self.fields = frozenset(self.plan[1::2])
+        self._placeholders = {match.group(1): match.group(0) for match in PLACEHOLDER_PATTERN.finditer(source)}
+
+    def render(self, values):
+        """
+        Fill the template with values.
+
+        Args:
+            values (dict): Placeholder name -> value; values are converted with str()
+
+        Returns:
+            str: The rendered text
+        """
+        parts = list(self.plan)
+        for index in range(1, len(parts), 2):
+            name = parts[index]
+            value = values.get(name)
+            parts[index] = self._placeholders[name] if value is None else str(value)
+        return ''.join(parts)
+
+    def render_many(self, records):
+        """
+        Fill the template with each record in turn.
+
+        Args:
+            records (iterable): Dicts of placeholder values
+
+        Yields:
+            str: One rendered text per record
+        """
+        for values in records:
+            yield self.render(values)
+
+
+def compile_template(source):
+    """
+    Compile template text into a render plan.
+
+    Args:
+        source (str): Template text with ``{{name}}`` placeholders
+
+    Returns:
+        CompiledTemplate: The compiled template
+    """
+    return CompiledTemplate(source)
+
+
+class TemplateCache:
+    """
+    Compiled templates cached by path, invalidated when the file changes.
+
+    A cached entry is reused while the file's modification time and size are
+    unchanged. The cache is safe to share between threads.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def _get(self, path, load):
+        """Return the cached value for path, loading it with load(text) if the file changed."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == key and entry[1] is load:
+                return entry[2]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            value = load(f.read())
+        with self._lock:
+            self._entries[path] = (key, load, value)
+            self.loads += 1
+        logger.debug(f"Compiled template {path}")
+        return value
+
+    def get(self, path):
+        """
+        Return the compiled template at path.
+
+        Args:
+            path (str): Template file
+
+        Returns:
+            CompiledTemplate: The compiled template
+
+        Raises:
+            OSError: If the template cannot be read
+        """
+        return self._get(path, compile_template)
+
+    def get_json(self, path):
+        """
+        Return a copy of the parsed JSON template at path.
+
+        Args:
+            path (str): JSON template file
+
+        Returns:
+            object: The parsed template; callers may modify it
+
+        Raises:
+            OSError: If the template cannot be read
+            ValueError: If the template is not valid JSON
+        """
+        return copy.deepcopy(self._get(path, json.loads))
+
+    def invalidate(self, path=None):
+        """
+        Drop a cached template, or every template when path is None.
+
+        Args:
+            path (str): Template file to drop
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+
+_template_cache = TemplateCache()
+
+
+def get_template_cache():
+    """Return the template cache shared by the process."""
+    return _template_cache
+
+
+def load_template(path):
+    """
+    Return the compiled template at path from the shared cache.
+
+    Args:
+        path (str): Template file
+
+    Returns:
+        CompiledTemplate: The compiled template
+    """
+    return _template_cache.get(path)
+
+
+def render_template(path, values):
+    """
+    Render the template at path with values.
+
+    Args:
+        path (str): Template file
+        values (dict): Placeholder name -> value
+
+    Returns:
+        str: The rendered text
+    """
+    return _template_cache.get(path).render(values)
+
+
+def render_many(path, records):
+    """
+    Render the template at path once per record, loading it once for the batch.
+
+    Args:
+        path (str): Template file
+        records (iterable): Dicts of placeholder values
+
+    Returns:
+        generator: Rendered texts in record order
+    """
+    return _template_cache.get(path).render_many(records)
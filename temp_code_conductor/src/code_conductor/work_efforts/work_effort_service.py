@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Work Effort Service
+
+The read and status-change operations behind the ``list``, ``search`` and
+``update-status`` commands, answered from in-memory indexes.
+
+A ``WorkEffortService`` keeps a ``RetrievalIndex`` (titles, list fields and
+trigram postings for every work effort) and a ``WorkNodeIndex`` (the links
+between documents) loaded. The CLI uses it directly for a single command, and the
+``code-conductor serve`` daemon keeps one alive between commands so that nothing
+has to be re-read or re-indexed per call.
+
+Freshness is checked cheaply before every operation: the mtimes of the status
+directories change whenever a work effort is added, removed or moved, and only
+then is the index refreshed. Edits inside existing files are picked up by
+``refresh()``, which the daemon calls periodically from its watcher thread.
+"""
+
+import os
+import logging
+
+try:
+    from .graph_export import WorkNodeIndex
+    from .frontmatter import patch_frontmatter, patch_frontmatter_in_place, DEFAULT_FSYNC_POLICY
+    from .listing import list_work_efforts as run_listing, select_work_efforts
+    from .retrieval_index import RetrievalIndex, STATUSES
+except ImportError:
+    from graph_export import WorkNodeIndex
+    from frontmatter import patch_frontmatter, patch_frontmatter_in_place, DEFAULT_FSYNC_POLICY
+    from listing import list_work_efforts as run_listing, select_work_efforts
+    from retrieval_index import RetrievalIndex, STATUSES
+
+logger = logging.getLogger(__name__)
+
+# Constants
+VALID_STATUSES = STATUSES + ['paused']
+STATUS_DIRECTORIES = {'active': 'active', 'completed': 'completed', 'archived': 'archived', 'paused': 'active'}
+
+
+class WorkEffortService:
+    """
+    Indexed list, search and status operations over a work efforts directory.
+    """
+
+    def __init__(self, work_efforts_dir, fsync=DEFAULT_FSYNC_POLICY):
+        """
+        Initialize the service and bring its indexes up to date.
+
+        Args:
+            work_efforts_dir (str): Directory containing the status subdirectories
+            fsync (str): fsync policy for status changes (see frontmatter.FSYNC_POLICIES)
+        """
+        self.work_efforts_dir = os.path.abspath(work_efforts_dir)
+        self.fsync = fsync
+        self.index = RetrievalIndex(self.work_efforts_dir)
+        self.graph = WorkNodeIndex(self.work_efforts_dir)
+        self._directory_mtimes = None
+        self.refresh()
+
+    def _status_directory_mtimes(self):
+        """Return the mtimes of the status directories (None for missing ones)."""
+        mtimes = []
+        for status in STATUSES:
+            try:
+                mtimes.append(os.stat(os.path.join(self.work_efforts_dir, status)).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return mtimes
+
+    def refresh(self):
+        """
+        Re-read every changed work effort into the indexes.
+
+        Returns:
+            int: Number of retrieval index entries added, updated or removed
+        """
+        self._directory_mtimes = self._status_directory_mtimes()
+        changed = self.index.refresh()
+        self.graph.refresh()
+        return changed
+
+    def ensure_fresh(self):
+        """Refresh the indexes if a work effort was added, removed or moved."""
+        if self._status_directory_mtimes() != self._directory_mtimes:
+            self.refresh()
+
+    def _describe(self, rel_path):
+        """Return the public record for an indexed work effort."""
+        entry = self.index.entries[rel_path]
+        metadata = entry.get('metadata', {})
+        return {
+            'path': rel_path,
+            'filename': entry['filename'],
+            'title': entry['title'] or os.path.splitext(entry['filename'])[0],
+            'status': metadata.get('status', entry['status']),
+            'priority': metadata.get('priority', ''),
+            'assignee': metadata.get('assignee', ''),
+            'tags': entry.get('tags', []),
+            'created': entry['created'],
+            'updated': entry['mtime_ns'] / 1e9,
+        }
+
+    def iter_work_efforts(self, status=None, assignee=None, tag=None, sort_by='created',
+                          reverse=False, offset=0, limit=None):
+        """
+        Yield a filtered, sorted page of work efforts.
+
+        Records are described one at a time from the index, newest first (oldest
+        first for a reversed ``created`` sort), and run through the listing
+        pipeline, so nothing is materialized unless a non-default sort needs it.
+
+        Args:
+            status (str): Only include work efforts with this status
+            assignee (str): Only include work efforts with this assignee
+            tag (str): Only include work efforts with this tag
+            sort_by (str): One of listing.SORT_KEYS
+            reverse (bool): Sort descending
+            offset (int): Number of records to skip
+            limit (int): Maximum number of records, or None for all
+
+        Returns:
+            iterator: Work effort records
+        """
+        self.ensure_fresh()
+        order = self.index.by_created if (reverse and sort_by == 'created') else reversed(self.index.by_created)
+        records = (self._describe(rel_path) for _, rel_path in order)
+        return run_listing(records, status=status, assignee=assignee, tag=tag, sort_by=sort_by,
+                           reverse=reverse, offset=offset, limit=limit)
+
+    def list_work_efforts(self, status=None, assignee=None, tag=None, sort_by='created',
+                          reverse=False, offset=0, limit=None):
+        """
+        List a filtered, sorted page of work efforts.
+
+        Takes the same arguments as iter_work_efforts.
+
+        Returns:
+            list: Work effort records
+        """
+        return list(self.iter_work_efforts(status=status, assignee=assignee, tag=tag, sort_by=sort_by,
+                                           reverse=reverse, offset=offset, limit=limit))
+
+    def search(self, query, limit=10):
+        """
+        Rank work efforts by how well their filename or title matches query.
+
+        Args:
+            query (str): Name or part of a name to look for
+            limit (int): Maximum number of results
+
+        Returns:
+            list: Work effort records with a score, best match first
+        """
+        self.ensure_fresh()
+        return [dict(self._describe(rel_path), score=round(score, 3))
+                for rel_path, score in self.index.search(query, limit)]
+
+    def find(self, name):
+        """
+        Find the work efforts a user means by name.
+
+        A relative path or filename selects one work effort; anything else matches
+        every work effort whose title contains name.
+
+        Args:
+            name (str): Relative path, filename or part of a title
+
+        Returns:
+            list: Matching work effort records
+        """
+        self.ensure_fresh()
+        if name in self.index.entries:
+            return [self._describe(name)]
+        by_filename = [rel_path for rel_path, entry in self.index.entries.items() if entry['filename'] == name]
+        if by_filename:
+            return [self._describe(rel_path) for rel_path in by_filename]
+        needle = name.lower()
+        return [record for record in self.list_work_efforts() if needle in record['title'].lower()]
+
+    def related(self, rel_path):
+        """
+        Return the documents a work effort links to and the ones linking to it.
+
+        Args:
+            rel_path (str): Relative path of the work effort
+
+        Returns:
+            dict: 'outgoing' and 'incoming' lists of edge records
+        """
+        self.ensure_fresh()
+        stem = os.path.splitext(os.path.basename(rel_path))[0]
+        outgoing, incoming = [], []
+        for edge in self.graph.iter_edges():
+            if edge['source'] == rel_path:
+                outgoing.append(edge)
+            elif edge['target'] in (stem, rel_path):
+                incoming.append(edge)
+        return {'outgoing': outgoing, 'incoming': incoming}
+
+    def _move(self, rel_path, target_rel_path, new_status):
+        """
+        Patch the status line of a work effort in place, then rename it into the target directory.
+
+        The status line is overwritten inside the file when the new one fits
+        (see frontmatter.patch_frontmatter_in_place), so a transition writes a
+        few bytes and one rename whatever the size of the document. Only a
+        status line that grows has the document rewritten first.
+
+        Raises:
+            ValueError: If the target path is taken by another file
+            OSError: If the file cannot be read, written or renamed
+        """
+        source = self.index.path_for(rel_path)
+        target = self.index.path_for(target_rel_path)
+        if target_rel_path != rel_path and os.path.exists(target):
+            raise ValueError(f"Cannot move {rel_path}: {target_rel_path} already exists")
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if not patch_frontmatter_in_place(source, {'status': new_status}, target_path=target, fsync=self.fsync):
+            # The new status line is longer: rewrite the document once, then rename it
+            patch_frontmatter(source, {'status': new_status}, fsync=self.fsync)
+            patch_frontmatter_in_place(source, {'status': new_status}, target_path=target, fsync=self.fsync)
+
+    def _commit(self, moves, new_status):
+        """
+        Apply one batched update of both indexes for (old path, new path) moves.
+
+        Only the path and status of a moved work effort change, so the index
+        entries are carried over instead of re-reading the files.
+        """
+        for rel_path, target_rel_path in moves:
+            self.index.rename_entry(rel_path, target_rel_path, new_status, save=False)
+            self.graph.rename_entry(rel_path, target_rel_path)
+        self.index.save()
+        self.graph.save()
+        self._directory_mtimes = self._status_directory_mtimes()
+
+    def update_status(self, rel_path, new_status):
+        """
+        Set the status of a work effort and move it to the matching directory.
+
+        The frontmatter status line is rewritten in place and the rest of the
+        document is kept as it is.
+
+        Args:
+            rel_path (str): Relative path of the work effort
+            new_status (str): One of VALID_STATUSES
+
+        Returns:
+            dict: The updated work effort record
+
+        Raises:
+            ValueError: If the status is invalid, the work effort is unknown or the
+                target path is taken
+        """
+        if new_status not in VALID_STATUSES:
+            raise ValueError(f"Invalid status '{new_status}', expected one of {', '.join(VALID_STATUSES)}")
+        self.ensure_fresh()
+        if rel_path not in self.index.entries:
+            raise ValueError(f"Unknown work effort: {rel_path}")
+
+        target_rel_path = os.path.join(STATUS_DIRECTORIES[new_status], os.path.basename(rel_path))
+        self._move(rel_path, target_rel_path, new_status)
+        logger.info(f"Updated {rel_path} to status '{new_status}'")
+        self._commit([(rel_path, target_rel_path)], new_status)
+        return self._describe(target_rel_path)
+
+    def transition(self, selector, new_status):
+        """
+        Move every work effort matching a selector to a new status.
+
+        The selector is evaluated against the index. Each match gets its status
+        line patched in place and is renamed into the directory for the new
+        status; both indexes are then updated once for the whole batch. A file
+        that cannot be moved is reported and the rest are still moved.
+
+        Args:
+            selector (str): Selector such as "status:completed updated<2025-01-01"
+                (see listing.parse_selector)
+            new_status (str): One of VALID_STATUSES
+
+        Returns:
+            dict: ``moved`` (updated records) and ``errors`` (list of [path, message])
+
+        Raises:
+            ValueError: If the status or the selector is invalid
+        """
+        if new_status not in VALID_STATUSES:
+            raise ValueError(f"Invalid status '{new_status}', expected one of {', '.join(VALID_STATUSES)}")
+        self.ensure_fresh()
+        records = (self._describe(rel_path) for _, rel_path in self.index.by_created)
+        matches = list(select_work_efforts(records, selector))
+
+        moved, errors = [], []
+        for record in matches:
+            rel_path = record['path']
+            target_rel_path = os.path.join(STATUS_DIRECTORIES[new_status], record['filename'])
+            if record['status'] == new_status and target_rel_path == rel_path:
+                continue
+            try:
+                self._move(rel_path, target_rel_path, new_status)
+            except (OSError, ValueError) as e:
+                errors.append([rel_path, str(e)])
+                continue
+            moved.append((rel_path, target_rel_path))
+
+        if moved:
+            self._commit(moved, new_status)
+        logger.info(f"Moved {len(moved)} of {len(matches)} matching work efforts to '{new_status}'")
+        return {'moved': [self._describe(target_rel_path) for _, target_rel_path in moved], 'errors': errors}
@@ -3,7 +3,8 @@
 Simple Workflow Runner
 
 A simplified version of the workflow runner that creates a script with the
-provided feature name.
+provided feature name. With --warm the script and its tests run in a warm,
+preloaded interpreter (see warm_runner.py).
 """
 
 import os
@@ -11,7 +12,11 @@ import re
 import sys
 import argparse
 from typing import Dict, List
-import subprocess
+
+try:
+    from .warm_runner import WarmRunner, affected_tests, run_python
+except ImportError:
+    from warm_runner import WarmRunner, affected_tests, run_python
 
 def slugify(text):
     """Convert text to slug format."""
@@ -102,11 +107,11 @@ if __name__ == "__main__":
 
     return test_path
 
-def execute_script(script_path):
-    """Execute a script and return the results."""
+def execute_script(script_path, runner=None):
+    """Execute a script, in a warm runner if one is given, and return whether it succeeded."""
     print(f"Executing {script_path}...")
     try:
-        result = subprocess.run(['python3', script_path], capture_output=True, text=True)
+        result = run_python(script_path, runner=runner)
 
         print("\nExecution Results:")
         print("-" * 50)
@@ -137,6 +142,8 @@ def main():
                         help="Description of the feature")
     parser.add_argument("--non-interactive", action="store_true",
                         help="Run in non-interactive mode with default values")
+    parser.add_argument("--warm", action="store_true",
+                        help="Run the script and its tests in a warm, preloaded interpreter")
     args = parser.parse_args()
 
     feature_name = args.feature_name
@@ -148,11 +155,21 @@ def main():
     script_name = slugify(feature_name)
     script_path = create_script(feature_name, description)
 
-    # 2. Execute script
-    execute_script(script_path)
-
-    # 3. Create test
-    test_path = create_test(feature_name, script_name)
+    runner = WarmRunner() if args.warm else None
+    try:
+        # 2. Execute script
+        execute_script(script_path, runner)
+
+        # 3. Create test
+        test_path = create_test(feature_name, script_name)
+
+        # 4. Run the tests affected by the script
+        if args.warm:
+            for affected in affected_tests(script_path):
+                execute_script(affected, runner)
+    finally:
+        if runner:
+            runner.close()
 
     print("\n=== Workflow completed successfully! ===\n")
     print(f"Created files:")
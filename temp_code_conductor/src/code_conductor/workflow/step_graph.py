@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Workflow Step Graph
+
+Runs workflow steps as a dependency graph with bounded parallelism, caching
+and resumable state.
+
+Each ``Step`` names the steps it depends on. ``StepExecutor`` starts every step
+whose dependencies have finished, up to ``max_workers`` at a time, so
+independent steps (creating a script while the devlog is updated, running the
+script while its tests are written) overlap. Steps marked ``exclusive`` (those
+that prompt the user) run on their own.
+
+Before a step runs, a hash of its inputs and of the outputs of the steps it
+depends on is compared with the hash recorded the last time it completed. If
+they match and the files the step produces still exist, the step is skipped
+and its recorded output is reused. A change to a step's inputs therefore
+re-runs that step and everything downstream of it.
+
+The state is written to a JSON file (atomically, via a temporary file) after
+every step, so an interrupted workflow resumes after the last completed step.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_MAX_WORKERS = 4
+STATE_VERSION = 1
+
+
+class Step:
+    """
+    One unit of work in a workflow.
+
+    Attributes:
+        name (str): Unique step name
+        func (callable): Runs the step; its return value must be JSON serializable
+        deps (tuple): Names of the steps that must finish first
+        inputs (callable): Returns the values the step's result depends on
+        outputs (callable): Returns the paths the step creates
+        cache (bool): Whether the step may be skipped when nothing changed
+        exclusive (bool): Whether the step must run with no other step running
+    """
+
+    def __init__(self, name, func, deps=(), inputs=None, outputs=None, cache=True, exclusive=False):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.inputs = inputs
+        self.outputs = outputs
+        self.cache = cache
+        self.exclusive = exclusive
+
+    def __repr__(self):
+        return f"Step({self.name!r}, deps={list(self.deps)})"
+
+
+def topological_order(steps):
+    """
+    Order steps so that every step comes after its dependencies.
+
+    Args:
+        steps (list): Step objects
+
+    Returns:
+        list: Step names in a valid execution order (stable for independent steps)
+
+    Raises:
+        ValueError: If a dependency is unknown, a name is repeated or the steps form a cycle
+    """
+    by_name = {}
+    for step in steps:
+        if step.name in by_name:
+            raise ValueError(f"Duplicate step '{step.name}'")
+        by_name[step.name] = step
+    for step in steps:
+        for dep in step.deps:
+            if dep not in by_name:
+                raise ValueError(f"Step '{step.name}' depends on unknown step '{dep}'")
+
+    order, visiting, visited = [], set(), set()
+
+    def visit(name, path):
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(f"Steps form a cycle: {' -> '.join(path + [name])}")
+        visiting.add(name)
+        for dep in by_name[name].deps:
+            visit(dep, path + [name])
+        visiting.discard(name)
+        visited.add(name)
+        order.append(name)
+
+    for step in steps:
+        visit(step.name, [])
+    return order
+
+
+def _hash(value):
+    """Return a stable hash of a JSON-serializable value."""
+    encoded = json.dumps(value, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def file_digest(path):
+    """
+    Return the SHA-256 of a file's contents, or None if it does not exist.
+
+    Args:
+        path (str): File to hash
+
+    Returns:
+        str: Hex digest, or None
+    """
+    if not path or not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StepExecutor:
+    """
+    Executes a step graph with caching and a persisted state file.
+    """
+
+    def __init__(self, steps, state_path=None, max_workers=DEFAULT_MAX_WORKERS, snapshot=None):
+        """
+        Initialize the executor.
+
+        Args:
+            steps (list): Step objects
+            state_path (str): JSON file recording completed steps (no persistence if None)
+            max_workers (int): Most steps running at the same time
+            snapshot (callable): Returns extra JSON data saved with the state after every step
+        """
+        self.order = topological_order(steps)
+        self.steps = {step.name: step for step in steps}
+        self.state_path = state_path
+        self.max_workers = max(1, max_workers)
+        self.snapshot = snapshot
+        self.state = self.load_state()
+        self._lock = threading.Lock()
+
+    def load_state(self):
+        """
+        Read the saved state, or start a new one.
+
+        Returns:
+            dict: State with 'version', 'steps' and 'context' keys
+        """
+        if self.state_path and os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                if state.get('version') == STATE_VERSION:
+                    return state
+                logger.warning(f"Ignoring workflow state {self.state_path} with version {state.get('version')}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable workflow state {self.state_path}: {e}")
+        return {'version': STATE_VERSION, 'steps': {}, 'context': {}}
+
+    def save_state(self):
+        """Write the state atomically."""
+        if not self.state_path:
+            return
+        if self.snapshot:
+            self.state['context'] = self.snapshot()
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp.{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2, default=str)
+        os.replace(tmp_path, self.state_path)
+
+    def input_hash(self, step, finished):
+        """Hash a step's inputs together with the outputs of its dependencies."""
+        return _hash({
+            'inputs': step.inputs() if step.inputs else None,
+            'deps': {dep: finished[dep] for dep in step.deps},
+        })
+
+    def is_cached(self, step, input_hash):
+        """Return True if the step completed before with the same inputs and its outputs exist."""
+        record = self.state['steps'].get(step.name)
+        if not step.cache or not record or record.get('status') != 'completed':
+            return False
+        if record.get('input_hash') != input_hash:
+            return False
+        return all(os.path.exists(path) for path in (step.outputs() if step.outputs else []))
+
+    def _record(self, name, **values):
+        """Update a step's record and persist the state."""
+        with self._lock:
+            self.state['steps'][name] = dict(values, updated_at=datetime.now().isoformat())
+            self.save_state()
+
+    def run(self):
+        """
+        Run every step that is not cached, respecting dependencies.
+
+        Steps already running when one fails are allowed to finish; nothing
+        new is started after a failure.
+
+        Returns:
+            dict: 'ran' and 'skipped' (step names in completion order) and
+                'failed' ((name, error message) or None)
+        """
+        finished = {}  # Step name -> output hash
+        pending = list(self.order)
+        running = {}  # Future -> step name
+        input_hashes = {}  # Step name -> input hash of the running step
+        report = {'ran': [], 'skipped': [], 'failed': None}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                progressed = True
+                while progressed and report['failed'] is None:
+                    progressed = False
+                    for name in list(pending):
+                        step = self.steps[name]
+                        if not all(dep in finished for dep in step.deps):
+                            continue
+                        input_hash = self.input_hash(step, finished)
+                        if self.is_cached(step, input_hash):
+                            pending.remove(name)
+                            finished[name] = self.state['steps'][name]['output_hash']
+                            report['skipped'].append(name)
+                            logger.info(f"Skipping unchanged step {name}")
+                            progressed = True
+                            continue
+
+                        exclusive_running = any(self.steps[n].exclusive for n in running.values())
+                        if exclusive_running or len(running) >= self.max_workers:
+                            break
+                        if step.exclusive and running:
+                            continue
+                        pending.remove(name)
+                        running[pool.submit(step.func)] = name
+                        input_hashes[name] = input_hash
+                        progressed = True
+                        if step.exclusive:
+                            break
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    input_hash = input_hashes.pop(name)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Workflow step {name} failed: {e}")
+                        self._record(name, status='failed', input_hash=input_hash, error=str(e))
+                        if report['failed'] is None:
+                            report['failed'] = (name, str(e))
+                        continue
+                    output_hash = _hash(result)
+                    finished[name] = output_hash
+                    report['ran'].append(name)
+                    self._record(name, status='completed', input_hash=input_hash,
+                                 output_hash=output_hash, result=result)
+
+        return report
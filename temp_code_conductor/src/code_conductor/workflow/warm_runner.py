@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Warm Script Runner
+
+Runs workflow scripts and their tests in forked children of a warm interpreter.
+
+Starting a new ``python3`` for every execution in the refine-until-successful
+loop pays for interpreter startup and for importing the same modules each
+time. ``WarmRunner`` starts one server interpreter instead, which imports the
+common modules once. For each run the server:
+
+1. Imports the modules the script imports that are installed in the
+   interpreter's library directories (the standard library and
+   site-packages), so later runs find them loaded. Modules next to the script
+   and the project's own packages (on ``PYTHONPATH`` or installed in editable
+   mode) may change between runs, so they are never preloaded.
+2. Forks a child that redirects stdout and stderr to temporary files, changes
+   to the requested directory and runs the script as ``__main__``.
+3. Waits for the child, killing it if a timeout was given and it runs too
+   long, and sends back its exit code and output.
+
+Because every run happens in a fresh fork, scripts cannot affect each other or
+the server, and edits to a script or its sibling modules are always picked up.
+Results are ``subprocess.CompletedProcess`` objects and timeouts raise
+``subprocess.TimeoutExpired``, as with ``subprocess.run``. Where ``os.fork`` is
+not available the runner falls back to ``subprocess.run``.
+
+``affected_tests`` selects the test scripts that import a changed script,
+directly or through other scripts in the same directory, so only those need to
+run after an edit.
+
+Usage:
+    python warm_runner.py --serve [MODULE ...]
+"""
+
+import os
+import re
+import sys
+import ast
+import json
+import time
+import signal
+import tempfile
+import threading
+import subprocess
+
+# Constants
+DEFAULT_TIMEOUT = None  # Scripts run until they finish, as with subprocess.run
+POLL_INTERVAL = 0.001
+PRELOAD_MODULES = ("argparse", "datetime", "json", "pathlib", "re", "subprocess", "unittest", "unittest.mock")
+TEST_FILE_PATTERN = re.compile(r'^test_.*\.py$')
+
+
+def script_imports(path):
+    """
+    Get the top-level names of the modules a script imports.
+
+    Args:
+        path (str): Path to the Python script
+
+    Returns:
+        list: Module names in the order they are first imported; empty if the
+            script cannot be parsed
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return []
+
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules = [node.module]
+        else:
+            continue
+        for module in modules:
+            if module not in names:
+                names.append(module)
+    return names
+
+
+def affected_tests(changed_path, search_dir=None):
+    """
+    Find the test scripts affected by a change to a script.
+
+    A test is affected if it imports the changed script's module, or imports
+    another script in the same directory that does. A changed test script is
+    affected by its own change.
+
+    Args:
+        changed_path (str): Path to the changed script
+        search_dir (str): Directory holding the scripts and tests (default: the
+            changed script's directory)
+
+    Returns:
+        list: Paths of the affected test scripts, sorted
+    """
+    search_dir = search_dir or os.path.dirname(os.path.abspath(changed_path))
+    changed = os.path.splitext(os.path.basename(changed_path))[0]
+
+    # Map each local module to the local modules that import it
+    importers = {}
+    modules = {}
+    for filename in os.listdir(search_dir):
+        if not filename.endswith('.py'):
+            continue
+        module = filename[:-3]
+        modules[module] = os.path.join(search_dir, filename)
+        for imported in script_imports(modules[module]):
+            importers.setdefault(imported.split('.')[0], set()).add(module)
+
+    reached = {changed}
+    queue = [changed]
+    while queue:
+        for importer in importers.get(queue.pop(), ()):
+            if importer not in reached:
+                reached.add(importer)
+                queue.append(importer)
+
+    return sorted(modules[module] for module in reached
+                  if module in modules and TEST_FILE_PATTERN.match(os.path.basename(modules[module])))
+
+
+def run_python(path, args=(), timeout=DEFAULT_TIMEOUT, cwd=None, runner=None):
+    """
+    Run a Python script, in a warm runner if one is given.
+
+    Args:
+        path (str): Script to run
+        args (iterable): Command line arguments for the script
+        timeout (float): Seconds to wait before killing the script (default: no limit)
+        cwd (str): Working directory for the script (default: the current one)
+        runner (WarmRunner): Warm runner to use; a new interpreter is started if None
+
+    Returns:
+        subprocess.CompletedProcess: Exit code and captured output
+
+    Raises:
+        subprocess.TimeoutExpired: If the script ran longer than timeout
+    """
+    if runner is not None:
+        return runner.run(path, args, timeout=timeout, cwd=cwd)
+    return subprocess.run(['python3', path, *args], capture_output=True, text=True, timeout=timeout, cwd=cwd)
+
+
+class WarmRunner:
+    """
+    Runs scripts in forked children of a long-lived interpreter.
+
+    Runs are serialized; the runner is safe to share between threads.
+    """
+
+    def __init__(self, preload=PRELOAD_MODULES, python=None):
+        """
+        Initialize the runner. The server is started on the first run.
+
+        Args:
+            preload (iterable): Modules the server imports at startup
+            python (str): Interpreter for the server (default: sys.executable)
+        """
+        self.preload = list(preload)
+        self.python = python or sys.executable
+        self.available = hasattr(os, 'fork')
+        self._process = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Start the server interpreter and wait until its modules are loaded.
+
+        Raises:
+            RuntimeError: If the server does not start
+        """
+        if self._process is not None and self._process.poll() is None:
+            return
+        self._process = subprocess.Popen(
+            [self.python, os.path.abspath(__file__), '--serve', *self.preload],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1
+        )
+        ready = self._process.stdout.readline()
+        if not ready or not json.loads(ready).get('ready'):
+            self.close()
+            raise RuntimeError("Warm runner failed to start")
+
+    def run(self, path, args=(), timeout=DEFAULT_TIMEOUT, cwd=None):
+        """
+        Run a script in a forked child of the server.
+
+        Args:
+            path (str): Script to run
+            args (iterable): Command line arguments for the script
+            timeout (float): Seconds to wait before killing the script (default: no limit)
+            cwd (str): Working directory for the script (default: the current one)
+
+        Returns:
+            subprocess.CompletedProcess: Exit code and captured output
+
+        Raises:
+            subprocess.TimeoutExpired: If the script ran longer than timeout
+            RuntimeError: If the server stopped unexpectedly
+        """
+        path = os.path.abspath(path)
+        command = ['python3', path, *args]
+        if not self.available:
+            return run_python(path, args, timeout=timeout, cwd=cwd)
+
+        request = {
+            'path': path,
+            'args': list(args),
+            'cwd': os.path.abspath(cwd or os.getcwd()),
+            'timeout': timeout,
+            'preload': script_imports(path),
+        }
+        with self._lock:
+            self.start()
+            self._process.stdin.write(json.dumps(request) + '\n')
+            self._process.stdin.flush()
+            line = self._process.stdout.readline()
+        if not line:
+            self.close()
+            raise RuntimeError("Warm runner stopped unexpectedly")
+
+        response = json.loads(line)
+        if response['timed_out']:
+            raise subprocess.TimeoutExpired(command, timeout, output=response['stdout'], stderr=response['stderr'])
+        return subprocess.CompletedProcess(command, response['returncode'], response['stdout'], response['stderr'])
+
+    def close(self):
+        """Stop the server."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _library_dirs():
+    """Return the directories modules are installed in: the standard library and site-packages."""
+    import site
+    import sysconfig
+
+    paths = sysconfig.get_paths()
+    dirs = [paths[key] for key in ('stdlib', 'platstdlib', 'purelib', 'platlib') if key in paths]
+    if hasattr(site, 'getsitepackages'):
+        dirs.extend(site.getsitepackages())
+    if site.ENABLE_USER_SITE:
+        dirs.append(site.getusersitepackages())
+    return sorted({os.path.realpath(path) for path in dirs})
+
+
+def _is_under(path, directory):
+    """Return True if path is directory or inside it."""
+    return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
+
+
+def _import_quietly(module, library_dirs, exclude_dir=None):
+    """
+    Import a module in the server if it is installed in one of library_dirs.
+
+    Modules under exclude_dir, modules from anywhere else (such as the project's
+    own packages) and modules that fail to import are skipped.
+    """
+    import importlib
+    import importlib.util
+
+    try:
+        spec = importlib.util.find_spec(module.split('.')[0])
+        if spec is None:
+            return
+        if spec.origin and os.path.isabs(spec.origin):
+            origin = os.path.dirname(os.path.realpath(spec.origin))
+        elif spec.submodule_search_locations:
+            origin = os.path.realpath(list(spec.submodule_search_locations)[0])
+        else:
+            origin = None  # Built-in and frozen modules
+        if origin is not None:
+            if exclude_dir and _is_under(origin, os.path.realpath(exclude_dir)):
+                return
+            if not any(_is_under(origin, directory) for directory in library_dirs):
+                return
+        importlib.import_module(module)
+    except Exception:
+        pass
+
+
+def _run_child(request, out_path, err_path):
+    """Run the requested script in a forked child; never returns."""
+    import runpy
+    import traceback
+
+    code = 1
+    try:
+        stdin = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(stdin, 0)
+        for fd, target in ((1, out_path), (2, err_path)):
+            os.dup2(os.open(target, os.O_WRONLY | os.O_TRUNC), fd)
+        os.chdir(request['cwd'])
+        sys.argv = [request['path']] + request['args']
+        sys.path.insert(0, os.path.dirname(request['path']))
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+        code = 0
+        runpy.run_path(request['path'], run_name='__main__')
+    except SystemExit as e:
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code & 0xFF)
+
+
+def _wait(pid, timeout):
+    """Wait for a child, killing it after timeout seconds if given. Returns (exit code, timed out)."""
+    if timeout is None:
+        _, status = os.waitpid(pid, 0)
+        return os.waitstatus_to_exitcode(status), False
+    deadline = time.monotonic() + timeout
+    while True:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            return os.waitstatus_to_exitcode(status), False
+        if time.monotonic() >= deadline:
+            os.kill(pid, signal.SIGKILL)
+            _, status = os.waitpid(pid, 0)
+            return os.waitstatus_to_exitcode(status), True
+        time.sleep(POLL_INTERVAL)
+
+
+def serve(preload):
+    """
+    Serve run requests read as JSON lines from stdin until it closes.
+
+    Args:
+        preload (iterable): Modules to import before serving
+    """
+    # Keep the protocol on a private copy of stdout so nothing else can write to it
+    protocol = os.fdopen(os.dup(1), 'w', buffering=1)
+    os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+    if sys.path and os.path.abspath(sys.path[0]) == os.path.dirname(os.path.abspath(__file__)):
+        sys.path.pop(0)
+
+    library_dirs = _library_dirs()
+    for module in preload:
+        _import_quietly(module, library_dirs)
+    protocol.write(json.dumps({'ready': True}) + '\n')
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        script_dir = os.path.dirname(request['path'])
+        for module in request.get('preload', ()):
+            _import_quietly(module, library_dirs, exclude_dir=script_dir)
+
+        fd_out, out_path = tempfile.mkstemp(prefix='warm-out-')
+        fd_err, err_path = tempfile.mkstemp(prefix='warm-err-')
+        os.close(fd_out)
+        os.close(fd_err)
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid == 0:
+                protocol.close()
+                _run_child(request, out_path, err_path)
+            returncode, timed_out = _wait(pid, request['timeout'])
+            with open(out_path, 'r', encoding='utf-8', errors='replace') as f:
+                stdout = f.read()
+            with open(err_path, 'r', encoding='utf-8', errors='replace') as f:
+                stderr = f.read()
+        finally:
+            os.unlink(out_path)
+            os.unlink(err_path)
+
+        protocol.write(json.dumps({
+            'returncode': returncode,
+            'stdout': stdout,
+            'stderr': stderr,
+            'timed_out': timed_out,
+        }) + '\n')
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--serve']:
+        serve(sys.argv[2:])
+    else:
+        print(__doc__)
+        sys.exit(2)
@@ -13,12 +13,26 @@ This script guides users through the complete Code Conductor workflow process:
 7. Add Tests
 8. Update All Documentation
 
+The steps run as a dependency graph (see step_graph.py): independent steps
+such as creating the script and updating the devlog run in parallel, steps
+whose inputs have not changed since the last run are skipped, and a workflow
+that was interrupted resumes after the last completed step. The state of each
+feature's workflow is kept in .code-conductor/workflows/ under the work
+efforts directory.
+
+With --warm, scripts and tests run in forked children of one warm interpreter
+(see warm_runner.py) instead of a new interpreter each time, and only the tests
+affected by the script are run.
+
 Usage:
-    python workflow_runner.py [--non-interactive] [--feature-name NAME]
+    python workflow_runner.py [--non-interactive] [--feature-name NAME] [--workers N] [--restart] [--warm]
 
 Options:
     --non-interactive    Run in non-interactive mode with default values
     --feature-name NAME  Name of the feature to develop
+    --workers N          Maximum number of steps to run at the same time
+    --restart            Ignore the saved state and run every step again
+    --warm               Run scripts and tests in a warm, preloaded interpreter
 """
 
 import os
@@ -26,7 +40,26 @@ import re
 import sys
 import argparse
 import datetime
-import subprocess
+
+try:
+    from ..work_efforts.entry_log import open_changelog, open_devlog
+    from ..work_efforts.frontmatter import patch_frontmatter
+    from ..work_efforts.template_engine import load_template
+except ImportError:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'work_efforts'))
+    from entry_log import open_changelog, open_devlog
+    from frontmatter import patch_frontmatter
+    from template_engine import load_template
+
+try:
+    from .step_graph import DEFAULT_MAX_WORKERS, Step, StepExecutor, file_digest
+except ImportError:
+    from step_graph import DEFAULT_MAX_WORKERS, Step, StepExecutor, file_digest
+
+try:
+    from .warm_runner import WarmRunner, affected_tests, run_python
+except ImportError:
+    from warm_runner import WarmRunner, affected_tests, run_python
 
 # Constants
 WORK_EFFORTS_DIR = "_AI-Setup/work_efforts"
@@ -37,6 +70,12 @@ SCRIPTS_DIR = f"{WORK_EFFORTS_DIR}/scripts"
 DEVLOG_PATH = f"{WORK_EFFORTS_DIR}/devlog.md"
 CHANGELOG_PATH = "CHANGELOG.md"
 TEMPLATE_PATH = f"{WORK_EFFORTS_DIR}/templates/work-effort-template.md"
+WORKFLOW_STATE_DIR = os.path.join(".code-conductor", "workflows")
+
+# Attributes that identify a workflow run and are restored when it resumes
+PERSISTED_ATTRIBUTES = (
+    "timestamp", "date", "time", "created", "last_updated", "due_date", "status", "work_effort_path",
+)
 
 # Template for devlog entries
 DEVLOG_ENTRY_TEMPLATE = """## {date}
@@ -128,7 +167,7 @@ class WorkflowRunner:
     Guides users through the Code Conductor workflow process.
     """
 
-    def __init__(self, interactive=True, work_efforts_dir=None, devlog_file=None, changelog_file=None):
+    def __init__(self, interactive=True, work_efforts_dir=None, devlog_file=None, changelog_file=None, warm=False):
         """
         Initialize the workflow runner.
 
@@ -137,8 +176,10 @@ class WorkflowRunner:
             work_efforts_dir (str): Path to the work efforts directory
             devlog_file (str): Path to the devlog file
             changelog_file (str): Path to the changelog file
+            warm (bool): Whether to run scripts and tests in a warm interpreter
         """
         self.interactive = interactive
+        self.warm_runner = WarmRunner() if warm else None
         self.timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M")
         self.date = datetime.datetime.now().strftime("%Y-%m-%d")
         self.time = datetime.datetime.now().strftime("%H:%M:%S")
@@ -214,6 +255,19 @@ class WorkflowRunner:
         """
         return re.sub(r'[^a-z0-9_]', '', text.lower().replace(' ', '_'))
 
+    def get_template(self):
+        """
+        Get the compiled template, creating the template file if it doesn't exist.
+
+        The template is compiled once and reused until the file changes.
+
+        Returns:
+            CompiledTemplate: The compiled template
+        """
+        if not os.path.exists(self.template_path):
+            self.get_template_content()
+        return load_template(self.template_path)
+
     def get_template_content(self):
         """
         Get the content of the template file.
@@ -272,52 +326,55 @@ tags: [{{tags}}]
             return default_template
 
         # Read the template file
-        with open(self.template_path, 'r') as f:
-            return f.read()
+        return load_template(self.template_path).source
 
-    def create_work_effort(self):
+    def gather_feature_info(self):
+        """
+        Prompt for the feature information and derive the script and class names.
+        """
+        self.feature_name = self.prompt("Feature name", "New Feature")
+        self.feature_title = self.prompt("Feature title", self.feature_name)
+        self.feature_description = self.prompt("Feature description", "A new feature for Code Conductor")
+        self.feature_priority = self.prompt("Priority (low, medium, high, critical)", "medium")
+        self.assignee = self.prompt("Assignee", "Unassigned")
+        tags_input = self.prompt("Tags (comma-separated)", "feature, documentation")
+        self.feature_tags = [tag.strip() for tag in tags_input.split(",")]
+
+        # Generate derived properties from feature_name
+        self.script_name = self.slugify(self.feature_name)
+        self.class_name = ''.join(word.capitalize() for word in self.slugify(self.feature_name).split('_'))
+
+    def create_work_effort(self, with_devlog=True):
         """
         Step 1: Create a work effort document.
+
+        Args:
+            with_devlog (bool): Whether to add the devlog entry as well
+
+        Returns:
+            str: The filename of the work effort
         """
         print("\n=== Step 1: Create Work Effort Document ===\n")
 
         # Get feature information
         if not self.feature_name:  # Only prompt if feature_name not already set
-            self.feature_name = self.prompt("Feature name", "New Feature")
-            self.feature_title = self.prompt("Feature title", self.feature_name)
-            self.feature_description = self.prompt("Feature description", "A new feature for Code Conductor")
-            self.feature_priority = self.prompt("Priority (low, medium, high, critical)", "medium")
-            self.assignee = self.prompt("Assignee", "Unassigned")
-            tags_input = self.prompt("Tags (comma-separated)", "feature, documentation")
-            self.feature_tags = [tag.strip() for tag in tags_input.split(",")]
-
-            # Generate derived properties from feature_name
-            self.script_name = self.slugify(self.feature_name)
-            self.class_name = ''.join(word.capitalize() for word in self.slugify(self.feature_name).split('_'))
+            self.gather_feature_info()
 
         # Generate file name and paths
         work_effort_filename = f"{self.timestamp}_{self.script_name}.md"
         self.work_effort_path = os.path.join(self.active_dir, work_effort_filename)
 
-        # Get template content
-        template_content = self.get_template_content()
-
-        # Create a dictionary of replacements
-        replacements = {
-            "{{title}}": self.feature_title,
-            "{{status}}": self.status,
-            "{{priority}}": self.feature_priority,
-            "{{assignee}}": self.assignee,
-            "{{created}}": self.created,
-            "{{last_updated}}": self.last_updated,
-            "{{due_date}}": self.due_date,
-            "{{tags}}": ", ".join(self.feature_tags)
-        }
-
-        # Replace placeholders in the template
-        content = template_content
-        for placeholder, value in replacements.items():
-            content = content.replace(placeholder, value)
+        # Fill the placeholders in the template
+        content = self.get_template().render({
+            "title": self.feature_title,
+            "status": self.status,
+            "priority": self.feature_priority,
+            "assignee": self.assignee,
+            "created": self.created,
+            "last_updated": self.last_updated,
+            "due_date": self.due_date,
+            "tags": ", ".join(self.feature_tags)
+        })
 
         # Write the work effort file
         with open(self.work_effort_path, 'w') as f:
@@ -326,21 +383,24 @@ tags: [{{tags}}]
         print(f"✅ Created work effort document: {self.work_effort_path}")
 
         # Update the devlog
-        self.update_devlog(work_effort_filename)
+        if with_devlog:
+            self.update_devlog(work_effort_filename)
 
         return work_effort_filename
 
-    def update_devlog(self, work_effort_filename):
+    def update_devlog(self, work_effort_filename, render=True):
         """
         Update the devlog with a new entry.
 
+        The entry is appended to the devlog's entry journal. The devlog is
+        rendered from the journal, newest entry first, either straight away or
+        by render_logs() once the batch of steps is done.
+
         Args:
             work_effort_filename (str): The filename of the work effort
+            render (bool): Whether to render the devlog now
         """
         if os.path.exists(self.devlog_path):
-            with open(self.devlog_path, 'r') as f:
-                content = f.read()
-
             # Create new devlog entry
             new_entry = DEVLOG_ENTRY_TEMPLATE.format(
                 date=self.date,
@@ -349,11 +409,9 @@ tags: [{{tags}}]
                 work_effort_filename=work_effort_filename
             )
 
-            # Add to the beginning of the devlog
-            updated_content = "# Development Log\n\n" + new_entry + content[len("# Development Log"):]
-
-            with open(self.devlog_path, 'w') as f:
-                f.write(updated_content)
+            open_devlog(self.devlog_path).append(new_entry)
+            if render:
+                self.render_logs()
 
             print(f"✅ Updated devlog: {self.devlog_path}")
         else:
@@ -394,7 +452,7 @@ tags: [{{tags}}]
         # Run the script
         print(f"Executing {self.script_path}...")
         try:
-            result = subprocess.run(['python3', self.script_path], capture_output=True, text=True)
+            result = run_python(self.script_path, runner=self.warm_runner)
 
             print("\nExecution Results:")
             print("-" * 50)
@@ -411,8 +469,11 @@ tags: [{{tags}}]
             else:
                 print("\n⚠️ Script execution failed")
 
+            return result.returncode
+
         except Exception as e:
             print(f"Error executing script: {e}")
+            return None
 
     def document_results(self):
         """
@@ -472,9 +533,22 @@ tags: [{{tags}}]
 
         # Run the tests
         if self.interactive and self.prompt("Would you like to run the tests? (y/n)", "y").lower() == 'y':
-            print(f"Running tests in {self.test_path}...")
+            self.run_tests()
+
+        return self.test_path
+
+    def run_tests(self):
+        """
+        Run the tests affected by the script.
+
+        Returns:
+            bool: True if every test script passed
+        """
+        passed = True
+        for test_path in affected_tests(self.script_path, self.scripts_dir) or [self.test_path]:
+            print(f"Running tests in {test_path}...")
             try:
-                result = subprocess.run(['python3', self.test_path], capture_output=True, text=True)
+                result = run_python(test_path, runner=self.warm_runner)
 
                 print("\nTest Results:")
                 print("-" * 50)
@@ -490,11 +564,13 @@ tags: [{{tags}}]
                     print("\n✅ Tests passed")
                 else:
                     print("\n⚠️ Tests failed")
+                    passed = False
 
             except Exception as e:
                 print(f"Error running tests: {e}")
+                passed = False
 
-        return self.test_path
+        return passed
 
     def update_work_effort_status(self, new_status):
         """
@@ -510,21 +586,6 @@ tags: [{{tags}}]
             print(f"❌ Work effort not found at {self.work_effort_path}")
             return False
 
-        # Read the current content
-        with open(self.work_effort_path, 'r') as f:
-            content = f.read()
-
-        # Update the status in the content
-        # Use regex to replace status line in frontmatter
-        status_pattern = r'status: "(active|completed|archived|paused)"'
-        replacement = f'status: "{new_status}"'
-
-        if re.search(status_pattern, content):
-            updated_content = re.sub(status_pattern, replacement, content)
-        else:
-            print(f"❌ Status field not found in work effort document")
-            return False
-
         # Determine the target directory
         if new_status == "active":
             target_dir = self.active_dir
@@ -540,15 +601,10 @@ tags: [{{tags}}]
         filename = os.path.basename(self.work_effort_path)
         target_path = os.path.join(target_dir, filename)
 
-        # Write the updated content to the new location
+        # Patch the status in the frontmatter and move the file in one rename
         try:
-            # Create the updated file
-            with open(target_path, 'w') as f:
-                f.write(updated_content)
-
-            # If the target path is different from the current path, remove the old file
-            if target_path != self.work_effort_path:
-                os.remove(self.work_effort_path)
+            os.makedirs(target_dir, exist_ok=True)
+            patch_frontmatter(self.work_effort_path, {"status": new_status}, target_path=target_path)
 
             # Update the work effort path
             self.work_effort_path = target_path
@@ -560,9 +616,13 @@ tags: [{{tags}}]
             print(f"❌ Error updating work effort status: {str(e)}")
             return False
 
-    def update_documentation(self):
+    def update_documentation(self, validate=True, render=True):
         """
         Step 8: Update all documentation.
+
+        Args:
+            validate (bool): Whether to print the documentation checklist afterwards
+            render (bool): Whether to render the changelog now rather than in render_logs()
         """
         print("\n=== Step 8: Update All Documentation ===\n")
 
@@ -579,35 +639,35 @@ tags: [{{tags}}]
                 entry = input("- ")
 
                 if entry:
-                    with open(self.changelog_path, 'r') as f:
-                        content = f.read()
-
-                    # Find the Unreleased section and add entry
-                    if "## [Unreleased]" in content:
-                        # Find where to add the entry
-                        unreleased_pos = content.find("## [Unreleased]")
-                        added_pos = content.find("### Added", unreleased_pos)
+                    # Add the entry under "### Added" in the Unreleased section
+                    open_changelog(self.changelog_path).append(f"- {entry}", section="Added")
+                    if render:
+                        self.render_logs()
 
-                        if added_pos > -1:
-                            # Insert after "### Added" line
-                            insert_pos = content.find("\n", added_pos) + 1
-                            updated_content = (
-                                content[:insert_pos] +
-                                f"- {entry}\n" +
-                                content[insert_pos:]
-                            )
+                    print(f"✅ Updated CHANGELOG: {self.changelog_path}")
 
-                            with open(self.changelog_path, 'w') as f:
-                                f.write(updated_content)
+        # Validate documentation
+        if validate:
+            self.validate_documentation()
 
-                            print(f"✅ Updated CHANGELOG: {self.changelog_path}")
+    def render_logs(self):
+        """
+        Render the devlog and CHANGELOG from the entries appended to their journals.
 
-        # Validate documentation
-        self.validate_documentation()
+        Entries are only appended while the workflow runs, so each document is
+        rewritten once per run instead of once per entry.
+        """
+        for path, open_log in ((self.devlog_path, open_devlog), (self.changelog_path, open_changelog)):
+            log = open_log(path)
+            if os.path.exists(log.journal_path):
+                log.render()
 
     def validate_documentation(self):
         """
         Validate that all necessary documentation has been updated.
+
+        Returns:
+            bool: True if every document exists
         """
         checks = [
             ("Work Effort Document", os.path.exists(self.work_effort_path)),
@@ -625,17 +685,12 @@ tags: [{{tags}}]
             print("\n🎉 All required documentation has been created!")
         else:
             print("\n⚠️ Some documentation is missing. Please review and complete.")
+        return all(exists for _, exists in checks)
 
-    def run_workflow(self):
+    def add_context(self):
         """
-        Run the complete workflow process.
+        Step 2: Ask the user to add context and requirements to the work effort.
         """
-        print("\n🚀 Starting Code Conductor Workflow Process\n")
-
-        # 1. Create Work Effort Document
-        work_effort_filename = self.create_work_effort()
-
-        # 2. Add Context & Requirements
         print("\n=== Step 2: Add Context & Requirements ===\n")
         print(f"Please edit {self.work_effort_path} to add:")
         print("- Specific goals for this feature")
@@ -646,16 +701,10 @@ tags: [{{tags}}]
         if self.interactive:
             input("\nPress Enter when you've completed this step...")
 
-        # 3. Create Script or Code
-        self.create_script()
-
-        # 4. Execute & Test
-        self.execute_and_test()
-
-        # 5. Document Results
-        self.document_results()
-
-        # 6. Refine Until Successful
+    def refine(self):
+        """
+        Step 6: Ask the user to refine the script until it works.
+        """
         print("\n=== Step 6: Refine Until Successful ===\n")
         print("The script has been created and tested.")
         print("You should now:")
@@ -666,11 +715,114 @@ tags: [{{tags}}]
         if self.interactive:
             input("\nPress Enter when you're ready to proceed to adding tests...")
 
-        # 7. Add Tests
-        self.add_tests()
+    def workflow_state_path(self):
+        """
+        Get the path of the state file for this feature's workflow.
+
+        Returns:
+            str: Path to the JSON state file
+        """
+        return os.path.join(self.work_efforts_dir, WORKFLOW_STATE_DIR, f"{self.script_name}.json")
+
+    def workflow_context(self):
+        """
+        Get the attributes that identify this run, to be saved with the workflow state.
+
+        Returns:
+            dict: Attribute name -> value
+        """
+        return {name: getattr(self, name) for name in PERSISTED_ATTRIBUTES}
+
+    def build_workflow_steps(self):
+        """
+        Build the workflow as a dependency graph.
+
+        Each step lists the steps it needs and the values its result depends
+        on. Steps that prompt the user are exclusive in interactive mode so
+        prompts are never interleaved with the output of other steps.
+
+        Returns:
+            list: Step objects
+        """
+        def fields(*names):
+            return {name: getattr(self, name) for name in names}
+
+        prompts = self.interactive
+        return [
+            Step("work_effort", lambda: self.create_work_effort(with_devlog=False),
+                 inputs=lambda: dict(fields("feature_title", "feature_priority", "feature_tags", "assignee",
+                                            "script_name", "timestamp", "created", "due_date"),
+                                     template=self.get_template().source),
+                 outputs=lambda: [self.work_effort_path]),
+            Step("devlog", lambda: self.update_devlog(f"{self.timestamp}_{self.script_name}.md", render=False),
+                 deps=["work_effort"],
+                 inputs=lambda: fields("devlog_path", "date", "feature_title", "feature_description")),
+            Step("context", self.add_context, deps=["work_effort"], exclusive=prompts),
+            Step("script", self.create_script,
+                 inputs=lambda: dict(fields("feature_name", "feature_description", "script_name"),
+                                     template=SCRIPT_TEMPLATE),
+                 outputs=lambda: [self.script_path]),
+            Step("execute", self.execute_and_test, deps=["script"],
+                 inputs=lambda: {"script": file_digest(self.script_path)}),
+            Step("results", self.document_results, deps=["context", "execute"], exclusive=prompts),
+            Step("refine", self.refine, deps=["results"], exclusive=prompts),
+            # Without prompts the tests are written while the script runs
+            Step("tests", self.add_tests, deps=["script", "refine"] if prompts else ["script"],
+                 inputs=lambda: dict(fields("feature_name", "script_name", "class_name"),
+                                     template=TEST_TEMPLATE),
+                 outputs=lambda: [self.test_path],
+                 exclusive=prompts),
+            Step("documentation", lambda: self.update_documentation(validate=False, render=False),
+                 deps=["devlog", "results", "tests"], exclusive=prompts),
+            Step("validation", self.validate_documentation, deps=["documentation"], cache=False),
+        ]
 
-        # 8. Update All Documentation
-        self.update_documentation()
+    def run_workflow(self, max_workers=DEFAULT_MAX_WORKERS, restart=False):
+        """
+        Run the complete workflow process.
+
+        Args:
+            max_workers (int): Maximum number of steps to run at the same time
+            restart (bool): Ignore the saved state and run every step again
+
+        Returns:
+            int: 0 on success, 1 if a step failed
+        """
+        print("\n🚀 Starting Code Conductor Workflow Process\n")
+
+        if not self.feature_name:
+            self.gather_feature_info()
+
+        state_path = self.workflow_state_path()
+        if restart and os.path.exists(state_path):
+            os.remove(state_path)
+
+        executor = StepExecutor(self.build_workflow_steps(), state_path=state_path,
+                                max_workers=max_workers, snapshot=self.workflow_context)
+
+        # Resume the run recorded in the state so files keep their names
+        for name, value in executor.state.get("context", {}).items():
+            if name in PERSISTED_ATTRIBUTES:
+                setattr(self, name, value)
+        if not self.work_effort_path:
+            self.work_effort_path = os.path.join(self.active_dir, f"{self.timestamp}_{self.script_name}.md")
+        self.script_path = os.path.join(self.scripts_dir, f"{self.script_name}.py")
+        self.test_path = os.path.join(self.scripts_dir, f"test_{self.script_name}.py")
+
+        try:
+            report = executor.run()
+        finally:
+            self.render_logs()
+            if self.warm_runner:
+                self.warm_runner.close()
+
+        if report["skipped"]:
+            print(f"\n⏭️ Skipped unchanged steps: {', '.join(report['skipped'])}")
+        if report["failed"]:
+            name, error = report["failed"]
+            print(f"\n❌ Step '{name}' failed: {error}")
+            print(f"Run the workflow again to resume from the last completed step (state: {state_path})")
+            return 1
 
         print("\n🎉 Workflow process completed successfully!")
         print("\nCreated files:")
@@ -694,10 +846,16 @@ def main():
                         help="Run in non-interactive mode with default values")
     parser.add_argument("--feature-name", type=str,
                         help="Name of the feature to develop")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help="Maximum number of steps to run at the same time")
+    parser.add_argument("--restart", action="store_true",
+                        help="Ignore the saved state and run every step again")
+    parser.add_argument("--warm", action="store_true",
+                        help="Run scripts and tests in a warm, preloaded interpreter")
     args = parser.parse_args()
 
     # Create the workflow runner
-    runner = WorkflowRunner(interactive=not args.non_interactive)
+    runner = WorkflowRunner(interactive=not args.non_interactive, warm=args.warm)
 
     # Set feature name if provided
     if args.feature_name:
@@ -713,7 +871,7 @@ def main():
         print(f"Script will be created at: {os.path.join(runner.scripts_dir, f'{runner.script_name}.py')}")
 
     # Run the workflow
-    return runner.run_workflow()
+    return runner.run_workflow(max_workers=args.workers, restart=args.restart)
 
 
 if __name__ == "__main__":
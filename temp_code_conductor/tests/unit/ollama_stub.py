@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+A local stub of the Ollama HTTP API shared by the provider and streaming tests.
+
+The stub answers /api/tags with a fixed model list and /api/generate with either
+an echo of the prompt or the pieces set on the server, as one JSON object or as
+a chunked NDJSON stream. Attributes on the server control its behaviour:
+
+- delay: seconds to wait before answering a prompt
+- piece_delay: seconds to wait after each streamed piece
+- stall: event the stream waits on (up to 5 seconds) before its final record
+- pieces: response pieces, or None to echo the prompt word by word
+
+and record what happened: connections, requests and peak (the most prompts
+answered at once).
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+MODELS = ["phi4:latest", "llama3:8b"]
+
+
+class StubOllama(BaseHTTPRequestHandler):
+    """Answers a small part of the Ollama API."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, payload):
+        line = json.dumps(payload) + "\n"
+        self.wfile.write(f"{len(line):x}\r\n{line}\r\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.path == "/api/tags":
+            self._send_json(200, {"models": [{"name": name} for name in MODELS]})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(self.path)
+        if payload["model"] == "missing":
+            self._send_json(404, {"error": f"model '{payload['model']}' not found"})
+            return
+
+        with self.server.lock:
+            self.server.active += 1
+            self.server.peak = max(self.server.peak, self.server.active)
+        time.sleep(self.server.delay)
+        with self.server.lock:
+            self.server.active -= 1
+
+        pieces = self.server.pieces
+        if pieces is None:
+            words = ["Echo:"] + payload["prompt"].split()
+            pieces = [word if index == 0 else f" {word}" for index, word in enumerate(words)]
+        if not payload.get("stream"):
+            self._send_json(200, {"response": "".join(pieces), "done": True})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for piece in pieces:
+                self._write_chunk({"response": piece, "done": False})
+                time.sleep(self.server.piece_delay)
+            self.server.stall.wait(5)
+            self._write_chunk({"response": "", "done": True})
+            self.wfile.write(b"0\r\n\r\n")
+        except OSError:
+            # The client hung up once it had read what it needed
+            pass
+
+
+class StubOllamaMixin:
+    """Starts a stub Ollama server in setUp and stops it in tearDown."""
+
+    def setUp(self):
+        """Start a stub Ollama server at self.url."""
+        super().setUp()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubOllama)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.connections = 0
+        self.server.requests = []
+        self.server.active = 0
+        self.server.peak = 0
+        self.server.delay = 0
+        self.server.piece_delay = 0
+        self.server.stall = threading.Event()
+        self.server.stall.set()
+        self.server.pieces = None
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        """Release a stalled stream and stop the stub server."""
+        self.server.stall.set()
+        self.server.shutdown()
+        self.server.server_close()
+        super().tearDown()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for streaming AI work effort content, run against a local stub server.
+
+These tests cover:
+1. Picking JSON fields out of text that arrives in pieces
+2. Streaming a response over an asyncio connection
+3. Keeping the event loop running while content is generated
+4. Honouring the timeout in the middle of a stream
+5. Listing the installed models for the model prompt
+6. Closing the stream as soon as the JSON object is complete
+"""
+
+import io
+import socket
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from ollama_stub import StubOllamaMixin
+from src.code_conductor.providers import ollama
+from src.code_conductor.providers.ollama import OllamaClient, OllamaError, agenerate_stream
+from src.code_conductor.utils.json_stream import JSONFieldParser
+from src.code_conductor.work_efforts.scripts.ai_work_effort_creator import (
+    format_content,
+    generate_content_with_ollama,
+    get_available_ollama_models,
+)
+
+RESPONSE = ('Here is the {requested} content:\n```json\n{"objectives": ["Ship it", "Keep {braces} \\"quoted\\""], '
+            '"tasks": ["- [ ] Write code", "Test code"], "extra": {"nested": [1, 2]}, "notes": "- Note"}\n```\n'
+            'Let me know if you need anything else }')
+
+
+class TestAIContentStream(StubOllamaMixin, unittest.TestCase):
+    """Test streaming generation of work effort content."""
+
+    def setUp(self):
+        """Start a stub Ollama server that streams RESPONSE in small pieces."""
+        super().setUp()
+        self.server.pieces = [RESPONSE[i:i + 7] for i in range(0, len(RESPONSE), 7)]
+
+    def _generate(self, timeout):
+        """Generate content while a ticker task counts how often the loop ran it."""
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def run():
+            ticker = asyncio.create_task(tick())
+            try:
+                return await generate_content_with_ollama("Add streaming", model="phi3", timeout=timeout,
+                                                         use_cache=False)
+            finally:
+                ticker.cancel()
+
+        with patch.dict("os.environ", {"OLLAMA_HOST": self.url}), patch("sys.stdout", new_callable=io.StringIO):
+            return asyncio.run(run()), ticks
+
+    def test_parser_reports_fields_as_they_arrive(self):
+        """Fields are reported once complete, whatever the piece boundaries are."""
+        for size in (1, 3, 50):
+            seen = []
+            parser = JSONFieldParser(("objectives", "tasks", "notes"), on_field=lambda key, value: seen.append(key))
+            for i in range(0, len(RESPONSE), size):
+                done = parser.feed(RESPONSE[i:i + size])
+                if "notes" not in seen:
+                    self.assertFalse(done)
+            self.assertEqual(seen, ["objectives", "tasks", "notes"])
+            self.assertEqual(parser.result(), {
+                "objectives": ["Ship it", 'Keep {braces} "quoted"'],
+                "tasks": ["- [ ] Write code", "Test code"],
+                "notes": "- Note",
+            })
+
+        parser = JSONFieldParser()
+        parser.feed('{"objectives": ["one"], "tasks": ')
+        self.assertEqual(parser.result(), {"objectives": ["one"]})
+        self.assertEqual(format_content(["- [ ] Write code", "Test code"], "- [ ] "),
+                         "- [ ] Write code\n- [ ] Test code")
+
+    def test_async_stream(self):
+        """Pieces arrive in order over an asyncio connection; errors raise OllamaError."""
+        async def collect(model):
+            return [piece async for piece in agenerate_stream("prompt", model=model, host=self.url)]
+
+        self.assertEqual("".join(asyncio.run(collect("phi3"))), RESPONSE)
+        with self.assertRaises(OllamaError):
+            asyncio.run(collect("missing"))
+
+    def test_generation_does_not_block_the_loop(self):
+        """Other tasks run while tokens stream, and the stream stops once the JSON is complete."""
+        self.server.piece_delay = 0.01
+        self.server.stall.clear()
+        started = time.monotonic()
+        content, ticks = self._generate(timeout=10)
+
+        self.assertLess(time.monotonic() - started, 4)
+        self.assertEqual(sorted(content), ["notes", "objectives", "tasks"])
+        self.assertGreater(len(ticks), 10)
+        self.assertLess(max(b - a for a, b in zip(ticks, ticks[1:])), 0.5)
+
+    def test_timeout_mid_stream(self):
+        """The timeout cancels a stalled stream and keeps the fields already complete."""
+        self.server.pieces = ['{"objectives": ["Ship it"], "tasks": ["Wri']
+        self.server.stall.clear()
+        started = time.monotonic()
+        content, ticks = self._generate(timeout=0.3)
+
+        self.assertLess(time.monotonic() - started, 3)
+        self.assertEqual(content, {"objectives": ["Ship it"]})
+        self.assertTrue(ticks)
+
+    def test_stream_is_closed_on_break(self):
+        """The stream is closed by the loop that stopped reading it, not later by its finalizer."""
+        events = []
+
+        async def fake_stream(prompt, model="phi4", host=None):
+            try:
+                yield '{"objectives": ["Ship it"], "tasks": ["Write code"], "notes": ["Note"]}'
+                yield 'never read'
+            finally:
+                events.append("closed")
+
+        streams = []
+
+        def kept_stream(prompt, model="phi4", host=None):
+            # Keep a reference, so the stream can only be closed explicitly or at loop shutdown
+            streams.append(fake_stream(prompt, model, host))
+            return streams[-1]
+
+        async def run():
+            content = await generate_content_with_ollama("Add streaming", model="phi3", use_cache=False)
+            events.append("returned")
+            return content
+
+        with patch.object(ollama, "agenerate_stream", kept_stream), patch("sys.stdout", new_callable=io.StringIO):
+            content = asyncio.run(run())
+
+        self.assertEqual(sorted(content), ["notes", "objectives", "tasks"])
+        self.assertEqual(events, ["closed", "returned"])
+
+        async def aclosing_closes():
+            async with ollama.aclosing(fake_stream("prompt")) as stream:
+                async for _ in stream:
+                    break
+            return list(events)
+
+        events.clear()
+        self.assertEqual(asyncio.run(aclosing_closes()), ["closed"])
+
+    def test_available_models(self):
+        """Installed models are listed, and the defaults are offered when Ollama is unreachable."""
+        with patch.object(ollama, "_client", OllamaClient(self.url)):
+            self.assertEqual(get_available_ollama_models(), ["phi4:latest", "llama3:8b"])
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            unused = sock.getsockname()[1]
+        with patch.object(ollama, "_client", OllamaClient(f"http://127.0.0.1:{unused}", timeout=1)), \
+                patch("sys.stdout", new_callable=io.StringIO) as output:
+            self.assertEqual(get_available_ollama_models(), ["phi3", "llama3", "mistral"])
+        self.assertIn("Could not connect to Ollama", output.getvalue())
+        self.assertNotIn("not defined", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
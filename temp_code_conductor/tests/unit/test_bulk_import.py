@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the bulk JSON Lines work effort import.
+
+These tests cover:
+1. Creating numbered work efforts in their status directories
+2. Reporting bad lines without aborting the import
+3. Reserving numbers once and continuing after existing work efforts
+4. Updating the retrieval index in the same import
+5. Rendering work efforts from a markdown template
+"""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.code_conductor.work_efforts.bulk_import import import_work_efforts
+from src.code_conductor.work_efforts.counter import WorkEffortCounter
+from src.code_conductor.work_efforts.retrieval_index import RetrievalIndex
+
+
+def _jsonl(*records):
+    return io.StringIO(''.join((r if isinstance(r, str) else json.dumps(r)) + '\n' for r in records))
+
+
+class TestBulkImport(unittest.TestCase):
+    """Test importing work efforts from JSON Lines."""
+
+    def setUp(self):
+        """Create an empty work efforts directory."""
+        self.work_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.work_dir, 'active'))
+
+    def tearDown(self):
+        """Remove the work efforts directory."""
+        shutil.rmtree(self.work_dir)
+
+    def test_import_creates_numbered_files(self):
+        """Records become numbered files in the directory for their status."""
+        report = import_work_efforts(self.work_dir, _jsonl(
+            {'title': 'Login Page', 'priority': 'high', 'tags': 'ui, auth'},
+            {'title': 'Old Cleanup', 'status': 'completed'},
+        ), workers=2)
+
+        self.assertEqual(report['errors'], [])
+        self.assertEqual(report['created'], [os.path.join('active', '0001_login_page.md'),
+                                             os.path.join('completed', '0002_old_cleanup.md')])
+        with open(os.path.join(self.work_dir, 'active', '0001_login_page.md')) as f:
+            content = f.read()
+        self.assertIn('id: 0001_login_page', content)
+        self.assertIn('priority: high', content)
+        self.assertIn('tags: ui, auth', content)
+
+    def test_bad_lines_are_reported(self):
+        """Invalid lines are listed by line number and the rest are imported."""
+        report = import_work_efforts(self.work_dir, _jsonl(
+            {'title': 'First'},
+            'not json',
+            {'priority': 'high'},
+            '',
+            {'title': 'Bad Date', 'due_date': 'tomorrow'},
+            {'title': 'Last'},
+        ), batch_size=2)
+
+        self.assertEqual([line for line, _ in report['errors']], [2, 3, 5])
+        self.assertIn("title", report['errors'][1][1])
+        self.assertEqual(sorted(os.listdir(os.path.join(self.work_dir, 'active'))),
+                         ['0001_first.md', '0002_last.md'])
+
+    def test_single_reservation_after_existing_files(self):
+        """Numbering continues after existing work efforts with one counter update."""
+        with open(os.path.join(self.work_dir, 'active', '0007_existing.md'), 'w') as f:
+            f.write('---\ntitle: Existing\n---\n')
+
+        with patch.object(WorkEffortCounter, 'get_next_count') as get_next_count:
+            report = import_work_efforts(self.work_dir, _jsonl(*({'title': f'Task {i}'} for i in range(30))))
+        get_next_count.assert_not_called()
+
+        self.assertEqual(report['created'][0], os.path.join('active', '0008_task_0.md'))
+        self.assertEqual(report['created'][-1], os.path.join('active', '0037_task_29.md'))
+        counter = WorkEffortCounter(os.path.join(self.work_dir, '.code-conductor', 'counter.json'))
+        self.assertEqual(counter.get_current_count(), 38)
+
+    def test_index_is_updated(self):
+        """Imported work efforts are searchable without a refresh."""
+        import_work_efforts(self.work_dir, _jsonl({'title': 'Release Notes', 'assignee': 'ann'}))
+        index = RetrievalIndex(self.work_dir)
+        rel_path = os.path.join('active', '0001_release_notes.md')
+        self.assertIn(rel_path, index.entries)
+        self.assertEqual(index.entries[rel_path]['metadata']['assignee'], 'ann')
+
+    def test_import_with_template(self):
+        """Each record is rendered from the template given for the import."""
+        template_path = os.path.join(self.work_dir, 'template.md')
+        with open(template_path, 'w') as f:
+            f.write('---\ntitle: "{{title}}"\nstatus: "{{status}}"\ntags: [{{tags}}]\n---\n\n# {{id}}\n')
+
+        report = import_work_efforts(self.work_dir, _jsonl(
+            {'title': 'One', 'tags': ['a', 'b']},
+            {'title': 'Two', 'status': 'paused'},
+        ), template_path=template_path)
+
+        self.assertEqual(report['errors'], [])
+        with open(os.path.join(self.work_dir, 'active', '0001_one.md')) as f:
+            self.assertEqual(f.read(), '---\ntitle: "One"\nstatus: "active"\ntags: [a, b]\n---\n\n# 0001_one\n')
+        index = RetrievalIndex(self.work_dir)
+        self.assertEqual(index.entries[os.path.join('active', '0002_two.md')]['metadata']['status'], 'paused')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the memoized config resolver.
+
+These tests cover:
+1. One filesystem walk per start directory across every lookup helper
+2. Manifests taking precedence over _AI-Setup/config.json
+3. Re-resolving when a config file appears or changes
+4. Returned config data being safe to modify
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.code_conductor import config
+from src.code_conductor.cli import cli
+
+
+class TestConfigResolver(unittest.TestCase):
+    """Test memoized config discovery."""
+
+    def setUp(self):
+        """Create a project with a config and a nested working directory."""
+        self.project = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.project, "_AI-Setup", "config.json")
+        os.makedirs(os.path.join(self.project, "_AI-Setup", "work_efforts"))
+        self._write_json(self.config_file, {"version": "1", "work_managers": []})
+        self.subdir = os.path.join(self.project, "src", "pkg")
+        os.makedirs(self.subdir)
+
+        self.resolver = config.get_config_resolver()
+        self.resolver.reset()
+
+    def tearDown(self):
+        """Remove the project and clear the shared cache."""
+        shutil.rmtree(self.project)
+        self.resolver.reset()
+
+    def _write_json(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    def test_single_walk_per_process(self):
+        """Every helper in config.py and cli.py shares one walk and one parse."""
+        self.assertEqual(config.find_nearest_config(self.subdir)[0], self.config_file)
+        config.find_work_efforts_directory(self.subdir)
+        self.assertEqual(cli.find_nearest_config(self.subdir)[0], self.config_file)
+        self.assertEqual(cli.find_work_efforts_dir(self.subdir),
+                         os.path.join(self.project, "_AI-Setup", "work_efforts"))
+
+        self.assertEqual(self.resolver.counters["walks"], 1)
+        self.assertEqual(self.resolver.counters["parses"], 1)
+        self.assertEqual(self.resolver.counters["hits"], 4)
+
+    def test_manifest_takes_precedence(self):
+        """A manifest pointing at another setup directory wins."""
+        other = os.path.join(self.project, "tools", "setup", "config.json")
+        self._write_json(other, {"version": "manifest"})
+        self._write_json(os.path.join(self.project, ".code-conductor"), {"setup_path": os.path.join("tools", "setup")})
+
+        found, data = config.find_nearest_config(self.subdir)
+        self.assertEqual(found, other)
+        self.assertEqual(data["version"], "manifest")
+
+    def test_changes_are_detected(self):
+        """A nearer config or an edited config is picked up on the next lookup."""
+        config.find_nearest_config(self.subdir)
+        nearer = os.path.join(self.project, "src", "_AI-Setup", "config.json")
+        self._write_json(nearer, {"version": "nearer"})
+
+        self.assertEqual(config.find_nearest_config(self.subdir), (nearer, {"version": "nearer"}))
+        self.assertEqual(self.resolver.counters["walks"], 2)
+
+        config.save_json_file(nearer, {"version": "edited"})
+        self.assertEqual(config.find_nearest_config(self.subdir)[1], {"version": "edited"})
+
+    def test_returned_data_is_a_copy(self):
+        """Modifying returned data does not change the cache."""
+        _, data = config.find_nearest_config(self.subdir)
+        data["work_managers"].append({"name": "changed"})
+        self.assertEqual(config.find_nearest_config(self.subdir)[1]["work_managers"], [])
+
+    def test_missing_config(self):
+        """Without any config both helpers report nothing found."""
+        os.remove(self.config_file)
+        self.assertEqual(config.find_nearest_config(self.subdir), (None, {}))
+        self.assertEqual(cli.find_nearest_config(self.subdir), (None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
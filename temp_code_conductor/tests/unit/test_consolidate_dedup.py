@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for content-hash deduplication in the work effort consolidator.
+
+These tests cover:
+1. Collapsing identical files found in several work effort directories
+2. Reusing an identical file already at the destination instead of renaming
+3. Keeping differing files apart with a numeric suffix
+4. Hardlink copy mode
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.code_conductor.work_efforts.consolidate_work_efforts import WorkEffortConsolidator
+
+CONTENT = '---\ntitle: "Plan"\nstatus: active\n---\n\n# Plan\n'
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+class TestConsolidateDedup(unittest.TestCase):
+    """Test deduplicated copying of work effort files."""
+
+    def setUp(self):
+        """Create a project with two work effort directories."""
+        self.root = tempfile.mkdtemp()
+        self.dest = os.path.join(self.root, '_AI-Setup', 'work_efforts')
+        _write(os.path.join(self.root, 'a', 'work_efforts', 'plan.md'), CONTENT)
+        _write(os.path.join(self.root, 'b', 'work_efforts', 'plan.md'), CONTENT)
+        _write(os.path.join(self.root, 'b', 'work_efforts', 'copy_of_plan.md'), CONTENT)
+
+    def tearDown(self):
+        """Remove the project."""
+        shutil.rmtree(self.root)
+
+    def _consolidator(self, **kwargs):
+        return WorkEffortConsolidator(root_dir=self.root, dest_dir=self.dest, no_delete=True,
+                                      use_cache=False, **kwargs)
+
+    def _copy(self, consolidator):
+        return consolidator.copy_files(consolidator.find_work_effort_dirs())
+
+    def test_identical_files_are_collapsed(self):
+        """Three identical sources produce one destination file."""
+        consolidator = self._consolidator()
+        copied = self._copy(consolidator)
+
+        self.assertEqual(len(copied), 1)
+        self.assertEqual(len(consolidator.deduplicated_files), 2)
+        self.assertEqual(consolidator.bytes_saved, 2 * len(CONTENT))
+        self.assertEqual(os.listdir(os.path.join(self.dest, 'active')), ['plan.md'])
+
+    def test_rerun_reuses_identical_destination(self):
+        """A second run finds the identical destination file and copies nothing."""
+        self._copy(self._consolidator())
+        consolidator = self._consolidator()
+        copied = self._copy(consolidator)
+
+        self.assertEqual(copied, [])
+        self.assertEqual(len(consolidator.deduplicated_files), 3)
+        self.assertEqual(os.listdir(os.path.join(self.dest, 'active')), ['plan.md'])
+
+    def test_different_content_gets_suffix(self):
+        """A file with the same name but different content is still renamed."""
+        _write(os.path.join(self.root, 'b', 'work_efforts', 'plan.md'), CONTENT + '\nMore.\n')
+        self._copy(self._consolidator())
+
+        self.assertEqual(sorted(os.listdir(os.path.join(self.dest, 'active'))), ['plan.md', 'plan_1.md'])
+
+    def test_hardlink_mode(self):
+        """Hardlink mode links the destination to the source."""
+        consolidator = self._consolidator(copy_mode='hardlink')
+        (source, dest), = self._copy(consolidator)
+
+        self.assertTrue(os.path.samefile(source, dest))
+
+    def test_invalid_copy_mode(self):
+        """Unknown copy modes are rejected."""
+        with self.assertRaises(ValueError):
+            self._consolidator(copy_mode='teleport')
+
+
+if __name__ == "__main__":
+    unittest.main()
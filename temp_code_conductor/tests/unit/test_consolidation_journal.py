@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for resumable, journaled work effort consolidation.
+
+These tests cover:
+1. Resuming an interrupted run from the journal without recopying files
+2. Refusing to delete original directories when verification fails
+3. Removing the journal after a completed run
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.code_conductor.work_efforts.consolidate_work_efforts import WorkEffortConsolidator
+from src.code_conductor.work_efforts.consolidation_journal import ConsolidationJournal, JOURNAL_FILENAME
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+class TestConsolidationJournal(unittest.TestCase):
+    """Test the consolidation journal and resume logic."""
+
+    def setUp(self):
+        """Create a project with one work effort directory holding three files."""
+        self.root = tempfile.mkdtemp()
+        self.dest = os.path.join(self.root, '_AI-Setup', 'work_efforts')
+        self.source_dir = os.path.join(self.root, 'old', 'work_efforts')
+        for name in ('a.md', 'b.md', 'c.md'):
+            _write(os.path.join(self.source_dir, name), f'# {name}\n')
+        self.journal_path = os.path.join(self.dest, JOURNAL_FILENAME)
+
+    def tearDown(self):
+        """Remove the project."""
+        shutil.rmtree(self.root)
+
+    def _consolidator(self):
+        return WorkEffortConsolidator(root_dir=self.root, dest_dir=self.dest, force=True, use_cache=False)
+
+    def test_resume_after_interruption(self):
+        """An interrupted run is resumed and only the remaining files are copied."""
+        consolidator = self._consolidator()
+        original_place = consolidator._place_file
+        calls = []
+
+        def interrupt_after_first(source, dest):
+            if calls:
+                raise KeyboardInterrupt
+            calls.append(source)
+            return original_place(source, dest)
+
+        with patch.object(consolidator, '_place_file', side_effect=interrupt_after_first):
+            with self.assertRaises(KeyboardInterrupt):
+                consolidator.run()
+
+        self.assertTrue(os.path.isdir(self.source_dir))
+        state = ConsolidationJournal(self.journal_path).load()
+        self.assertEqual(len(state['copied']), 1)
+        self.assertFalse(state['committed'])
+
+        resumed = self._consolidator()
+        with patch.object(resumed, '_place_file', wraps=resumed._place_file) as place:
+            results = resumed.run()
+
+        self.assertEqual(place.call_count, 2)
+        self.assertEqual(results['copied_files'], 3)
+        self.assertEqual(results['deleted_dirs'], 1)
+        self.assertFalse(os.path.exists(self.source_dir))
+        self.assertFalse(os.path.exists(self.journal_path))
+        self.assertEqual(sorted(os.listdir(os.path.join(self.dest, 'active'))), ['a.md', 'b.md', 'c.md'])
+
+    def test_no_delete_without_verified_commit(self):
+        """If a destination does not match its planned hash, nothing is deleted."""
+        consolidator = self._consolidator()
+        with patch.object(consolidator, 'verify_copies', return_value=[os.path.join(self.dest, 'active', 'a.md')]):
+            self.assertIsNone(consolidator.run())
+
+        self.assertTrue(os.path.isdir(self.source_dir))
+        self.assertFalse(ConsolidationJournal(self.journal_path).load()['committed'])
+
+    def test_restart_discards_journal(self):
+        """With resume disabled a stale journal is replaced by a fresh plan."""
+        ConsolidationJournal(self.journal_path).start(self.root, self.dest, [], [])
+
+        consolidator = WorkEffortConsolidator(root_dir=self.root, dest_dir=self.dest, force=True,
+                                              use_cache=False, resume=False)
+        results = consolidator.run()
+
+        self.assertEqual(results['copied_files'], 3)
+        self.assertFalse(os.path.exists(self.journal_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
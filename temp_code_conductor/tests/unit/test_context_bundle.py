@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the token-budgeted context bundle builder.
+
+These tests cover:
+1. Splitting documents into prioritized sections, skipping fenced code blocks
+2. Following links by distance within a token budget
+3. Trimming low-priority sections first
+4. Serving cached bundles until an involved file changes
+5. Missing the cache when a link resolves to a newly created document
+6. Writing back the mtime of a touched but unchanged file
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from src.code_conductor.work_efforts.context_bundle import (
+    ContextBundleBuilder, estimate_tokens, split_sections, TRIM_MARKER
+)
+from src.code_conductor.work_efforts.retrieval_index import RetrievalIndex
+
+ROOT_DOC = """---
+title: "Root Effort"
+---
+# Root Effort
+
+## Notes
+
+{notes}
+
+## Objectives
+
+Finish the root effort. See [[child_effort]].
+
+## Tasks
+
+- [x] Finished item
+- [ ] Open item
+"""
+
+CHILD_DOC = """---
+title: "Child Effort"
+---
+# Child Effort
+
+## Objectives
+
+Support the root. See [[grandchild_effort]].
+"""
+
+GRANDCHILD_DOC = """# Grandchild Effort
+
+## Objectives
+
+Far away.
+"""
+
+
+class TestContextBundle(unittest.TestCase):
+    """Test building context bundles."""
+
+    def setUp(self):
+        """Create a chain of three linked work efforts."""
+        self.work_dir = tempfile.mkdtemp()
+        self.active = os.path.join(self.work_dir, 'active')
+        os.makedirs(self.active)
+        self.root = self._write('0001_root_effort.md', ROOT_DOC.format(notes='Short notes.'))
+        self._write('0002_child_effort.md', CHILD_DOC)
+        self._write('0003_grandchild_effort.md', GRANDCHILD_DOC)
+
+    def tearDown(self):
+        """Remove the work efforts directory."""
+        shutil.rmtree(self.work_dir)
+
+    def _write(self, name, content):
+        path = os.path.join(self.active, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def _build(self, **kwargs):
+        index = RetrievalIndex(self.work_dir)
+        index.refresh()
+        builder = ContextBundleBuilder(index, **kwargs)
+        return builder, ''.join(builder.build(self.root))
+
+    def test_split_sections(self):
+        """Sections get ranks and completed tasks are split off."""
+        title, sections = split_sections(ROOT_DOC.format(notes='n'))
+        self.assertEqual(title, 'Root Effort')
+        headings = {heading: rank for heading, _, rank in sections}
+        self.assertEqual(headings['Objectives'], 0)
+        self.assertEqual(headings['Tasks'], 1)
+        self.assertEqual(headings['Notes'], 3)
+        self.assertGreater(headings['Tasks (completed)'], headings['Notes'])
+
+        title, sections = split_sections('# Fenced\n\n## Notes\n\n```\n## Not a heading\n```\n')
+        self.assertEqual(title, 'Fenced')
+        self.assertEqual(sections, [('Notes', '```\n## Not a heading\n```\n', 3)])
+
+    def test_follows_links_within_depth(self):
+        """Linked efforts are included up to the maximum distance."""
+        _, bundle = self._build(max_depth=1, use_cache=False)
+        self.assertIn('Child Effort', bundle)
+        self.assertNotIn('Grandchild Effort', bundle)
+
+        _, bundle = self._build(max_depth=2, use_cache=False)
+        self.assertIn('Far away.', bundle)
+
+    def test_budget_keeps_objectives_and_open_tasks(self):
+        """Under a tight budget, long notes are trimmed and objectives and open tasks stay."""
+        self.root = self._write('0001_root_effort.md', ROOT_DOC.format(notes='\n'.join(['Lots of notes.'] * 200)))
+        _, bundle = self._build(token_budget=120, use_cache=False)
+
+        self.assertLessEqual(estimate_tokens(bundle), 120)
+        self.assertIn('Finish the root effort.', bundle)
+        self.assertIn('- [ ] Open item', bundle)
+        self.assertNotIn('Finished item', bundle)
+        self.assertIn(TRIM_MARKER.strip(), bundle)
+
+    def test_cache_until_file_changes(self):
+        """A repeated build is served from cache until an involved file changes."""
+        _, first = self._build()
+        builder, second = self._build()
+        self.assertTrue(builder.cache_hit)
+        self.assertEqual(first, second)
+
+        self._write('0002_child_effort.md', CHILD_DOC.replace('Support the root.', 'Support it differently.'))
+        builder, third = self._build()
+        self.assertFalse(builder.cache_hit)
+        self.assertIn('Support it differently.', third)
+
+    def test_cache_misses_when_link_target_appears(self):
+        """A link that did not resolve when the bundle was cached is checked again."""
+        self.root = self._write('0001_root_effort.md', ROOT_DOC.format(notes='See [[zephyr_quokka]].'))
+        self._build()
+        builder, _ = self._build()
+        self.assertTrue(builder.cache_hit)
+
+        self._write('0004_zephyr_quokka.md', '# Zephyr Quokka\n\n## Objectives\n\nBrand new.\n')
+        builder, bundle = self._build()
+        self.assertFalse(builder.cache_hit)
+        self.assertIn('Brand new.', bundle)
+
+    def test_touched_file_mtime_is_written_back(self):
+        """A file with a new mtime but the same content is served from cache and not hashed again."""
+        self._build()
+        child = os.path.join(self.active, '0002_child_effort.md')
+        os.utime(child, ns=(1_000_000_000, 1_000_000_000))
+
+        builder, _ = self._build()
+        self.assertTrue(builder.cache_hit)
+        cache_dir = os.path.join(self.work_dir, '.context_cache')
+        for name in os.listdir(cache_dir):
+            with open(os.path.join(cache_dir, name)) as f:
+                self.assertEqual(json.load(f)['files'][child][1], 1_000_000_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the append-only devlog and changelog entry log.
+
+These tests cover:
+1. Rendering devlog entries newest first below the title
+2. Keeping every entry when many writers append at once
+3. Keeping hand edits made to the document between renders
+4. Placing changelog entries under their Unreleased sections
+5. Compacting the journal so hand edits do not pile up copies of the document
+6. Not adding entries twice when a render stops before compacting
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.code_conductor.work_efforts import entry_log
+from src.code_conductor.work_efforts.entry_log import open_changelog, open_devlog
+
+CHANGELOG = "# Changelog\n\n## [Unreleased]\n\n### Added\n- Older feature\n\n## [1.0.0]\n\n### Added\n- First release\n"
+
+
+class TestEntryLog(unittest.TestCase):
+    """Test appending and rendering entries."""
+
+    def setUp(self):
+        """Create a devlog and a changelog."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.devlog_path = os.path.join(self.temp_dir, 'devlog.md')
+        self.changelog_path = os.path.join(self.temp_dir, 'CHANGELOG.md')
+        with open(self.devlog_path, 'w') as f:
+            f.write('# Development Log\n\nOld entry\n')
+        with open(self.changelog_path, 'w') as f:
+            f.write(CHANGELOG)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def _read(self, path):
+        with open(path) as f:
+            return f.read()
+
+    def test_devlog_newest_first(self):
+        """Entries appear below the title, newest first, above the existing content."""
+        devlog = open_devlog(self.devlog_path)
+        devlog.append('## First\n')
+        devlog.append('## Second\n')
+        self.assertEqual(self._read(self.devlog_path), '# Development Log\n\nOld entry\n')
+
+        self.assertTrue(devlog.render())
+        self.assertEqual(self._read(self.devlog_path),
+                         '# Development Log\n\n## Second\n\n## First\n\nOld entry\n')
+        self.assertFalse(devlog.render())
+
+    def test_append_does_not_read_the_document(self):
+        """Appending opens only the journal, however large the document is."""
+        devlog = open_devlog(self.devlog_path)
+        with patch.object(entry_log.os, 'open', wraps=os.open) as opened, \
+                patch('builtins.open', side_effect=AssertionError('document read')):
+            devlog.append('## Entry\n')
+        self.assertEqual([call.args[0] for call in opened.call_args_list], [devlog.journal_path])
+
+    def test_concurrent_appends_are_kept(self):
+        """Entries appended and rendered from many threads are all in the document."""
+        def write(worker):
+            devlog = open_devlog(self.devlog_path)
+            for i in range(25):
+                devlog.append(f'## Entry {worker}-{i}\n')
+                if i % 5 == 0:
+                    devlog.render()
+
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        open_devlog(self.devlog_path).render()
+
+        content = self._read(self.devlog_path)
+        self.assertEqual(content.count('## Entry '), 200)
+        self.assertEqual(open_devlog(self.devlog_path).entries(), [])
+
+    def test_hand_edits_are_kept(self):
+        """Editing the rendered document by hand is not undone by the next render."""
+        devlog = open_devlog(self.devlog_path)
+        devlog.append('## First\n')
+        devlog.render()
+
+        with open(self.devlog_path, 'a') as f:
+            f.write('Edited by hand\n')
+        devlog.append('## Second\n')
+        devlog.render()
+
+        self.assertEqual(self._read(self.devlog_path),
+                         '# Development Log\n\n## Second\n\n## First\n\nOld entry\nEdited by hand\n')
+
+        # A deleted document is rebuilt from the journal
+        os.remove(self.devlog_path)
+        self.assertTrue(devlog.render())
+        self.assertIn('Edited by hand', self._read(self.devlog_path))
+
+    def test_journal_is_compacted(self):
+        """After each render the journal holds one copy of the document, however often it is edited."""
+        with open(self.devlog_path, 'w') as f:
+            f.write('# Development Log\n\n' + 'Old entry\n' * 20000)
+        devlog = open_devlog(self.devlog_path)
+        for i in range(5):
+            devlog.append(f'## Entry {i}\n')
+            devlog.render()
+            with open(self.devlog_path, 'a') as f:
+                f.write(f'Edit {i}\n')
+
+        devlog.append('## Last\n')
+        self.assertEqual(len(devlog.entries()), 1)
+        devlog.render()
+        content = self._read(self.devlog_path)
+        self.assertTrue(content.startswith('# Development Log\n\n## Last\n\n## Entry 4\n'))
+        self.assertTrue(content.endswith('Edit 3\nEdit 4\n'))
+        self.assertLess(os.path.getsize(devlog.journal_path), 1.1 * len(content) + 200)
+
+    def test_interrupted_render(self):
+        """A render that wrote the document but not the compacted journal is finished, not repeated."""
+        devlog = open_devlog(self.devlog_path)
+        devlog.append('## First\n')
+        real_replace = devlog._replace
+
+        def stop_before_journal(path, text, mode=None):
+            if path == devlog.journal_path:
+                raise KeyboardInterrupt
+            real_replace(path, text, mode)
+
+        with patch.object(devlog, '_replace', side_effect=stop_before_journal):
+            with self.assertRaises(KeyboardInterrupt):
+                devlog.render()
+        devlog.render()
+
+        self.assertEqual(self._read(self.devlog_path), '# Development Log\n\n## First\n\nOld entry\n')
+        self.assertEqual(devlog.entries(), [])
+
+    def test_entry_appended_after_an_interrupted_render(self):
+        """An entry that lands after an interrupted render's pending record is rendered next time."""
+        devlog = open_devlog(self.devlog_path)
+        devlog.append('## First\n')
+        real_replace = devlog._replace
+
+        def stop_before_journal(path, text, mode=None):
+            if path == devlog.journal_path:
+                raise KeyboardInterrupt
+            real_replace(path, text, mode)
+
+        # Each interrupted render wrote the document; the next entry was waiting for the lock
+        for text in ('## Second\n', '## Third\n'):
+            with patch.object(devlog, '_replace', side_effect=stop_before_journal):
+                with self.assertRaises(KeyboardInterrupt):
+                    devlog.render()
+            devlog.append(text)
+
+        devlog.render()
+        self.assertEqual(self._read(self.devlog_path),
+                         '# Development Log\n\n## Third\n\n## Second\n\n## First\n\nOld entry\n')
+        self.assertEqual(devlog.entries(), [])
+
+    def test_changelog_sections(self):
+        """Entries go under their section in Unreleased, creating missing sections."""
+        changelog = open_changelog(self.changelog_path)
+        changelog.append('- New feature', section='Added')
+        changelog.append('- Reworked listing', section='Changed')
+        changelog.append('- Newest feature', section='Added')
+        changelog.render()
+
+        self.assertEqual(self._read(self.changelog_path),
+                         "# Changelog\n\n## [Unreleased]\n\n### Changed\n- Reworked listing\n\n"
+                         "### Added\n- Newest feature\n- New feature\n- Older feature\n\n"
+                         "## [1.0.0]\n\n### Added\n- First release\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
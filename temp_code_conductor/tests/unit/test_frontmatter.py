@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for frontmatter parsing and in-place frontmatter patching.
+
+These tests cover:
+1. Parsing fields, lists and wiki links from the frontmatter
+2. Finding sections while skipping fenced code blocks
+3. Rewriting only the changed keys and keeping the body byte for byte
+4. Keeping trailing comments, line endings and multi-line values of other keys
+5. Adding missing keys and frontmatter
+6. Moving a document in the same atomic write
+7. Reading wiki links the same way from inline lists, scalars and block lists
+8. Saying why unclosed frontmatter is rejected
+9. Recording a manager status change in the work effort index
+10. Overwriting a key line inside the file when the new line fits
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.code_conductor.core.work_effort.indexer import WorkEffortIndexer
+from src.code_conductor.core.work_effort.manager import WorkEffortManager
+from src.code_conductor.work_efforts import frontmatter
+from src.code_conductor.work_efforts.consolidate_work_efforts import WorkEffortConsolidator
+from src.code_conductor.work_efforts.frontmatter import (
+    decode, parse_document, patch_frontmatter, patch_frontmatter_in_place, read_document, scan_frontmatter
+)
+
+BODY = b"\n# Title\n\nstatus: \"active\" in the body stays.\n\xff\xfe raw bytes\n"
+
+
+DOCUMENT = (
+    "---\n"
+    "title: \"Login Page\" # shown in listings\n"
+    "status: active\n"
+    "tags: [ui, auth]\n"
+    "assignee:\n"
+    "related_efforts:\n"
+    "  - [[0001_setup]]\n"
+    "  - \"[[0002_design|Design]]\"\n"
+    "---\n"
+    "\n"
+    "# Login Page\n"
+    "\n"
+    "## Objectives\n"
+    "- Sign in\n"
+    "```\n"
+    "## Not a heading\n"
+    "```\n"
+    "### Detail\n"
+    "More\n"
+    "## Notes\n"
+    "Ünïcode\n"
+)
+
+
+class TestParseDocument(unittest.TestCase):
+    """Test the shared document parser."""
+
+    def test_fields(self):
+        """Scalars, inline lists, block lists and empty keys are parsed."""
+        document = parse_document(DOCUMENT, sections=False)
+        self.assertTrue(document.has_frontmatter)
+        self.assertEqual(document.fields, {
+            'title': 'Login Page',
+            'status': 'active',
+            'tags': ['ui', 'auth'],
+            'assignee': None,
+            'related_efforts': ['0001_setup', '0002_design'],
+        })
+        self.assertEqual(document.sections, [])
+
+    def test_wiki_link_forms(self):
+        """Inline lists, scalars and block lists all yield bare link targets."""
+        document = parse_document(
+            '---\n'
+            'inline: ["[[a]]", "[[b|B]]", plain]\n'
+            'scalar: "[[b]]"\n'
+            'pair: "[[a]], [[b]]"\n'
+            'prose: see [[a]] first\n'
+            'block:\n'
+            '  - [[a]]\n'
+            '  - "[[b]]"\n'
+            '---\n', sections=False)
+        self.assertEqual(document.fields, {
+            'inline': ['a', 'b', 'plain'],
+            'scalar': 'b',
+            'pair': ['a', 'b'],
+            'prose': 'see [[a]] first',
+            'block': ['a', 'b'],
+        })
+
+    def test_consolidation_merges_existing_links(self):
+        """Existing related_efforts links are kept once, whatever form they were written in."""
+        consolidator = WorkEffortConsolidator(root_dir=tempfile.gettempdir(), no_delete=True, use_cache=False)
+        related = [(None, 'a'), (None, 'c')]
+        for value in ('["[[a]]", "[[b]]"]', '"[[b]]"', '\n  - [[a]]\n  - [[b]]'):
+            with self.subTest(value=value):
+                content = f"---\ntitle: Plan\nrelated_efforts: {value}\n---\n\nBody\n".replace(': \n', ':\n')
+                updated = consolidator._add_links_to_document({'content': content, 'related': related, 'title': 'Plan'})
+                links = parse_document(updated, sections=False).fields['related_efforts']
+                self.assertEqual(sorted(links), ['a', 'b', 'c'])
+                self.assertNotIn('[[[[', updated)
+                self.assertTrue(updated.endswith('---\n\nBody\n'))
+
+    def test_sections_are_views(self):
+        """Sections skip fenced code and are memoryview slices of the document."""
+        document = parse_document(DOCUMENT)
+        self.assertEqual([(s.title, s.level) for s in document.sections],
+                         [('Login Page', 1), ('Objectives', 2), ('Detail', 3), ('Notes', 2)])
+
+        objectives = document.find_section('Objectives', level=2)
+        self.assertEqual(document.section_content(objectives),
+                         "- Sign in\n```\n## Not a heading\n```\n### Detail\nMore")
+        self.assertIsInstance(document.body, memoryview)
+        self.assertEqual(decode(document.section("Notes")).strip(), "Ünïcode")
+        self.assertIsNone(document.find_section('Missing'))
+
+    def test_documents_without_frontmatter(self):
+        """Plain markdown and unclosed frontmatter have no fields."""
+        for content in ("# Title\n\ntext\n", "---\ntitle: open\n# Title\n"):
+            with self.subTest(content=content):
+                document = parse_document(content)
+                self.assertFalse(document.has_frontmatter)
+                self.assertEqual(document.fields, {})
+                self.assertEqual(document.sections[0].title, 'Title')
+
+    def test_read_frontmatter_only(self):
+        """Reading only the frontmatter gives the same fields."""
+        work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, work_dir)
+        path = os.path.join(work_dir, 'doc.md')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(DOCUMENT)
+        self.assertEqual(read_document(path, frontmatter_only=True).fields,
+                         parse_document(DOCUMENT).fields)
+
+
+class TestFrontmatterPatch(unittest.TestCase):
+    """Test the frontmatter patch primitive."""
+
+    def setUp(self):
+        """Create a scratch directory."""
+        self.work_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.work_dir, 'doc.md')
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        shutil.rmtree(self.work_dir)
+
+    def _write(self, data):
+        with open(self.path, 'wb') as f:
+            f.write(data)
+
+    def _read(self, path=None):
+        with open(path or self.path, 'rb') as f:
+            return f.read()
+
+    def test_only_changed_keys_are_rewritten(self):
+        """The status line changes; other keys, comments and the body do not."""
+        header = (b"---\ntitle: 'Doc'\nstatus: 'active' # options: active, completed\n"
+                  b"tags:\n  - one\n  - two\n---\n")
+        self._write(header + BODY)
+
+        self.assertTrue(patch_frontmatter(self.path, {'status': 'completed'}))
+        self.assertEqual(self._read(), header.replace(b"'active'", b'"completed"') + BODY)
+        self.assertFalse(patch_frontmatter(self.path, {'status': 'completed'}))
+
+    def test_spans_and_line_endings(self):
+        """Multi-line values are replaced as a whole and CRLF endings are kept."""
+        self._write(b"---\r\ntags:\r\n  - one\r\nstatus: active\r\n---\r\nbody\r\n")
+        with open(self.path, 'rb') as f:
+            layout = scan_frontmatter(f)
+        self.assertEqual(set(layout.spans), {'tags', 'status'})
+
+        patch_frontmatter(self.path, {'tags': ['a', 'b'], 'updated_at': '2025-01-01'})
+        self.assertEqual(self._read(), b'---\r\ntags: ["a", "b"]\r\nstatus: active\r\n'
+                                       b'updated_at: "2025-01-01"\r\n---\r\nbody\r\n')
+
+    def test_missing_frontmatter_is_added(self):
+        """A document without frontmatter gets one in front of the unchanged body."""
+        self._write(BODY)
+        patch_frontmatter(self.path, {'status': 'paused'})
+        self.assertEqual(self._read(), b'---\nstatus: "paused"\n---\n\n' + BODY)
+
+    def test_move_and_fsync_policy(self):
+        """A target path moves the document; fsync follows the policy."""
+        self._write(b'---\nstatus: "active"\n---\n' + BODY)
+        target = os.path.join(self.work_dir, 'done.md')
+
+        with patch.object(frontmatter.os, 'fsync', wraps=os.fsync) as fsync:
+            patch_frontmatter(self.path, {'status': 'completed'}, target_path=target, fsync='full')
+        self.assertEqual(fsync.call_count, 3)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(self._read(target), b'---\nstatus: "completed"\n---\n' + BODY)
+        self.assertEqual([name for name in os.listdir(self.work_dir)], ['done.md'])
+
+        with self.assertRaises(ValueError):
+            patch_frontmatter(target, {'status': 'active'}, fsync='sometimes')
+
+    def test_patch_in_place(self):
+        """A line that fits is padded and overwritten in the same file; a longer one is refused."""
+        self._write(b'---\r\nstatus: "completed" # note\r\n---\r\n' + BODY)
+        inode = os.stat(self.path).st_ino
+        target = os.path.join(self.work_dir, 'archived.md')
+
+        self.assertTrue(patch_frontmatter_in_place(self.path, {'status': 'archived'}, target_path=target))
+        self.assertEqual(os.stat(target).st_ino, inode)
+        self.assertEqual(self._read(target), b'---\r\nstatus: "archived" # note \r\n---\r\n' + BODY)
+        self.assertEqual(read_document(target).fields['status'], 'archived')
+
+        self._write(b'---\nstatus: "active"\n---\n' + BODY)
+        self.assertFalse(patch_frontmatter_in_place(self.path, {'status': 'completed'}))
+        self.assertFalse(patch_frontmatter_in_place(self.path, {'priority': 'high'}))
+        self.assertEqual(self._read(), b'---\nstatus: "active"\n---\n' + BODY)
+
+    def test_unclosed_frontmatter_is_rejected(self):
+        """An unterminated frontmatter block is not rewritten."""
+        self._write(b'---\nstatus: active\n' + b'x: y\n' * (frontmatter.MAX_FRONTMATTER_BYTES // 5))
+        with self.assertRaisesRegex(ValueError, 'not closed within'):
+            patch_frontmatter(self.path, {'status': 'completed'})
+
+        self._write(b'---\nstatus: active\n\n# Title\n')
+        with self.assertRaisesRegex(ValueError, "no closing '---' line"):
+            patch_frontmatter(self.path, {'status': 'completed'})
+
+    def test_manager_status_change_is_indexed(self):
+        """WorkEffortManager.update_status moves the document and records the new status in its indexer."""
+        indexer = WorkEffortIndexer(self.work_dir)
+        manager = WorkEffortManager(
+            'default', self.work_dir, info=MagicMock(), config={'work_efforts_dir': os.path.join(self.work_dir, 'we')},
+            indexer=indexer, validator=MagicMock(**{'validate_status.return_value': True}), tracer=MagicMock(),
+            counter=MagicMock(), template=MagicMock(), event_emitter=MagicMock())
+        os.makedirs(manager.active_dir, exist_ok=True)
+        with open(os.path.join(manager.active_dir, '0001_task.md'), 'wb') as f:
+            f.write(b'---\ntitle: Task\nstatus: active\n---\n\nBody\n')
+        indexer.index_work_effort('0001_task', {'title': 'Task', 'status': 'active'})
+
+        self.assertTrue(manager.update_status('0001_task', 'completed'))
+        self.assertEqual(os.listdir(manager.completed_dir), ['0001_task.md'])
+        self.assertEqual(WorkEffortIndexer(self.work_dir).get_indexed_work_effort('0001_task')['status'], 'completed')
+
+
+if __name__ == "__main__":
+    unittest.main()
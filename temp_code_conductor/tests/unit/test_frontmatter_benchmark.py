@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parse-time budget tests for the shared document parser.
+
+These tests cover:
+1. Small, large and pathological documents parsing within a time budget
+2. Parse time growing linearly with the size of the document
+
+Each document is parsed repeatedly with timeit and the best run is compared
+against the budget. The budget can be raised on slow machines with
+CC_PARSE_BUDGET_MS.
+"""
+
+import os
+import timeit
+import unittest
+
+from src.code_conductor.work_efforts.frontmatter import parse_document
+
+PARSE_BUDGET_MS = float(os.environ.get('CC_PARSE_BUDGET_MS', '50'))
+SMALL_DOCUMENT = (
+    "---\ntitle: \"Small\"\nstatus: active\ntags: [a, b]\nrelated_efforts:\n  - [[0001_other]]\n---\n\n"
+    "# Small\n\n## Objectives\n- One\n\n## Notes\nText\n"
+)
+
+
+def _large_document(sections):
+    """A document with a full frontmatter and many sections, code blocks included."""
+    section = "## Section {0}\n" + "Some text for the section.\n" * 20 + "```\n## fenced\n```\n"
+    return SMALL_DOCUMENT + ''.join(section.format(i) for i in range(sections))
+
+
+def _best_ms(content, number=5):
+    """Best time in milliseconds of parsing content number times, over three runs."""
+    return min(timeit.repeat(lambda: parse_document(content), number=number, repeat=3)) * 1000 / number
+
+
+PATHOLOGICAL_DOCUMENTS = {
+    'unclosed frontmatter': "---\n" + "key: value\n" * 100000,
+    'whitespace body': "---\n" + " " * 1000000,
+    'dash lines': "---\n" + "--\n" * 300000,
+    'repeated frontmatter': "---\ntitle: x\n---\n" * 50000,
+    'unclosed fence': "```\n" + "## not a heading\n" * 50000,
+    'long heading': "# " + "x " * 500000,
+}
+
+
+class TestParseBudget(unittest.TestCase):
+    """Test parse cost of the shared document parser."""
+
+    def test_documents_parse_within_budget(self):
+        """Small, large and pathological documents parse within the budget."""
+        documents = dict(PATHOLOGICAL_DOCUMENTS, small=SMALL_DOCUMENT, large=_large_document(1000))
+        for name, content in documents.items():
+            with self.subTest(document=name):
+                elapsed_ms = _best_ms(content)
+                self.assertLess(elapsed_ms, PARSE_BUDGET_MS, f"{name} took {elapsed_ms:.1f} ms to parse")
+
+    def test_parse_time_is_linear(self):
+        """Parsing ten times the sections takes well under a hundred times as long."""
+        small_ms = _best_ms(_large_document(200))
+        large_ms = _best_ms(_large_document(2000))
+        self.assertLess(large_ms, small_ms * 30, f"{small_ms:.2f} ms grew to {large_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the streaming knowledge graph exporter.
+
+These tests cover:
+1. Maintaining the work node index as nodes are created
+2. Refreshing the index without re-reading unchanged files
+3. Exporting NDJSON, GraphML and GEXF
+4. Delta exports, and rejecting them for the XML formats
+5. Cleaning up the temporary output when an export fails
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from unittest.mock import patch
+
+from src.code_conductor.work_efforts import graph_export
+from src.code_conductor.work_efforts.create_work_node import WorkNodeManager
+from src.code_conductor.work_efforts.graph_export import WorkNodeIndex, export_graph
+
+
+class TestGraphExport(unittest.TestCase):
+    """Test the work node index and graph exporter."""
+
+    def setUp(self):
+        """Create a work directory with two documents and one node."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.work_dir = os.path.join(self.temp_dir, 'work_effort')
+        os.makedirs(self.work_dir)
+
+        for name, title in (('doc1.md', 'Document 1'), ('doc2.md', 'Document 2')):
+            with open(os.path.join(self.work_dir, name), 'w') as f:
+                f.write(f'---\ntitle: "{title}"\n---\n\n# {title}\n\nBody text.\n')
+
+        self.manager = WorkNodeManager(work_dir=self.work_dir)
+        self.node = self.manager.create_work_node(
+            title="Export Test",
+            category="test",
+            description="Node used by the export tests",
+            documents=["doc1.md", "doc2.md"]
+        )
+        self.output = os.path.join(self.temp_dir, 'graph.ndjson')
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_index_is_maintained_on_write(self):
+        """Creating a node records the node and the linked documents in the index."""
+        index = WorkNodeIndex(self.work_dir)
+        node_id = os.path.join('node', self.node.filename)
+
+        self.assertEqual(index.entries[node_id]['type'], 'node')
+        self.assertEqual(index.entries[node_id]['links']['connected_document'], ['doc1.md', 'doc2.md'])
+        self.assertEqual(index.entries['doc1.md']['links']['connected_node'], [self.node.filename])
+
+    def test_refresh_skips_unchanged_files(self):
+        """A refresh with no filesystem changes reads no frontmatter."""
+        index = WorkNodeIndex(self.work_dir)
+        index.refresh()
+
+        with patch.object(graph_export, 'read_frontmatter_fields') as reader:
+            self.assertEqual(index.refresh(), 0)
+            reader.assert_not_called()
+
+    def test_ndjson_export(self):
+        """NDJSON export emits one line per node and edge."""
+        stats = export_graph(WorkNodeIndex(self.work_dir), self.output, fmt='ndjson')
+
+        with open(self.output) as f:
+            records = [json.loads(line) for line in f]
+
+        self.assertEqual(stats['nodes'], 3)
+        self.assertEqual(stats['edges'], 2)
+        self.assertEqual(len(records), 5)
+        edges = [r for r in records if r['kind'] == 'edge']
+        self.assertEqual({e['target'] for e in edges}, {'doc1.md', 'doc2.md'})
+
+    def test_xml_exports_are_well_formed(self):
+        """GraphML and GEXF exports parse as XML with the expected element counts."""
+        for fmt, node_tag, edge_tag in (
+            ('graphml', '{http://graphml.graphdrawing.org/xmlns}node', '{http://graphml.graphdrawing.org/xmlns}edge'),
+            ('gexf', '{http://www.gexf.net/1.2draft}node', '{http://www.gexf.net/1.2draft}edge'),
+        ):
+            output = os.path.join(self.temp_dir, f'graph.{fmt}')
+            export_graph(WorkNodeIndex(self.work_dir), output, fmt=fmt)
+            root = ET.parse(output).getroot()
+            self.assertEqual(len(list(root.iter(node_tag))), 3)
+            self.assertEqual(len(list(root.iter(edge_tag))), 2)
+
+    def test_delta_export(self):
+        """A delta export only contains changed and deleted records."""
+        export_graph(WorkNodeIndex(self.work_dir), self.output, fmt='ndjson')
+
+        unchanged = export_graph(WorkNodeIndex(self.work_dir), self.output, fmt='ndjson', delta=True)
+        self.assertEqual(unchanged, {'nodes': 0, 'edges': 0, 'deleted': 0})
+
+        with open(os.path.join(self.work_dir, 'doc3.md'), 'w') as f:
+            f.write('---\ntitle: "Document 3"\n---\n')
+        os.remove(os.path.join(self.work_dir, 'doc2.md'))
+
+        stats = export_graph(WorkNodeIndex(self.work_dir), self.output, fmt='ndjson', delta=True)
+        with open(self.output) as f:
+            records = [json.loads(line) for line in f]
+
+        self.assertEqual(stats['nodes'], 1)
+        self.assertEqual(stats['deleted'], 1)
+        self.assertIn({'kind': 'node', 'op': 'delete', 'id': 'doc2.md'}, records)
+
+        # Edges are identified by their type as well as their endpoints
+        with open(self.output + graph_export.STATE_SUFFIX) as f:
+            state = json.load(f)
+        self.assertIn(f"node/{self.node.filename}-[node_to_document]->doc2.md", state['edge'])
+
+    def test_delta_rejected_for_xml(self):
+        """GraphML and GEXF cannot express deletions, so delta exports are refused."""
+        for fmt in ('graphml', 'gexf'):
+            output = os.path.join(self.temp_dir, f'graph.{fmt}')
+            export_graph(WorkNodeIndex(self.work_dir), output, fmt=fmt)
+            with self.assertRaises(ValueError):
+                export_graph(WorkNodeIndex(self.work_dir), output, fmt=fmt, delta=True)
+
+    def test_failed_export_leaves_no_temporary_file(self):
+        """A failed export removes its temporary file and keeps the previous output."""
+        export_graph(WorkNodeIndex(self.work_dir), self.output, fmt='ndjson')
+        with open(self.output) as f:
+            previous = f.read()
+
+        with patch.object(graph_export.GraphExporter, '_write_ndjson', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                export_graph(WorkNodeIndex(self.work_dir), self.output, fmt='ndjson')
+
+        self.assertFalse(os.path.exists(f"{self.output}.tmp"))
+        with open(self.output) as f:
+            self.assertEqual(f.read(), previous)
+
+    def test_unsupported_format(self):
+        """Unknown formats are rejected."""
+        with self.assertRaises(ValueError):
+            export_graph(WorkNodeIndex(self.work_dir), self.output, fmt='csv')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Import-time budget tests for the console script entry points.
+
+These tests cover:
+1. Each console script module importing within a time budget
+2. Heavy optional dependencies staying unloaded until a command needs them
+
+Each module is imported in a fresh interpreter with ``-X importtime``. The
+budget can be raised on slow machines with CC_IMPORT_BUDGET_MS.
+"""
+
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+IMPORT_BUDGET_MS = float(os.environ.get('CC_IMPORT_BUDGET_MS', '400'))
+CONSOLE_SCRIPT_MODULES = [
+    'code_conductor.cli.cli',
+    'code_conductor.scripts.cc_new',
+    'code_conductor.scripts.cc_trace',
+    'code_conductor.scripts.index_work_efforts',
+    'code_conductor.work_efforts.scripts.ai_work_effort_creator',
+]
+HEAVY_MODULES = ['rich', 'tabulate', 'yaml', 'requests']
+
+
+def _import_in_subprocess(module):
+    """Import module in a fresh interpreter and return (cumulative ms, loaded heavy modules)."""
+    check = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', check],
+        capture_output=True, text=True, env=env, cwd=SRC_DIR, timeout=60
+    )
+    if result.returncode != 0:
+        raise AssertionError(f"Importing {module} failed:\n{result.stderr}")
+
+    pattern = re.compile(rf"import time:\s+\d+ \|\s+(\d+) \|\s*{re.escape(module)}$")
+    cumulative_us = [int(match.group(1)) for match in map(pattern.search, result.stderr.splitlines()) if match]
+    loaded = [name for name in result.stdout.strip().split(',') if name]
+    return cumulative_us[-1] / 1000.0, loaded
+
+
+class TestImportBudget(unittest.TestCase):
+    """Test console script import cost."""
+
+    def test_console_scripts_import_within_budget(self):
+        """Every console script module imports within the budget without heavy dependencies."""
+        for module in CONSOLE_SCRIPT_MODULES:
+            with self.subTest(module=module):
+                elapsed_ms, loaded = _import_in_subprocess(module)
+                self.assertLess(elapsed_ms, IMPORT_BUDGET_MS,
+                                f"{module} took {elapsed_ms:.0f} ms to import")
+                self.assertEqual(loaded, [], f"{module} eagerly imported {loaded}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for batched frontmatter link patching.
+
+These tests cover:
+1. Inserting links into existing and missing frontmatter fields
+2. Merging links into inline lists and scalars, keeping CRLF line endings
+3. Rewriting each document once per run
+4. Dry-run diff output
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.code_conductor.work_efforts import link_patcher
+from src.code_conductor.work_efforts.create_work_node import WorkNodeManager
+from src.code_conductor.work_efforts.link_patcher import LinkPatchPlanner, add_links_to_frontmatter
+
+
+class TestAddLinksToFrontmatter(unittest.TestCase):
+    """Test the frontmatter patch function."""
+
+    def test_appends_to_existing_list(self):
+        content = '---\ntitle: "Doc"\nconnected_node:\n  - [[a.md]]\nstatus: active\n---\n\nBody\n'
+        patched = add_links_to_frontmatter(content, {'connected_node': ['b.md', 'a.md']}, 'doc')
+        self.assertEqual(
+            patched,
+            '---\ntitle: "Doc"\nconnected_node: ["[[a.md]]", "[[b.md]]"]\nstatus: active\n---\n\nBody\n'
+        )
+
+    def test_merges_inline_lists_and_scalars(self):
+        """Inline lists and scalars are merged into one valid inline list."""
+        for value in ('["[[a.md]]"]', '[[a.md]]', '"[[a.md]]"'):
+            content = f'---\r\nconnected_node: {value}\r\nstatus: active\r\n---\r\nBody\r\n'
+            patched = add_links_to_frontmatter(content, {'connected_node': ['b.md']}, 'doc')
+            self.assertEqual(
+                patched,
+                '---\r\nconnected_node: ["[[a.md]]", "[[b.md]]"]\r\nstatus: active\r\n---\r\nBody\r\n'
+            )
+
+    def test_adds_missing_field(self):
+        content = '---\ntitle: "Doc"\n---\nBody\n'
+        patched = add_links_to_frontmatter(content, {'connected_node': ['a.md']}, 'doc')
+        self.assertEqual(patched, '---\ntitle: "Doc"\nconnected_node: ["[[a.md]]"]\n---\nBody\n')
+
+    def test_creates_frontmatter(self):
+        patched = add_links_to_frontmatter('# Heading\n', {'connected_node': ['a.md']}, 'doc')
+        self.assertTrue(patched.startswith('---\ntitle: "doc"\nconnected_node: ["[[a.md]]"]\n---\n\n# Heading'))
+
+    def test_horizontal_rule_is_not_frontmatter(self):
+        content = '# Heading\n\n---\n\ntext\n'
+        patched = add_links_to_frontmatter(content, {'connected_node': ['a.md']}, 'doc')
+        self.assertTrue(patched.endswith(content))
+
+    def test_noop_when_links_present(self):
+        content = '---\nconnected_node:\n  - [[a.md]]\n---\n'
+        self.assertIs(add_links_to_frontmatter(content, {'connected_node': ['a.md']}, 'doc'), content)
+
+
+class TestLinkPatchPlanner(unittest.TestCase):
+    """Test batching of link additions."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.work_dir = os.path.join(self.temp_dir, 'work_effort')
+        os.makedirs(self.work_dir)
+        for name in ('doc1.md', 'doc2.md'):
+            with open(os.path.join(self.work_dir, name), 'w') as f:
+                f.write(f'---\ntitle: "{name}"\n---\n\nshared words about testing and python\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_one_write_per_document(self):
+        """A document linked from several nodes is rewritten once."""
+        manager = WorkNodeManager(work_dir=self.work_dir)
+        with patch.object(link_patcher, 'patch_frontmatter', wraps=link_patcher.patch_frontmatter) as writer:
+            for title in ('First', 'Second', 'Third'):
+                manager.create_work_node(title, 'test', '', ['doc1.md', 'doc2.md'], flush_links=False)
+            self.assertEqual(writer.call_count, 0)
+            manager.flush_links()
+            self.assertEqual(writer.call_count, 2)
+
+        with open(os.path.join(self.work_dir, 'doc1.md')) as f:
+            content = f.read()
+        self.assertEqual(content.count('[['), 3)
+
+    def test_dry_run_diff(self):
+        """Dry-run returns a unified diff and leaves the files untouched."""
+        planner = LinkPatchPlanner(self.work_dir)
+        planner.add_link('doc1.md', 'connected_node', 'node.md')
+
+        diffs = planner.apply(dry_run=True)
+
+        self.assertEqual(len(diffs), 1)
+        self.assertIn('--- a/doc1.md', diffs[0])
+        self.assertIn('+connected_node: ["[[node.md]]"]', diffs[0])
+        with open(os.path.join(self.work_dir, 'doc1.md')) as f:
+            self.assertNotIn('node.md', f.read())
+        self.assertEqual(len(planner), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the streaming work effort listing pipeline.
+
+These tests cover:
+1. Filtering by status, assignee and tag
+2. Heap-based top-k sorting matching a full sort
+3. Paging with offset and limit
+4. Producing the first row without consuming the whole input
+5. Parsing and matching selectors
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.code_conductor.work_efforts.listing import (
+    filter_work_efforts, list_work_efforts, paginate, parse_selector, select_work_efforts,
+    sort_work_efforts, SORT_KEYS
+)
+from src.code_conductor.work_efforts.work_effort_service import WorkEffortService
+
+
+def _record(i, priority='medium', status='active', assignee='ann', tags=()):
+    return {'path': f'active/{i:04d}.md', 'filename': f'{i:04d}.md', 'title': f'Effort {i:04d}',
+            'status': status, 'priority': priority, 'assignee': assignee, 'tags': list(tags), 'created': i,
+            'updated': 1_700_000_000 + i * 86400}
+
+
+class TestListingPipeline(unittest.TestCase):
+    """Test the generator stages."""
+
+    def setUp(self):
+        """Create records with mixed fields."""
+        priorities = ['low', 'critical', 'medium', 'high']
+        self.records = [_record(i, priority=priorities[i % 4], status='completed' if i % 3 == 0 else 'active',
+                                assignee='Bob' if i % 2 else 'ann', tags=['ui'] if i % 5 == 0 else [])
+                        for i in range(50)]
+
+    def test_filters(self):
+        """Every filter narrows the records, case-insensitively for assignee and tag."""
+        selected = list(filter_work_efforts(self.records, status='active', assignee='bob', tag='UI'))
+        self.assertEqual([r['created'] for r in selected], [5, 25, 35])
+
+    def test_heap_top_k_matches_full_sort(self):
+        """A limited sort returns the same leading records as a full sort."""
+        for sort_by in [key for key in SORT_KEYS if key != 'created']:
+            for reverse in (False, True):
+                full = list(sort_work_efforts(self.records, sort_by, reverse))
+                top = list(sort_work_efforts(iter(self.records), sort_by, reverse, limit=7))
+                self.assertEqual(top, full[:7], (sort_by, reverse))
+
+    def test_pagination(self):
+        """Offset and limit select a window, and negative values are rejected."""
+        page = list(list_work_efforts(self.records, sort_by='priority', offset=10, limit=5))
+        self.assertEqual(page, list(sort_work_efforts(self.records, 'priority'))[10:15])
+        with self.assertRaises(ValueError):
+            paginate(self.records, offset=-1)
+
+    def test_first_row_is_streamed(self):
+        """The default order yields the first row after reading only one record."""
+        consumed = []
+
+        def source():
+            for record in self.records:
+                consumed.append(record)
+                yield record
+
+        rows = list_work_efforts(source())
+        self.assertEqual(next(rows)['created'], 0)
+        self.assertEqual(len(consumed), 1)
+
+
+    def test_selectors(self):
+        """Equality, negation, tag membership and date comparisons combine with AND."""
+        selected = select_work_efforts(self.records, 'status:completed assignee!=BOB updated<2023-11-25')
+        self.assertEqual([r['created'] for r in selected], [0, 6])
+        selected = select_work_efforts(self.records, 'tags:ui priority=low')
+        self.assertEqual([r['created'] for r in selected], [0, 20, 40])
+
+    def test_invalid_selectors(self):
+        """Malformed terms, unknown fields and date operators on text fields are rejected."""
+        for selector in ('', 'status', 'owner:ann', 'priority<high', 'updated<yesterday'):
+            with self.assertRaises(ValueError, msg=selector):
+                parse_selector(selector)
+
+
+class TestServiceListing(unittest.TestCase):
+    """Test listing through the work effort service."""
+
+    def setUp(self):
+        """Create work efforts with template-style frontmatter."""
+        self.work_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.work_dir, 'active'))
+        for i, (priority, tags) in enumerate([('low', 'ui, api'), ('critical', 'api'), ('high', 'docs')]):
+            path = os.path.join(self.work_dir, 'active', f'000{i}_effort.md')
+            with open(path, 'w') as f:
+                f.write(f"---\ntitle: 'Effort {i}'\nstatus: 'active' # options: active, paused, completed\n"
+                        f"priority: '{priority}' # options: low, medium, high, critical\ntags: [{tags}]\n---\n")
+            os.utime(path, (1_700_000_000 + i, 1_700_000_000 + i))
+
+    def tearDown(self):
+        """Remove the work efforts directory."""
+        shutil.rmtree(self.work_dir)
+
+    def test_filter_sort_and_page(self):
+        """Template comments are ignored and inline tag lists can be filtered on."""
+        service = WorkEffortService(self.work_dir)
+        records = service.list_work_efforts(tag='api', sort_by='priority')
+        self.assertEqual([r['title'] for r in records], ['Effort 1', 'Effort 0'])
+        self.assertEqual(records[0]['status'], 'active')
+        self.assertEqual(len(service.list_work_efforts(offset=1, limit=1)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the .AI-Setup to _AI-Setup reference scanner and rewriter.
+
+These tests cover:
+1. Finding references with the memory-mapped scanner
+2. Skipping binary and empty files
+3. Rewriting references in a single pass while preserving line endings
+4. Dry-run mode leaving files untouched
+5. Rewriting gitignored files unless --gitignore is given
+6. Rewriting symlinked and hard-linked files through the link
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.code_conductor.utils import migrate_ai_setup
+from src.code_conductor.utils.migrate_ai_setup import AiSetupMigrator
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class TestMigrateReferences(unittest.TestCase):
+    """Test scanning and rewriting references."""
+
+    def setUp(self):
+        """Create files with and without references."""
+        self.root = tempfile.mkdtemp()
+        self.text = os.path.join(self.root, 'docs', 'guide.md')
+        self.script = os.path.join(self.root, 'run.sh')
+        self.binary = os.path.join(self.root, 'data.json')
+        self.plain = os.path.join(self.root, 'notes.txt')
+        _write(self.text, b'See .AI-Setup/work_efforts\r\nand .AI-Setup again\r\n')
+        _write(self.script, b'cd .AI-Setup\n')
+        _write(self.binary, b'\x00\x01.AI-Setup')
+        _write(self.plain, b'nothing here\n')
+        _write(os.path.join(self.root, 'empty.md'), b'')
+        os.chmod(self.script, 0o755)
+
+    def tearDown(self):
+        """Remove the temporary tree."""
+        shutil.rmtree(self.root)
+
+    def _migrator(self, **kwargs):
+        return AiSetupMigrator(root_dir=self.root, use_cache=False, **kwargs)
+
+    def test_find_skips_binary_files(self):
+        """Only text files with references are reported."""
+        self.assertEqual(self._migrator().find_files_with_references(), [self.text, self.script])
+
+    def test_migrate_rewrites_in_one_pass(self):
+        """Every reference is replaced, line endings and mode are kept, and no file is mapped twice."""
+        migrator = self._migrator()
+        with patch.object(migrate_ai_setup, '_open_mapped', wraps=migrate_ai_setup._open_mapped) as opener:
+            updated = migrator.migrate_references()
+
+        self.assertEqual(updated, [self.text, self.script])
+        self.assertEqual(_read(self.text), b'See _AI-Setup/work_efforts\r\nand _AI-Setup again\r\n')
+        self.assertEqual(_read(self.binary), b'\x00\x01.AI-Setup')
+        self.assertEqual(os.stat(self.script).st_mode & 0o777, 0o755)
+        opened = [call.args[0] for call in opener.call_args_list]
+        self.assertEqual(len(opened), len(set(opened)))
+        self.assertFalse([name for name in os.listdir(self.root) if name.endswith('.tmp')])
+
+    def test_large_file_is_streamed(self):
+        """References spanning chunk boundaries are all rewritten."""
+        data = (b'x' * 1000 + b'.AI-Setup') * 50
+        _write(self.plain, data)
+        with patch.object(migrate_ai_setup, 'COPY_CHUNK_SIZE', 64):
+            self._migrator().migrate_references()
+
+        self.assertEqual(_read(self.plain), data.replace(b'.AI-Setup', b'_AI-Setup'))
+
+    def test_dry_run_leaves_files_untouched(self):
+        """Dry run reports files without modifying them."""
+        updated = self._migrator(dry_run=True).migrate_references()
+
+        self.assertEqual(updated, [self.text, self.script])
+        self.assertIn(b'.AI-Setup', _read(self.text))
+
+    def test_gitignored_files_are_rewritten_by_default(self):
+        """Ignored files are only skipped when use_gitignore is requested."""
+        _write(os.path.join(self.root, '.gitignore'), b'run.sh\n')
+
+        self.assertEqual(self._migrator().find_files_with_references(), [self.text, self.script])
+        self.assertEqual(self._migrator(use_gitignore=True).find_files_with_references(), [self.text])
+
+    def test_links_are_rewritten_in_place(self):
+        """Symlinks and hard links still point at the rewritten file."""
+        target = os.path.join(self.root, 'shared.txt')
+        symlink = os.path.join(self.root, 'docs', 'link.md')
+        hardlink = os.path.join(self.root, 'copy.txt')
+        _write(target, b'cd .AI-Setup\n')
+        os.symlink(target, symlink)
+        os.link(self.script, hardlink)
+
+        self._migrator().migrate_references()
+
+        self.assertTrue(os.path.islink(symlink))
+        self.assertEqual(_read(target), b'cd _AI-Setup\n')
+        self.assertTrue(os.path.samefile(self.script, hardlink))
+        self.assertEqual(_read(hardlink), b'cd _AI-Setup\n')
+        self.assertFalse([name for name in os.listdir(self.root) if name.endswith('.tmp')])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the Ollama provider's HTTP client, run against a local stub server.
+
+These tests cover:
+1. Reusing one keep-alive connection for consecutive prompts
+2. Streaming a response piece by piece
+3. Caching the model list with a TTL
+4. Bounding the number of requests in flight
+5. Reporting an unreachable server
+"""
+
+import socket
+import threading
+import unittest
+from unittest.mock import patch
+
+from ollama_stub import StubOllamaMixin
+from src.code_conductor.providers import ollama
+from src.code_conductor.providers.ollama import OllamaClient, OllamaError
+
+
+class TestOllamaClient(StubOllamaMixin, unittest.TestCase):
+    """Test the pooled Ollama client."""
+
+    def setUp(self):
+        """Start a stub Ollama server and a client for it."""
+        super().setUp()
+        self.client = OllamaClient(self.url)
+
+    def tearDown(self):
+        """Close the client and stop the stub server."""
+        self.client.close()
+        super().tearDown()
+
+    def test_connection_is_reused(self):
+        """Consecutive prompts share one keep-alive connection."""
+        for i in range(5):
+            self.assertEqual(self.client.generate(f"prompt {i}"), f"Echo: prompt {i}")
+        self.assertEqual(self.server.connections, 1)
+
+        with self.assertRaises(OllamaError):
+            self.client.generate("hello", model="missing")
+        self.assertEqual(self.client.generate("again"), "Echo: again")
+
+    def test_streaming(self):
+        """A streamed response arrives in pieces and the connection is reused afterwards."""
+        pieces = list(self.client.generate_stream("one two three"))
+        self.assertEqual(pieces, ["Echo:", " one", " two", " three"])
+        self.assertEqual(self.client.generate("four"), "Echo: four")
+        self.assertEqual(self.server.connections, 1)
+
+    def test_model_list_is_cached(self):
+        """The model list is fetched once per TTL."""
+        self.assertTrue(self.client.has_model("phi4"))
+        self.assertTrue(self.client.has_model("llama3:8b"))
+        self.assertFalse(self.client.has_model("mistral"))
+        self.assertTrue(self.client.is_available())
+        self.assertEqual(self.server.requests.count("/api/tags"), 1)
+
+        self.client.model_ttl = 0
+        self.client.has_model("phi4")
+        self.assertEqual(self.server.requests.count("/api/tags"), 2)
+
+    def test_concurrency_is_bounded(self):
+        """No more than max_connections requests are in flight at once."""
+        client = OllamaClient(self.url, max_connections=2)
+        self.server.delay = 0.05
+        results = []
+        threads = [threading.Thread(target=lambda i=i: results.append(client.generate(f"p{i}")))
+                   for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.close()
+
+        self.assertEqual(sorted(results), [f"Echo: p{i}" for i in range(6)])
+        self.assertEqual(self.server.peak, 2)
+        self.assertEqual(self.server.connections, 2)
+
+    def test_provider_functions(self):
+        """The module functions use the shared client and report failures."""
+        with patch.object(ollama, "_client", OllamaClient(self.url)):
+            self.assertTrue(ollama.is_ollama_installed())
+            self.assertTrue(ollama.check_model_exists("phi4"))
+            streamed = []
+            with patch("builtins.print"):
+                self.assertEqual(ollama.get_ai_response("hi there", on_chunk=streamed.append), "Echo: hi there")
+            self.assertEqual(streamed, ["Echo:", " hi", " there"])
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            unused = sock.getsockname()[1]
+        with patch.object(ollama, "_client", OllamaClient(f"http://127.0.0.1:{unused}", timeout=1)):
+            self.assertFalse(ollama.is_ollama_installed())
+            with patch("builtins.print"):
+                self.assertEqual(ollama.get_ai_response("hi"), ollama.FAILED_RESPONSE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the gitignore-aware project walker.
+
+These tests cover:
+1. Gitignore pattern parsing and matching
+2. Pruning by .gitignore files at any level and by exclude globs
+3. Reusing cached directory listings between runs
+4. Walking a subdirectory with the ancestors' ignore rules applied
+5. Keeping the listing cache out of the project unless asked to
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.code_conductor.utils.project_walker import (
+    ProjectWalker, parse_gitignore, is_ignored, walk_cache_path, WALK_CACHE_PATH, WALK_CACHE_DIR_ENV
+)
+
+OLD_MTIME = 1_600_000_000
+
+
+def _touch(path, content='x'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+class TestGitignoreRules(unittest.TestCase):
+    """Test gitignore pattern parsing."""
+
+    def test_patterns(self):
+        """Unanchored, anchored, directory-only, double-star and negated patterns."""
+        rules = parse_gitignore("# comment\n*.log\n!keep.log\n/dist\nbuild/\ndocs/**/draft.md\n")
+
+        self.assertTrue(is_ignored('a/b/x.log', False, rules))
+        self.assertFalse(is_ignored('a/keep.log', False, rules))
+        self.assertTrue(is_ignored('dist', True, rules))
+        self.assertFalse(is_ignored('src/dist', True, rules))
+        self.assertTrue(is_ignored('src/build', True, rules))
+        self.assertFalse(is_ignored('src/build', False, rules))
+        self.assertTrue(is_ignored('docs/draft.md', False, rules))
+        self.assertTrue(is_ignored('docs/a/b/draft.md', False, rules))
+
+    def test_nested_base(self):
+        """Rules from a nested .gitignore only apply below their directory."""
+        rules = parse_gitignore("*.md\n", base='sub')
+
+        self.assertTrue(is_ignored('sub/a.md', False, rules))
+        self.assertFalse(is_ignored('a.md', False, rules))
+
+
+class TestProjectWalker(unittest.TestCase):
+    """Test walking a project tree."""
+
+    def setUp(self):
+        """Create a small project tree."""
+        self.root = tempfile.mkdtemp()
+        _touch(os.path.join(self.root, '.gitignore'), 'generated/\n')
+        _touch(os.path.join(self.root, 'src', 'main.md'))
+        _touch(os.path.join(self.root, 'src', 'main.md.bak'))
+        _touch(os.path.join(self.root, 'src', '.gitignore'), 'secret.md\n')
+        _touch(os.path.join(self.root, 'src', 'secret.md'))
+        _touch(os.path.join(self.root, 'generated', 'out.md'))
+        _touch(os.path.join(self.root, 'node_modules', 'pkg', 'readme.md'))
+        _touch(os.path.join(self.root, 'vendor', 'lib.md'))
+
+    def tearDown(self):
+        """Remove the project tree."""
+        shutil.rmtree(self.root)
+
+    def _files(self, walker, top=None):
+        return sorted(os.path.relpath(p, self.root) for p in walker.iter_files(['*.md'], top=top))
+
+    def test_prunes_ignored_paths(self):
+        """Ignored, excluded and backup paths are never returned."""
+        walker = ProjectWalker(self.root, exclude=['node_modules', '*.bak', 'vendor'])
+        self.assertEqual(self._files(walker), [os.path.join('src', 'main.md')])
+
+    def test_without_gitignore(self):
+        """Gitignore handling can be turned off."""
+        walker = ProjectWalker(self.root, exclude=[], use_gitignore=False)
+        self.assertIn(os.path.join('generated', 'out.md'), self._files(walker))
+        self.assertIn(os.path.join('src', 'secret.md'), self._files(walker))
+
+    def test_caller_can_prune(self):
+        """Removing a name from dirnames stops the walker descending into it."""
+        walker = ProjectWalker(self.root, exclude=[])
+        seen = []
+        for dirpath, dirnames, _ in walker.walk():
+            dirnames[:] = [d for d in dirnames if d != 'src']
+            seen.append(os.path.relpath(dirpath, self.root))
+        self.assertNotIn('src', seen)
+        self.assertIn('vendor', seen)
+
+    def test_walk_subdirectory_applies_ancestor_rules(self):
+        """Starting below the root still honours the root .gitignore."""
+        _touch(os.path.join(self.root, 'src', 'generated', 'x.md'))
+        walker = ProjectWalker(self.root)
+        self.assertEqual(self._files(walker, top=os.path.join(self.root, 'src')), [os.path.join('src', 'main.md')])
+
+    def test_listing_cache(self):
+        """Unchanged directories are served from the cache on the next run."""
+        for dirpath, dirnames, _ in os.walk(self.root):
+            os.utime(dirpath, (OLD_MTIME, OLD_MTIME))
+
+        first = ProjectWalker(self.root, cache_path='cache.json')
+        expected = self._files(first)
+        self.assertEqual(first.stats['cached'], 0)
+        self.assertTrue(os.path.exists(os.path.join(self.root, 'cache.json')))
+
+        second = ProjectWalker(self.root, cache_path='cache.json')
+        self.assertEqual(self._files(second), expected)
+        self.assertEqual(second.stats['listed'], 1)  # the root changed when cache.json was written
+
+        _touch(os.path.join(self.root, 'src', 'new.md'))
+        third = ProjectWalker(self.root, cache_path='cache.json')
+        self.assertIn(os.path.join('src', 'new.md'), self._files(third))
+
+    def test_cache_is_kept_out_of_the_project(self):
+        """By default the listings are cached per project in the user cache directory."""
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        other = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, other)
+        for dirpath, dirnames, _ in os.walk(self.root):
+            os.utime(dirpath, (OLD_MTIME, OLD_MTIME))
+
+        with patch.dict(os.environ, {WALK_CACHE_DIR_ENV: cache_dir}):
+            cache_path = walk_cache_path(self.root)
+            self.assertNotEqual(walk_cache_path(other), cache_path)
+            walker = ProjectWalker(self.root, cache_path=cache_path)
+            self._files(walker)
+
+        self.assertEqual(os.path.dirname(cache_path), cache_dir)
+        self.assertTrue(os.path.exists(cache_path))
+        self.assertFalse(os.path.exists(os.path.join(self.root, '.code_conductor')))
+        self.assertEqual(walk_cache_path(self.root, in_project=True), WALK_CACHE_PATH)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the disk-backed model response cache.
+
+These tests cover:
+1. Storing and finding responses by provider, model, prompt and parameters
+2. Expiring entries the TTL after they were written, however recently used
+3. Evicting the least recently used entries past the size cap
+4. Scanning the cache only when the cap may be crossed or every EVICT_INTERVAL writes
+5. Concurrent writers of one entry
+6. Answering repeated work effort content requests without calling the model
+7. Not caching an answer whose JSON object was cut short
+"""
+
+import io
+import os
+import time
+import shutil
+import asyncio
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.code_conductor.providers import ollama, response_cache
+from src.code_conductor.providers.response_cache import ResponseCache
+from src.code_conductor.utils import thought_process
+from src.code_conductor.work_efforts.scripts.ai_work_effort_creator import generate_content_with_ollama
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test the response cache."""
+
+    def setUp(self):
+        """Create a cache in a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = ResponseCache(self.temp_dir)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def _files(self):
+        return [name for _, _, names in os.walk(self.temp_dir) for name in names]
+
+    def test_get_and_put(self):
+        """Entries are found only for the same provider, model, prompt and parameters."""
+        key = self.cache.key("ollama", "phi3", "Describe the work")
+        self.assertIsNone(self.cache.get(key))
+        self.assertTrue(self.cache.put(key, {"objectives": ["One"]}))
+        self.assertEqual(self.cache.get(key), {"objectives": ["One"]})
+
+        self.assertEqual(key, ResponseCache.key("ollama", "phi3", "Describe the work"))
+        others = {
+            self.cache.key("openai", "phi3", "Describe the work"),
+            self.cache.key("ollama", "llama3", "Describe the work"),
+            self.cache.key("ollama", "phi3", "Describe the work again"),
+            self.cache.key("ollama", "phi3", "Describe the work", {"temperature": 0.2}),
+        }
+        self.assertNotIn(key, others)
+        self.assertEqual(len(others), 4)
+
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+        self.assertGreater(stats["bytes"], 0)
+
+    def test_ttl(self):
+        """An entry older than the TTL is a miss and is removed."""
+        key = self.cache.key("ollama", "phi3", "prompt")
+        self.cache.put(key, "response")
+        self.cache.ttl = 0
+        time.sleep(0.01)
+        self.assertIsNone(self.cache.get(key))
+        self.assertEqual(self._files(), [])
+
+    def test_ttl_counts_from_the_write(self):
+        """A recently used entry still expires, and lookups and eviction agree on when."""
+        keys = [self.cache.key("ollama", "phi3", f"prompt {i}") for i in range(2)]
+        for key in keys:
+            self.cache.put(key, "response")
+            written = time.time() - 100
+            os.utime(self.cache._path(key), (time.time(), written))
+        self.cache.ttl = 50
+
+        self.assertIsNone(self.cache.get(keys[0]))
+        self.assertEqual(self.cache.evict(), 1)
+        self.assertEqual(self._files(), [])
+
+    def test_eviction_is_not_run_on_every_write(self):
+        """Writes below the cap scan the cache once, then only every EVICT_INTERVAL writes."""
+        with patch.object(self.cache, "_entries", wraps=self.cache._entries) as scans:
+            for i in range(response_cache.EVICT_INTERVAL + 1):
+                self.cache.put(self.cache.key("ollama", "phi3", f"prompt {i}"), "x")
+        self.assertEqual(scans.call_count, 2)
+
+        self.cache.max_bytes = self.cache.stats()["bytes"]
+        with patch.object(self.cache, "_entries", wraps=self.cache._entries) as scans:
+            self.cache.put(self.cache.key("ollama", "phi3", "one more"), "x")
+        self.assertEqual(scans.call_count, 1)
+        self.assertLessEqual(self.cache.stats()["bytes"], self.cache.max_bytes)
+
+    def test_lru_eviction(self):
+        """Past the size cap, the least recently used entries are removed first."""
+        keys = [self.cache.key("ollama", "phi3", f"prompt {i}") for i in range(4)]
+        for i, key in enumerate(keys):
+            self.cache.put(key, "x" * 100)
+            path = self.cache._path(key)
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+        self.assertEqual(self.cache.get(keys[0]), "x" * 100)
+
+        self.cache.max_bytes = self.cache.stats()["bytes"]
+        self.cache.put(self.cache.key("ollama", "phi3", "prompt 4"), "x" * 100)
+
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self.assertIsNotNone(self.cache.get(keys[2]))
+        self.assertLessEqual(self.cache.stats()["bytes"], self.cache.max_bytes)
+
+    def test_concurrent_writers(self):
+        """Writers of the same entry replace each other without leaving partial files."""
+        key = self.cache.key("ollama", "phi3", "prompt")
+
+        def write(worker):
+            for i in range(20):
+                self.cache.put(key, {"worker": worker, "text": "y" * 1000})
+                self.assertEqual(self.cache.get(key)["text"], "y" * 1000)
+
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self._files(), [os.path.basename(self.cache._path(key))])
+
+    def test_repeated_generation_uses_the_cache(self):
+        """The second request for the same description returns without calling the model."""
+        calls = []
+
+        async def fake_stream(prompt, model="phi4", host=None):
+            calls.append(model)
+            yield '{"objectives": ["Ship it"], "tasks": ["Write code"], "notes": ["Note"]}'
+
+        async def generate_twice():
+            first = await generate_content_with_ollama("Add caching", model="phi3")
+            started = time.monotonic()
+            second = await generate_content_with_ollama("Add caching", model="phi3")
+            return first, second, time.monotonic() - started
+
+        with patch.object(response_cache, "_cache", self.cache), \
+                patch.object(ollama, "agenerate_stream", fake_stream), \
+                patch("sys.stdout", new_callable=io.StringIO):
+            first, second, elapsed = asyncio.run(generate_twice())
+
+        self.assertEqual(first, second)
+        self.assertEqual(calls, ["phi3"])
+        self.assertLess(elapsed, 0.1)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_truncated_answer_is_not_cached(self):
+        """Fields from a stream that ended before the object closed are used but not cached."""
+        async def truncated_stream(prompt, model="phi4", host=None):
+            yield '{"objectives": ["Ship it"], "tasks": ["Write code"], "notes": ["No'
+
+        for generate in (generate_content_with_ollama, thought_process.generate_content_with_ollama):
+            with patch.object(response_cache, "_cache", self.cache), \
+                    patch.object(ollama, "agenerate_stream", truncated_stream), \
+                    patch("sys.stdout", new_callable=io.StringIO):
+                content = asyncio.run(generate("Add caching", model="phi3"))
+            self.assertEqual(content, {"objectives": ["Ship it"], "tasks": ["Write code"]})
+        self.assertEqual(self._files(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
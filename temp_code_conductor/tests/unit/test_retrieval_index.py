@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the index-backed work effort retrieval.
+
+These tests cover:
+1. Ranking filename, title and fuzzy trigram matches
+2. Latest work efforts from the creation-time index
+3. Refreshing without opening unchanged files
+4. Picking up renamed and deleted work efforts
+5. Saving the index of an empty corpus, so it is not rebuilt on every query
+6. Keeping the creation time when a work effort is rewritten or renamed
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from src.code_conductor.work_efforts import retrieval_index
+from src.code_conductor.work_efforts.retrieval_index import RetrievalIndex, trigrams
+
+
+def _write(path, title):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(f'---\ntitle: "{title}"\n---\n\n# {title}\n')
+
+
+class TestRetrievalIndex(unittest.TestCase):
+    """Test the retrieval index."""
+
+    def setUp(self):
+        """Create a work efforts directory with three work efforts."""
+        self.work_dir = tempfile.mkdtemp()
+        self.files = {
+            'active/0001_database_migration.md': 'Database Migration',
+            'active/0002_login_page.md': 'Authentication Screen',
+            'completed/0003_release_notes.md': 'Release Notes',
+        }
+        for offset, (rel_path, title) in enumerate(self.files.items()):
+            path = os.path.join(self.work_dir, rel_path)
+            _write(path, title)
+            os.utime(path, (1_700_000_000 + offset, 1_700_000_000 + offset))
+
+    def tearDown(self):
+        """Remove the work efforts directory."""
+        shutil.rmtree(self.work_dir)
+
+    def _index(self):
+        index = RetrievalIndex(self.work_dir)
+        index.refresh()
+        return index
+
+    def test_trigrams(self):
+        """Trigrams are lowercased and padded."""
+        self.assertEqual(trigrams('Ab'), {'  a', ' ab', 'ab '})
+
+    def test_filename_match_ranks_first(self):
+        """A filename substring match beats fuzzy matches."""
+        results = self._index().search('login')
+        self.assertEqual(results[0][0], os.path.join('active', '0002_login_page.md'))
+
+    def test_title_and_fuzzy_match(self):
+        """Titles are searched and small typos still match."""
+        index = self._index()
+        self.assertEqual(index.search('authentication')[0][0], os.path.join('active', '0002_login_page.md'))
+        self.assertEqual(index.search('databse migraton')[0][0], os.path.join('active', '0001_database_migration.md'))
+        self.assertEqual(index.search('zzzzzz'), [])
+
+    def test_latest(self):
+        """Latest returns the newest entries first."""
+        index = self._index()
+        index.by_created = sorted((i, rel) for i, rel in enumerate(sorted(index.entries)))
+        self.assertEqual(index.latest(2), [os.path.join('completed', '0003_release_notes.md'),
+                                           os.path.join('active', '0002_login_page.md')])
+
+    def test_lookup_opens_no_files(self):
+        """A persisted index is reused without reading any work effort."""
+        self._index()
+
+        with patch.object(retrieval_index, 'read_frontmatter_fields') as reader:
+            index = RetrievalIndex(self.work_dir)
+            self.assertEqual(index.refresh(), 0)
+            self.assertTrue(index.search('release'))
+            reader.assert_not_called()
+
+    def test_refresh_tracks_changes(self):
+        """Deleted files leave the index and renamed titles are re-read."""
+        self._index()
+        os.remove(os.path.join(self.work_dir, 'completed', '0003_release_notes.md'))
+        _write(os.path.join(self.work_dir, 'active', '0002_login_page.md'), 'Sign In Flow')
+
+        index = RetrievalIndex(self.work_dir)
+        self.assertEqual(index.refresh(), 2)
+        self.assertEqual(index.search('release'), [])
+        self.assertEqual(index.search('sign in')[0][0], os.path.join('active', '0002_login_page.md'))
+        self.assertEqual(len(index.by_created), 2)
+
+    def test_empty_index_is_saved(self):
+        """An empty corpus is indexed once, then loaded without saving again."""
+        empty_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, empty_dir)
+        os.makedirs(os.path.join(empty_dir, 'active'))
+
+        self.assertEqual(RetrievalIndex(empty_dir).refresh(), 0)
+        self.assertTrue(os.path.exists(os.path.join(empty_dir, retrieval_index.INDEX_FILENAME)))
+
+        index = RetrievalIndex(empty_dir)
+        with patch.object(index, 'save') as save:
+            self.assertEqual(index.refresh(), 0)
+            save.assert_not_called()
+        self.assertEqual(index.search('anything'), [])
+
+    def test_created_survives_rewrites_and_renames(self):
+        """The frontmatter date, or the first-seen time, is kept when the file is replaced."""
+        dated = os.path.join(self.work_dir, 'active', '0004_dated.md')
+        with open(dated, 'w') as f:
+            f.write("---\ntitle: Dated\ncreated: '2024-01-02 03:04' # YYYY-MM-DD HH:mm\n---\n")
+        index = self._index()
+        rel_path = os.path.join('active', '0002_login_page.md')
+        first_seen = index.entries[rel_path]['created']
+        self.assertEqual(index.entries[os.path.join('active', '0004_dated.md')]['created'],
+                         datetime(2024, 1, 2, 3, 4).timestamp())
+
+        path = os.path.join(self.work_dir, rel_path)
+        _write(path + '.tmp', 'Sign In Flow')
+        os.replace(path + '.tmp', path)
+        os.utime(path, (1_800_000_000, 1_800_000_000))
+        self.assertEqual(index.refresh(), 1)
+        self.assertEqual(index.entries[rel_path]['created'], first_seen)
+
+        target = os.path.join('completed', '0002_login_page.md')
+        os.rename(path, os.path.join(self.work_dir, target))
+        index.rename_entry(rel_path, target, status='completed')
+        self.assertEqual(index.entries[target]['created'], first_seen)
+        index.update_paths([target])
+        self.assertEqual(index.entries[target]['created'], first_seen)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the streaming table renderer and pager.
+
+These tests cover:
+1. Sizing columns from fixed widths and a bounded sample of rows
+2. Writing rows in chunks while the source is still being read
+3. Plain output for pipes and coloured output for terminals
+4. Paging that reads and formats only the visible rows
+"""
+
+import io
+import unittest
+from unittest.mock import patch
+
+from src.code_conductor.utils.table_renderer import Pager, TableRenderer, render_table
+
+
+class FakeTerminal(io.StringIO):
+    """A text stream that claims to be a terminal."""
+
+    def isatty(self):
+        return True
+
+
+def _rows(count, title='Task'):
+    for i in range(count):
+        yield {'title': f'{title} {i}', 'status': 'completed' if i % 2 else 'active', 'priority': 'high'}
+
+
+class TestTableRenderer(unittest.TestCase):
+    """Test the table renderer."""
+
+    def test_widths_come_from_the_sample(self):
+        """Rows after the sample are cut to the sampled width instead of widening the table."""
+        renderer = TableRenderer(sample_size=3)
+        rows = list(_rows(3)) + [{'title': 'A title much longer than the sampled ones', 'status': 'active'}]
+        lines = list(renderer.iter_lines(rows))
+
+        self.assertEqual(renderer.widths, [6, 9, 8, 10, 10])
+        self.assertEqual(lines[0], 'Title   Status     Priority  Assignee    Due Date')
+        self.assertEqual(lines[-1], 'A tit…  active     none      unassigned  not set')
+        self.assertEqual(len({len(line) for line in lines[2:-1]}), 1)
+
+    def test_rows_are_streamed_in_chunks(self):
+        """The first chunk is written before the rest of the source is read."""
+        consumed = []
+
+        def source():
+            for row in _rows(1000):
+                consumed.append(row)
+                yield row
+
+        stream = io.StringIO()
+        writes = []
+        stream.write = lambda text: writes.append((len(consumed), text))
+        count = TableRenderer(sample_size=10, chunk_size=50).write(source(), stream)
+
+        self.assertEqual(count, 1000)
+        self.assertEqual(writes[0][0], 48)
+        self.assertEqual(sum(text.count('\n') for _, text in writes), 1002)
+
+    def test_plain_output_off_a_terminal(self):
+        """Pipes get plain text and terminals get coloured status cells."""
+        plain = io.StringIO()
+        render_table(_rows(2), stream=plain, pager=True)
+        self.assertNotIn('\033', plain.getvalue())
+        self.assertEqual(len(plain.getvalue().splitlines()), 4)
+
+        terminal = FakeTerminal()
+        with patch.dict('os.environ', {}, clear=True):
+            render_table(_rows(2), stream=terminal)
+        self.assertIn('\033[32mcompleted\033[0m', terminal.getvalue())
+
+    def test_empty_source_writes_nothing(self):
+        """No rows means no header either."""
+        stream = io.StringIO()
+        self.assertEqual(TableRenderer().write([], stream), 0)
+        self.assertEqual(stream.getvalue(), '')
+
+
+class TestPager(unittest.TestCase):
+    """Test the pager."""
+
+    def test_only_the_window_is_read_and_formatted(self):
+        """Paging reads rows as far as the user scrolls and formats one screen per draw."""
+        consumed = []
+
+        def source():
+            for row in _rows(100000):
+                consumed.append(row)
+                yield row
+
+        stream = FakeTerminal()
+        renderer = TableRenderer(sample_size=5)
+        pager = Pager(renderer, source(), stream=stream, height=13, keys=[' ', 'j', 'b', 'q'])
+        with patch.object(renderer, 'format_row', wraps=renderer.format_row) as format_row:
+            read = pager.run()
+
+        # Three rows of chrome leave ten rows per screen; four screens are drawn
+        self.assertEqual(format_row.call_count, 40)
+        self.assertLessEqual(read, 30)
+        self.assertLessEqual(len(consumed), 30)
+        screens = stream.getvalue().split('\033[H\033[2J')
+        self.assertIn('rows 11-20 of', screens[2])
+        self.assertIn('rows 12-21 of', screens[3])
+        self.assertIn('rows 2-11 of', screens[4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the compiled work effort template engine.
+
+These tests cover:
+1. Rendering placeholders and leaving unknown ones in place
+2. Reusing a compiled template until the file changes
+3. Rendering a batch without reading the template again
+4. Returning independent copies of cached JSON templates
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.code_conductor.work_efforts import template_engine
+from src.code_conductor.work_efforts.template_engine import TemplateCache, compile_template
+
+TEMPLATE = '---\ntitle: "{{title}}"\nstatus: "{{ status }}"\n---\n\n# {{title}}\n\n{{unknown}} stays\n'
+
+
+class TestTemplateEngine(unittest.TestCase):
+    """Test compiling, caching and rendering templates."""
+
+    def setUp(self):
+        """Create a template file."""
+        self.work_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.work_dir, 'work-effort-template.md')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(TEMPLATE)
+        self.cache = TemplateCache()
+
+    def tearDown(self):
+        """Remove the template directory."""
+        shutil.rmtree(self.work_dir)
+
+    def test_render(self):
+        """Known placeholders are filled and unknown ones are left alone."""
+        template = compile_template(TEMPLATE)
+        self.assertEqual(template.fields, {'title', 'status', 'unknown'})
+        self.assertEqual(template.render({'title': 'Login {{status}}', 'status': 'active'}),
+                         '---\ntitle: "Login {{status}}"\nstatus: "active"\n---\n\n'
+                         '# Login {{status}}\n\n{{unknown}} stays\n')
+
+    def test_cache_follows_mtime(self):
+        """The template is compiled once and again after the file changes."""
+        first = self.cache.get(self.path)
+        self.assertIs(self.cache.get(self.path), first)
+        self.assertEqual(self.cache.loads, 1)
+
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('# {{title}}\n')
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+        self.assertEqual(self.cache.get(self.path).render({'title': 'New'}), '# New\n')
+        self.assertEqual(self.cache.loads, 2)
+
+    def test_batch_reads_template_once(self):
+        """Rendering many records reads the template file once."""
+        records = [{'title': f'Task {i}', 'status': 'active'} for i in range(500)]
+        with patch.object(template_engine, 'open', create=True, wraps=open) as opened:
+            rendered = list(template_engine.render_many(self.path, records))
+            rendered += [template_engine.render_template(self.path, record) for record in records]
+        self.assertLessEqual(opened.call_count, 1)
+        self.assertEqual(len(rendered), 1000)
+        self.assertIn('# Task 499\n', rendered[499])
+
+    def test_json_templates_are_copied(self):
+        """Changing a loaded JSON template does not change the cached one."""
+        path = os.path.join(self.work_dir, 'default.json')
+        with open(path, 'w') as f:
+            json.dump({'title': '', 'tags': []}, f)
+
+        loaded = self.cache.get_json(path)
+        loaded['tags'].append('changed')
+        self.assertEqual(self.cache.get_json(path), {'title': '', 'tags': []})
+        self.assertEqual(self.cache.loads, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the warm script runner.
+
+These tests cover:
+1. Capturing output and exit codes like subprocess.run
+2. Picking up edits to a script's sibling modules between runs
+3. Killing scripts that run past their timeout, and not limiting them by default
+4. Selecting only the tests affected by a changed script
+5. Never preloading the project's own packages
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.code_conductor.workflow import warm_runner
+from src.code_conductor.workflow.warm_runner import WarmRunner, affected_tests, run_python, script_imports
+
+
+def _write(path, content):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), "requires os.fork")
+class TestWarmRunner(unittest.TestCase):
+    """Test running scripts in the warm runner."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start one runner for all tests."""
+        cls.runner = WarmRunner()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the runner."""
+        cls.runner.close()
+
+    def setUp(self):
+        """Create a scripts directory."""
+        self.scripts_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the scripts directory."""
+        shutil.rmtree(self.scripts_dir)
+
+    def test_output_and_exit_code(self):
+        """Output, arguments, exit codes and tracebacks come back as from subprocess.run."""
+        script = os.path.join(self.scripts_dir, 'feature.py')
+        _write(script, 'import sys\nprint("args", sys.argv[1:])\nprint("oops", file=sys.stderr)\nsys.exit(3)\n')
+        result = self.runner.run(script, ['--flag'], cwd=self.scripts_dir)
+
+        self.assertIsInstance(result, subprocess.CompletedProcess)
+        self.assertEqual(result.returncode, 3)
+        self.assertEqual(result.stdout, "args ['--flag']\n")
+        self.assertEqual(result.stderr, 'oops\n')
+
+        _write(script, 'raise ValueError("broken")\n')
+        result = self.runner.run(script)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn('ValueError: broken', result.stderr)
+
+    def test_edits_are_picked_up(self):
+        """Sibling modules are not cached by the server between runs."""
+        _write(os.path.join(self.scripts_dir, 'helper.py'), 'VALUE = 1\n')
+        script = os.path.join(self.scripts_dir, 'feature.py')
+        _write(script, 'import helper\nprint(helper.VALUE)\n')
+        self.assertEqual(self.runner.run(script).stdout, '1\n')
+
+        _write(os.path.join(self.scripts_dir, 'helper.py'), 'VALUE = 2\n')
+        self.assertEqual(self.runner.run(script).stdout, '2\n')
+
+    def test_timeout(self):
+        """A script that runs too long is killed and reported like subprocess.run."""
+        script = os.path.join(self.scripts_dir, 'slow.py')
+        _write(script, 'import time\nprint("started", flush=True)\ntime.sleep(30)\n')
+        with self.assertRaises(subprocess.TimeoutExpired) as raised:
+            self.runner.run(script, timeout=0.2)
+        self.assertEqual(raised.exception.output, 'started\n')
+
+        # The runner keeps serving after a timeout
+        _write(script, 'print("fast")\n')
+        self.assertEqual(self.runner.run(script).stdout, 'fast\n')
+
+        # Without a timeout, warm and cold runs wait for the script like subprocess.run
+        self.assertIsNone(warm_runner.DEFAULT_TIMEOUT)
+        with patch.object(warm_runner.subprocess, 'run', wraps=subprocess.run) as cold:
+            self.assertEqual(run_python(script).stdout, 'fast\n')
+        self.assertIsNone(cold.call_args.kwargs['timeout'])
+
+    def test_project_packages_are_not_preloaded(self):
+        """A package from the project's source tree is imported fresh by every run."""
+        project_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, project_dir)
+        os.makedirs(os.path.join(project_dir, 'projectpkg'))
+        _write(os.path.join(project_dir, 'projectpkg', '__init__.py'), 'VALUE = 1\n')
+        script = os.path.join(self.scripts_dir, 'feature.py')
+        _write(script, 'import json\nimport projectpkg\nprint(projectpkg.VALUE)\n')
+
+        with patch.dict(os.environ, {'PYTHONPATH': project_dir}):
+            with WarmRunner() as runner:
+                self.assertEqual(runner.run(script).stdout, '1\n')
+                _write(os.path.join(project_dir, 'projectpkg', '__init__.py'), 'VALUE = 22\n')
+                self.assertEqual(runner.run(script).stdout, '22\n')
+
+
+class TestAffectedTests(unittest.TestCase):
+    """Test selecting the tests affected by a change."""
+
+    def setUp(self):
+        """Create scripts and tests that import each other."""
+        self.scripts_dir = tempfile.mkdtemp()
+        files = {
+            'helper.py': 'VALUE = 1\n',
+            'feature.py': 'import os\nimport helper\n',
+            'other.py': 'import json\n',
+            'test_feature.py': 'import unittest\nimport feature\n',
+            'test_helper.py': 'from helper import VALUE\n',
+            'test_other.py': 'import other\n',
+        }
+        for name, content in files.items():
+            _write(os.path.join(self.scripts_dir, name), content)
+
+    def tearDown(self):
+        """Remove the scripts directory."""
+        shutil.rmtree(self.scripts_dir)
+
+    def _names(self, changed):
+        return [os.path.basename(path) for path in affected_tests(os.path.join(self.scripts_dir, changed))]
+
+    def test_selection(self):
+        """Tests are selected through direct and indirect imports."""
+        self.assertEqual(self._names('helper.py'), ['test_feature.py', 'test_helper.py'])
+        self.assertEqual(self._names('feature.py'), ['test_feature.py'])
+        self.assertEqual(self._names('test_other.py'), ['test_other.py'])
+        self.assertEqual(script_imports(os.path.join(self.scripts_dir, 'feature.py')), ['os', 'helper'])
+
+
+if __name__ == "__main__":
+    unittest.main()
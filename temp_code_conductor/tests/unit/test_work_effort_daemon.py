@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the work effort service and the ``code-conductor serve`` daemon.
+
+These tests cover:
+1. Listing, searching and finding work efforts from the indexes
+2. Changing status without touching the rest of the document, one at a time
+   or for every work effort matching a selector
+3. Answering JSON-RPC requests over the Unix socket, telling bad parameters
+   apart from errors raised by the method
+4. Falling back to the in-process service when no daemon is running
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.code_conductor.cli import daemon as daemon_module
+from src.code_conductor.cli.daemon import (
+    DaemonClient, WorkEffortDaemon, connect_service, daemon_available, socket_path_for
+)
+from src.code_conductor.work_efforts.work_effort_service import WorkEffortService
+
+DOCUMENT = """---
+title: "{title}"
+status: "active"
+priority: "high"
+---
+
+# {title}
+
+Body text stays as it is.
+"""
+
+
+class TestWorkEffortService(unittest.TestCase):
+    """Test the in-process service."""
+
+    def setUp(self):
+        """Create a work efforts directory with two active work efforts."""
+        self.work_dir = tempfile.mkdtemp()
+        for name, title in [('0001_login_page.md', 'Login Page'), ('0002_release.md', 'Release Notes')]:
+            path = os.path.join(self.work_dir, 'active', name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(DOCUMENT.format(title=title))
+        self.service = WorkEffortService(self.work_dir)
+
+    def tearDown(self):
+        """Remove the work efforts directory."""
+        shutil.rmtree(self.work_dir)
+
+    def test_list_and_search(self):
+        """Records carry list fields and searches rank by name."""
+        records = self.service.list_work_efforts()
+        self.assertEqual({record['title'] for record in records}, {'Login Page', 'Release Notes'})
+        self.assertEqual(records[0]['priority'], 'high')
+        self.assertEqual(self.service.search('login')[0]['path'], os.path.join('active', '0001_login_page.md'))
+        self.assertEqual(len(self.service.find('release')), 1)
+
+    def test_update_status_moves_and_keeps_body(self):
+        """The status line changes, the file moves and the body is untouched."""
+        updated = self.service.update_status(os.path.join('active', '0002_release.md'), 'completed')
+
+        self.assertEqual(updated['path'], os.path.join('completed', '0002_release.md'))
+        self.assertEqual(updated['status'], 'completed')
+        with open(os.path.join(self.work_dir, updated['path'])) as f:
+            content = f.read()
+        self.assertEqual(content, DOCUMENT.format(title='Release Notes').replace('"active"', '"completed"'))
+        self.assertFalse(os.path.exists(os.path.join(self.work_dir, 'active', '0002_release.md')))
+        self.assertEqual(self.service.list_work_efforts(status='completed')[0]['title'], 'Release Notes')
+
+    def test_transition_renames_the_file(self):
+        """A status line that fits is patched in place and the same file is renamed."""
+        path = os.path.join(self.work_dir, 'active', '0002_release.md')
+        inode = os.stat(path).st_ino
+
+        with patch('src.code_conductor.work_efforts.work_effort_service.patch_frontmatter') as rewrite:
+            updated = self.service.update_status(os.path.join('active', '0002_release.md'), 'paused')
+            rewrite.assert_not_called()
+        self.assertEqual(os.stat(os.path.join(self.work_dir, updated['path'])).st_ino, inode)
+        self.assertEqual(updated['status'], 'paused')
+
+        updated = self.service.update_status(updated['path'], 'completed')
+        self.assertEqual(updated['path'], os.path.join('completed', '0002_release.md'))
+        with open(os.path.join(self.work_dir, updated['path'])) as f:
+            self.assertEqual(f.read(), DOCUMENT.format(title='Release Notes').replace('"active"', '"completed"'))
+
+    def test_update_status_rejects_unknown_status(self):
+        """Invalid statuses raise ValueError."""
+        with self.assertRaises(ValueError):
+            self.service.update_status(os.path.join('active', '0002_release.md'), 'done')
+
+    def test_transition_moves_matching_work_efforts(self):
+        """Matches are renamed into the new directory with only the status line changed."""
+        result = self.service.transition('status:active title!="login page"', 'archived')
+
+        self.assertEqual(result['errors'], [])
+        self.assertEqual([r['path'] for r in result['moved']], [os.path.join('archived', '0002_release.md')])
+        with open(os.path.join(self.work_dir, 'archived', '0002_release.md')) as f:
+            self.assertEqual(f.read(), DOCUMENT.format(title='Release Notes').replace('"active"', '"archived"'))
+        self.assertEqual([r['title'] for r in self.service.list_work_efforts(status='archived')], ['Release Notes'])
+
+        with patch.object(self.service.index, 'save', wraps=self.service.index.save) as save:
+            result = self.service.transition('status:active', 'completed')
+        self.assertEqual(result['moved'][0]['status'], 'completed')
+        save.assert_called_once()
+        self.assertEqual(WorkEffortService(self.work_dir).list_work_efforts(status='completed')[0]['title'], 'Login Page')
+
+    def test_transition_reports_conflicts(self):
+        """A taken target is reported and the other matches still move."""
+        os.makedirs(os.path.join(self.work_dir, 'completed'))
+        with open(os.path.join(self.work_dir, 'completed', '0001_login_page.md'), 'w') as f:
+            f.write('taken')
+        result = self.service.transition('status:active', 'completed')
+        self.assertEqual([path for path, _ in result['errors']], [os.path.join('active', '0001_login_page.md')])
+        self.assertEqual(len(result['moved']), 1)
+        with self.assertRaises(ValueError):
+            self.service.transition('owner:ann', 'completed')
+
+    def test_new_files_are_seen(self):
+        """Adding a work effort is picked up without an explicit refresh."""
+        with open(os.path.join(self.work_dir, 'active', '0003_new.md'), 'w') as f:
+            f.write(DOCUMENT.format(title='Brand New'))
+        self.assertEqual(self.service.find('brand')[0]['title'], 'Brand New')
+
+
+@unittest.skipUnless(daemon_available(), "Unix domain sockets are not available")
+class TestWorkEffortDaemon(unittest.TestCase):
+    """Test the daemon and its thin client."""
+
+    def setUp(self):
+        """Start a daemon on a temporary work efforts directory."""
+        self.work_dir = tempfile.mkdtemp()
+        path = os.path.join(self.work_dir, 'active', '0001_login_page.md')
+        os.makedirs(os.path.dirname(path))
+        with open(path, 'w') as f:
+            f.write(DOCUMENT.format(title='Login Page'))
+
+        self.daemon = WorkEffortDaemon(self.work_dir, watch_interval=0)
+        self.daemon.start()
+        self.thread = threading.Thread(target=self.daemon.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        """Stop the daemon and remove the work efforts directory."""
+        self.daemon.shutdown()
+        self.thread.join(timeout=5)
+        shutil.rmtree(self.work_dir)
+
+    def test_client_round_trip(self):
+        """The client gets the same answers as the in-process service."""
+        client = connect_service(self.work_dir)
+        try:
+            self.assertIsInstance(client, DaemonClient)
+            self.assertEqual(client.search('login')[0]['title'], 'Login Page')
+            updated = client.update_status(os.path.join('active', '0001_login_page.md'), 'archived')
+            self.assertEqual(updated['path'], os.path.join('archived', '0001_login_page.md'))
+            with self.assertRaises(ValueError):
+                client.update_status('missing.md', 'active')
+            self.assertEqual(client.ping()['requests_served'], 2)
+        finally:
+            client.close()
+
+    def test_listing_is_paged(self):
+        """The client fetches listings page by page with filters applied in the daemon."""
+        for name in ('0002_extra.md', '0003_more.md'):
+            with open(os.path.join(self.work_dir, 'active', name), 'w') as f:
+                f.write(DOCUMENT.format(title=name))
+        client = connect_service(self.work_dir)
+        try:
+            with patch.object(daemon_module, 'PAGE_SIZE', 1):
+                records = list(client.iter_work_efforts(sort_by='title'))
+                self.assertEqual([r['title'] for r in records], ['0002_extra.md', '0003_more.md', 'Login Page'])
+                self.assertEqual(len(list(client.iter_work_efforts(offset=1, limit=5))), 2)
+            self.assertEqual(client.ping()['requests_served'], 7)
+        finally:
+            client.close()
+
+    def test_protocol_errors(self):
+        """Malformed and unknown requests get JSON-RPC errors."""
+        self.assertEqual(self.daemon.handle_line(b'not json')['error']['code'], -32700)
+        self.assertEqual(self.daemon.handle_request({'id': 1, 'method': 'nope'})['error']['code'], -32601)
+        self.assertIsNone(self.daemon.handle_request({'method': 'refresh'}))
+
+        # Parameters that do not fit the method are invalid; errors raised inside it are server errors
+        bad_params = self.daemon.handle_request({'id': 2, 'method': 'search', 'params': {'text': 'login'}})
+        self.assertEqual(bad_params['error']['code'], -32602)
+        with patch.object(self.daemon.service, 'search', side_effect=TypeError('index is broken')):
+            failed = self.daemon.handle_request({'id': 3, 'method': 'search', 'params': {'query': 'login'}})
+        self.assertEqual(failed['error']['code'], -32000)
+        self.assertEqual(failed['error']['message'], 'index is broken')
+
+    def test_shutdown_removes_socket(self):
+        """After shutdown the socket is gone and clients run in process."""
+        self.daemon.shutdown()
+        self.thread.join(timeout=5)
+        self.assertFalse(os.path.exists(socket_path_for(self.work_dir)))
+        self.assertIsInstance(connect_service(self.work_dir), WorkEffortService)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for lazy section access and partial updates of work efforts.
+
+These tests cover:
+1. Decoding a section only when it is read
+2. Keeping untouched bytes when a section or frontmatter key changes
+3. Adding and removing sections
+4. Saving an append to a large work effort without rewriting the file
+5. Refusing to splice into a file edited since it was read, even at the same size
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.code_conductor import work_effort as work_effort_module
+from src.code_conductor.work_effort import WorkEffort
+from src.code_conductor.work_efforts.frontmatter import file_stamp, splice_file
+
+DOCUMENT = (
+    '---\n'
+    'title: "Sections"\n'
+    'status: "active" # options: active, paused, completed\n'
+    'priority: "high" # options: low, medium, high, critical\n'
+    'assignee: "ann"\n'
+    'created: "2025-03-01 10:00" # YYYY-MM-DD HH:mm\n'
+    'last_updated: "2025-03-01 10:00" # YYYY-MM-DD HH:mm\n'
+    'due_date: "2025-04-01" # YYYY-MM-DD\n'
+    '---\n'
+    '\n'
+    '# Sections\n'
+    '\n'
+    '## 🚩 Objectives\n'
+    '- Keep  odd   spacing\n'
+    '\n'
+    '## 🛠 Tasks\n'
+    '- [ ] One\n'
+    '\n'
+    '## 📝 Notes\n'
+    'First note\n'
+)
+
+
+class TestWorkEffortSections(unittest.TestCase):
+    """Test the section offset table of WorkEffort."""
+
+    def setUp(self):
+        """Create a scratch directory."""
+        self.work_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.work_dir, '0001_sections.md')
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        shutil.rmtree(self.work_dir)
+
+    def test_sections_are_read_lazily(self):
+        """Only the sections that are read are decoded."""
+        work_effort = WorkEffort.from_markdown(DOCUMENT)
+        self.assertEqual(list(work_effort.content), ['objectives', 'tasks', 'notes'])
+        self.assertEqual(work_effort.content._values, {})
+
+        self.assertEqual(work_effort.content['tasks'], '- [ ] One')
+        self.assertEqual(list(work_effort.content._values), ['tasks'])
+        self.assertEqual(work_effort.to_markdown(), DOCUMENT)
+
+    def test_update_splices_changed_ranges(self):
+        """Changing one section and the status leaves every other byte alone."""
+        work_effort = WorkEffort.from_markdown(DOCUMENT)
+        work_effort.content['tasks'] = '- [x] One'
+        work_effort.update_status('completed')
+        work_effort.last_updated = '2025-03-02 09:30'
+
+        expected = (DOCUMENT.replace('- [ ] One', '- [x] One')
+                    .replace('status: "active"', 'status: "completed"')
+                    .replace('last_updated: "2025-03-01 10:00"', 'last_updated: "2025-03-02 09:30"'))
+        self.assertEqual(work_effort.to_markdown(), expected)
+
+    def test_add_and_remove_sections(self):
+        """New sections are appended and removed sections disappear with their heading."""
+        work_effort = WorkEffort.from_markdown(DOCUMENT)
+        del work_effort.content['objectives']
+        work_effort.update_content('outcomes', 'Shipped')
+
+        markdown = work_effort.to_markdown()
+        self.assertNotIn('Objectives', markdown)
+        self.assertTrue(markdown.endswith('## 📝 Notes\nFirst note\n\n## ✅ Outcomes\nShipped\n'))
+        self.assertEqual(WorkEffort.from_markdown(markdown).content['outcomes'], 'Shipped')
+        self.assertEqual(list(work_effort.content), ['tasks', 'notes', 'outcomes'])
+        self.assertIsNone(work_effort.content.get('objectives'))
+
+    def test_append_to_large_work_effort(self):
+        """Appending to the last section writes only the new bytes and the changed key."""
+        body = 'A long line of notes for a very large work effort.\n' * 20000
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(DOCUMENT + body)
+
+        work_effort = WorkEffort.from_file(self.path)
+        written = []
+        splice_file = work_effort_module.splice_file
+        with patch.object(work_effort_module, 'splice_file',
+                          side_effect=lambda *args, **kwargs: written.append(splice_file(*args, **kwargs))):
+            work_effort.append_content('notes', 'Appended note')
+            work_effort.save()
+        self.assertEqual(len(written), 1)
+        self.assertLess(written[0], 100)
+
+        with open(self.path, encoding='utf-8') as f:
+            content = f.read()
+        self.assertTrue(content.endswith(body.rstrip('\n') + '\nAppended note\n'))
+        self.assertIn(f'last_updated: "{work_effort.last_updated}" # YYYY-MM-DD HH:mm', content)
+        self.assertEqual(len(content.encode('utf-8')),
+                         len((DOCUMENT + body).encode('utf-8')) + len('\nAppended note'))
+
+        # A second change splices against the saved document
+        work_effort.append_content('notes', 'Second')
+        work_effort.save()
+        self.assertTrue(WorkEffort.from_file(self.path).content['notes'].endswith('Appended note\nSecond'))
+
+    def test_splice_checks_the_file_stamp(self):
+        """A same-size edit since the read is detected, and a splice replaces the file in one rename."""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(DOCUMENT)
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        stamp = file_stamp(os.stat(self.path))
+        inode = os.stat(self.path).st_ino
+
+        with open(self.path, 'r+b') as f:
+            f.seek(len(data) - 2)
+            f.write(b'X')
+        os.utime(self.path, ns=(stamp[0] + 1000, stamp[0] + 1000))
+        with self.assertRaises(ValueError):
+            splice_file(self.path, data, [(0, 0, b'')], stamp)
+
+        with open(self.path, 'wb') as f:
+            f.write(data)
+        stamp = file_stamp(os.stat(self.path))
+        splice_file(self.path, data, [(len(data), len(data), b'Tail\n')], stamp)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), data + b'Tail\n')
+        self.assertNotEqual(os.stat(self.path).st_ino, inode)
+        self.assertEqual(os.listdir(self.work_dir), [os.path.basename(self.path)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the workflow step graph and the graph-based workflow runner.
+
+These tests cover:
+1. Ordering steps and rejecting unknown dependencies and cycles
+2. Running independent steps in parallel and exclusive steps alone
+3. Skipping unchanged steps and re-running changed ones and their dependents
+4. Resuming an interrupted workflow from the saved state
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.code_conductor.workflow.step_graph import Step, StepExecutor, topological_order
+from src.code_conductor.workflow.workflow_runner import WorkflowRunner
+
+
+class TestStepGraph(unittest.TestCase):
+    """Test the step graph executor."""
+
+    def setUp(self):
+        """Create a directory for the state file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.state_path = os.path.join(self.temp_dir, 'state.json')
+        self.calls = []
+
+    def tearDown(self):
+        """Remove the state directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def _step(self, name, deps=(), value=None, **options):
+        def run():
+            self.calls.append(name)
+            return value if value is not None else name
+        return Step(name, run, deps=deps, **options)
+
+    def test_topological_order(self):
+        """Dependencies come first and invalid graphs are rejected."""
+        steps = [self._step('c', ['b']), self._step('a'), self._step('b', ['a'])]
+        self.assertEqual(topological_order(steps), ['a', 'b', 'c'])
+
+        with self.assertRaises(ValueError):
+            topological_order([self._step('a', ['missing'])])
+        with self.assertRaises(ValueError):
+            topological_order([self._step('a', ['b']), self._step('b', ['a'])])
+
+    def test_independent_steps_run_in_parallel(self):
+        """Two independent steps overlap, and an exclusive step overlaps nothing."""
+        barrier = threading.Barrier(2, timeout=5)
+        active = []
+        overlapped = []
+
+        def meet(name):
+            def run():
+                barrier.wait()
+                return name
+            return run
+
+        def alone():
+            overlapped.append(len(active))
+            return 'alone'
+
+        def track(name):
+            def run():
+                active.append(name)
+                threading.Event().wait(0.05)
+                active.remove(name)
+                return name
+            return run
+
+        steps = [
+            Step('left', meet('left')),
+            Step('right', meet('right')),
+            Step('exclusive', alone, deps=['left'], exclusive=True),
+            Step('other', track('other'), deps=['right']),
+        ]
+        report = StepExecutor(steps, max_workers=2).run()
+
+        self.assertIsNone(report['failed'])
+        self.assertEqual(sorted(report['ran']), ['exclusive', 'left', 'other', 'right'])
+        self.assertEqual(overlapped, [0])
+
+    def test_unchanged_steps_are_skipped(self):
+        """A re-run skips cached steps and re-runs a changed step and the steps using its output."""
+        inputs = {'a': 1}
+
+        def run_a():
+            self.calls.append('a')
+            return inputs['a']
+
+        def build():
+            return [
+                Step('a', run_a, inputs=lambda: dict(inputs)),
+                self._step('b', ['a']),
+                self._step('c'),
+            ]
+
+        StepExecutor(build(), self.state_path).run()
+        self.assertEqual(sorted(self.calls), ['a', 'b', 'c'])
+
+        self.calls.clear()
+        report = StepExecutor(build(), self.state_path).run()
+        self.assertEqual(self.calls, [])
+        self.assertEqual(sorted(report['skipped']), ['a', 'b', 'c'])
+
+        inputs['a'] = 2
+        StepExecutor(build(), self.state_path).run()
+        self.assertEqual(self.calls, ['a', 'b'])
+
+        # Re-running a step that produces the same output leaves its dependents cached
+        self.calls.clear()
+        inputs['unused'] = True
+        StepExecutor(build(), self.state_path).run()
+        self.assertEqual(self.calls, ['a'])
+
+    def test_resume_after_failure(self):
+        """An interrupted run resumes with the step that failed."""
+        fail = [True]
+
+        def flaky():
+            self.calls.append('b')
+            if fail[0]:
+                raise RuntimeError('interrupted')
+            return 'b'
+
+        def build():
+            return [self._step('a'), Step('b', flaky, deps=['a']), self._step('c', ['b'])]
+
+        report = StepExecutor(build(), self.state_path).run()
+        self.assertEqual(report['failed'], ('b', 'interrupted'))
+        self.assertEqual(self.calls, ['a', 'b'])
+        with open(self.state_path) as f:
+            self.assertEqual(json.load(f)['steps']['b']['status'], 'failed')
+
+        fail[0] = False
+        self.calls.clear()
+        report = StepExecutor(build(), self.state_path).run()
+        self.assertIsNone(report['failed'])
+        self.assertEqual(self.calls, ['b', 'c'])
+        self.assertEqual(report['skipped'], ['a'])
+
+
+class TestWorkflowRunnerGraph(unittest.TestCase):
+    """Test running the workflow runner as a step graph."""
+
+    def setUp(self):
+        """Create a work efforts directory with a devlog."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.work_efforts_dir = os.path.join(self.temp_dir, 'work_efforts')
+        self.devlog_file = os.path.join(self.temp_dir, 'devlog.md')
+        with open(self.devlog_file, 'w') as f:
+            f.write('# Development Log\n\n')
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def _runner(self, description='Implementation of Graph Feature'):
+        runner = WorkflowRunner(interactive=False, work_efforts_dir=self.work_efforts_dir,
+                                devlog_file=self.devlog_file,
+                                changelog_file=os.path.join(self.temp_dir, 'CHANGELOG.md'))
+        runner.feature_name = runner.feature_title = 'Graph Feature'
+        runner.feature_description = description
+        runner.script_name = runner.slugify(runner.feature_name)
+        runner.class_name = 'GraphFeature'
+        return runner
+
+    def test_rerun_skips_completed_steps(self):
+        """A second run creates nothing new and adds no second devlog entry."""
+        with patch('builtins.print'):
+            self.assertEqual(self._runner().run_workflow(), 0)
+        first = self._runner()
+        active = os.listdir(os.path.join(self.work_efforts_dir, 'active'))
+        self.assertEqual(len(active), 1)
+
+        with patch.object(WorkflowRunner, 'execute_and_test') as execute, patch('builtins.print'):
+            self.assertEqual(first.run_workflow(), 0)
+        execute.assert_not_called()
+        self.assertEqual(os.listdir(os.path.join(self.work_efforts_dir, 'active')), active)
+        with open(self.devlog_file) as f:
+            self.assertEqual(f.read().count('### Graph Feature'), 1)
+
+        # A new description changes the script and the devlog entry
+        with patch('builtins.print'):
+            self.assertEqual(self._runner('Reworked').run_workflow(), 0)
+        with open(os.path.join(self.work_efforts_dir, 'scripts', 'graph_feature.py')) as f:
+            self.assertIn('Reworked', f.read())
+        with open(self.devlog_file) as f:
+            self.assertEqual(f.read().count('### Graph Feature'), 2)
+
+    def test_resume_after_failed_step(self):
+        """A failed step is retried on the next run without repeating earlier steps."""
+        with patch.object(WorkflowRunner, 'add_tests', side_effect=OSError('disk full')), \
+                patch('builtins.print'):
+            self.assertEqual(self._runner().run_workflow(), 1)
+
+        runner = self._runner()
+        with patch.object(WorkflowRunner, 'create_work_effort') as create, patch('builtins.print'):
+            self.assertEqual(runner.run_workflow(), 0)
+        create.assert_not_called()
+        self.assertTrue(os.path.exists(runner.test_path))
+
+
+if __name__ == "__main__":
+    unittest.main()